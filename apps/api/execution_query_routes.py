@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Query, Response
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
 
 from core.contracts.artifact_lifecycle_remote_endpoints import (
     ARTIFACT_LIFECYCLE_POLICY_READ,
@@ -50,6 +51,7 @@ from core.contracts.remote_endpoints import (
     RUN_RULE_OUTPUT_INVALIDATION_APPLY,
     RUN_RULE_RETRY,
     RUN_RULES_READ,
+    RUN_UPDATES_STREAM,
     WORKFLOW_REVISION_READ,
     remote_endpoint_success_status,
 )
@@ -97,6 +99,7 @@ from apps.api.execution_query_service import (
     get_artifact_lifecycle_policy_from_request,
     get_artifact_lifecycle_usage_from_request,
     get_artifact_storage_readiness_from_request,
+    open_run_update_stream_from_request,
     run_artifact_storage_readiness_smoke_from_request,
     list_artifact_lifecycle_controller_ticks_from_request,
     run_artifact_lifecycle_controller_once_from_request,
@@ -139,8 +142,13 @@ from apps.api.execution_query_service import (
 
 router = APIRouter()
 DOWNLOAD_HEADER_ALLOWLIST = {
+    "accept-ranges",
     "cache-control",
     "content-disposition",
+    "content-length",
+    "content-range",
+    "etag",
+    "last-modified",
     "x-content-type-options",
     "x-h2ometa-result-id",
     "x-h2ometa-package-export-id",
@@ -151,8 +159,26 @@ DOWNLOAD_HEADER_ALLOWLIST = {
 
 
 @router.get("/api/v1/runs", operation_id=REMOTE_ENDPOINTS[RUN_LIST].operation_id)
-async def list_runs(refresh: bool = False) -> dict[str, Any]:
-    return await list_runs_from_request(refresh)
+async def list_runs(
+    refresh: bool = False,
+    limit: int | None = None,
+    cursor: str | None = None,
+    status: str | None = None,
+    pipelineId: str | None = None,
+    submittedAfter: str | None = None,
+    submittedBefore: str | None = None,
+) -> dict[str, Any]:
+    return await list_runs_from_request(
+        refresh,
+        {
+            "limit": limit,
+            "cursor": cursor,
+            "status": status,
+            "pipelineId": pipelineId,
+            "submittedAfter": submittedAfter,
+            "submittedBefore": submittedBefore,
+        },
+    )
 
 
 @router.get("/api/v1/runs/{run_id}", operation_id=REMOTE_ENDPOINTS[RUN_READ].operation_id)
@@ -332,6 +358,26 @@ async def get_run_logs(
     return await get_run_logs_from_request(run_id, stream=stream, cursor=cursor)
 
 
+@router.get("/api/v1/runs/{run_id}/stream", operation_id=REMOTE_ENDPOINTS[RUN_UPDATES_STREAM].operation_id)
+async def stream_run_updates(
+    run_id: str,
+    stdoutCursor: str | None = None,
+    stderrCursor: str | None = None,
+    last_event_id: Annotated[str | None, Header(alias="Last-Event-ID")] = None,
+) -> StreamingResponse:
+    stream = await open_run_update_stream_from_request(
+        run_id,
+        last_event_id=last_event_id,
+        stdout_cursor=stdoutCursor,
+        stderr_cursor=stderrCursor,
+    )
+    return StreamingResponse(
+        stream["chunks"],
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/api/v1/runs/{run_id}/results", operation_id=REMOTE_ENDPOINTS[RUN_RESULTS_READ].operation_id)
 async def get_run_results(run_id: str) -> dict[str, Any]:
     return await get_run_results_from_request(run_id)
@@ -351,8 +397,24 @@ async def get_run_failure_locator(run_id: str) -> dict[str, Any]:
 
 
 @router.get("/api/v1/results", operation_id=REMOTE_ENDPOINTS[RESULT_LIST].operation_id)
-async def list_results() -> dict[str, Any]:
-    return await list_results_from_request()
+async def list_results(
+    limit: int | None = None,
+    cursor: str | None = None,
+    status: str | None = None,
+    pipelineId: str | None = None,
+    producedAfter: str | None = None,
+    producedBefore: str | None = None,
+) -> dict[str, Any]:
+    return await list_results_from_request(
+        {
+            "limit": limit,
+            "cursor": cursor,
+            "status": status,
+            "pipelineId": pipelineId,
+            "producedAfter": producedAfter,
+            "producedBefore": producedBefore,
+        }
+    )
 
 
 @router.get("/api/v1/results/{result_id}", operation_id=REMOTE_ENDPOINTS[RESULT_READ].operation_id)
@@ -427,17 +489,21 @@ async def download_result_package(
     result_id: str,
     package_export_id: str,
     serverId: str | None = None,
-) -> Response:
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
+    if_range: Annotated[str | None, Header(alias="If-Range")] = None,
+) -> StreamingResponse:
     download = await download_result_package_from_request(
         result_id,
         package_export_id,
         server_id=serverId,
+        range_header=range_header,
+        if_range=if_range,
     )
-    headers = _download_headers(download)
-    return Response(
-        content=download["content"],
+    return StreamingResponse(
+        download["chunks"],
+        status_code=int(download.get("statusCode") or 200),
         media_type=_download_media_type(download),
-        headers=headers,
+        headers=_download_headers(download),
     )
 
 
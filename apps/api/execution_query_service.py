@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
+from contextlib import suppress
 from typing import Any
 
 from apps.api.models import (
@@ -37,7 +39,13 @@ from core.contracts.remote_endpoints import render_remote_endpoint_path
 from core.contracts.result_package_remote_endpoints import RESULT_PACKAGE_DOWNLOAD
 
 
-async def list_runs_from_request(refresh: bool) -> dict[str, Any]:
+async def list_runs_from_request(refresh: bool, query: dict[str, Any] | None = None) -> dict[str, Any]:
+    page_query = _listing_query(query)
+    if page_query:
+        return await run_runtime_payload(
+            lambda: runtime_service().list_runs_page(page_query),
+            wrapper="data",
+        )
     return await cached_runtime_payload(
         "runs",
         10,
@@ -222,6 +230,37 @@ async def get_run_attempts_from_request(run_id: str) -> dict[str, Any]:
     )
 
 
+async def open_run_update_stream_from_request(
+    run_id: str,
+    *,
+    last_event_id: str | None = None,
+    stdout_cursor: str | None = None,
+    stderr_cursor: str | None = None,
+) -> dict[str, Any]:
+    stream = await run_sync(
+        lambda: runtime_service().open_run_update_stream(
+            run_id,
+            last_event_id=last_event_id,
+            stdout_cursor=stdout_cursor,
+            stderr_cursor=stderr_cursor,
+        )
+    )
+    return {**stream, "chunks": _relay_upstream_chunks(stream["chunks"])}
+
+
+async def _relay_upstream_chunks(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    # Each blocking upstream read gets a worker thread; the relay itself waits on the event loop.
+    try:
+        while (chunk := await run_sync(next, chunks, None)) is not None:
+            yield chunk
+    finally:
+        close = getattr(chunks, "close", None)
+        # A read cancelled mid-flight still owns the generator; it is released once that read returns.
+        if close is not None:
+            with suppress(ValueError):
+                close()
+
+
 async def get_run_logs_from_request(
     run_id: str,
     *,
@@ -259,7 +298,13 @@ async def get_run_failure_locator_from_request(run_id: str) -> dict[str, Any]:
     )
 
 
-async def list_results_from_request() -> dict[str, Any]:
+async def list_results_from_request(query: dict[str, Any] | None = None) -> dict[str, Any]:
+    page_query = _listing_query(query)
+    if page_query:
+        return await run_runtime_payload(
+            lambda: runtime_service().list_results_page(page_query),
+            wrapper="raw",
+        )
     return await run_runtime_payload(
         runtime_service().list_results,
         wrapper="raw",
@@ -339,12 +384,16 @@ async def download_result_package_from_request(
     package_export_id: str,
     *,
     server_id: str | None = None,
+    range_header: str | None = None,
+    if_range: str | None = None,
 ) -> dict[str, Any]:
     return await run_sync(
-        lambda: runtime_service().download_result_package(
+        lambda: runtime_service().open_result_package_download_stream(
             result_id,
             package_export_id,
             server_id=server_id,
+            range_header=range_header,
+            if_range=if_range,
         )
     )
 
@@ -698,3 +747,7 @@ async def lookup_artifact_cache_from_request(request: ArtifactCacheLookupRequest
         lambda: runtime_service().lookup_artifact_cache(payload, server_id=server_id),
         wrapper="raw",
     )
+
+
+def _listing_query(query: dict[str, Any] | None) -> dict[str, Any]:
+    return {key: value for key, value in (query or {}).items() if value is not None and str(value) != ""}
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import base64
 import hashlib
+import io
 import mimetypes
 import os
 from dataclasses import dataclass
@@ -116,13 +116,13 @@ def _download_and_upload_moving_pictures(server_id: str) -> list[dict]:
         prepared = _prepare_sample_file(item)
         integrity = _verify_sample_file_integrity(item, prepared.content)
         mime_type = item.mime_type or mimetypes.guess_type(item.filename)[0] or "application/octet-stream"
-        upload = runtime.upload_file(
-            {
-                "serverId": server_id,
-                "filename": item.filename,
-                "contentBase64": base64.b64encode(prepared.content).decode("ascii"),
-                "mimeType": mime_type,
-            }
+        upload = runtime.upload_file_chunked(
+            io.BytesIO(prepared.content),
+            filename=item.filename,
+            size_bytes=len(prepared.content),
+            mime_type=mime_type,
+            sha256=integrity["sha256"],
+            server_id=server_id,
         )
         uploads.append(
             {
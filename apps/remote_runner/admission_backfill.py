@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import sqlite3
+from typing import Any
+
+from .admission_storage import (
+    available_resources,
+    capacity_shortfall,
+    record_admission_wait,
+    resource_shortfall,
+    subtract_resources,
+)
+from .execution_policy import resource_request_for_job
+from .execution_storage_primitives import add_seconds
+from .reconciler_actions import dead_letter_job
+from .resource_pool import ResourceRequest
+
+ADMISSION_MODE_STRICT = "strict"
+ADMISSION_MODE_BACKFILL = "backfill"
+ADMISSION_MODES = {ADMISSION_MODE_STRICT, ADMISSION_MODE_BACKFILL}
+DEFAULT_BACKFILL_WINDOW = 16
+DEFAULT_BACKFILL_RESERVATION_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class BackfillDecision:
+    head_wait_reason: dict[str, Any]
+    job: sqlite3.Row | None = None
+    request: ResourceRequest | None = None
+
+
+def admission_mode(value: Any) -> str:
+    mode = str(value or ADMISSION_MODE_BACKFILL).strip().lower()
+    if mode not in ADMISSION_MODES:
+        raise ValueError("RUN_ADMISSION_MODE_INVALID")
+    return mode
+
+
+def select_backfill_job(
+    cfg: Any,
+    connection: sqlite3.Connection,
+    *,
+    head: sqlite3.Row,
+    head_request: ResourceRequest,
+    head_wait_reason: dict[str, Any],
+    now: str,
+    queue_name: str,
+    default_request: ResourceRequest,
+    capacity: ResourceRequest,
+) -> BackfillDecision | None:
+    """Pick a later queued job that fits the free capacity the blocked head cannot use.
+
+    The head keeps a reservation that starts when it is first blocked. Once the
+    reservation is older than ``run_admission_backfill_reservation_seconds``
+    backfill may only use capacity that would still be free after the head
+    starts, so a stream of small jobs cannot keep a large one waiting
+    indefinitely. Returns ``None`` when the head waits for anything but resources
+    or backfill is disabled.
+    """
+    if head_wait_reason.get("code") != "ADMISSION_RESOURCES_UNAVAILABLE":
+        return None
+    if admission_mode(getattr(cfg, "run_admission_mode", None)) != ADMISSION_MODE_BACKFILL:
+        return None
+    window = int(getattr(cfg, "run_admission_backfill_window", DEFAULT_BACKFILL_WINDOW))
+    reservation_seconds = int(
+        getattr(cfg, "run_admission_backfill_reservation_seconds", DEFAULT_BACKFILL_RESERVATION_SECONDS)
+    )
+    reserved_since = _reserved_since(head) or now
+    wait_reason = {**head_wait_reason, "reservedSince": reserved_since}
+    available = available_resources(connection, capacity)
+    # A head that can never fit gets no reservation; the claim path dead-letters it.
+    if (
+        capacity_shortfall(head_request, capacity) is None
+        and add_seconds(reserved_since, max(0, int(reservation_seconds))) <= now
+    ):
+        available = subtract_resources(available, head_request)
+    candidates = connection.execute(
+        """
+        SELECT jobs.*
+        FROM run_jobs AS jobs
+        WHERE jobs.state = 'queued'
+          AND jobs.available_at <= ?
+          AND jobs.dead_lettered_at IS NULL
+          AND jobs.queue_name = ?
+          AND jobs.job_id != ?
+        ORDER BY jobs.priority DESC, jobs.available_at ASC, jobs.created_at ASC, jobs.job_id ASC
+        LIMIT ?
+        """,
+        (now, queue_name, head["job_id"], max(0, int(window))),
+    ).fetchall()
+    for candidate in candidates:
+        request = resource_request_for_job(candidate, default=default_request)
+        if resource_shortfall(request, available) is None:
+            return BackfillDecision(head_wait_reason=wait_reason, job=candidate, request=request)
+    return BackfillDecision(head_wait_reason=wait_reason)
+
+
+def dead_letter_if_oversized(
+    connection: sqlite3.Connection,
+    job: sqlite3.Row,
+    *,
+    default_request: ResourceRequest,
+    capacity: ResourceRequest,
+    now: str,
+) -> bool:
+    """Dead-letter a job whose resource request exceeds the worker's total capacity.
+
+    Such a job can never be admitted, so leaving it queued would block strict
+    FIFO admission and, once reserved, every backfill candidate behind it.
+    """
+    shortfall = capacity_shortfall(resource_request_for_job(job, default=default_request), capacity)
+    if shortfall is None:
+        return False
+    record_admission_wait(connection, job, shortfall, now)
+    dead_letter_job(
+        connection,
+        job_id=str(job["job_id"]),
+        run_id=str(job["run_id"]),
+        reason=str(shortfall["code"]),
+        dead_lettered_at=now,
+    )
+    return True
+
+
+def _reserved_since(job: sqlite3.Row) -> str:
+    try:
+        previous = json.loads(job["wait_reason_json"] or "{}")
+    except json.JSONDecodeError:
+        return ""
+    if not isinstance(previous, dict) or previous.get("code") != "ADMISSION_RESOURCES_UNAVAILABLE":
+        return ""
+    return str(previous.get("reservedSince") or "")
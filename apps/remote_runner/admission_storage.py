@@ -4,8 +4,11 @@ import sqlite3
 import uuid
 from typing import Any
 
+from .execution_storage_primitives import stable_json
 from .resource_pool import ResourceRequest
 
+RESOURCE_FIELDS = ("cpu", "memory_mb", "disk_mb", "gpu")
+
 
 def admission_wait_reason(
     connection: sqlite3.Connection,
@@ -31,6 +34,10 @@ def admission_wait_reason(
     ).fetchone()
     if slot_active is not None:
         return {"code": "ADMISSION_SLOT_BUSY", "slotId": slot_id}
+    return resource_shortfall(request, available_resources(connection, capacity))
+
+
+def available_resources(connection: sqlite3.Connection, capacity: ResourceRequest) -> dict[str, int]:
     active = connection.execute(
         """
         SELECT
@@ -42,13 +49,16 @@ def admission_wait_reason(
         WHERE state = 'allocated'
         """
     ).fetchone()
-    available = {
+    return {
         "cpu": max(0, int(capacity.cpu) - int(active["cpu"])),
         "memory_mb": max(0, int(capacity.memory_mb) - int(active["memory_mb"])),
         "disk_mb": max(0, int(capacity.disk_mb) - int(active["disk_mb"])),
         "gpu": max(0, int(capacity.gpu) - int(active["gpu"])),
     }
-    for field in ("cpu", "memory_mb", "disk_mb", "gpu"):
+
+
+def resource_shortfall(request: ResourceRequest, available: dict[str, int]) -> dict[str, Any] | None:
+    for field in RESOURCE_FIELDS:
         requested = int(getattr(request, field))
         if requested > available[field]:
             return {
@@ -60,6 +70,40 @@ def admission_wait_reason(
     return None
 
 
+def capacity_shortfall(request: ResourceRequest, capacity: ResourceRequest) -> dict[str, Any] | None:
+    """Return why ``request`` can never fit this worker's total capacity, or ``None``."""
+    shortfall = resource_shortfall(request, {field: int(getattr(capacity, field)) for field in RESOURCE_FIELDS})
+    if shortfall is None:
+        return None
+    return {
+        "code": "ADMISSION_REQUEST_EXCEEDS_CAPACITY",
+        "resource": shortfall["resource"],
+        "capacity": shortfall["available"],
+        "requested": shortfall["requested"],
+    }
+
+
+def subtract_resources(available: dict[str, int], request: ResourceRequest) -> dict[str, int]:
+    """Return what stays free after ``request``; negative values mark a shortfall."""
+    return {field: available[field] - int(getattr(request, field)) for field in RESOURCE_FIELDS}
+
+
+def record_admission_wait(
+    connection: sqlite3.Connection,
+    job: sqlite3.Row,
+    wait_reason: dict[str, Any],
+    updated_at: str,
+) -> None:
+    connection.execute(
+        """
+        UPDATE run_jobs
+        SET wait_reason_json = ?, updated_at = ?
+        WHERE job_id = ?
+        """,
+        (stable_json(wait_reason), updated_at, job["job_id"]),
+    )
+
+
 def record_resource_allocation(
     connection: sqlite3.Connection,
     *,
@@ -19,6 +19,13 @@ class UploadCreateRequest(RemoteRunnerRequest):
     mimeType: str = "application/octet-stream"
 
 
+class UploadSessionCreateRequest(RemoteRunnerRequest):
+    filename: str = Field(min_length=1)
+    sizeBytes: int = Field(ge=0)
+    mimeType: str = "application/octet-stream"
+    sha256: str = ""
+
+
 class RunSpecRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
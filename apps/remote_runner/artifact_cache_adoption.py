@@ -363,8 +363,8 @@ def _record_restored_materialization(
         """
         INSERT INTO artifact_materializations (
             materialization_id, artifact_blob_id, storage_backend,
-            storage_uri, local_path, created_at
-        ) VALUES (?, ?, ?, ?, ?, ?)
+            storage_uri, local_path, created_at, materialization_method
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
         """,
         (
             materialization_id,
@@ -373,6 +373,7 @@ def _record_restored_materialization(
             restore["storageUri"],
             restore["localPath"],
             occurred_at,
+            str(restore.get("materializationMethod") or ""),
         ),
     )
     return materialization_id
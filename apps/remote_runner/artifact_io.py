@@ -15,7 +15,24 @@ from .artifact_directory_package import (
     iter_directory_package_payloads,
     restore_directory_package_payload,
 )
+from .artifact_materialization import (
+    MATERIALIZATION_COPY,
+    MATERIALIZATION_DOWNLOAD,
+    materialize_directory,
+    materialize_file,
+)
+from .artifact_s3_transfer import (
+    configured_s3_transfer_settings,
+    iter_s3_object_ranges,
+    read_s3_object_range,
+    supports_multipart_transfers,
+    upload_file_multipart,
+)
 from .config import RemoteRunnerConfig
+from .verified_digest_cache import verified_file_stats
+
+
+ARTIFACT_STREAM_CHUNK_BYTES = 1024 * 1024
 
 
 def local_artifact_location(path: Path) -> dict[str, str]:
@@ -109,24 +126,40 @@ def read_artifact_preview_text(
     return payload[:limit].decode("utf-8", errors="ignore"), truncated
 
 
-def iter_artifact_file_payloads(cfg: RemoteRunnerConfig, record: dict[str, Any]):
+def iter_artifact_file_streams(cfg: RemoteRunnerConfig, record: dict[str, Any]):
+    """Yield ``(relative_path, size_bytes, chunks)`` per payload file without buffering whole files."""
     storage_backend = str(record.get("storageBackend") or record.get("storage_backend") or "local")
     if storage_backend == "s3":
         if _artifact_is_directory(record):
-            yield from iter_directory_package_payloads(read_artifact_bytes(cfg, record))
+            for relative_path, payload in iter_directory_package_payloads(read_artifact_bytes(cfg, record)):
+                yield relative_path, len(payload), iter((payload,))
             return
-        yield _artifact_filename(record), read_artifact_bytes(cfg, record)
+        size_bytes = int(record.get("sizeBytes") or record.get("size_bytes") or 0)
+        yield _artifact_filename(record), size_bytes, iter_artifact_byte_chunks(cfg, record)
         return
     path = artifact_local_path(record)
     _assert_local_payload_has_no_symlinks(path)
     if path.is_file():
-        yield path.name or "artifact", path.read_bytes()
+        yield path.name or "artifact", path.stat().st_size, _iter_local_file_chunks(path)
         return
     if not path.is_dir():
         raise ValueError("RESULT_ARTIFACT_PATH_INVALID")
     for child in _iter_local_directory_children(path):
         if child.is_file():
-            yield child.relative_to(path).as_posix(), child.read_bytes()
+            yield child.relative_to(path).as_posix(), child.stat().st_size, _iter_local_file_chunks(child)
+
+
+def iter_artifact_byte_chunks(cfg: RemoteRunnerConfig, record: dict[str, Any]):
+    storage_backend = str(record.get("storageBackend") or record.get("storage_backend") or "local")
+    if storage_backend == "local":
+        path = artifact_local_path(record)
+        _assert_local_payload_has_no_symlinks(path)
+        yield from _iter_local_file_chunks(path)
+        return
+    if storage_backend == "s3":
+        yield from _iter_s3_artifact_chunks(cfg, record)
+        return
+    raise ValueError(f"ARTIFACT_STORAGE_BACKEND_UNSUPPORTED: {storage_backend}")
 
 
 def read_artifact_bytes(
@@ -187,26 +220,31 @@ def restore_artifact_payload(
 ) -> dict[str, Any]:
     target = Path(destination)
     storage_backend = str(record.get("storageBackend") or record.get("storage_backend") or "local")
+    method = MATERIALIZATION_DOWNLOAD
     if storage_backend == "local":
         source = artifact_local_path(record)
         _assert_local_payload_has_no_symlinks(source)
         if source.is_dir() or _artifact_is_directory(record):
-            _restore_local_directory(source, target)
+            method = _restore_local_directory(source, target)
+            size_bytes, sha256 = artifact_payload_stats(target)
         elif source.is_file():
-            _restore_file_bytes(source.read_bytes(), target)
+            method = materialize_file(source, target)
+            # A clone or link shares the source's bytes, so the source's verified digest holds for the target.
+            stats_path = target if method == MATERIALIZATION_COPY else source
+            size_bytes, sha256 = verified_payload_stats(cfg, stats_path)
         else:
             raise ValueError("ARTIFACT_RESTORE_SOURCE_UNAVAILABLE")
     elif storage_backend == "s3":
-        payload = read_artifact_bytes(cfg, record)
         if _artifact_is_directory(record) or _s3_object_is_directory_package(cfg, record):
+            payload = read_artifact_bytes(cfg, record)
             _assert_s3_package_checksum(cfg, record, payload)
             restore_directory_package_payload(payload, target)
         else:
-            _restore_file_bytes(payload, target)
+            _restore_file_chunks(iter_artifact_byte_chunks(cfg, record), target)
+        size_bytes, sha256 = artifact_payload_stats(target)
     else:
         raise ValueError(f"ARTIFACT_STORAGE_BACKEND_UNSUPPORTED: {storage_backend}")
 
-    size_bytes, sha256 = artifact_payload_stats(target)
     expected_size = int(record.get("sizeBytes") or record.get("size_bytes") or size_bytes)
     expected_sha = str(record.get("sha256") or sha256)
     if int(size_bytes) != expected_size or sha256 != expected_sha:
@@ -219,13 +257,14 @@ def restore_artifact_payload(
         "localPath": str(resolved),
         "sizeBytes": size_bytes,
         "sha256": sha256,
+        "materializationMethod": method,
     }
 
 
 def artifact_record_stats(cfg: RemoteRunnerConfig, record: dict[str, Any]) -> tuple[int, str]:
     storage_backend = str(record.get("storageBackend") or record.get("storage_backend") or "local")
     if storage_backend == "local":
-        return artifact_payload_stats(artifact_local_path(record))
+        return verified_payload_stats(cfg, artifact_local_path(record))
     if storage_backend == "s3":
         payload = _read_s3_artifact_bytes(cfg, record)
         if _artifact_is_directory(record) or _s3_object_is_directory_package(cfg, record):
@@ -300,6 +339,14 @@ def artifact_payload_stats(path: Path) -> tuple[int, str]:
     raise ValueError("OUTPUT_ARTIFACT_PATH_INVALID")
 
 
+def verified_payload_stats(cfg: RemoteRunnerConfig | None, path: Path) -> tuple[int, str]:
+    """Like ``artifact_payload_stats`` but reuses a digest already verified for an unchanged file."""
+    artifact_path = Path(path)
+    if cfg is None or artifact_path.is_symlink() or not artifact_path.is_file():
+        return artifact_payload_stats(artifact_path)
+    return verified_file_stats(cfg, artifact_path)
+
+
 def _directory_payload_stats(path: Path) -> tuple[int, str]:
     digest = hashlib.sha256()
     size_bytes = 0
@@ -330,15 +377,17 @@ def _update_digest_with_file(digest: Any, path: Path) -> int:
     return size_bytes
 
 
-def _restore_file_bytes(payload: bytes, destination: Path) -> None:
+def _restore_file_chunks(chunks, destination: Path) -> None:
     target = Path(destination)
     if target.exists():
         raise ValueError("ARTIFACT_RESTORE_DESTINATION_EXISTS")
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_bytes(payload)
+    with target.open("xb") as handle:
+        for chunk in chunks:
+            handle.write(chunk)
 
 
-def _restore_local_directory(source: Path, destination: Path) -> None:
+def _restore_local_directory(source: Path, destination: Path) -> str:
     if not source.is_dir():
         raise ValueError("ARTIFACT_RESTORE_SOURCE_NOT_DIRECTORY")
     _assert_local_payload_has_no_symlinks(source)
@@ -350,7 +399,7 @@ def _restore_local_directory(source: Path, destination: Path) -> None:
             raise ValueError("ARTIFACT_RESTORE_DESTINATION_NOT_EMPTY")
         shutil.rmtree(target)
     target.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copytree(source, target)
+    return materialize_directory(source, target)
 
 
 def _iter_local_directory_children(path: Path):
@@ -474,13 +523,26 @@ def _upload_s3_artifact_object(
                 "X-Amz-Meta-H2OMeta-Package-Size-Bytes": str(int(package_info["packageSizeBytes"])),
             }
         )
-    _build_s3_client(cfg).fput_object(
-        bucket,
-        object_name,
-        str(path),
-        content_type=content_type,
-        metadata=metadata,
-    )
+    client = _build_s3_client(cfg)
+    settings = configured_s3_transfer_settings()
+    if supports_multipart_transfers(client) and Path(path).stat().st_size > settings.part_size_bytes:
+        upload_file_multipart(
+            client,
+            bucket,
+            object_name,
+            Path(path),
+            content_type=content_type,
+            metadata=metadata,
+            settings=settings,
+        )
+    else:
+        client.fput_object(
+            bucket,
+            object_name,
+            str(path),
+            content_type=content_type,
+            metadata=metadata,
+        )
     return {
         "storageBackend": "s3",
         "storageUri": f"s3://{bucket}/{object_name}",
@@ -494,25 +556,64 @@ def _read_s3_artifact_bytes(
     *,
     limit: int | None = None,
 ) -> bytes:
+    if limit is None:
+        return b"".join(_iter_s3_artifact_chunks(cfg, record))
     bucket, object_name = _parse_s3_uri(record)
+    client = _build_s3_client(cfg)
+    if supports_multipart_transfers(client):
+        size_bytes = int(_stat_s3_object(cfg, bucket, object_name).size)
+        if min(limit, size_bytes) <= 0:
+            return b""
+        return read_s3_object_range(client, bucket, object_name, 0, min(limit, size_bytes))
     response = _get_s3_object(cfg, bucket, object_name)
     try:
-        if limit is not None:
-            return response.read(limit)
-        chunks: list[bytes] = []
+        return response.read(limit)
+    finally:
+        _release_s3_response(response)
+
+
+def _iter_s3_artifact_chunks(cfg: RemoteRunnerConfig, record: dict[str, Any]):
+    bucket, object_name = _parse_s3_uri(record)
+    client = _build_s3_client(cfg)
+    settings = configured_s3_transfer_settings()
+    if supports_multipart_transfers(client):
+        size_bytes = int(_stat_s3_object(cfg, bucket, object_name).size)
+        if size_bytes > settings.part_size_bytes:
+            yield from iter_s3_object_ranges(
+                client,
+                bucket,
+                object_name,
+                size_bytes=size_bytes,
+                settings=settings,
+                chunk_bytes=ARTIFACT_STREAM_CHUNK_BYTES,
+            )
+            return
+    yield from _iter_s3_response_chunks(_get_s3_object(cfg, bucket, object_name))
+
+
+def _iter_s3_response_chunks(response: Any):
+    try:
         while True:
-            chunk = response.read(1024 * 1024)
+            chunk = response.read(ARTIFACT_STREAM_CHUNK_BYTES)
             if not chunk:
-                break
-            chunks.append(chunk)
-        return b"".join(chunks)
+                return
+            yield chunk
     finally:
-        close = getattr(response, "close", None)
-        if callable(close):
-            close()
-        release = getattr(response, "release_conn", None)
-        if callable(release):
-            release()
+        _release_s3_response(response)
+
+
+def _release_s3_response(response: Any) -> None:
+    close = getattr(response, "close", None)
+    if callable(close):
+        close()
+    release = getattr(response, "release_conn", None)
+    if callable(release):
+        release()
+
+
+def _iter_local_file_chunks(path: Path):
+    with Path(path).open("rb") as handle:
+        yield from iter(lambda: handle.read(ARTIFACT_STREAM_CHUNK_BYTES), b"")
 
 
 def _stat_s3_object(cfg: RemoteRunnerConfig, bucket: str, object_name: str) -> Any:
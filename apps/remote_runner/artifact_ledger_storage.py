@@ -12,6 +12,8 @@ from .artifact_storage import artifact_payload_stats
 from .config import RemoteRunnerConfig
 from .storage_core import get_connection, now_iso
 
+LINEAGE_RUN_BATCH_SIZE = 500
+
 
 def record_artifact_blob_for_path(
     cfg: RemoteRunnerConfig,
@@ -59,6 +61,7 @@ def record_artifact_materialization(
     storage_uri: str,
     local_path: Path | None = None,
     created_at: str | None = None,
+    materialization_method: str = "",
 ) -> dict[str, Any]:
     normalized_blob_id = _required_text(artifact_blob_id, "ARTIFACT_BLOB_ID_REQUIRED")
     normalized_backend = _required_text(storage_backend, "ARTIFACT_STORAGE_BACKEND_REQUIRED")
@@ -82,8 +85,8 @@ def record_artifact_materialization(
             """
             INSERT INTO artifact_materializations (
                 materialization_id, artifact_blob_id, storage_backend,
-                storage_uri, local_path, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?)
+                storage_uri, local_path, created_at, materialization_method
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 materialization_id,
@@ -92,6 +95,7 @@ def record_artifact_materialization(
                 normalized_uri,
                 normalized_local_path,
                 timestamp,
+                str(materialization_method or "").strip(),
             ),
         )
         connection.commit()
@@ -278,6 +282,28 @@ def list_lineage_edges_for_run(
     return [_lineage_edge_row_to_dict(row) for row in rows]
 
 
+def list_lineage_edges_for_runs(
+    connection,
+    run_ids: list[str],
+) -> dict[str, list[dict[str, Any]]]:
+    edges_by_run: dict[str, list[dict[str, Any]]] = {run_id: [] for run_id in run_ids}
+    for offset in range(0, len(run_ids), LINEAGE_RUN_BATCH_SIZE):
+        batch = run_ids[offset : offset + LINEAGE_RUN_BATCH_SIZE]
+        placeholders = ", ".join("?" for _ in batch)
+        rows = connection.execute(
+            f"""
+            SELECT * FROM lineage_edges
+            WHERE run_id IN ({placeholders})
+              AND lifecycle_state = 'active'
+            ORDER BY run_id, created_at ASC, lineage_edge_id ASC
+            """,
+            batch,
+        ).fetchall()
+        for row in rows:
+            edges_by_run[str(row["run_id"])].append(_lineage_edge_row_to_dict(row))
+    return edges_by_run
+
+
 def _require_blob(connection, artifact_blob_id: str):
     row = connection.execute(
         "SELECT * FROM artifact_blobs WHERE artifact_blob_id = ?",
@@ -311,6 +337,7 @@ def _materialization_row_to_dict(row) -> dict[str, Any]:
         "deletedAt": row["deleted_at"],
         "gcReason": row["gc_reason"],
         "retentionUntil": row["retention_until"],
+        "materializationMethod": row["materialization_method"],
     }
 
 
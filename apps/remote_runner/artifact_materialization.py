@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import errno
+import os
+from pathlib import Path
+import shutil
+import stat
+
+
+MATERIALIZATION_REFLINK = "reflink"
+MATERIALIZATION_HARDLINK = "hardlink"
+MATERIALIZATION_COPY = "copy"
+MATERIALIZATION_DOWNLOAD = "download"
+MATERIALIZATION_STRATEGIES = (MATERIALIZATION_REFLINK, MATERIALIZATION_HARDLINK, MATERIALIZATION_COPY)
+# Linux FICLONE ioctl: share the source extents copy-on-write (btrfs, XFS with reflink=1, bcachefs).
+FICLONE = 0x40049409
+_READ_ONLY_MASK = ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+# Errors that mean "this strategy cannot work here", as opposed to a real I/O failure.
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EMLINK,
+    errno.ENOSYS,
+}
+
+
+def configured_materialization_strategies() -> tuple[str, ...]:
+    raw = str(os.environ.get("H2OMETA_ARTIFACT_MATERIALIZATION", "") or "").strip().lower()
+    if not raw or raw == "auto":
+        return MATERIALIZATION_STRATEGIES
+    strategies = tuple(item.strip() for item in raw.split(",") if item.strip())
+    if not strategies or any(item not in MATERIALIZATION_STRATEGIES for item in strategies):
+        raise ValueError("ARTIFACT_MATERIALIZATION_STRATEGY_INVALID")
+    # Copy always works, so it is the implicit last resort.
+    return strategies if MATERIALIZATION_COPY in strategies else (*strategies, MATERIALIZATION_COPY)
+
+
+def materialize_file(source: Path, destination: Path, *, strategies: tuple[str, ...] | None = None) -> str:
+    """Place ``source``'s bytes at ``destination`` without copying them when the filesystem allows.
+
+    Tries each strategy in order and returns the one that succeeded. Hardlinked
+    files share an inode with the store, so both are made read-only.
+    """
+    target = Path(destination)
+    if target.exists() or target.is_symlink():
+        raise ValueError("ARTIFACT_RESTORE_DESTINATION_EXISTS")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    for strategy in strategies or configured_materialization_strategies():
+        if strategy == MATERIALIZATION_REFLINK and _try_reflink(Path(source), target):
+            return MATERIALIZATION_REFLINK
+        if strategy == MATERIALIZATION_HARDLINK and _try_hardlink(Path(source), target):
+            return MATERIALIZATION_HARDLINK
+        if strategy == MATERIALIZATION_COPY:
+            break
+    shutil.copyfile(source, target)
+    shutil.copymode(source, target)
+    return MATERIALIZATION_COPY
+
+
+def materialize_directory(source: Path, destination: Path, *, strategies: tuple[str, ...] | None = None) -> str:
+    """Recreate ``source`` at ``destination`` file by file; returns the weakest strategy any file needed."""
+    resolved = strategies or configured_materialization_strategies()
+    root = Path(source)
+    target = Path(destination)
+    target.mkdir(parents=True, exist_ok=False)
+    used: set[str] = set()
+    for child in sorted(root.rglob("*"), key=lambda item: item.relative_to(root).as_posix()):
+        if child.is_symlink():
+            raise ValueError(f"OUTPUT_ARTIFACT_SYMLINK_UNSUPPORTED: {child.relative_to(root).as_posix()}")
+        destination_child = target / child.relative_to(root)
+        if child.is_dir():
+            destination_child.mkdir(parents=True, exist_ok=True)
+        elif child.is_file():
+            used.add(materialize_file(child, destination_child, strategies=resolved))
+    for strategy in reversed(MATERIALIZATION_STRATEGIES):
+        if strategy in used:
+            return strategy
+    return MATERIALIZATION_COPY
+
+
+def _try_reflink(source: Path, target: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with source.open("rb") as src, target.open("xb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError as exc:
+        target.unlink(missing_ok=True)
+        if exc.errno in _UNSUPPORTED_ERRNOS:
+            return False
+        raise
+    shutil.copymode(source, target)
+    return True
+
+
+def _try_hardlink(source: Path, target: Path) -> bool:
+    try:
+        os.link(source, target)
+    except OSError as exc:
+        if exc.errno in _UNSUPPORTED_ERRNOS:
+            return False
+        raise
+    mode = stat.S_IMODE(os.stat(target).st_mode)
+    if mode & ~_READ_ONLY_MASK:
+        os.chmod(target, mode & _READ_ONLY_MASK)
+    return True
@@ -6,10 +6,6 @@ import zipfile
 from pathlib import Path
 from typing import Any
 
-from .artifact_io import (
-    assert_managed_artifact_storage,
-    iter_artifact_file_payloads,
-)
 from .artifact_product_audit import audit_artifact
 from .artifact_product_payloads import json_bytes, json_sha256, redacted_run
 from .artifact_product_lineage import (
@@ -17,6 +13,7 @@ from .artifact_product_lineage import (
     input_artifact_ro_crate_id,
     input_artifacts_from_lineage,
 )
+from .artifact_product_zip import package_artifact_root, write_artifact_to_zip, write_zip_bytes
 from .config import RemoteRunnerConfig
 from .evidence_storage import append_evidence_event, list_evidence_events
 from .execution_query_storage import fetch_result, fetch_run_events, fetch_run_results, require_run
@@ -297,7 +294,7 @@ def _result_package_manifest(
             "sizeBytes": artifact["sizeBytes"],
             "sha256": artifact["sha256"],
             "storageBackend": artifact["storageBackend"],
-            "packagePath": _package_artifact_root(artifact) if include_artifacts else None,
+            "packagePath": package_artifact_root(artifact) if include_artifacts else None,
             "includedInPackage": include_artifacts,
         }
         if not include_artifacts:
@@ -404,43 +401,21 @@ def _write_result_package(
     include_artifacts: bool,
 ) -> None:
     with zipfile.ZipFile(package_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        _write_zip_bytes(
+        write_zip_bytes(
             archive,
             "manifest.json",
             json_bytes(manifest),
         )
-        _write_zip_bytes(
+        write_zip_bytes(
             archive,
             "ro-crate-metadata.json",
             json_bytes(ro_crate_metadata),
         )
         for name, payload in sorted(metadata_files.items()):
-            _write_zip_bytes(archive, name, json_bytes(payload))
+            write_zip_bytes(archive, name, json_bytes(payload))
         if include_artifacts:
             for artifact in artifacts:
-                _write_artifact_to_zip(cfg, archive, artifact)
-
-
-def _write_artifact_to_zip(
-    cfg: RemoteRunnerConfig,
-    archive: zipfile.ZipFile,
-    artifact: dict[str, Any],
-) -> None:
-    assert_managed_artifact_storage(cfg, artifact)
-    root = _package_artifact_root(artifact)
-    for relative_path, payload in iter_artifact_file_payloads(cfg, artifact):
-        _write_zip_bytes(archive, f"{root}/{relative_path}", payload)
-
-
-def _write_zip_bytes(archive: zipfile.ZipFile, name: str, payload: bytes) -> None:
-    info = zipfile.ZipInfo(name)
-    info.date_time = (1980, 1, 1, 0, 0, 0)
-    info.compress_type = zipfile.ZIP_DEFLATED
-    archive.writestr(info, payload)
-
-
-def _package_artifact_root(artifact: dict[str, Any]) -> str:
-    return f"artifacts/{artifact['artifactId']}"
+                write_artifact_to_zip(cfg, archive, artifact)
 
 
 def _package_filename(result_id: str, artifact_payload_mode: str) -> str:
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+import zipfile
+
+from .artifact_io import assert_managed_artifact_storage, iter_artifact_file_streams
+from .config import RemoteRunnerConfig
+
+
+def write_artifact_to_zip(cfg: RemoteRunnerConfig, archive: zipfile.ZipFile, artifact: dict[str, Any]) -> None:
+    assert_managed_artifact_storage(cfg, artifact)
+    root = package_artifact_root(artifact)
+    for relative_path, size_bytes, chunks in iter_artifact_file_streams(cfg, artifact):
+        write_zip_chunks(archive, f"{root}/{relative_path}", size_bytes, chunks)
+
+
+def write_zip_bytes(archive: zipfile.ZipFile, name: str, payload: bytes) -> None:
+    archive.writestr(_zip_info(name), payload)
+
+
+def write_zip_chunks(archive: zipfile.ZipFile, name: str, size_bytes: int, chunks: Iterable[bytes]) -> None:
+    info = _zip_info(name)
+    # A known size lets zipfile pick ZIP64 up front, exactly as writestr does.
+    info.file_size = size_bytes
+    with archive.open(info, "w") as handle:
+        for chunk in chunks:
+            handle.write(chunk)
+
+
+def package_artifact_root(artifact: dict[str, Any]) -> str:
+    return f"artifacts/{artifact['artifactId']}"
+
+
+def _zip_info(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name)
+    info.date_time = (1980, 1, 1, 0, 0, 0)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import base64
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+
+MIB = 1024 * 1024
+DEFAULT_PART_SIZE_BYTES = 16 * MIB
+# S3 rejects non-final parts below 5 MiB and uploads above 10,000 parts.
+MIN_CONFIGURED_PART_SIZE_MB = 5
+MAX_UPLOAD_PARTS = 10_000
+DEFAULT_CONCURRENCY = 4
+MAX_CONCURRENCY = 32
+DEFAULT_CHUNK_BYTES = MIB
+_MULTIPART_METHODS = ("_create_multipart_upload", "_upload_part", "_complete_multipart_upload", "_list_parts")
+
+
+@dataclass(frozen=True)
+class S3TransferSettings:
+    part_size_bytes: int = DEFAULT_PART_SIZE_BYTES
+    concurrency: int = DEFAULT_CONCURRENCY
+
+    def __post_init__(self) -> None:
+        if self.part_size_bytes < 1:
+            raise ValueError("ARTIFACT_S3_PART_SIZE_INVALID")
+        if not 1 <= self.concurrency <= MAX_CONCURRENCY:
+            raise ValueError("ARTIFACT_S3_CONCURRENCY_INVALID")
+
+    def upload_part_size(self, size_bytes: int) -> int:
+        return max(self.part_size_bytes, -(-int(size_bytes) // MAX_UPLOAD_PARTS))
+
+
+@dataclass(frozen=True)
+class _PartPlan:
+    number: int
+    offset: int
+    length: int
+
+
+def supports_multipart_transfers(client: Any) -> bool:
+    return all(callable(getattr(client, name, None)) for name in _MULTIPART_METHODS)
+
+
+def configured_s3_transfer_settings() -> S3TransferSettings:
+    part_size_mb = _env_int("H2OMETA_ARTIFACT_S3_PART_SIZE_MB", DEFAULT_PART_SIZE_BYTES // MIB, "ARTIFACT_S3_PART_SIZE_INVALID")
+    if part_size_mb < MIN_CONFIGURED_PART_SIZE_MB:
+        raise ValueError("ARTIFACT_S3_PART_SIZE_INVALID")
+    concurrency = _env_int("H2OMETA_ARTIFACT_S3_CONCURRENCY", DEFAULT_CONCURRENCY, "ARTIFACT_S3_CONCURRENCY_INVALID")
+    return S3TransferSettings(part_size_bytes=part_size_mb * MIB, concurrency=concurrency)
+
+
+def upload_file_multipart(
+    client: Any,
+    bucket: str,
+    object_name: str,
+    path: Path,
+    *,
+    content_type: str,
+    metadata: dict[str, str],
+    settings: S3TransferSettings | None = None,
+) -> dict[str, Any]:
+    """Upload ``path`` in parallel parts, resuming an unfinished upload of the same key.
+
+    Every part carries a ``Content-MD5`` header so the store rejects corrupted
+    bodies, and the returned ETag is checked against the local digest. Parts an
+    earlier attempt already stored are kept when their ETag and size still
+    match the local bytes. A failed upload is left open so the next attempt can
+    resume it; a bucket lifecycle rule should expire abandoned uploads.
+    """
+    resolved = settings or configured_s3_transfer_settings()
+    source = Path(path)
+    size_bytes = source.stat().st_size
+    part_size = resolved.upload_part_size(size_bytes)
+    plans = [
+        _PartPlan(number=index + 1, offset=offset, length=min(part_size, size_bytes - offset))
+        for index, offset in enumerate(range(0, max(size_bytes, 1), part_size))
+    ]
+    try:
+        upload_id = _find_resumable_upload(client, bucket, object_name)
+        stored = _list_uploaded_parts(client, bucket, object_name, upload_id) if upload_id else {}
+        if upload_id is None:
+            upload_id = client._create_multipart_upload(
+                bucket,
+                object_name,
+                {"Content-Type": content_type, **metadata},
+            )
+    except Exception as exc:
+        raise ValueError(f"ARTIFACT_S3_UPLOAD_FAILED: {exc.__class__.__name__}") from exc
+
+    def upload(plan: _PartPlan) -> tuple[int, str, bool]:
+        payload = _read_part(source, plan)
+        md5_hex = hashlib.md5(payload, usedforsecurity=False).hexdigest()
+        previous = stored.get(plan.number)
+        if previous is not None and previous == (md5_hex, plan.length):
+            return plan.number, md5_hex, True
+        headers = {"Content-MD5": base64.b64encode(bytes.fromhex(md5_hex)).decode("ascii")}
+        etag = client._upload_part(bucket, object_name, payload, headers, upload_id, plan.number)
+        if _normalized_etag(etag) != md5_hex:
+            raise ValueError(f"ARTIFACT_S3_PART_CHECKSUM_MISMATCH: part {plan.number}")
+        return plan.number, md5_hex, False
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(resolved.concurrency, len(plans))) as pool:
+            results = list(pool.map(upload, plans))
+    except ValueError:
+        raise
+    except Exception as exc:
+        raise ValueError(f"ARTIFACT_S3_UPLOAD_FAILED: {exc.__class__.__name__}") from exc
+
+    from minio.datatypes import Part
+
+    try:
+        client._complete_multipart_upload(
+            bucket,
+            object_name,
+            upload_id,
+            [Part(number, etag) for number, etag, _ in sorted(results)],
+        )
+    except Exception as exc:
+        raise ValueError(f"ARTIFACT_S3_UPLOAD_FAILED: {exc.__class__.__name__}") from exc
+    resumed = [plan for plan, (_, _, skipped) in zip(plans, results) if skipped]
+    return {
+        "uploadId": upload_id,
+        "parts": len(plans),
+        "partSizeBytes": part_size,
+        "resumedParts": len(resumed),
+        "uploadedBytes": size_bytes - sum(plan.length for plan in resumed),
+    }
+
+
+def iter_s3_object_ranges(
+    client: Any,
+    bucket: str,
+    object_name: str,
+    *,
+    size_bytes: int,
+    settings: S3TransferSettings | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+):
+    """Yield an object's bytes in order from ranged GETs, prefetching up to ``concurrency`` ranges.
+
+    At most ``concurrency`` part-sized ranges are held in memory at once.
+    """
+    resolved = settings or configured_s3_transfer_settings()
+    ranges = [
+        (offset, min(resolved.part_size_bytes, size_bytes - offset))
+        for offset in range(0, size_bytes, resolved.part_size_bytes)
+    ]
+    pool = ThreadPoolExecutor(max_workers=min(resolved.concurrency, max(len(ranges), 1)))
+    pending: deque[Future[bytes]] = deque()
+    queued = iter(ranges)
+    try:
+        for offset, length in queued:
+            pending.append(pool.submit(read_s3_object_range, client, bucket, object_name, offset, length))
+            if len(pending) >= resolved.concurrency:
+                break
+        while pending:
+            payload = pending.popleft().result()
+            following = next(queued, None)
+            if following is not None:
+                pending.append(pool.submit(read_s3_object_range, client, bucket, object_name, *following))
+            view = memoryview(payload)
+            for start in range(0, len(payload), chunk_bytes):
+                yield bytes(view[start : start + chunk_bytes])
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def read_s3_object_range(client: Any, bucket: str, object_name: str, offset: int, length: int) -> bytes:
+    try:
+        response = client.get_object(bucket, object_name, offset=offset, length=length)
+    except Exception as exc:
+        raise ValueError(f"ARTIFACT_S3_READ_FAILED: {exc.__class__.__name__}") from exc
+    try:
+        payload = response.read(length)
+    finally:
+        for name in ("close", "release_conn"):
+            release = getattr(response, name, None)
+            if callable(release):
+                release()
+    if len(payload) != length:
+        raise ValueError("ARTIFACT_S3_RANGE_SHORT_READ")
+    return payload
+
+
+def _find_resumable_upload(client: Any, bucket: str, object_name: str) -> str | None:
+    list_uploads = getattr(client, "_list_multipart_uploads", None)
+    if not callable(list_uploads):
+        return None
+    result = list_uploads(bucket, prefix=object_name)
+    candidates = [upload for upload in result.uploads if upload.object_name == object_name and upload.upload_id]
+    if not candidates:
+        return None
+    latest = max(candidates, key=lambda upload: str(getattr(upload, "initiated_time", "") or ""))
+    return str(latest.upload_id)
+
+
+def _list_uploaded_parts(client: Any, bucket: str, object_name: str, upload_id: str) -> dict[int, tuple[str, int]]:
+    parts: dict[int, tuple[str, int]] = {}
+    marker: str | None = None
+    while True:
+        result = client._list_parts(bucket, object_name, upload_id, part_number_marker=marker)
+        for part in result.parts:
+            parts[int(part.part_number)] = (_normalized_etag(part.etag), int(part.size or 0))
+        if not result.is_truncated or not result.next_part_number_marker:
+            return parts
+        marker = str(result.next_part_number_marker)
+
+
+def _read_part(path: Path, plan: _PartPlan) -> bytes:
+    with path.open("rb") as handle:
+        handle.seek(plan.offset)
+        payload = handle.read(plan.length)
+    if len(payload) != plan.length:
+        raise ValueError("ARTIFACT_S3_SOURCE_CHANGED")
+    return payload
+
+
+def _normalized_etag(etag: Any) -> str:
+    return str(etag or "").strip().strip('"').lower()
+
+
+def _env_int(name: str, default: int, code: str) -> int:
+    raw = str(os.environ.get(name, "") or "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise ValueError(code) from exc
@@ -87,6 +87,10 @@ class RemoteRunnerConfig:
     run_worker_attempt_memory_mb: int = 0
     run_worker_attempt_disk_mb: int = 0
     run_worker_attempt_gpu: int = 0
+    sqlite_pool_max_idle_connections: int = 8
+    process_output_buffer_bytes: int = 1024 * 1024
+    process_output_tail_bytes: int = 64 * 1024
+    log_segment_max_bytes: int = 8 * 1024 * 1024
     artifact_storage_backend: str = "local"
     artifact_s3_endpoint: str = ""
     artifact_s3_bucket: str = ""
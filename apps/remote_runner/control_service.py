@@ -52,6 +52,7 @@ from .health_service import (
     build_health_ready_payload,
     build_health_startup_payload,
 )
+from .metrics_exposition import render_prometheus_metrics
 from .pipeline import get_pipeline, list_pipelines
 from .result_preview_service import build_result_preview_data
 from .result_package_byte_gc_run_service import run_result_package_byte_gc
@@ -72,6 +73,7 @@ from .route_utils import authorized_config, data_response, remote_runner_princip
 from .execution_attempt_read_model import fetch_run_attempts_read_model
 from .trigger_provenance_read_model import attach_run_trigger_provenance
 from .run_worker_storage import build_run_worker_health
+from .execution_query_storage import next_run_page_cursor
 from .storage import (
     fetch_log_lines,
     fetch_run_events,
@@ -165,6 +167,11 @@ async def execution_diagnostics_from_request(authorization: str | None) -> dict[
     return data_response(diagnostics)
 
 
+async def prometheus_metrics_from_request(authorization: str | None) -> str:
+    cfg = await _authorized_config_from_request(authorization)
+    return await run_sync(render_prometheus_metrics, cfg)
+
+
 async def list_pipelines_from_request(authorization: str | None) -> dict[str, Any]:
     cfg = await _authorized_config_from_request(authorization)
     pipelines = await run_sync(list_pipelines, cfg)
@@ -396,10 +403,10 @@ async def get_workflow_backfill_launch_request(
     return await run_sync(get_governed_workflow_backfill_launch, cfg, launch_id)
 
 
-async def list_runs_from_request(authorization: str | None) -> dict[str, Any]:
+async def list_runs_from_request(authorization: str | None, **query: Any) -> dict[str, Any]:
     cfg = await _authorized_config_from_request(authorization)
-    runs = await run_sync(list_runs, cfg)
-    return data_response({"items": runs})
+    runs = await run_sync(list_runs, cfg, **query)
+    return data_response({"items": runs, "nextCursor": next_run_page_cursor(runs, query.get("limit"))})
 
 
 async def get_run_from_request(run_id: str, authorization: str | None) -> dict[str, Any]:
@@ -505,10 +512,10 @@ async def get_run_rules_from_request(run_id: str, authorization: str | None) ->
     return data_response(rules)
 
 
-async def list_results_from_request(authorization: str | None) -> dict[str, Any]:
+async def list_results_from_request(authorization: str | None, **query: Any) -> dict[str, Any]:
     cfg = await _authorized_config_from_request(authorization, action="result.list")
-    results = await run_sync(governed_list_results, cfg)
-    return data_response({"items": results})
+    results = await run_sync(governed_list_results, cfg, **query)
+    return data_response(results)
 
 
 async def get_result_from_request(result_id: str, authorization: str | None) -> dict[str, Any]:
@@ -31,7 +31,7 @@ def log_admission_wait(
             "workerId": worker_id,
             "sessionId": session_id,
             "slotId": slot_id,
-            "resourceRequest": _resource_request_to_dict(request),
+            "resourceRequest": resource_request_to_dict(request),
         },
     )
 
@@ -46,13 +46,14 @@ def log_claim_accepted(
     session_id: str,
     slot_id: str,
     request: ResourceRequest,
+    reason_code: str = "",
 ) -> None:
     LOGGER.info(
         "run job claimed",
         extra={
             "event": "execution.claim.accepted",
             "decision": "claim",
-            "reasonCode": "",
+            "reasonCode": reason_code,
             "runId": job["run_id"],
             "jobId": job["job_id"],
             "attemptId": attempt_id,
@@ -61,12 +62,12 @@ def log_claim_accepted(
             "workerId": worker_id,
             "sessionId": session_id,
             "slotId": slot_id,
-            "resourceRequest": _resource_request_to_dict(request),
+            "resourceRequest": resource_request_to_dict(request),
         },
     )
 
 
-def _resource_request_to_dict(request: ResourceRequest) -> dict[str, int]:
+def resource_request_to_dict(request: ResourceRequest) -> dict[str, int]:
     return {
         "cpu": int(request.cpu),
         "memoryMb": int(request.memory_mb),
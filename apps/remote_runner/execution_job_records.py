@@ -18,6 +18,7 @@ def run_job_row_to_dict(row: Any) -> dict[str, Any]:
         "retryPolicy": json_object(row["retry_policy_json"]),
         "timeoutPolicy": json_object(row["timeout_policy_json"]),
         "executionOptions": json_object(row["execution_options_json"]),
+        "resourcePolicy": json_object(row["resource_request_json"]),
         "deadLetteredAt": row["dead_lettered_at"],
         "createdAt": row["created_at"],
         "updatedAt": row["updated_at"],
@@ -300,6 +300,17 @@ def record_run_logs_read_audit(
     )
 
 
+def record_run_update_stream_audit(cfg: RemoteRunnerConfig, run_id: str, *, resumed: bool) -> None:
+    record_governance_audit_event(
+        cfg,
+        action="run.updates.stream",
+        actor=_actor(cfg),
+        subject_kind="run_update_stream",
+        subject_id=run_id,
+        details={"resumed": bool(resumed)},
+    )
+
+
 def record_run_rules_read_audit(cfg: RemoteRunnerConfig, run_id: str, rules: dict[str, Any]) -> None:
     items = _list_value(rules.get("items"))
     statuses = Counter(str(item.get("status") or "unknown") for item in items if isinstance(item, dict))
@@ -4,7 +4,7 @@ import json
 from pathlib import Path
 from typing import Any
 
-from .artifact_io import artifact_payload_stats
+from .artifact_io import verified_payload_stats
 from .config import RemoteRunnerConfig
 from .storage_core import get_connection
 
@@ -19,6 +19,7 @@ def build_attempt_output_audit(
     attempts: list[dict[str, Any]],
     managed_work_dir: str | Path,
     managed_results_dir: str | Path,
+    cfg: RemoteRunnerConfig | None = None,
 ) -> dict[str, Any]:
     latest = _latest_attempt_raw(attempts)
     base = {
@@ -64,7 +65,9 @@ def build_attempt_output_audit(
         work_dir=work_dir,
         managed_result_root=managed_result_root,
     )
-    audited = [_audit_output(name, value, work_dir=work_dir, safe_roots=safe_roots) for name, value in outputs.items()]
+    audited = [
+        _audit_output(name, value, work_dir=work_dir, safe_roots=safe_roots, cfg=cfg) for name, value in outputs.items()
+    ]
     existing_count = sum(1 for item in audited if item["state"] == "present")
     missing_count = sum(1 for item in audited if item["state"] == "missing")
     verified_count = sum(1 for item in audited if item.get("verificationState") == "verified")
@@ -173,6 +176,7 @@ def build_rule_retry_output_audit(
             safe_roots=safe_roots,
             candidates=candidates,
             active_edges=active_edges,
+            cfg=cfg,
         )
         for item in _rule_retry_outputs(cache_restore_plan)
     ]
@@ -296,6 +300,7 @@ def _audit_output(
     *,
     work_dir: Path,
     safe_roots: list[Path],
+    cfg: RemoteRunnerConfig | None = None,
 ) -> dict[str, Any]:
     key = str(name or "").strip()
     if not isinstance(value, str):
@@ -328,7 +333,7 @@ def _audit_output(
             "reasonCode": "OUTPUT_MISSING_RERUN_REQUIRED",
         }
     try:
-        size_bytes, _sha256 = artifact_payload_stats(resolved)
+        size_bytes, _sha256 = verified_payload_stats(cfg, resolved)
     except (OSError, ValueError):
         return _unchecked(key, "OUTPUT_PAYLOAD_CHECKSUM_UNAVAILABLE")
     return {
@@ -352,6 +357,7 @@ def _audit_rule_retry_output(
     safe_roots: list[Path],
     candidates: dict[str, dict[str, Any]],
     active_edges: dict[str, list[dict[str, Any]]],
+    cfg: RemoteRunnerConfig | None = None,
 ) -> dict[str, Any]:
     output = _dict_value(item.get("output"))
     artifact_key = str(output.get("artifactKey") or "").strip()
@@ -371,7 +377,7 @@ def _audit_rule_retry_output(
             "verificationState": "unverified",
             "reasonCode": "RULE_OUTPUT_AUDIT_SCOPE_MISMATCH",
         }
-    path_audit = _audit_output(artifact_key, str(expected_path), work_dir=work_dir, safe_roots=safe_roots)
+    path_audit = _audit_output(artifact_key, str(expected_path), work_dir=work_dir, safe_roots=safe_roots, cfg=cfg)
     if path_audit["state"] in {"unsafe", "unchecked"}:
         return {
             **base,
@@ -381,7 +387,7 @@ def _audit_rule_retry_output(
         }
     candidate = candidates.get(artifact_key)
     if candidate is not None:
-        candidate_check = _candidate_verification(candidate, expected_path=expected_path)
+        candidate_check = _candidate_verification(candidate, expected_path=expected_path, cfg=cfg)
         if candidate_check:
             return {
                 **base,
@@ -543,14 +549,19 @@ def _expected_rule_output_path(
     return result_candidate if result_dir in result_candidate.parents or result_candidate == result_dir else work_candidate
 
 
-def _candidate_verification(candidate: dict[str, Any], *, expected_path: Path) -> str:
+def _candidate_verification(
+    candidate: dict[str, Any],
+    *,
+    expected_path: Path,
+    cfg: RemoteRunnerConfig | None = None,
+) -> str:
     candidate_path = _path_from(candidate.get("path"))
     if candidate_path is None:
         return "RULE_OUTPUT_AUDIT_CANDIDATE_PATH_MISSING"
     if candidate_path.resolve(strict=False) != expected_path.resolve(strict=False):
         return "RULE_OUTPUT_AUDIT_CANDIDATE_MISMATCH"
     try:
-        size_bytes, sha256 = artifact_payload_stats(expected_path)
+        size_bytes, sha256 = verified_payload_stats(cfg, expected_path)
     except (OSError, ValueError):
         return "RULE_OUTPUT_AUDIT_CANDIDATE_CHECKSUM_UNAVAILABLE"
     if _safe_int(candidate.get("size_bytes")) != int(size_bytes):
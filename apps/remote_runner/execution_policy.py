@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 import json
 from typing import Any
 
+from .resource_pool import ResourceRequest
 
 DEFAULT_MAX_ATTEMPTS = 3
 DEFAULT_RETRY_BACKOFF_SECONDS = 5
@@ -14,6 +15,13 @@ DEFAULT_START_TO_CLOSE_TIMEOUT_SECONDS = 0
 
 RETRY_POLICY_SCHEMA_VERSION = "execution-retry-policy.v1"
 TIMEOUT_POLICY_SCHEMA_VERSION = "execution-timeout-policy.v1"
+RESOURCE_POLICY_SCHEMA_VERSION = "execution-resource-policy.v1"
+_RESOURCE_POLICY_FIELDS = (
+    ("cpu", "cpu", "EXECUTION_RESOURCE_CPU_INVALID"),
+    ("memoryMb", "memory_mb", "EXECUTION_RESOURCE_MEMORY_INVALID"),
+    ("diskMb", "disk_mb", "EXECUTION_RESOURCE_DISK_INVALID"),
+    ("gpu", "gpu", "EXECUTION_RESOURCE_GPU_INVALID"),
+)
 
 
 @dataclass(frozen=True)
@@ -44,11 +52,38 @@ class TimeoutPolicy:
         }
 
 
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """Per-run resource overrides; unset fields fall back to the worker's attempt request."""
+
+    cpu: int | None = None
+    memory_mb: int | None = None
+    disk_mb: int | None = None
+    gpu: int | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {"schemaVersion": RESOURCE_POLICY_SCHEMA_VERSION}
+        for key, attribute, _code in _RESOURCE_POLICY_FIELDS:
+            value = getattr(self, attribute)
+            if value is not None:
+                payload[key] = value
+        return payload
+
+    def request(self, default: ResourceRequest) -> ResourceRequest:
+        return ResourceRequest(
+            cpu=default.cpu if self.cpu is None else self.cpu,
+            memory_mb=default.memory_mb if self.memory_mb is None else self.memory_mb,
+            disk_mb=default.disk_mb if self.disk_mb is None else self.disk_mb,
+            gpu=default.gpu if self.gpu is None else self.gpu,
+        )
+
+
 @dataclass(frozen=True)
 class ExecutionPolicy:
     queue_name: str
     retry: RetryPolicy
     timeout: TimeoutPolicy
+    resources: ResourcePolicy = ResourcePolicy()
 
 
 def execution_policy_from_run_spec(run_spec: dict[str, Any]) -> ExecutionPolicy:
@@ -95,7 +130,10 @@ def execution_policy_from_run_spec(run_spec: dict[str, Any]) -> ExecutionPolicy:
             code="EXECUTION_HEARTBEAT_TIMEOUT_INVALID",
         ),
     )
-    return ExecutionPolicy(queue_name=queue_name, retry=retry, timeout=timeout)
+    resources = _resource_policy(
+        _object(execution.get("resources"), "EXECUTION_RESOURCE_POLICY_INVALID"),
+    )
+    return ExecutionPolicy(queue_name=queue_name, retry=retry, timeout=timeout, resources=resources)
 
 
 def retry_policy_from_job(row: Any, *, fallback_backoff_seconds: int = DEFAULT_RETRY_BACKOFF_SECONDS) -> RetryPolicy:
@@ -135,6 +173,14 @@ def timeout_policy_from_job(row: Any) -> TimeoutPolicy:
     )
 
 
+def resource_policy_from_job(row: Any) -> ResourcePolicy:
+    return _resource_policy(_json_object(row["resource_request_json"]))
+
+
+def resource_request_for_job(row: Any, *, default: ResourceRequest) -> ResourceRequest:
+    return resource_policy_from_job(row).request(default)
+
+
 def heartbeat_timeout_seconds_for_job(row: Any, *, fallback_seconds: int) -> int:
     timeout = timeout_policy_from_job(row)
     if timeout.heartbeat_timeout_seconds > 0:
@@ -167,6 +213,18 @@ def attempt_start_to_close_exceeded(row: Any, *, now: str) -> bool:
     return _parse_utc(now) >= started_at + timedelta(seconds=timeout.start_to_close_timeout_seconds)
 
 
+def _resource_policy(raw: dict[str, Any]) -> ResourcePolicy:
+    values: dict[str, int | None] = {}
+    for key, attribute, code in _RESOURCE_POLICY_FIELDS:
+        if raw.get(key) in (None, ""):
+            values[attribute] = None
+        elif attribute == "cpu":
+            values[attribute] = _positive_int(raw.get(key), default=1, code=code)
+        else:
+            values[attribute] = _non_negative_int(raw.get(key), default=0, code=code)
+    return ResourcePolicy(**values)
+
+
 def _object(value: Any, code: str) -> dict[str, Any]:
     if value in (None, ""):
         return {}
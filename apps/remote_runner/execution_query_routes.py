@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Literal
 
 from fastapi import APIRouter, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from core.contracts.artifact_lifecycle_remote_endpoints import (
     ARTIFACT_LIFECYCLE_POLICY_READ,
@@ -49,6 +49,7 @@ from core.contracts.remote_endpoints import (
     RUN_RULE_OUTPUT_INVALIDATION_APPLY,
     RUN_RULE_RETRY,
     RUN_RULES_READ,
+    RUN_UPDATES_STREAM,
     remote_endpoint_success_status,
 )
 from core.contracts.result_package_remote_endpoints import (
@@ -124,6 +125,7 @@ from .artifact_lifecycle_policy_route_service import (
 )
 from .artifact_lifecycle_controller_read_api import list_artifact_lifecycle_controller_ticks_from_request
 from .run_failure_locator_read_api import get_run_failure_locator_from_request
+from .run_update_stream_api import open_run_update_stream_from_request
 from .run_reexecution_service import (
     apply_rule_cache_restore_pins_from_request,
     apply_rule_cache_restore_staged_files_from_request,
@@ -141,15 +143,31 @@ from .rule_cache_restore_adoption_service import (
     apply_rule_cache_restore_adoption_from_request,
     prepare_rule_cache_restore_adoption_from_request,
 )
-from .route_headers import AuthorizationHeader
+from .route_headers import AuthorizationHeader, LastEventIdHeader
 
 
 router = APIRouter()
 
 
 @router.get("/api/v1/runs", operation_id=REMOTE_ENDPOINTS[RUN_LIST].operation_id)
-async def get_runs(authorization: AuthorizationHeader = None) -> dict[str, Any]:
-    return await list_runs_from_request(authorization)
+async def get_runs(
+    limit: int | None = None,
+    cursor: str | None = None,
+    status: str | None = None,
+    pipelineId: str | None = None,
+    submittedAfter: str | None = None,
+    submittedBefore: str | None = None,
+    authorization: AuthorizationHeader = None,
+) -> dict[str, Any]:
+    return await list_runs_from_request(
+        authorization,
+        limit=limit,
+        cursor=cursor,
+        status=status,
+        pipeline_id=pipelineId,
+        submitted_after=submittedAfter,
+        submitted_before=submittedBefore,
+    )
 
 
 @router.get("/api/v1/runs/{run_id}", operation_id=REMOTE_ENDPOINTS[RUN_READ].operation_id)
@@ -340,6 +358,24 @@ async def get_run_logs_api(
     return await get_run_logs_from_request(run_id, stream, cursor, authorization)
 
 
+@router.get("/api/v1/runs/{run_id}/stream", operation_id=REMOTE_ENDPOINTS[RUN_UPDATES_STREAM].operation_id)
+async def stream_run_updates_api(
+    run_id: str,
+    stdoutCursor: str | None = None,
+    stderrCursor: str | None = None,
+    authorization: AuthorizationHeader = None,
+    last_event_id: LastEventIdHeader = None,
+) -> StreamingResponse:
+    stream = await open_run_update_stream_from_request(
+        run_id,
+        authorization,
+        last_event_id=last_event_id,
+        stdout_cursor=stdoutCursor,
+        stderr_cursor=stderrCursor,
+    )
+    return StreamingResponse(stream["body"], media_type=stream["mediaType"], headers=stream["headers"])
+
+
 @router.get("/api/v1/runs/{run_id}/results", operation_id=REMOTE_ENDPOINTS[RUN_RESULTS_READ].operation_id)
 async def get_run_results_api(run_id: str, authorization: AuthorizationHeader = None) -> dict[str, Any]:
     return await get_run_results_from_request(run_id, authorization)
@@ -359,8 +395,24 @@ async def get_run_failure_locator_api(run_id: str, authorization: AuthorizationH
 
 
 @router.get("/api/v1/results", operation_id=REMOTE_ENDPOINTS[RESULT_LIST].operation_id)
-async def list_results_api(authorization: AuthorizationHeader = None) -> dict[str, Any]:
-    return await list_results_from_request(authorization)
+async def list_results_api(
+    limit: int | None = None,
+    cursor: str | None = None,
+    status: Literal["completed", "failed"] | None = None,
+    pipelineId: str | None = None,
+    producedAfter: str | None = None,
+    producedBefore: str | None = None,
+    authorization: AuthorizationHeader = None,
+) -> dict[str, Any]:
+    return await list_results_from_request(
+        authorization,
+        limit=limit,
+        cursor=cursor,
+        status=status,
+        pipeline_id=pipelineId,
+        produced_after=producedAfter,
+        produced_before=producedBefore,
+    )
 
 
 @router.get("/api/v1/results/{result_id}", operation_id=REMOTE_ENDPOINTS[RESULT_READ].operation_id)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import base64
 import json
+import sqlite3
 from typing import Any
 
 from .artifact_output_labels import safe_artifact_output_label
@@ -8,45 +10,16 @@ from .config import RemoteRunnerConfig
 from .errors import RemoteRunnerNotFoundError
 from .storage_core import get_connection
 
+MAX_LISTING_PAGE_LIMIT = 500
+LISTING_BATCH_SIZE = 500
+
 
 def fetch_run(cfg: RemoteRunnerConfig, run_id: str) -> dict[str, Any] | None:
     with get_connection(cfg) as connection:
         row = connection.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
     if row is None:
         return None
-    last_error = json.loads(row["last_error_json"]) if row["last_error_json"] else None
-    return {
-        "runId": row["run_id"],
-        "serverId": row["server_id"],
-        "projectId": row["project_id"],
-        "pipelineId": row["pipeline_id"],
-        "pipelineVersion": row["pipeline_version"],
-        "runSpecVersion": row["run_spec_version"],
-        "workflowRevisionId": row["workflow_revision_id"],
-        "status": row["status"],
-        "stage": row["stage"],
-        "stateVersion": row["state_version"],
-        "message": row["message"],
-        "startedAt": row["started_at"],
-        "finishedAt": row["finished_at"],
-        "resultDir": row["result_dir"],
-        "lastError": last_error,
-        "lastUpdatedAt": row["last_updated_at"],
-        "requestId": row["request_id"],
-        "submittedAt": row["submitted_at"],
-        "trigger": (
-            {
-                "triggerId": row["trigger_id"],
-                "triggerEventId": row["trigger_event_id"],
-                "source": row["trigger_source"],
-                "cursor": row["trigger_cursor"],
-            }
-            if row["trigger_id"] or row["trigger_event_id"] or row["trigger_source"] or row["trigger_cursor"]
-            else None
-        ),
-        "resumeSupported": False,
-        "runSpec": json.loads(row["run_spec_json"]),
-    }
+    return _run_row_to_dict(row)
 
 
 def require_run(cfg: RemoteRunnerConfig, run_id: str) -> dict[str, Any]:
@@ -56,10 +29,34 @@ def require_run(cfg: RemoteRunnerConfig, run_id: str) -> dict[str, Any]:
     return run
 
 
-def list_runs(cfg: RemoteRunnerConfig) -> list[dict[str, Any]]:
+def list_runs(
+    cfg: RemoteRunnerConfig,
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
+    status: str | None = None,
+    pipeline_id: str | None = None,
+    submitted_after: str | None = None,
+    submitted_before: str | None = None,
+) -> list[dict[str, Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    _append_filter(clauses, params, "status = ?", status)
+    _append_filter(clauses, params, "pipeline_id = ?", pipeline_id)
+    _append_filter(clauses, params, "submitted_at >= ?", submitted_after)
+    _append_filter(clauses, params, "submitted_at < ?", submitted_before)
+    _append_keyset(clauses, params, "submitted_at", cursor)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
     with get_connection(cfg) as connection:
-        rows = connection.execute("SELECT run_id FROM runs ORDER BY submitted_at DESC").fetchall()
-    return [fetch_run(cfg, row["run_id"]) for row in rows if fetch_run(cfg, row["run_id"]) is not None]
+        rows = connection.execute(
+            f"SELECT * FROM runs {where} ORDER BY submitted_at DESC, run_id DESC {_limit_clause(limit, params)}",
+            params,
+        ).fetchall()
+    return [_run_row_to_dict(row) for row in rows]
+
+
+def next_run_page_cursor(items: list[dict[str, Any]], limit: int | None) -> str | None:
+    return _next_page_cursor(items, limit, sort_field="submittedAt")
 
 
 def fetch_run_events(cfg: RemoteRunnerConfig, run_id: str) -> list[dict[str, Any]]:
@@ -142,35 +139,64 @@ def fetch_run_results(cfg: RemoteRunnerConfig, run_id: str) -> dict[str, Any]:
     }
 
 
-def list_results(cfg: RemoteRunnerConfig) -> list[dict[str, Any]]:
+def list_results(
+    cfg: RemoteRunnerConfig,
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
+    status: str | None = None,
+    pipeline_id: str | None = None,
+    produced_after: str | None = None,
+    produced_before: str | None = None,
+) -> list[dict[str, Any]]:
+    from .artifact_ledger_storage import list_lineage_edges_for_runs
+    from .artifact_product_lineage import input_artifacts_from_lineage
+
+    produced_at = "COALESCE(finished_at, last_updated_at)"
+    clauses = ["status IN ('completed', 'failed')"]
+    params: list[Any] = []
+    _append_filter(clauses, params, "status = ?", status)
+    _append_filter(clauses, params, "pipeline_id = ?", pipeline_id)
+    _append_filter(clauses, params, f"{produced_at} >= ?", produced_after)
+    _append_filter(clauses, params, f"{produced_at} < ?", produced_before)
+    _append_keyset(clauses, params, produced_at, cursor)
     with get_connection(cfg) as connection:
         rows = connection.execute(
-            """
-            SELECT run_id, pipeline_id, finished_at, last_updated_at
+            f"""
+            SELECT run_id, pipeline_id, {produced_at} AS produced_at
             FROM runs
-            WHERE status IN ('completed', 'failed')
-            ORDER BY COALESCE(finished_at, last_updated_at) DESC
-            """
+            WHERE {' AND '.join(clauses)}
+            ORDER BY {produced_at} DESC, run_id DESC
+            {_limit_clause(limit, params)}
+            """,
+            params,
         ).fetchall()
+        run_ids = [str(row["run_id"]) for row in rows]
+        artifact_counts = _artifact_counts_by_run(connection, run_ids)
+        lineage_by_run = list_lineage_edges_for_runs(connection, run_ids)
     items = []
     for row in rows:
-        results = fetch_run_results(cfg, row["run_id"])
-        artifacts = results["artifacts"]
+        run_id = str(row["run_id"])
+        lineage_edges = lineage_by_run.get(run_id, [])
         items.append(
             {
-                "resultId": f"res_{row['run_id']}",
-                "runId": row["run_id"],
+                "resultId": f"res_{run_id}",
+                "runId": run_id,
                 "title": f"{row['pipeline_id']} result",
                 "pipelineId": row["pipeline_id"],
-                "artifactCount": len(artifacts),
-                "inputArtifactCount": results["inputArtifactCount"],
-                "lineageEdges": results["lineageEdges"],
-                "producedAt": row["finished_at"] or row["last_updated_at"],
+                "artifactCount": artifact_counts.get(run_id, 0),
+                "inputArtifactCount": len(input_artifacts_from_lineage(lineage_edges)),
+                "lineageEdges": lineage_edges,
+                "producedAt": row["produced_at"],
             }
         )
     return items
 
 
+def next_result_page_cursor(items: list[dict[str, Any]], limit: int | None) -> str | None:
+    return _next_page_cursor(items, limit, sort_field="producedAt")
+
+
 def fetch_result(cfg: RemoteRunnerConfig, result_id: str) -> dict[str, Any]:
     run_id = result_id.removeprefix("res_")
     run = fetch_run(cfg, run_id)
@@ -207,3 +233,102 @@ def _output_labels_by_artifact_id(lineage_edges: list[dict[str, Any]]) -> dict[s
             continue
         labels[artifact_id] = label
     return labels
+
+
+def _run_row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
+    last_error = json.loads(row["last_error_json"]) if row["last_error_json"] else None
+    return {
+        "runId": row["run_id"],
+        "serverId": row["server_id"],
+        "projectId": row["project_id"],
+        "pipelineId": row["pipeline_id"],
+        "pipelineVersion": row["pipeline_version"],
+        "runSpecVersion": row["run_spec_version"],
+        "workflowRevisionId": row["workflow_revision_id"],
+        "status": row["status"],
+        "stage": row["stage"],
+        "stateVersion": row["state_version"],
+        "message": row["message"],
+        "startedAt": row["started_at"],
+        "finishedAt": row["finished_at"],
+        "resultDir": row["result_dir"],
+        "lastError": last_error,
+        "lastUpdatedAt": row["last_updated_at"],
+        "requestId": row["request_id"],
+        "submittedAt": row["submitted_at"],
+        "trigger": (
+            {
+                "triggerId": row["trigger_id"],
+                "triggerEventId": row["trigger_event_id"],
+                "source": row["trigger_source"],
+                "cursor": row["trigger_cursor"],
+            }
+            if row["trigger_id"] or row["trigger_event_id"] or row["trigger_source"] or row["trigger_cursor"]
+            else None
+        ),
+        "resumeSupported": False,
+        "runSpec": json.loads(row["run_spec_json"]),
+    }
+
+
+def _artifact_counts_by_run(connection: sqlite3.Connection, run_ids: list[str]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for offset in range(0, len(run_ids), LISTING_BATCH_SIZE):
+        batch = run_ids[offset : offset + LISTING_BATCH_SIZE]
+        placeholders = ", ".join("?" for _ in batch)
+        rows = connection.execute(
+            f"""
+            SELECT run_id, COUNT(*) AS artifact_count
+            FROM artifacts
+            WHERE run_id IN ({placeholders})
+            GROUP BY run_id
+            """,
+            batch,
+        ).fetchall()
+        counts.update({str(row["run_id"]): int(row["artifact_count"]) for row in rows})
+    return counts
+
+
+def _append_filter(clauses: list[str], params: list[Any], clause: str, value: str | None) -> None:
+    normalized = str(value or "").strip()
+    if normalized:
+        clauses.append(clause)
+        params.append(normalized)
+
+
+def _append_keyset(clauses: list[str], params: list[Any], sort_expression: str, cursor: str | None) -> None:
+    if not str(cursor or "").strip():
+        return
+    sort_value, run_id = _decode_page_cursor(str(cursor))
+    clauses.append(f"({sort_expression} < ? OR ({sort_expression} = ? AND run_id < ?))")
+    params.extend([sort_value, sort_value, run_id])
+
+
+def _limit_clause(limit: int | None, params: list[Any]) -> str:
+    if limit is None:
+        return ""
+    normalized = int(limit)
+    if normalized < 1 or normalized > MAX_LISTING_PAGE_LIMIT:
+        raise ValueError("LISTING_LIMIT_INVALID")
+    params.append(normalized)
+    return "LIMIT ?"
+
+
+def _next_page_cursor(items: list[dict[str, Any]], limit: int | None, *, sort_field: str) -> str | None:
+    if limit is None or not items or len(items) < int(limit):
+        return None
+    last = items[-1]
+    payload = json.dumps([str(last.get(sort_field) or ""), str(last.get("runId") or "")], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_page_cursor(cursor: str) -> tuple[str, str]:
+    text = cursor.strip()
+    try:
+        decoded = base64.urlsafe_b64decode(text + "=" * (-len(text) % 4)).decode("utf-8")
+        sort_value, run_id = json.loads(decoded)
+    except (ValueError, TypeError, UnicodeDecodeError) as exc:
+        raise ValueError("LISTING_CURSOR_INVALID") from exc
+    if not isinstance(sort_value, str) or not isinstance(run_id, str) or not run_id:
+        raise ValueError("LISTING_CURSOR_INVALID")
+    return sort_value, run_id
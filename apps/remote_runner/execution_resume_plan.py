@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from .config import RemoteRunnerConfig
+
 from .execution_activation_readiness import build_run_resume_activation_readiness
 from .execution_plan_hash import attach_plan_hash
 from .execution_output_audit import build_attempt_output_audit
@@ -28,6 +30,7 @@ def build_run_resume_plan(
     active_lease: dict[str, Any] | None,
     managed_work_dir: str,
     managed_results_dir: str,
+    cfg: RemoteRunnerConfig | None = None,
 ) -> dict[str, Any]:
     base = _base_plan(
         run,
@@ -35,6 +38,7 @@ def build_run_resume_plan(
         attempts=attempts,
         managed_work_dir=managed_work_dir,
         managed_results_dir=managed_results_dir,
+        cfg=cfg,
     )
     latest_attempt = base["latestAttempt"]
     if active_lease is not None:
@@ -77,6 +81,7 @@ def _base_plan(
     attempts: list[dict[str, Any]],
     managed_work_dir: str,
     managed_results_dir: str,
+    cfg: RemoteRunnerConfig | None = None,
 ) -> dict[str, Any]:
     workdir_evidence = build_workdir_reuse_policy(
         attempts=attempts,
@@ -87,6 +92,7 @@ def _base_plan(
         attempts=attempts,
         managed_work_dir=managed_work_dir,
         managed_results_dir=managed_results_dir,
+        cfg=cfg,
     )
     return {
         "schemaVersion": RUN_RESUME_PLAN_SCHEMA_VERSION,
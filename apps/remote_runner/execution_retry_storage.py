@@ -11,6 +11,7 @@ from .execution_resume_claim_preflight import (
     validate_run_resume_claim_preflight,
 )
 from .run_execution_state_machine import RunExecutionStateMachine
+from .run_job_wakeup import notify_run_jobs_claimable
 from .execution_storage_primitives import (
     add_seconds,
     fetch_run_row,
@@ -205,6 +206,7 @@ def request_run_retry(
             command_derived=True,
         )
         connection.commit()
+        notify_run_jobs_claimable("retry_scheduled", available_at=available_at)
         result = {
             "runId": normalized_run_id,
             "status": transition.to_status,
@@ -29,6 +29,8 @@ from .rule_execution_projection import (
     seed_run_rules_from_config,
     seed_run_rules_from_graph,
 )
+from .snakemake_dry_run_cache import DryRunCacheScope
+from .snakemake_resource_plan import attempt_snakemake_resource_plan
 from .storage import append_log_lines, update_run_state
 from .workflow_resources import build_workflow_resource_config
 from .resource_pool import ResourcePool, ResourceRequest, get_default_resource_pool
@@ -69,6 +71,7 @@ def run_snakemake_execution(
             attempt_work_dir=attempt_work_dir,
             execution_options=execution_options,
             should_cancel_attempt=should_cancel_attempt,
+            resource_request=request,
         )
     finally:
         pool.release(task_id)
@@ -85,6 +88,7 @@ def _execute_snakemake_workflow(
     attempt_work_dir: str | None = None,
     execution_options: dict | None = None,
     should_cancel_attempt: Callable[[], bool] | None = None,
+    resource_request: ResourceRequest | None = None,
 ) -> None:
     result_dir = _resolve_execution_result_dir(
         cfg,
@@ -108,6 +112,7 @@ def _execute_snakemake_workflow(
     engine_stage: str | None = None
     output_schema: dict | None = None
     run_outputs: dict[str, str] | None = None
+    pipeline_execution: dict = {}
     try:
         snakemake_execution_options = _snakemake_execution_options(execution_options)
         output_adoption_scope = snakemake_execution_options.pop("output_adoption_scope")
@@ -207,6 +212,7 @@ def _execute_snakemake_workflow(
                 bindings=dict(run_spec.get("resourceBindings") or {}),
             )
             snakefile = pipeline.snakefile
+            pipeline_execution = pipeline.execution
             run_outputs = _build_run_outputs(pipeline.execution, result_dir)
             output_schema = pipeline.output_schema
             config_path.write_text(
@@ -255,6 +261,7 @@ def _execute_snakemake_workflow(
             snakefile=snakefile,
             work_dir=work_dir,
             config_path=config_path,
+            cache_scope=DryRunCacheScope(run_id=run_id, request_id=request_id, work_dir=work_dir, result_dir=result_dir),
             **snakemake_execution_options,
         )
         append_log_lines(cfg, run_id, "stdout", [line for line in dry_run.stdout.splitlines() if line])
@@ -324,6 +331,9 @@ def _execute_snakemake_workflow(
             lease_generation=lease_generation,
             attempt_number=attempt_number,
         )
+        resource_plan = attempt_snakemake_resource_plan(
+            cfg, attempt_id=attempt_id, fallback=resource_request, execution=pipeline_execution
+        )
         engine_stage = "run"
         run_result, rule_event_projection = run_snakemake_with_rule_events(
             cfg,
@@ -338,6 +348,7 @@ def _execute_snakemake_workflow(
             attempt_id=attempt_id,
             lease_generation=lease_generation,
             attempt_number=attempt_number,
+            resource_plan=resource_plan,
             **snakemake_execution_options,
         )
         if run_result.returncode != 0:
@@ -253,6 +253,7 @@ def _resolved_artifact_input(
         "sourceStorageBackend": source_materialization["storage_backend"],
         "inputStorageBackend": restored["storageBackend"],
         "inputStorageUri": restored["storageUri"],
+        "inputMaterializationMethod": restored["materializationMethod"],
         **({"upstreamRunId": upstream_run_id} if upstream_run_id else {}),
         "name": str(item.get("name") or "").strip(),
         "filename": str(item.get("filename") or filename_default or artifact_blob_id),
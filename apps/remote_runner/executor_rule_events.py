@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Any
 
 from .config import RemoteRunnerConfig
+from .log_storage import RunLogStreamWriter
+from .process_output_capture import ProcessOutputCapture
 from .snakemake_rule_event_projection import SnakemakeRuleEventProjector
 from .storage import append_log_lines
 
@@ -25,6 +27,7 @@ def run_snakemake_with_rule_events(
     forcerun_rules: list[str] | None = None,
     rerun_incomplete: bool = False,
     target_paths: list[str] | None = None,
+    resource_plan: Any = None,
 ) -> tuple[Any, dict[str, Any]]:
     projector = SnakemakeRuleEventProjector(
         cfg,
@@ -34,19 +37,33 @@ def run_snakemake_with_rule_events(
         attempt_number=attempt_number,
         event_log_path=event_log_path,
     )
-    result = engine.run(
-        snakefile=snakefile,
-        work_dir=work_dir,
-        config_path=config_path,
-        event_log_path=event_log_path,
-        forcerun_rules=forcerun_rules,
-        rerun_incomplete=rerun_incomplete,
-        target_paths=target_paths,
-        on_poll=projector.poll,
+    log_writer = RunLogStreamWriter(cfg, run_id, attempt_logs={"stdout": stdout_log, "stderr": stderr_log})
+    output_capture = ProcessOutputCapture(
+        log_writer.write,
+        max_buffered_bytes=cfg.process_output_buffer_bytes,
+        tail_bytes=cfg.process_output_tail_bytes,
     )
-    stdout_log.write_text(result.stdout or "", encoding="utf-8")
-    stderr_log.write_text(result.stderr or "", encoding="utf-8")
-    append_log_lines(cfg, run_id, "stdout", [line for line in result.stdout.splitlines() if line])
-    append_log_lines(cfg, run_id, "stderr", [line for line in result.stderr.splitlines() if line])
+    try:
+        result = engine.run(
+            snakefile=snakefile,
+            work_dir=work_dir,
+            config_path=config_path,
+            event_log_path=event_log_path,
+            forcerun_rules=forcerun_rules,
+            rerun_incomplete=rerun_incomplete,
+            target_paths=target_paths,
+            on_poll=projector.poll,
+            output_capture=output_capture,
+            resource_plan=resource_plan,
+        )
+    finally:
+        if output_capture.started:
+            log_writer.close()
+    if not output_capture.started:
+        # Engines that do not stream (injected runners, test doubles) hand back the full output at exit.
+        stdout_log.write_text(result.stdout or "", encoding="utf-8")
+        stderr_log.write_text(result.stderr or "", encoding="utf-8")
+        append_log_lines(cfg, run_id, "stdout", [line for line in result.stdout.splitlines() if line])
+        append_log_lines(cfg, run_id, "stderr", [line for line in result.stderr.splitlines() if line])
     projection = projector.finalize(workflow_succeeded=result.returncode == 0)
     return result, projection
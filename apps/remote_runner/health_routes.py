@@ -11,7 +11,9 @@ from .control_service import (
     health_startup_from_request,
     health_workers_from_request,
     execution_diagnostics_from_request,
+    prometheus_metrics_from_request,
 )
+from .metrics_exposition import PROMETHEUS_CONTENT_TYPE
 from .route_headers import AuthorizationHeader
 
 
@@ -57,6 +59,11 @@ async def health_execution_diagnostics(authorization: AuthorizationHeader = None
     return await execution_diagnostics_from_request(authorization)
 
 
+@router.get("/metrics", response_class=Response)
+async def prometheus_metrics(authorization: AuthorizationHeader = None) -> Response:
+    return Response(content=await prometheus_metrics_from_request(authorization), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 def _with_probe_status(payload: dict[str, Any], *, response: Response | None) -> dict[str, Any]:
     if response is not None:
         response.status_code = 200 if payload.get("status") == "ok" else 503
@@ -13,6 +13,7 @@ from .errors import RemoteRunnerReadinessError
 from .execution_diagnostics import build_execution_diagnostics
 from .execution_lifecycle_guard import ensure_execution_lifecycle_admission_open
 from .pipeline import inspect_pipeline_registry
+from .startup_timing import startup_timing_snapshot
 
 
 _STARTED_AT = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
@@ -45,7 +46,9 @@ class PipelineRegistryInspection(BaseModel):
 def build_health_startup_payload(cfg: RemoteRunnerConfig) -> dict[str, Any]:
     checks = inspect_runtime_layout(cfg)
     status = "ok" if all(checks.values()) else "failed"
-    return _build_health_payload(status, checks, cfg)
+    payload = _build_health_payload(status, checks, cfg)
+    payload["startupTiming"] = startup_timing_snapshot()
+    return payload
 
 
 def build_health_live_payload(cfg: RemoteRunnerConfig) -> dict[str, Any]:
@@ -149,12 +152,16 @@ def _workflow_runtime_payload(
 
 
 def _enrich_with_operational_metrics(payload: dict[str, Any], cfg: RemoteRunnerConfig) -> None:
-    from .metrics import collect_disk_metrics, collect_queue_metrics, collect_sqlite_metrics, get_metrics
+    from .metrics import collect_sqlite_metrics, get_metrics
+    from .metrics_snapshot import cached_disk_metrics, cached_queue_metrics, get_operational_metrics_snapshot
+    from .run_job_wakeup import get_run_job_wakeup
     from .run_worker_storage import build_run_worker_health
+    from .snakemake_dry_run_cache import collect_dry_run_cache_metrics
+    from .verified_digest_cache import verified_digest_cache_metrics
 
     if Path(cfg.db_path).is_file():
         try:
-            queue = collect_queue_metrics(cfg)
+            queue = cached_queue_metrics(cfg)
             payload["queue"] = queue
         except Exception:
             payload["queue"] = {"error": "queue_metrics_failed"}
@@ -167,12 +174,20 @@ def _enrich_with_operational_metrics(payload: dict[str, Any], cfg: RemoteRunnerC
             payload["sqlite"] = collect_sqlite_metrics(cfg)
         except Exception:
             payload["sqlite"] = {"ok": False, "error": "sqlite_metrics_failed"}
+        try:
+            payload["dryRunCache"] = collect_dry_run_cache_metrics(cfg)
+        except Exception:
+            payload["dryRunCache"] = {"error": "dry_run_cache_metrics_failed"}
+        try:
+            payload["verifiedDigestCache"] = verified_digest_cache_metrics(cfg)
+        except Exception:
+            payload["verifiedDigestCache"] = {"error": "verified_digest_cache_metrics_failed"}
     else:
         payload["queue"] = {"error": "runtime_database_missing"}
         payload["workers"] = {"error": "runtime_database_missing"}
         payload["sqlite"] = {"ok": False, "error": "runtime_database_missing"}
     try:
-        disk = collect_disk_metrics(cfg.data_root)
+        disk = cached_disk_metrics(cfg.data_root)
         payload["disk"] = disk
     except Exception:
         payload["disk"] = {"error": "disk_metrics_failed"}
@@ -181,6 +196,8 @@ def _enrich_with_operational_metrics(payload: dict[str, Any], cfg: RemoteRunnerC
         payload["metrics"] = metrics.snapshot()
     except Exception:
         payload["metrics"] = {"error": "metrics_snapshot_failed"}
+    payload["runJobWakeup"] = get_run_job_wakeup().snapshot()
+    payload["metricsSnapshot"] = get_operational_metrics_snapshot().stats()
 
 
 def _enrich_with_execution_readiness(payload: dict[str, Any], cfg: RemoteRunnerConfig) -> None:
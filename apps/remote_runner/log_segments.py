@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import gzip
+import os
+from pathlib import Path
+import shutil
+import threading
+from typing import IO, Iterable
+
+DEFAULT_LOG_SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+LOG_INDEX_LINE_STRIDE = 1024
+LOG_READ_WINDOW_BYTES = 256 * 1024
+MAX_OPEN_LOG_WRITERS = 32
+
+_PLAIN_SUFFIX = ".log"
+_COMPRESSED_SUFFIX = ".log.gz"
+_INDEX_NAME = "index"
+
+
+@dataclass(frozen=True)
+class LogSegment:
+    base: int
+    path: Path
+    compressed: bool
+
+
+def segment_dir(logs_dir: str | Path, run_id: str, stream: str) -> Path:
+    return Path(logs_dir) / f"{run_id}.{stream}.segments"
+
+
+def legacy_log_path(logs_dir: str | Path, run_id: str, stream: str) -> Path:
+    return Path(logs_dir) / f"{run_id}.{stream}.log"
+
+
+class SegmentedLogWriter:
+    """Append-only writer for one run stream with byte-offset segments.
+
+    Offsets are global across segments: segment files are named by the byte
+    offset of their first line, sealed segments are gzip-compressed, and the
+    sparse ``index`` file records the offset of every ``LOG_INDEX_LINE_STRIDE``-th
+    line so tail reads can seek instead of scanning the whole log.
+    """
+
+    def __init__(self, directory: Path, *, max_segment_bytes: int = DEFAULT_LOG_SEGMENT_MAX_BYTES) -> None:
+        self._directory = directory
+        self._max_segment_bytes = max(1, int(max_segment_bytes))
+        self._lock = threading.Lock()
+        self._handle: IO[bytes] | None = None
+        self._base = 0
+        self._size = 0
+        self._line_count = 0
+
+    def append(self, lines: Iterable[str]) -> None:
+        payload = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        if not payload:
+            return
+        with self._lock:
+            handle = self._ensure_open()
+            start = self._base + self._size
+            handle.write(payload)
+            handle.flush()
+            self._record_index_entries(payload, start)
+            self._size += len(payload)
+            if self._size >= self._max_segment_bytes:
+                self._seal_active_segment()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def _ensure_open(self) -> IO[bytes]:
+        if self._handle is not None and not self._handle_is_stale(self._handle):
+            return self._handle
+        if self._handle is not None:
+            self._handle.close()
+        # Another process may have appended or sealed since we last wrote; recover from disk.
+        self._directory.mkdir(parents=True, exist_ok=True)
+        segments = list_segments(self._directory)
+        plain = [segment for segment in segments if not segment.compressed]
+        if plain:
+            self._base = plain[-1].base
+        elif segments:
+            self._base = segments[-1].base + _segment_size(segments[-1])
+        else:
+            self._base = 0
+        path = self._directory / _segment_name(self._base, compressed=False)
+        self._handle = path.open("ab")
+        self._size = os.fstat(self._handle.fileno()).st_size
+        self._line_count = count_lines(self._directory, list_segments(self._directory))
+        return self._handle
+
+    def _handle_is_stale(self, handle: IO[bytes]) -> bool:
+        stat = os.fstat(handle.fileno())
+        return stat.st_nlink == 0 or stat.st_size != self._size
+
+    def _record_index_entries(self, payload: bytes, start: int) -> None:
+        entries: list[str] = []
+        line_start = 0
+        for position in _newline_positions(payload):
+            if self._line_count % LOG_INDEX_LINE_STRIDE == 0 and self._line_count > 0:
+                entries.append(f"{self._line_count} {start + line_start}\n")
+            self._line_count += 1
+            line_start = position + 1
+        if entries:
+            with (self._directory / _INDEX_NAME).open("a", encoding="utf-8") as index:
+                index.writelines(entries)
+
+    def _seal_active_segment(self) -> None:
+        assert self._handle is not None
+        self._handle.close()
+        self._handle = None
+        plain = self._directory / _segment_name(self._base, compressed=False)
+        compressed = self._directory / _segment_name(self._base, compressed=True)
+        staging = compressed.with_name(f"{compressed.name}.tmp")
+        with plain.open("rb") as source, gzip.open(staging, "wb", compresslevel=6) as target:
+            shutil.copyfileobj(source, target)
+        os.replace(staging, compressed)
+        next_base = self._base + self._size
+        (self._directory / _segment_name(next_base, compressed=False)).touch()
+        plain.unlink()
+        self._base = next_base
+        self._size = 0
+
+
+def list_segments(directory: Path) -> list[LogSegment]:
+    if not directory.is_dir():
+        return []
+    segments: dict[int, LogSegment] = {}
+    for path in directory.iterdir():
+        name = path.name
+        if name.endswith(_COMPRESSED_SUFFIX):
+            base_text, compressed = name[: -len(_COMPRESSED_SUFFIX)], True
+        elif name.endswith(_PLAIN_SUFFIX):
+            base_text, compressed = name[: -len(_PLAIN_SUFFIX)], False
+        else:
+            continue
+        try:
+            base = int(base_text, 16)
+        except ValueError:
+            continue
+        # While a segment is being sealed both copies exist; the plain file wins.
+        if base not in segments or not compressed:
+            segments[base] = LogSegment(base=base, path=path, compressed=compressed)
+    return [segments[base] for base in sorted(segments)]
+
+
+def log_end_offset(segments: list[LogSegment]) -> int:
+    if not segments:
+        return 0
+    return segments[-1].base + _segment_size(segments[-1])
+
+
+def read_log_range(segments: list[LogSegment], start: int, end: int) -> bytes:
+    chunks: list[bytes] = []
+    for index, segment in enumerate(segments):
+        segment_end = segments[index + 1].base if index + 1 < len(segments) else None
+        if segment_end is not None and segment_end <= start:
+            continue
+        if segment.base >= end:
+            break
+        with _open_segment(segment) as handle:
+            handle.seek(max(0, start - segment.base))
+            limit = end - max(start, segment.base)
+            chunks.append(handle.read(limit))
+    return b"".join(chunks)
+
+
+def read_index(directory: Path) -> list[tuple[int, int]]:
+    path = directory / _INDEX_NAME
+    entries = [(0, 0)]
+    if not path.exists():
+        return entries
+    for raw in path.read_text(encoding="utf-8").splitlines():
+        parts = raw.split()
+        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+            entries.append((int(parts[0]), int(parts[1])))
+    return entries
+
+
+def resolve_segments(logs_dir: str | Path, run_id: str, stream: str) -> list[LogSegment]:
+    segments = list_segments(segment_dir(logs_dir, run_id, stream))
+    if segments:
+        return segments
+    legacy = legacy_log_path(logs_dir, run_id, stream)
+    # Logs written before segmentation are read as one uncompressed segment.
+    return [LogSegment(base=0, path=legacy, compressed=False)] if legacy.is_file() else []
+
+
+def count_lines(directory: Path, segments: list[LogSegment]) -> int:
+    line_number, offset = read_index(directory)[-1]
+    return line_number + _count_newlines(segments, offset, log_end_offset(segments))
+
+
+def line_offset(directory: Path, segments: list[LogSegment], target_line: int) -> int:
+    """Return the byte offset where ``target_line`` (0-based) starts."""
+    line_number, offset = max(entry for entry in read_index(directory) if entry[0] <= target_line)
+    end = log_end_offset(segments)
+    position = offset
+    if line_number >= target_line:
+        return position
+    while position < end:
+        window = read_log_range(segments, position, min(end, position + LOG_READ_WINDOW_BYTES))
+        for newline in _newline_positions(window):
+            line_number += 1
+            if line_number == target_line:
+                return position + newline + 1
+        position += len(window)
+    return position
+
+
+class _WriterCache:
+    def __init__(self, max_writers: int = MAX_OPEN_LOG_WRITERS) -> None:
+        self._max_writers = max(1, int(max_writers))
+        self._lock = threading.Lock()
+        self._writers: OrderedDict[Path, SegmentedLogWriter] = OrderedDict()
+
+    def get(self, directory: Path, *, max_segment_bytes: int) -> SegmentedLogWriter:
+        evicted: list[SegmentedLogWriter] = []
+        with self._lock:
+            writer = self._writers.get(directory)
+            if writer is None:
+                writer = SegmentedLogWriter(directory, max_segment_bytes=max_segment_bytes)
+                self._writers[directory] = writer
+                while len(self._writers) > self._max_writers:
+                    evicted.append(self._writers.popitem(last=False)[1])
+            self._writers.move_to_end(directory)
+        for stale in evicted:
+            stale.close()
+        return writer
+
+    def close(self, directories: Iterable[Path] | None = None) -> None:
+        with self._lock:
+            if directories is None:
+                closing = list(self._writers.values())
+                self._writers.clear()
+            else:
+                closing = [writer for directory in directories if (writer := self._writers.pop(directory, None))]
+        for writer in closing:
+            writer.close()
+
+
+_WRITERS = _WriterCache()
+
+
+def cached_writer(directory: Path, *, max_segment_bytes: int) -> SegmentedLogWriter:
+    return _WRITERS.get(directory, max_segment_bytes=max_segment_bytes)
+
+
+def close_writers(directories: Iterable[Path] | None = None) -> None:
+    _WRITERS.close(directories)
+
+
+def _segment_name(base: int, *, compressed: bool) -> str:
+    return f"{base:016x}{_COMPRESSED_SUFFIX if compressed else _PLAIN_SUFFIX}"
+
+
+def _segment_size(segment: LogSegment) -> int:
+    if not segment.compressed:
+        try:
+            return segment.path.stat().st_size
+        except FileNotFoundError:
+            segment = LogSegment(segment.base, segment.path.with_name(_segment_name(segment.base, compressed=True)), True)
+    with gzip.open(segment.path, "rb") as handle:
+        return handle.seek(0, os.SEEK_END)
+
+
+def _open_segment(segment: LogSegment) -> IO[bytes]:
+    if not segment.compressed:
+        try:
+            return segment.path.open("rb")
+        except FileNotFoundError:
+            # Sealed between listing and opening.
+            return gzip.open(segment.path.with_name(_segment_name(segment.base, compressed=True)), "rb")
+    return gzip.open(segment.path, "rb")
+
+
+def _count_newlines(segments: list[LogSegment], start: int, end: int) -> int:
+    count = 0
+    position = start
+    while position < end:
+        window = read_log_range(segments, position, min(end, position + LOG_READ_WINDOW_BYTES))
+        if not window:
+            break
+        count += window.count(b"\n")
+        position += len(window)
+    return count
+
+
+def _newline_positions(payload: bytes) -> Iterable[int]:
+    position = payload.find(b"\n")
+    while position != -1:
+        yield position
+        position = payload.find(b"\n", position + 1)
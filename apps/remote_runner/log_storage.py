@@ -1,32 +1,146 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Iterable
+from typing import IO, Any, Iterable
 
 from .config import RemoteRunnerConfig
+from .log_segments import (
+    DEFAULT_LOG_SEGMENT_MAX_BYTES,
+    LOG_READ_WINDOW_BYTES,
+    LogSegment,
+    cached_writer,
+    close_writers,
+    count_lines,
+    line_offset,
+    log_end_offset,
+    read_log_range,
+    resolve_segments,
+    segment_dir,
+)
+
+LOG_STREAMS = ("stdout", "stderr")
 
 
 def append_log_lines(cfg: RemoteRunnerConfig, run_id: str, stream: str, lines: Iterable[str]) -> None:
-    logs_dir = Path(cfg.logs_dir)
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    path = logs_dir / f"{run_id}.{stream}.log"
-    with path.open("a", encoding="utf-8") as handle:
-        for line in lines:
-            handle.write(f"{line}\n")
+    max_segment_bytes = getattr(cfg, "log_segment_max_bytes", DEFAULT_LOG_SEGMENT_MAX_BYTES)
+    cached_writer(segment_dir(cfg.logs_dir, run_id, stream), max_segment_bytes=max_segment_bytes).append(lines)
+
+
+def close_run_log_writers(cfg: RemoteRunnerConfig, run_id: str) -> None:
+    close_writers(segment_dir(cfg.logs_dir, run_id, stream) for stream in LOG_STREAMS)
+
+
+class RunLogStreamWriter:
+    """Appends live process output to run logs as complete lines arrive.
+
+    Partial lines are held until their newline is seen so log readers never
+    observe a line split across two fetches. When ``attempt_logs`` is given the
+    raw text is also mirrored to the per-attempt stdout/stderr files.
+    """
 
+    def __init__(self, cfg: RemoteRunnerConfig, run_id: str, *, attempt_logs: dict[str, Path] | None = None) -> None:
+        self._cfg = cfg
+        self._run_id = run_id
+        self._attempt_logs = {stream: Path(path) for stream, path in (attempt_logs or {}).items()}
+        self._attempt_handles: dict[str, IO[str]] = {}
+        self._partial_lines: dict[str, str] = {}
 
-def fetch_log_lines(cfg: RemoteRunnerConfig, run_id: str, stream: str, cursor: str | None) -> dict[str, Any]:
-    path = Path(cfg.logs_dir) / f"{run_id}.{stream}.log"
-    if not path.exists():
+    def write(self, stream: str, text: str) -> None:
+        if stream in self._attempt_logs:
+            handle = self._attempt_handle(stream)
+            handle.write(text)
+            handle.flush()
+        buffered = self._partial_lines.get(stream, "") + text
+        complete, newline, partial = buffered.rpartition("\n")
+        self._partial_lines[stream] = partial
+        if newline:
+            append_log_lines(self._cfg, self._run_id, stream, [line for line in complete.splitlines() if line])
+
+    def close(self) -> None:
+        for stream, partial in sorted(self._partial_lines.items()):
+            lines = [line for line in partial.splitlines() if line]
+            if lines:
+                append_log_lines(self._cfg, self._run_id, stream, lines)
+        self._partial_lines.clear()
+        for stream in self._attempt_logs:
+            self._attempt_handle(stream)
+        for handle in self._attempt_handles.values():
+            handle.close()
+        self._attempt_handles.clear()
+        close_run_log_writers(self._cfg, self._run_id)
+
+    def _attempt_handle(self, stream: str) -> IO[str]:
+        handle = self._attempt_handles.get(stream)
+        if handle is None:
+            path = self._attempt_logs[stream]
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = path.open("w", encoding="utf-8")
+            self._attempt_handles[stream] = handle
+        return handle
+
+
+def fetch_log_lines(
+    cfg: RemoteRunnerConfig,
+    run_id: str,
+    stream: str,
+    cursor: str | None,
+    *,
+    max_bytes: int = LOG_READ_WINDOW_BYTES,
+) -> dict[str, Any]:
+    segments = resolve_segments(cfg.logs_dir, run_id, stream)
+    if not segments:
         return {"runId": run_id, "stream": stream, "cursor": cursor or "", "nextCursor": cursor or "", "lines": []}
-    content = path.read_text(encoding="utf-8")
-    start = int(cursor or 0)
-    next_cursor = len(content)
-    lines = [line for line in content[start:].splitlines() if line]
+    end = log_end_offset(segments)
+    start = min(_parse_log_cursor(cursor), end)
+    data = _read_line_window(segments, start, end, max(1, int(max_bytes)))
+    next_cursor = start + len(data)
     return {
         "runId": run_id,
         "stream": stream,
         "cursor": cursor or "",
         "nextCursor": str(next_cursor),
-        "lines": lines,
+        "lines": _decode_lines(data),
+        "hasMore": next_cursor < end,
+    }
+
+
+def fetch_log_tail(cfg: RemoteRunnerConfig, run_id: str, stream: str, line_count: int) -> dict[str, Any]:
+    directory = segment_dir(cfg.logs_dir, run_id, stream)
+    segments = resolve_segments(cfg.logs_dir, run_id, stream)
+    total_lines = count_lines(directory, segments) if segments else 0
+    end = log_end_offset(segments)
+    start = line_offset(directory, segments, max(0, total_lines - max(0, int(line_count)))) if segments else 0
+    return {
+        "runId": run_id,
+        "stream": stream,
+        "lineCount": total_lines,
+        "nextCursor": str(end),
+        "lines": _decode_lines(read_log_range(segments, start, end)),
     }
+
+
+def _read_line_window(segments: list[LogSegment], start: int, end: int, max_bytes: int) -> bytes:
+    window_end = min(end, start + max_bytes)
+    data = read_log_range(segments, start, window_end)
+    while window_end < end:
+        newline = data.rfind(b"\n")
+        if newline != -1:
+            return data[: newline + 1]
+        # A single line longer than the window: keep reading until it ends.
+        next_end = min(end, window_end + max_bytes)
+        data += read_log_range(segments, window_end, next_end)
+        window_end = next_end
+    return data
+
+
+def _decode_lines(data: bytes) -> list[str]:
+    return [line for line in data.decode("utf-8", errors="replace").splitlines() if line]
+
+
+def _parse_log_cursor(cursor: str | None) -> int:
+    text = str(cursor or "").strip()
+    if not text:
+        return 0
+    if not text.isdigit():
+        raise ValueError("LOG_CURSOR_INVALID")
+    return int(text)
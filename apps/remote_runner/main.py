@@ -4,38 +4,43 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from .audit_routes import router as audit_router
 from .artifact_lifecycle_controller import start_configured_artifact_lifecycle_controller_supervisor
-from .database_routes import router as database_router
 from .execution_lifecycle_routes import router as execution_lifecycle_router
 from .execution_query_routes import router as execution_query_router
 from .health_routes import router as health_router
+from .metrics_exposition import HttpRequestLatencyMiddleware
+from .metrics_snapshot import start_configured_operational_metrics_refresher
 from .pipeline_routes import router as pipeline_router
 from .route_errors import register_exception_handlers
-from .secret_routes import router as secret_router
+from .route_groups import RouteGroup, RouteGroupRegistry
+from .sqlite_connection_pool import close_connection_pool
+from .startup_timing import STARTUP_TIMELINE
 from .trigger_scheduler import start_configured_workflow_trigger_scheduler_supervisor
 from .trigger_readiness_watcher import start_configured_workflow_trigger_readiness_watcher_supervisor
+from .verified_digest_cache import start_configured_verified_digest_scrubber_supervisor
 from .worker_supervisor import start_configured_run_worker_supervisor, start_configured_tool_prepare_worker_supervisor
 from .submission_routes import router as submission_router
 from .tool_routes import router as tool_router
-from .workflow_design_routes import router as workflow_design_router
-from .workflow_revision_routes import router as workflow_revision_router
 from .workflow_trigger_routes import router as workflow_trigger_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    supervisors = [
-        supervisor
-        for supervisor in (
-            start_configured_run_worker_supervisor(),
-            start_configured_tool_prepare_worker_supervisor(),
-            start_configured_workflow_trigger_scheduler_supervisor(),
-            start_configured_workflow_trigger_readiness_watcher_supervisor(),
-            start_configured_artifact_lifecycle_controller_supervisor(),
-        )
-        if supervisor is not None
-    ]
+    with STARTUP_TIMELINE.phase("supervisors"):
+        supervisors = [
+            supervisor
+            for supervisor in (
+                start_configured_run_worker_supervisor(),
+                start_configured_tool_prepare_worker_supervisor(),
+                start_configured_workflow_trigger_scheduler_supervisor(),
+                start_configured_workflow_trigger_readiness_watcher_supervisor(),
+                start_configured_artifact_lifecycle_controller_supervisor(),
+                start_configured_verified_digest_scrubber_supervisor(),
+                start_configured_operational_metrics_refresher(),
+            )
+            if supervisor is not None
+        ]
+    STARTUP_TIMELINE.mark_ready()
     if supervisors:
         app.state.worker_supervisors = supervisors
     try:
@@ -43,19 +48,58 @@ async def lifespan(app: FastAPI):
     finally:
         for supervisor in supervisors:
             supervisor.stop()
+        close_connection_pool()
+
+
+def _include_database_routes(app: FastAPI) -> None:
+    from .database_routes import router as database_router
+
+    app.include_router(database_router)
+
+
+def _include_workflow_design_routes(app: FastAPI) -> None:
+    from .workflow_design_routes import router as workflow_design_router
+
+    app.include_router(workflow_design_router)
+
+
+def _include_workflow_revision_routes(app: FastAPI) -> None:
+    from .workflow_revision_routes import router as workflow_revision_router
+
+    app.include_router(workflow_revision_router)
+
+
+def _include_audit_routes(app: FastAPI) -> None:
+    from .audit_routes import router as audit_router
+
+    app.include_router(audit_router)
+
+
+def _include_secret_routes(app: FastAPI) -> None:
+    from .secret_routes import router as secret_router
+
+    app.include_router(secret_router)
+
+
+# Rarely used route groups; with H2OMETA_REMOTE_LAZY_ROUTE_GROUPS=1 each is imported on its first request.
+ROUTE_GROUPS = (
+    RouteGroup("databases", ("/api/v1/database",), _include_database_routes),
+    RouteGroup("workflow_design", ("/api/v1/workflow-design-drafts",), _include_workflow_design_routes),
+    RouteGroup("workflow_revisions", ("/api/v1/workflow-revisions",), _include_workflow_revision_routes),
+    RouteGroup("audit", ("/api/v1/audit",), _include_audit_routes),
+    RouteGroup("secrets", ("/api/v1/secrets",), _include_secret_routes),
+)
 
 
 app = FastAPI(title="H2OMeta Remote Runner", version="0.1.1-control-plane", lifespan=lifespan)
 register_exception_handlers(app)
+app.add_middleware(HttpRequestLatencyMiddleware)
 app.include_router(health_router)
 app.include_router(pipeline_router)
 app.include_router(submission_router)
 app.include_router(execution_lifecycle_router)
 app.include_router(execution_query_router)
-app.include_router(database_router)
 app.include_router(tool_router)
-app.include_router(workflow_design_router)
-app.include_router(workflow_revision_router)
 app.include_router(workflow_trigger_router)
-app.include_router(audit_router)
-app.include_router(secret_router)
+route_groups = RouteGroupRegistry(app, ROUTE_GROUPS)
+route_groups.register()
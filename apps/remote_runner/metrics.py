@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import bisect
 from datetime import datetime, timezone
 import json
+import math
 import shutil
 import sqlite3
 import threading
@@ -37,12 +39,79 @@ class _MetricValue:
             self._value = max(floor, self._value - amount)
 
 
+LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DURATION_BUCKETS_SECONDS = (1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0, 21600.0, 86400.0)
+SIZE_BUCKETS = (1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 5000.0)
+SNAPSHOT_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+class _QuantileSketch:
+    """Log-bucketed quantile sketch with bounded relative error (DDSketch style).
+
+    Sketches with the same accuracy merge by adding bin counts, so per-process
+    or per-window sketches can be combined without keeping raw samples.
+    """
+
+    __slots__ = ("_gamma", "_log_gamma", "_bins", "_zero_count", "_count", "_max_bins")
+
+    def __init__(self, relative_accuracy: float = 0.01, *, max_bins: int = 2048) -> None:
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: dict[int, int] = {}
+        self._zero_count = 0
+        self._count = 0
+        self._max_bins = max_bins
+
+    def add(self, value: float) -> None:
+        self._count += 1
+        if value <= 1e-9:
+            self._zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._bins[key] = self._bins.get(key, 0) + 1
+        if len(self._bins) > self._max_bins:
+            self._collapse_lowest_bins()
+
+    def merge(self, other: _QuantileSketch) -> None:
+        if not math.isclose(self._gamma, other._gamma):
+            raise ValueError("METRICS_SKETCH_ACCURACY_MISMATCH")
+        self._count += other._count
+        self._zero_count += other._zero_count
+        for key, count in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + count
+        if len(self._bins) > self._max_bins:
+            self._collapse_lowest_bins()
+
+    def quantile(self, q: float) -> float:
+        if self._count == 0:
+            return 0.0
+        rank = max(0.0, min(1.0, q)) * (self._count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if rank < seen:
+                return 2.0 * self._gamma**key / (self._gamma + 1.0)
+        return 2.0 * self._gamma ** max(self._bins) / (self._gamma + 1.0)
+
+    def _collapse_lowest_bins(self) -> None:
+        keys = sorted(self._bins)
+        overflow = len(keys) - self._max_bins
+        folded = sum(self._bins.pop(key) for key in keys[:overflow])
+        self._bins[keys[overflow]] += folded
+
+
 class _Histogram:
-    __slots__ = ("_values", "_lock", "_count", "_sum", "_min", "_max")
+    """Fixed-bucket histogram plus a quantile sketch; all-time, no raw samples kept."""
 
-    def __init__(self) -> None:
-        self._values: list[float] = []
+    __slots__ = ("_lock", "_bounds", "_bucket_counts", "_sketch", "_count", "_sum", "_min", "_max")
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS_SECONDS) -> None:
         self._lock = threading.Lock()
+        self._bounds = tuple(sorted(buckets))
+        self._bucket_counts = [0] * (len(self._bounds) + 1)
+        self._sketch = _QuantileSketch()
         self._count = 0
         self._sum = 0.0
         self._min: float | None = None
@@ -50,24 +119,76 @@ class _Histogram:
 
     def observe(self, value: float) -> None:
         with self._lock:
-            self._values.append(value)
+            self._bucket_counts[bisect.bisect_left(self._bounds, value)] += 1
+            self._sketch.add(value)
             self._count += 1
             self._sum += value
             self._min = value if self._min is None else min(self._min, value)
             self._max = value if self._max is None else max(self._max, value)
-            if len(self._values) > 1000:
-                self._values = self._values[-500:]
+
+    def merge(self, other: _Histogram) -> None:
+        if other._bounds != self._bounds:
+            raise ValueError("METRICS_HISTOGRAM_BUCKETS_MISMATCH")
+        with other._lock:
+            counts = list(other._bucket_counts)
+            sketch = _QuantileSketch()
+            sketch.merge(other._sketch)
+            count, total, low, high = other._count, other._sum, other._min, other._max
+        with self._lock:
+            self._bucket_counts = [mine + theirs for mine, theirs in zip(self._bucket_counts, counts)]
+            self._sketch.merge(sketch)
+            self._count += count
+            self._sum += total
+            if low is not None:
+                self._min = low if self._min is None else min(self._min, low)
+            if high is not None:
+                self._max = high if self._max is None else max(self._max, high)
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        """Prometheus-style ``le`` buckets, ending with ``+Inf``."""
+        with self._lock:
+            counts = list(self._bucket_counts)
+        running = 0
+        buckets = []
+        for bound, count in zip((*self._bounds, math.inf), counts):
+            running += count
+            buckets.append((bound, running))
+        return buckets
+
+    def quantiles(self, quantiles: tuple[float, ...] = SNAPSHOT_QUANTILES) -> dict[float, float]:
+        with self._lock:
+            if self._count == 0:
+                return {q: 0.0 for q in quantiles}
+            # The sketch error is relative; clamp to the exact extremes it cannot see.
+            return {q: min(self._max or 0.0, max(self._min or 0.0, self._sketch.quantile(q))) for q in quantiles}
+
+    def totals(self) -> tuple[int, float]:
+        with self._lock:
+            return self._count, self._sum
 
     def snapshot(self) -> dict[str, Any]:
+        quantiles = self.quantiles()
         with self._lock:
             if self._count == 0:
-                return {"count": 0, "sum": 0.0, "min": 0.0, "max": 0.0, "avg": 0.0}
+                return {
+                    "count": 0,
+                    "sum": 0.0,
+                    "min": 0.0,
+                    "max": 0.0,
+                    "avg": 0.0,
+                    "p50": 0.0,
+                    "p95": 0.0,
+                    "p99": 0.0,
+                }
             return {
                 "count": self._count,
                 "sum": round(self._sum, 3),
                 "min": round(self._min or 0.0, 3),
                 "max": round(self._max or 0.0, 3),
                 "avg": round(self._sum / self._count, 3),
+                "p50": round(quantiles[0.5], 3),
+                "p95": round(quantiles[0.95], 3),
+                "p99": round(quantiles[0.99], 3),
             }
 
 
@@ -81,10 +202,18 @@ class RunnerMetrics:
         self.dead_lettered_jobs = _MetricValue()
         self.worker_heartbeats = _MetricValue()
         self.sqlite_busy_errors = _MetricValue()
-        self.run_duration_seconds = _Histogram()
-        self.queue_wait_seconds = _Histogram()
+        self.run_duration_seconds = _Histogram(DURATION_BUCKETS_SECONDS)
+        self.queue_wait_seconds = _Histogram(DURATION_BUCKETS_SECONDS)
+        self.enqueue_to_claim_seconds = _Histogram()
+        self.rule_projection_batch_size = _Histogram(SIZE_BUCKETS)
+        self.rule_projection_commit_seconds = _Histogram()
+        self.http_request_seconds = _Histogram()
         self._started_at = time.time()
 
+    @property
+    def started_at(self) -> float:
+        return self._started_at
+
     def snapshot(self) -> dict[str, Any]:
         return {
             "startedAt": time.strftime(
@@ -101,6 +230,10 @@ class RunnerMetrics:
             "sqliteBusyErrors": int(self.sqlite_busy_errors.get()),
             "runDurationSeconds": self.run_duration_seconds.snapshot(),
             "queueWaitSeconds": self.queue_wait_seconds.snapshot(),
+            "enqueueToClaimSeconds": self.enqueue_to_claim_seconds.snapshot(),
+            "ruleProjectionBatchSize": self.rule_projection_batch_size.snapshot(),
+            "ruleProjectionCommitSeconds": self.rule_projection_commit_seconds.snapshot(),
+            "httpRequestSeconds": self.http_request_seconds.snapshot(),
         }
 
 
@@ -130,6 +263,20 @@ def record_run_attempt_claimed(*, queued_at: str | None, claimed_at: str) -> Non
         metrics.queue_wait_seconds.observe(wait_seconds)
 
 
+def record_run_job_enqueue_to_claim(seconds: float) -> None:
+    get_metrics().enqueue_to_claim_seconds.observe(max(0.0, seconds))
+
+
+def record_http_request(seconds: float) -> None:
+    get_metrics().http_request_seconds.observe(max(0.0, seconds))
+
+
+def record_rule_projection_batch(*, rows: int, seconds: float) -> None:
+    metrics = get_metrics()
+    metrics.rule_projection_batch_size.observe(float(max(0, rows)))
+    metrics.rule_projection_commit_seconds.observe(max(0.0, seconds))
+
+
 def record_run_attempt_completed(
     *,
     started_at: str | None,
@@ -179,97 +326,104 @@ def collect_disk_metrics(path: str) -> dict[str, Any]:
         return {"path": path, "error": "disk_stat_failed"}
 
 
+_RECOVERY_EVENT_TYPES = (
+    "run_attempt_fenced",
+    "run_job_requeued",
+    "run_job_dead_lettered",
+    "run_attempt_recovery_blocked",
+    "run_control_plane_recovered",
+)
+# One grouped pass over every table the queue gauges read. Columns n1..n4 are
+# per-source: jobs -> ready, scheduled, dead-lettered; allocations -> cpu,
+# memory_mb, disk_mb, gpu. ``oldest`` is the oldest live job per job state.
+_QUEUE_AGGREGATE_SQL = f"""
+    SELECT 'jobs' AS source, state AS key, COUNT(*) AS count,
+        SUM(CASE WHEN dead_lettered_at IS NULL AND available_at <= :now THEN 1 ELSE 0 END) AS n1,
+        SUM(CASE WHEN dead_lettered_at IS NULL AND available_at > :now THEN 1 ELSE 0 END) AS n2,
+        SUM(CASE WHEN dead_lettered_at IS NOT NULL THEN 1 ELSE 0 END) AS n3,
+        0 AS n4,
+        MIN(CASE WHEN dead_lettered_at IS NULL THEN created_at END) AS oldest
+    FROM run_jobs GROUP BY state
+    UNION ALL
+    SELECT 'attempts', state, COUNT(*), 0, 0, 0, 0, NULL FROM run_attempts GROUP BY state
+    UNION ALL
+    SELECT 'leases', state, COUNT(*), 0, 0, 0, 0, NULL FROM run_leases GROUP BY state
+    UNION ALL
+    SELECT 'wait_reasons', wait_reason_json, COUNT(*), 0, 0, 0, 0, NULL
+    FROM run_jobs
+    WHERE state = 'queued'
+      AND dead_lettered_at IS NULL
+      AND wait_reason_json IS NOT NULL
+      AND wait_reason_json NOT IN ('', '{{}}')
+    GROUP BY wait_reason_json
+    UNION ALL
+    SELECT 'allocations', state, COUNT(*),
+        COALESCE(SUM(cpu), 0), COALESCE(SUM(memory_mb), 0), COALESCE(SUM(disk_mb), 0), COALESCE(SUM(gpu), 0), NULL
+    FROM run_resource_allocations GROUP BY state
+    UNION ALL
+    SELECT 'recovery', event_type, COUNT(*), 0, 0, 0, 0, NULL
+    FROM run_events
+    WHERE event_type IN ({", ".join(f"'{event_type}'" for event_type in _RECOVERY_EVENT_TYPES)})
+    GROUP BY event_type
+"""
+
+
 def collect_queue_metrics(cfg: Any) -> dict[str, Any]:
     from .storage_core import get_connection, now_iso
 
     now = now_iso()
     with get_connection(cfg) as connection:
-        jobs_by_state = _count_by_column(connection, "run_jobs", "state")
-        attempts_by_state = _count_by_column(connection, "run_attempts", "state")
-        leases_by_state = _count_by_column(connection, "run_leases", "state")
-        queued = connection.execute(
-            "SELECT COUNT(*) AS c FROM run_jobs WHERE state = 'queued' AND available_at <= ? AND dead_lettered_at IS NULL",
-            (now,),
-        ).fetchone()["c"]
-        total_queued = connection.execute(
-            "SELECT COUNT(*) AS c FROM run_jobs WHERE state = 'queued' AND dead_lettered_at IS NULL"
-        ).fetchone()["c"]
-        scheduled = connection.execute(
-            "SELECT COUNT(*) AS c FROM run_jobs WHERE state = 'queued' AND available_at > ? AND dead_lettered_at IS NULL",
-            (now,),
-        ).fetchone()["c"]
-        claimed = connection.execute(
-            "SELECT COUNT(*) AS c FROM run_jobs WHERE state = 'claimed'"
-        ).fetchone()["c"]
-        dead = connection.execute(
-            "SELECT COUNT(*) AS c FROM run_jobs WHERE dead_lettered_at IS NOT NULL"
-        ).fetchone()["c"]
-        active_leases = connection.execute(
-            "SELECT COUNT(*) AS c FROM run_leases WHERE state = 'active'"
-        ).fetchone()["c"]
-        wait_rows = connection.execute(
-            """
-            SELECT wait_reason_json
-            FROM run_jobs
-            WHERE state = 'queued'
-              AND dead_lettered_at IS NULL
-              AND wait_reason_json IS NOT NULL
-              AND wait_reason_json <> ''
-              AND wait_reason_json <> '{}'
-            """
-        ).fetchall()
-        allocations = connection.execute(
-            """
-            SELECT
-                COALESCE(SUM(CASE WHEN state = 'allocated' THEN 1 ELSE 0 END), 0) AS active_count,
-                COALESCE(SUM(CASE WHEN state = 'released' THEN 1 ELSE 0 END), 0) AS released_count,
-                COALESCE(SUM(CASE WHEN state = 'allocated' THEN cpu ELSE 0 END), 0) AS cpu,
-                COALESCE(SUM(CASE WHEN state = 'allocated' THEN memory_mb ELSE 0 END), 0) AS memory_mb,
-                COALESCE(SUM(CASE WHEN state = 'allocated' THEN disk_mb ELSE 0 END), 0) AS disk_mb,
-                COALESCE(SUM(CASE WHEN state = 'allocated' THEN gpu ELSE 0 END), 0) AS gpu
-            FROM run_resource_allocations
-            """
-        ).fetchone()
-        recovery = _recovery_counts(connection)
-        oldest_queued = connection.execute(
-            """
-            SELECT MIN(created_at) AS created_at
-            FROM run_jobs
-            WHERE state = 'queued' AND dead_lettered_at IS NULL
-            """
-        ).fetchone()["created_at"]
-    wait_reasons = _wait_reason_counts(wait_rows)
+        rows = connection.execute(_QUEUE_AGGREGATE_SQL, {"now": now}).fetchall()
+    grouped: dict[str, dict[str, sqlite3.Row]] = {}
+    for row in rows:
+        grouped.setdefault(str(row["source"]), {})[str(row["key"])] = row
+    jobs = grouped.get("jobs", {})
+    jobs_by_state = {state: int(row["count"]) for state, row in sorted(jobs.items())}
+    attempts_by_state = {state: int(row["count"]) for state, row in sorted(grouped.get("attempts", {}).items())}
+    leases_by_state = {state: int(row["count"]) for state, row in sorted(grouped.get("leases", {}).items())}
+    queued = jobs.get("queued")
+    allocated = grouped.get("allocations", {}).get("allocated")
+    released = grouped.get("allocations", {}).get("released")
+    recovery_counts = {event_type: int(row["count"]) for event_type, row in grouped.get("recovery", {}).items()}
+    wait_reasons = _wait_reason_counts(list(grouped.get("wait_reasons", {}).values()))
     return {
-        "queuedJobs": int(queued),
-        "totalQueuedJobs": int(total_queued),
-        "scheduledQueuedJobs": int(scheduled),
-        "claimedJobs": int(claimed),
-        "completedJobs": int(jobs_by_state.get("completed", 0)),
-        "failedJobs": int(jobs_by_state.get("failed", 0)),
-        "deadLetteredJobs": int(dead),
-        "activeLeases": int(active_leases),
+        "queuedJobs": int(queued["n1"]) if queued else 0,
+        "totalQueuedJobs": int(queued["count"]) - int(queued["n3"]) if queued else 0,
+        "scheduledQueuedJobs": int(queued["n2"]) if queued else 0,
+        "claimedJobs": jobs_by_state.get("claimed", 0),
+        "completedJobs": jobs_by_state.get("completed", 0),
+        "failedJobs": jobs_by_state.get("failed", 0),
+        "deadLetteredJobs": sum(int(row["n3"]) for row in jobs.values()),
+        "activeLeases": leases_by_state.get("active", 0),
         "jobsByState": jobs_by_state,
         "attemptsByState": attempts_by_state,
         "leasesByState": leases_by_state,
-        "runningAttempts": int(attempts_by_state.get("running", 0)),
+        "runningAttempts": attempts_by_state.get("running", 0),
         "resourceWaitJobs": sum(wait_reasons.values()),
         "waitReasons": wait_reasons,
-        "oldestQueuedAgeSeconds": _age_seconds(oldest_queued, now),
+        "oldestQueuedAgeSeconds": _age_seconds(queued["oldest"] if queued else None, now),
         "allocations": {
-            "active": int(allocations["active_count"]),
-            "released": int(allocations["released_count"]),
+            "active": int(allocated["count"]) if allocated else 0,
+            "released": int(released["count"]) if released else 0,
             "allocatedResources": {
-                "cpu": int(allocations["cpu"]),
-                "memoryMb": int(allocations["memory_mb"]),
-                "diskMb": int(allocations["disk_mb"]),
-                "gpu": int(allocations["gpu"]),
+                "cpu": int(allocated["n1"]) if allocated else 0,
+                "memoryMb": int(allocated["n2"]) if allocated else 0,
+                "diskMb": int(allocated["n3"]) if allocated else 0,
+                "gpu": int(allocated["n4"]) if allocated else 0,
             },
         },
-        "recovery": recovery,
+        "recovery": {
+            "fencedAttempts": recovery_counts.get("run_attempt_fenced", 0),
+            "requeuedJobs": recovery_counts.get("run_job_requeued", 0),
+            "deadLetteredJobs": recovery_counts.get("run_job_dead_lettered", 0),
+            "recoveryBlocked": recovery_counts.get("run_attempt_recovery_blocked", 0),
+            "controlPlaneRecoveries": recovery_counts.get("run_control_plane_recovered", 0),
+        },
     }
 
 
 def collect_sqlite_metrics(cfg: Any) -> dict[str, Any]:
+    from .sqlite_connection_pool import connection_pool_stats
     from .storage_core import get_connection
 
     try:
@@ -282,6 +436,7 @@ def collect_sqlite_metrics(cfg: Any) -> dict[str, Any]:
                 "ok": False,
                 "error": "sqlite_busy",
                 "busyErrors": int(get_metrics().sqlite_busy_errors.get()),
+                "connectionPool": connection_pool_stats(),
             }
         return {"ok": False, "error": "sqlite_metrics_failed", "message": str(exc)}
     return {
@@ -291,6 +446,7 @@ def collect_sqlite_metrics(cfg: Any) -> dict[str, Any]:
         "busyTimeoutMs": busy_timeout,
         "busyTimeoutOk": busy_timeout >= 5000,
         "busyErrors": int(get_metrics().sqlite_busy_errors.get()),
+        "connectionPool": connection_pool_stats(),
     }
 
 
@@ -298,47 +454,15 @@ def record_sqlite_busy_error() -> None:
     get_metrics().sqlite_busy_errors.inc()
 
 
-def _count_by_column(connection: sqlite3.Connection, table_name: str, column_name: str) -> dict[str, int]:
-    rows = connection.execute(
-        f"SELECT {column_name} AS value, COUNT(*) AS count FROM {table_name} GROUP BY {column_name}"
-    ).fetchall()
-    return {str(row["value"]): int(row["count"]) for row in rows}
-
-
 def _wait_reason_counts(rows: list[sqlite3.Row]) -> dict[str, int]:
     counts: dict[str, int] = {}
     for row in rows:
-        reason = _json_object(row["wait_reason_json"])
+        reason = _json_object(row["key"])
         code = str(reason.get("code") or "UNKNOWN_WAIT_REASON").strip() or "UNKNOWN_WAIT_REASON"
-        counts[code] = counts.get(code, 0) + 1
+        counts[code] = counts.get(code, 0) + int(row["count"])
     return dict(sorted(counts.items()))
 
 
-def _recovery_counts(connection: sqlite3.Connection) -> dict[str, int]:
-    rows = connection.execute(
-        """
-        SELECT event_type, COUNT(*) AS count
-        FROM run_events
-        WHERE event_type IN (
-            'run_attempt_fenced',
-            'run_job_requeued',
-            'run_job_dead_lettered',
-            'run_attempt_recovery_blocked',
-            'run_control_plane_recovered'
-        )
-        GROUP BY event_type
-        """
-    ).fetchall()
-    raw = {str(row["event_type"]): int(row["count"]) for row in rows}
-    return {
-        "fencedAttempts": raw.get("run_attempt_fenced", 0),
-        "requeuedJobs": raw.get("run_job_requeued", 0),
-        "deadLetteredJobs": raw.get("run_job_dead_lettered", 0),
-        "recoveryBlocked": raw.get("run_attempt_recovery_blocked", 0),
-        "controlPlaneRecoveries": raw.get("run_control_plane_recovered", 0),
-    }
-
-
 def _age_seconds(value: str | None, now_text: str) -> int | None:
     if not value:
         return None
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import math
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from .config import RemoteRunnerConfig
+from .metrics import RunnerMetrics, _Histogram, get_metrics, record_http_request
+from .metrics_snapshot import cached_queue_metrics
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRIC_PREFIX = "h2ometa_runner_"
+EXPOSITION_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+_COUNTERS = (
+    ("completed_runs", "runs_completed_total", "Run attempts that completed."),
+    ("failed_runs", "runs_failed_total", "Run attempts that failed or were dead-lettered."),
+    ("lease_expiries", "lease_expiries_total", "Run attempts fenced because their lease expired."),
+    ("dead_lettered_jobs", "dead_lettered_jobs_total", "Run jobs moved to the dead-letter state."),
+    ("worker_heartbeats", "worker_heartbeats_total", "Run worker heartbeats recorded."),
+    ("sqlite_busy_errors", "sqlite_busy_errors_total", "SQLite busy or locked errors seen by the runner."),
+)
+_GAUGES = (
+    ("queue_depth", "queue_depth", "Last recorded run queue depth."),
+    ("active_runs", "active_runs", "Run attempts currently holding a lease in this process."),
+)
+_HISTOGRAMS = (
+    ("run_duration_seconds", "run_duration_seconds", "Run attempt execution time."),
+    ("queue_wait_seconds", "queue_wait_seconds", "Time from job creation to claim."),
+    ("enqueue_to_claim_seconds", "enqueue_to_claim_seconds", "In-process enqueue to claim latency."),
+    ("rule_projection_batch_size", "rule_projection_batch_rows", "Rows written per rule-event projection batch."),
+    ("rule_projection_commit_seconds", "rule_projection_commit_seconds", "Rule-event projection batch commit time."),
+    ("http_request_seconds", "http_request_seconds", "Control-plane HTTP request latency."),
+)
+
+
+def render_prometheus_metrics(cfg: RemoteRunnerConfig, metrics: RunnerMetrics | None = None) -> str:
+    """Render runner, process and SQLite metrics in the Prometheus text format."""
+    resolved = metrics or get_metrics()
+    lines: list[str] = []
+    for attribute, name, help_text in _COUNTERS:
+        _family(lines, name, "counter", help_text, [("", getattr(resolved, attribute).get())])
+    for attribute, name, help_text in _GAUGES:
+        _family(lines, name, "gauge", help_text, [("", getattr(resolved, attribute).get())])
+    for attribute, name, help_text in _HISTOGRAMS:
+        _histogram_family(lines, name, help_text, getattr(resolved, attribute))
+    _process_families(lines, resolved)
+    _sqlite_families(lines, cfg)
+    _queue_families(lines, cfg)
+    return "\n".join(lines) + "\n"
+
+
+class HttpRequestLatencyMiddleware:
+    """Times each HTTP request until its final response body message is sent.
+
+    Pure ASGI on purpose: ``BaseHTTPMiddleware`` returns once headers are
+    ready, so streamed and file responses would only record time-to-headers.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        recorded = False
+
+        async def send_observed(message: dict[str, Any]) -> None:
+            nonlocal recorded
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False) and not recorded:
+                recorded = True
+                record_http_request(time.perf_counter() - started)
+
+        try:
+            await self.app(scope, receive, send_observed)
+        finally:
+            # Failed or disconnected requests never send a final body.
+            if not recorded:
+                record_http_request(time.perf_counter() - started)
+
+
+def _histogram_family(lines: list[str], name: str, help_text: str, histogram: _Histogram) -> None:
+    full_name = METRIC_PREFIX + name
+    count, total = histogram.totals()
+    lines.append(f"# HELP {full_name} {help_text}")
+    lines.append(f"# TYPE {full_name} histogram")
+    for bound, cumulative in histogram.cumulative_buckets():
+        lines.append(f'{full_name}_bucket{{le="{_number(bound)}"}} {cumulative}')
+    lines.append(f"{full_name}_sum {_number(total)}")
+    lines.append(f"{full_name}_count {count}")
+    # Quantiles come from the streaming sketch; exposed as a summary so alerts need no histogram_quantile().
+    sketch_name = f"{full_name}_sketch"
+    lines.append(f"# HELP {sketch_name} {help_text} Streaming quantile estimate.")
+    lines.append(f"# TYPE {sketch_name} summary")
+    for quantile, value in histogram.quantiles(EXPOSITION_QUANTILES).items():
+        lines.append(f'{sketch_name}{{quantile="{_number(quantile)}"}} {_number(value)}')
+    lines.append(f"{sketch_name}_sum {_number(total)}")
+    lines.append(f"{sketch_name}_count {count}")
+
+
+def _process_families(lines: list[str], metrics: RunnerMetrics) -> None:
+    _family(lines, "process_start_time_seconds", "gauge", "Runner start time since the Unix epoch.", [
+        ("", metrics.started_at),
+    ])
+    _family(lines, "process_cpu_seconds_total", "counter", "User and system CPU time consumed.", [
+        ("", time.process_time()),
+    ])
+    resident = _resident_memory_bytes()
+    if resident is not None:
+        _family(lines, "process_resident_memory_bytes", "gauge", "Resident set size.", [("", resident)])
+    open_fds = _open_fd_count()
+    if open_fds is not None:
+        _family(lines, "process_open_fds", "gauge", "Open file descriptors.", [("", open_fds)])
+    _family(lines, "process_threads", "gauge", "Live Python threads.", [("", threading.active_count())])
+
+
+def _sqlite_families(lines: list[str], cfg: RemoteRunnerConfig) -> None:
+    from .sqlite_connection_pool import connection_pool_stats
+
+    db_path = Path(cfg.db_path)
+    for suffix, name, help_text in (
+        ("", "sqlite_database_bytes", "Runtime database file size."),
+        ("-wal", "sqlite_wal_bytes", "Runtime database WAL file size."),
+    ):
+        try:
+            size = os.stat(f"{db_path}{suffix}").st_size
+        except OSError:
+            size = 0
+        _family(lines, name, "gauge", help_text, [("", size)])
+    pool = connection_pool_stats()
+    _family(lines, "sqlite_pool_connections", "gauge", "Pooled SQLite connections by state.", [
+        ('{state="idle"}', pool.get("idleConnections", 0)),
+        ('{state="in_use"}', pool.get("inUseConnections", 0)),
+    ])
+    _family(lines, "sqlite_pool_checkouts_total", "counter", "SQLite pool checkouts by outcome.", [
+        ('{outcome="hit"}', pool.get("hits", 0)),
+        ('{outcome="miss"}', pool.get("misses", 0)),
+    ])
+
+
+def _queue_families(lines: list[str], cfg: RemoteRunnerConfig) -> None:
+    if not Path(cfg.db_path).is_file():
+        return
+    try:
+        queue = cached_queue_metrics(cfg)
+    except Exception:  # noqa: BLE001 - a scrape must still return process and runner series.
+        _family(lines, "queue_metrics_up", "gauge", "Whether queue metrics could be read.", [("", 0)])
+        return
+    _family(lines, "queue_metrics_up", "gauge", "Whether queue metrics could be read.", [("", 1)])
+    _family(lines, "queue_jobs", "gauge", "Run jobs by queue state.", [
+        ('{state="ready"}', queue["queuedJobs"]),
+        ('{state="scheduled"}', queue["scheduledQueuedJobs"]),
+        ('{state="claimed"}', queue["claimedJobs"]),
+        ('{state="dead_lettered"}', queue["deadLetteredJobs"]),
+    ])
+    _family(lines, "queue_active_leases", "gauge", "Active run leases.", [("", queue["activeLeases"])])
+    _family(lines, "queue_resource_wait_jobs", "gauge", "Queued jobs waiting on resources.", [
+        ("", queue["resourceWaitJobs"]),
+    ])
+    oldest = queue.get("oldestQueuedAgeSeconds")
+    _family(lines, "queue_oldest_age_seconds", "gauge", "Age of the oldest queued job.", [("", oldest or 0)])
+
+
+def _family(lines: list[str], name: str, kind: str, help_text: str, samples: list[tuple[str, Any]]) -> None:
+    full_name = METRIC_PREFIX + name
+    lines.append(f"# HELP {full_name} {help_text}")
+    lines.append(f"# TYPE {full_name} {kind}")
+    for labels, value in samples:
+        lines.append(f"{full_name}{labels} {_number(value)}")
+
+
+def _number(value: Any) -> str:
+    number = float(value)
+    if math.isinf(number):
+        return "+Inf" if number > 0 else "-Inf"
+    if number.is_integer():
+        return str(int(number))
+    return repr(round(number, 6))
+
+
+def _resident_memory_bytes() -> int | None:
+    try:
+        pages = int(Path("/proc/self/statm").read_text(encoding="ascii").split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _open_fd_count() -> int | None:
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
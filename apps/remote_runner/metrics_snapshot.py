@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from .config import RemoteRunnerConfig, load_remote_runner_config
+from .metrics import collect_disk_metrics, collect_queue_metrics
+
+
+LOGGER = logging.getLogger(__name__)
+DEFAULT_MAX_AGE_SECONDS = 5.0
+
+
+class OperationalMetricsSnapshot:
+    """Queue and disk gauges cached for health checks, dashboards and scrapes.
+
+    A read returns the cached value while it is younger than ``max_age_seconds``
+    and only collects inline when it is missing or stale. With the refresher
+    running the cache is kept fresh, so reads never hit SQLite or statvfs.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._queue: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._disk: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._refreshes = 0
+        self._inline_collections = 0
+
+    def queue(self, cfg: RemoteRunnerConfig, *, max_age_seconds: float | None = None) -> dict[str, Any]:
+        key = str(Path(cfg.db_path))
+        cached = self._fresh(self._queue, key, max_age_seconds)
+        if cached is not None:
+            return cached
+        return self._store(self._queue, key, collect_queue_metrics(cfg), inline=True)
+
+    def disk(self, path: str, *, max_age_seconds: float | None = None) -> dict[str, Any]:
+        cached = self._fresh(self._disk, path, max_age_seconds)
+        if cached is not None:
+            return cached
+        return self._store(self._disk, path, collect_disk_metrics(path), inline=True)
+
+    def refresh(self, cfg: RemoteRunnerConfig) -> None:
+        if Path(cfg.db_path).is_file():
+            self._store(self._queue, str(Path(cfg.db_path)), collect_queue_metrics(cfg), inline=False)
+        self._store(self._disk, cfg.data_root, collect_disk_metrics(cfg.data_root), inline=False)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"refreshes": self._refreshes, "inlineCollections": self._inline_collections}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._queue.clear()
+            self._disk.clear()
+
+    def _fresh(
+        self,
+        entries: dict[str, tuple[float, dict[str, Any]]],
+        key: str,
+        max_age_seconds: float | None,
+    ) -> dict[str, Any] | None:
+        max_age = configured_max_age_seconds() if max_age_seconds is None else max_age_seconds
+        with self._lock:
+            entry = entries.get(key)
+        if entry is None:
+            return None
+        age = time.monotonic() - entry[0]
+        if age > max_age:
+            return None
+        return {**entry[1], "snapshotAgeSeconds": round(age, 3)}
+
+    def _store(
+        self,
+        entries: dict[str, tuple[float, dict[str, Any]]],
+        key: str,
+        value: dict[str, Any],
+        *,
+        inline: bool,
+    ) -> dict[str, Any]:
+        with self._lock:
+            entries[key] = (time.monotonic(), value)
+            if inline:
+                self._inline_collections += 1
+            else:
+                self._refreshes += 1
+        return {**value, "snapshotAgeSeconds": 0.0}
+
+
+class OperationalMetricsRefresher:
+    def __init__(
+        self,
+        cfg: RemoteRunnerConfig,
+        *,
+        snapshot: OperationalMetricsSnapshot | None = None,
+        interval_seconds: float | None = None,
+    ) -> None:
+        interval = interval_seconds if interval_seconds is not None else configured_max_age_seconds() / 2
+        if interval <= 0:
+            raise ValueError("OPERATIONAL_METRICS_REFRESH_INTERVAL_INVALID")
+        self._cfg = cfg
+        self._snapshot = snapshot or get_operational_metrics_snapshot()
+        self._interval_seconds = interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name="h2ometa-operational-metrics-refresher",
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, *, timeout_seconds: float = 5.0) -> None:
+        self._stop_event.set()
+        self._thread.join(timeout=timeout_seconds)
+
+    def _run_loop(self) -> None:
+        while True:
+            try:
+                self._snapshot.refresh(self._cfg)
+            except Exception:  # noqa: BLE001 - a failed refresh leaves reads to collect inline.
+                LOGGER.exception("Operational metrics refresh failed.")
+            if self._stop_event.wait(self._interval_seconds):
+                return
+
+
+_SNAPSHOT = OperationalMetricsSnapshot()
+
+
+def get_operational_metrics_snapshot() -> OperationalMetricsSnapshot:
+    return _SNAPSHOT
+
+
+def cached_queue_metrics(cfg: RemoteRunnerConfig) -> dict[str, Any]:
+    return _SNAPSHOT.queue(cfg)
+
+
+def cached_disk_metrics(path: str) -> dict[str, Any]:
+    return _SNAPSHOT.disk(path)
+
+
+def start_configured_operational_metrics_refresher() -> OperationalMetricsRefresher | None:
+    cfg = load_remote_runner_config()
+    if not cfg.token or not _refresher_enabled():
+        return None
+    refresher = OperationalMetricsRefresher(cfg)
+    refresher.start()
+    return refresher
+
+
+def configured_max_age_seconds() -> float:
+    raw = str(os.environ.get("H2OMETA_OPERATIONAL_METRICS_MAX_AGE_SECONDS", "") or "").strip()
+    if not raw:
+        return DEFAULT_MAX_AGE_SECONDS
+    value = float(raw)
+    if value < 0:
+        raise ValueError("OPERATIONAL_METRICS_MAX_AGE_INVALID")
+    return value
+
+
+def _refresher_enabled() -> bool:
+    value = str(os.environ.get("H2OMETA_OPERATIONAL_METRICS_REFRESHER", "1") or "").strip().lower()
+    return value in {"1", "true", "yes", "on"} and configured_max_age_seconds() > 0
@@ -11,6 +11,7 @@ from core.contracts.pipeline_manifest import (
 )
 
 from .config import RemoteRunnerConfig
+from .snakemake_resource_plan import snakemake_resource_policy
 
 
 class PipelineNotFoundError(PipelineRegistryError):
@@ -115,6 +116,10 @@ def _load_pipeline_manifest(manifest_path: Path) -> PipelineDefinition:
     pipeline_id = validation.pipeline_id
     snakefile = validation.snakefile
     execution = validation.execution
+    try:
+        snakemake_resource_policy(execution)
+    except ValueError as exc:
+        raise PipelineRegistryError(str(exc)) from exc
     return PipelineDefinition(
         pipeline_id=pipeline_id,
         name=str(raw.get("name") or pipeline_id),
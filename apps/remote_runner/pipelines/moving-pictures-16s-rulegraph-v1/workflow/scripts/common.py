@@ -1,7 +1,16 @@
 import csv
 import gzip
+from itertools import islice
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # The conda env ships NumPy; plain interpreters fall back to the per-read loop.
+    np = None
+
+
+FASTQ_BATCH_READS = 65536
+
 
 def open_text(path: Path):
     if path.suffix == ".gz":
@@ -20,18 +29,24 @@ def identify_inputs(items: list[dict]) -> tuple[Path, Path, Path]:
     return metadata, barcodes, sequences
 
 
-def iter_fastq(path: Path):
+def iter_fastq_batches(path: Path, batch_reads: int = FASTQ_BATCH_READS):
+    """Yield lists of ``(header, sequence, plus, quality)`` records, reading ``batch_reads`` reads at a time."""
     with open_text(path) as handle:
         while True:
-            header = handle.readline()
-            if not header:
+            lines = list(islice(handle, 4 * batch_reads))
+            if not lines:
                 return
-            seq = handle.readline()
-            plus = handle.readline()
-            qual = handle.readline()
-            if not qual:
+            if len(lines) % 4:
                 raise ValueError(f"FASTQ file ended mid-record: {path.name}")
-            yield header.strip(), seq.strip().upper(), plus.strip(), qual.strip()
+            yield [
+                (header.strip(), seq.strip().upper(), plus.strip(), qual.strip())
+                for header, seq, plus, qual in zip(lines[0::4], lines[1::4], lines[2::4], lines[3::4])
+            ]
+
+
+def iter_fastq(path: Path):
+    for batch in iter_fastq_batches(path):
+        yield from batch
 
 
 def mean_quality(qual: str) -> float:
@@ -40,6 +55,21 @@ def mean_quality(qual: str) -> float:
     return sum(ord(char) - 33 for char in qual) / len(qual)
 
 
+def quality_pass_mask(qualities: list[str], min_mean_quality: int) -> list[bool]:
+    """Return ``mean_quality(q) >= min_mean_quality`` for each quality string, vectorized when possible."""
+    joined = "".join(qualities)
+    if np is None or not joined.isascii():
+        return [mean_quality(qual) >= min_mean_quality for qual in qualities]
+    scores = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+    lengths = np.fromiter((len(qual) for qual in qualities), dtype=np.int64, count=len(qualities))
+    ends = np.cumsum(lengths)
+    totals = np.concatenate(([0], np.cumsum(scores, dtype=np.int64)))
+    sums = totals[ends] - totals[ends - lengths] - 33 * lengths
+    # Integer comparison avoids float rounding; empty qualities score 0.0 like mean_quality.
+    passed = np.where(lengths > 0, sums >= int(min_mean_quality) * lengths, 0 >= min_mean_quality)
+    return passed.tolist()
+
+
 def read_tsv(path: Path) -> list[dict[str, str]]:
     with path.open("r", encoding="utf-8", errors="replace", newline="") as handle:
         return list(csv.DictReader(handle, delimiter="\t"))
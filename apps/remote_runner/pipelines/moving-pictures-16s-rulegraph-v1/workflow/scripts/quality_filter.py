@@ -1,9 +1,10 @@
 from collections import Counter
+from itertools import islice
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(getattr(snakemake, "scriptdir", Path(__file__).resolve().parent))))  # type: ignore[name-defined]
-from common import mean_quality, write_tsv
+from common import FASTQ_BATCH_READS, quality_pass_mask, write_tsv
 
 
 params = dict(snakemake.config.get("params") or {})  # type: ignore[name-defined]
@@ -20,17 +21,20 @@ output_path.parent.mkdir(parents=True, exist_ok=True)
 with Path(snakemake.input.reads).open("r", encoding="utf-8", errors="replace") as source, output_path.open("w", encoding="utf-8", newline="") as target:  # type: ignore[name-defined]
     target.write("sample_id\tsequence\n")
     next(source, None)
-    for line in source:
-        total += 1
-        sample_id, sequence, quality = line.rstrip("\n").split("\t", 2)
-        if len(sequence) < min_length:
-            too_short += 1
-            continue
-        if mean_quality(quality) < min_mean_quality:
-            low_quality += 1
-            continue
-        passed[sample_id] += 1
-        target.write(f"{sample_id}\t{sequence}\n")
+    while lines := list(islice(source, FASTQ_BATCH_READS)):
+        total += len(lines)
+        long_enough = []
+        for line in lines:
+            sample_id, sequence, quality = line.rstrip("\n").split("\t", 2)
+            if len(sequence) < min_length:
+                too_short += 1
+            else:
+                long_enough.append((sample_id, sequence, quality))
+        mask = quality_pass_mask([quality for _sample_id, _sequence, quality in long_enough], min_mean_quality)
+        kept = [(sample_id, sequence) for (sample_id, sequence, _quality), ok in zip(long_enough, mask) if ok]
+        low_quality += len(long_enough) - len(kept)
+        passed.update(sample_id for sample_id, _sequence in kept)
+        target.write("".join(f"{sample_id}\t{sequence}\n" for sample_id, sequence in kept))
 
 rows = [{"metric": "demultiplexed_reads", "value": total}]
 rows.extend({"metric": f"passed_reads:{sample_id}", "value": passed[sample_id]} for sample_id in sorted(passed))
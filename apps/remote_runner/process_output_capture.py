@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import codecs
+import threading
+import time
+from typing import IO, Any
+
+DEFAULT_OUTPUT_CHUNK_BYTES = 64 * 1024
+DEFAULT_OUTPUT_BUFFER_BYTES = 1024 * 1024
+DEFAULT_OUTPUT_TAIL_BYTES = 64 * 1024
+OUTPUT_STREAMS = ("stdout", "stderr")
+
+OutputSink = Callable[[str, str], None]
+
+
+class ProcessOutputCapture:
+    """Drains child stdout/stderr concurrently and hands bounded chunks to a sink.
+
+    Reader threads only enqueue raw bytes; the sink always runs on the thread
+    that calls ``drain``/``finish`` so it may safely touch SQLite or log files.
+    When the queued bytes reach ``max_buffered_bytes`` readers block, which in
+    turn blocks the child on a full pipe; those stalls are counted as
+    backpressure. Only the last ``tail_bytes`` of each stream stay in memory.
+    """
+
+    def __init__(
+        self,
+        sink: OutputSink,
+        *,
+        max_buffered_bytes: int = DEFAULT_OUTPUT_BUFFER_BYTES,
+        tail_bytes: int = DEFAULT_OUTPUT_TAIL_BYTES,
+        chunk_bytes: int = DEFAULT_OUTPUT_CHUNK_BYTES,
+    ) -> None:
+        self._sink = sink
+        self._chunk_bytes = max(1, int(chunk_bytes))
+        self._max_buffered_bytes = max(self._chunk_bytes, int(max_buffered_bytes))
+        self._tail_bytes = max(0, int(tail_bytes))
+        self._condition = threading.Condition()
+        self._pending: deque[tuple[str, bytes]] = deque()
+        self._buffered_bytes = 0
+        self._open_readers = 0
+        self._aborted = False
+        self._discarding = False
+        self._readers: list[threading.Thread] = []
+        self._decoders = {stream: codecs.getincrementaldecoder("utf-8")(errors="replace") for stream in OUTPUT_STREAMS}
+        self._tails = {stream: bytearray() for stream in OUTPUT_STREAMS}
+        self._stream_bytes = dict.fromkeys(OUTPUT_STREAMS, 0)
+        self._stream_chunks = dict.fromkeys(OUTPUT_STREAMS, 0)
+        self._tail_truncated_bytes = 0
+        self._peak_buffered_bytes = 0
+        self._backpressure_waits = 0
+        self._backpressure_seconds = 0.0
+
+    @property
+    def started(self) -> bool:
+        return bool(self._readers)
+
+    def start(self, pipes: dict[str, IO[bytes] | None]) -> bool:
+        readable = {stream: pipe for stream, pipe in pipes.items() if stream in OUTPUT_STREAMS and hasattr(pipe, "read1")}
+        if not readable:
+            return False
+        with self._condition:
+            self._open_readers = len(readable)
+        for stream, pipe in readable.items():
+            reader = threading.Thread(
+                target=self._read_pipe,
+                args=(stream, pipe),
+                name=f"process-output-{stream}",
+                daemon=True,
+            )
+            self._readers.append(reader)
+            reader.start()
+        return True
+
+    def drain(self, timeout: float = 0.0) -> bool:
+        """Deliver queued output; returns False once no reader can produce more."""
+        with self._condition:
+            if not self._pending and self._open_readers and timeout > 0:
+                self._condition.wait(timeout)
+            readers_open = self._open_readers > 0
+            if self._discarding:
+                return False
+            batch = list(self._pending)
+            self._pending.clear()
+        try:
+            for stream, chunk in batch:
+                self._deliver(stream, chunk)
+        finally:
+            with self._condition:
+                self._buffered_bytes = max(0, self._buffered_bytes - sum(len(chunk) for _, chunk in batch))
+                self._condition.notify_all()
+        return readers_open
+
+    def finish(self, timeout: float | None = None) -> tuple[str, str]:
+        deadline = None if timeout is None else time.monotonic() + max(0.0, float(timeout))
+        while True:
+            with self._condition:
+                readers_open = self._open_readers > 0
+                discarding = self._discarding
+            if not readers_open:
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                # A grandchild still holds the pipe open; stop waiting for it.
+                self._stop_readers()
+                break
+            wait_seconds = 0.05 if remaining is None else min(0.05, remaining)
+            if discarding:
+                with self._condition:
+                    self._condition.wait(wait_seconds)
+            else:
+                self.drain(timeout=wait_seconds)
+        if not self._discarding:
+            self.drain()
+            for stream in OUTPUT_STREAMS:
+                tail = self._decoders[stream].decode(b"", final=True)
+                if tail:
+                    self._sink(stream, tail)
+        return self.tail("stdout"), self.tail("stderr")
+
+    def abort(self) -> None:
+        """Stop readers and drop undelivered output without calling the sink again."""
+        with self._condition:
+            self._discarding = True
+            self._pending.clear()
+            self._buffered_bytes = 0
+        self._stop_readers()
+
+    def tail(self, stream: str) -> str:
+        return bytes(self._tails[stream]).decode("utf-8", errors="replace")
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "streams": {
+                    stream: {"bytes": self._stream_bytes[stream], "chunks": self._stream_chunks[stream]}
+                    for stream in OUTPUT_STREAMS
+                },
+                "maxBufferedBytes": self._max_buffered_bytes,
+                "peakBufferedBytes": self._peak_buffered_bytes,
+                "bufferedBytes": self._buffered_bytes,
+                "backpressureWaits": self._backpressure_waits,
+                "backpressureSeconds": round(self._backpressure_seconds, 6),
+                "tailTruncatedBytes": self._tail_truncated_bytes,
+            }
+
+    def _stop_readers(self) -> None:
+        with self._condition:
+            self._aborted = True
+            self._condition.notify_all()
+
+    def _read_pipe(self, stream: str, pipe: IO[bytes]) -> None:
+        try:
+            while True:
+                chunk = pipe.read1(self._chunk_bytes)
+                if not chunk or not self._enqueue(stream, chunk):
+                    break
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._condition:
+                self._open_readers -= 1
+                self._condition.notify_all()
+
+    def _enqueue(self, stream: str, chunk: bytes) -> bool:
+        with self._condition:
+            if self._over_limit(len(chunk)):
+                self._backpressure_waits += 1
+                started = time.perf_counter()
+                while self._over_limit(len(chunk)):
+                    self._condition.wait()
+                self._backpressure_seconds += time.perf_counter() - started
+            if self._aborted:
+                return False
+            self._pending.append((stream, chunk))
+            self._buffered_bytes += len(chunk)
+            self._peak_buffered_bytes = max(self._peak_buffered_bytes, self._buffered_bytes)
+            self._stream_bytes[stream] += len(chunk)
+            self._stream_chunks[stream] += 1
+            self._condition.notify_all()
+            return True
+
+    def _over_limit(self, size: int) -> bool:
+        return not self._aborted and self._buffered_bytes > 0 and self._buffered_bytes + size > self._max_buffered_bytes
+
+    def _deliver(self, stream: str, chunk: bytes) -> None:
+        tail = self._tails[stream]
+        tail.extend(chunk)
+        overflow = len(tail) - self._tail_bytes
+        if overflow > 0:
+            del tail[:overflow]
+            self._tail_truncated_bytes += overflow
+        text = self._decoders[stream].decode(chunk)
+        if text:
+            self._sink(stream, text)
@@ -6,6 +6,8 @@ import signal
 import subprocess
 import time
 
+from .process_output_capture import ProcessOutputCapture
+
 
 ShouldCancel = Callable[[], bool]
 ProcessStarted = Callable[[int], None]
@@ -21,15 +23,17 @@ def run_process(
     on_poll: ProcessPoll | None = None,
     poll_interval_seconds: float = 0.2,
     terminate_timeout_seconds: float = 5.0,
+    output_capture: ProcessOutputCapture | None = None,
 ) -> subprocess.CompletedProcess[str]:
     process = subprocess.Popen(
         command,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
+        text=output_capture is None,
         env=env,
         **_process_group_kwargs(),
     )
+    capture = _start_output_capture(process, output_capture)
     if on_process_started is not None:
         try:
             on_process_started(int(process.pid))
@@ -39,6 +43,7 @@ def run_process(
                 command=command,
                 timeout_seconds=terminate_timeout_seconds,
                 reason="Snakemake process terminated after process-start callback failed.",
+                capture=capture,
             )
             raise
     try:
@@ -51,21 +56,70 @@ def run_process(
                     command=command,
                     timeout_seconds=terminate_timeout_seconds,
                     reason="Snakemake process terminated after stale lease.",
+                    capture=capture,
                 )
             if process.poll() is not None:
-                stdout, stderr = process.communicate()
+                stdout, stderr = _collect_output(process, capture, timeout_seconds=terminate_timeout_seconds)
                 return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
-            time.sleep(max(0.0, float(poll_interval_seconds)))
+            _wait_for_output(capture, poll_interval_seconds)
     except BaseException:
         _terminate_running_process(
             process,
             command=command,
             timeout_seconds=terminate_timeout_seconds,
             reason="Snakemake process terminated after process-poll callback failed.",
+            capture=capture,
         )
         raise
 
 
+def _start_output_capture(
+    process: subprocess.Popen,
+    output_capture: ProcessOutputCapture | None,
+) -> ProcessOutputCapture | None:
+    if output_capture is None:
+        return None
+    pipes = {"stdout": getattr(process, "stdout", None), "stderr": getattr(process, "stderr", None)}
+    return output_capture if output_capture.start(pipes) else None
+
+
+def _wait_for_output(capture: ProcessOutputCapture | None, poll_interval_seconds: float) -> None:
+    interval = max(0.0, float(poll_interval_seconds))
+    if capture is None:
+        time.sleep(interval)
+        return
+    # Drain as soon as output arrives instead of sleeping through a full pipe.
+    deadline = time.monotonic() + interval
+    while True:
+        readers_open = capture.drain(timeout=max(0.0, deadline - time.monotonic()))
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if not readers_open:
+            # The child closed its pipes but is still running; nothing will wake the drain.
+            time.sleep(remaining)
+            return
+
+
+def _collect_output(
+    process: subprocess.Popen,
+    capture: ProcessOutputCapture | None,
+    *,
+    timeout_seconds: float,
+) -> tuple[str, str]:
+    if capture is None:
+        stdout, stderr = process.communicate()
+        return _text(stdout), _text(stderr)
+    process.wait()
+    return capture.finish(timeout=max(0.0, float(timeout_seconds)))
+
+
+def _text(value: str | bytes | None) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return value or ""
+
+
 def _process_group_kwargs() -> dict[str, object]:
     if os.name == "nt":
         return {"creationflags": getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)}
@@ -78,13 +132,23 @@ def _terminate_process(
     command: list[str],
     timeout_seconds: float,
     reason: str,
+    capture: ProcessOutputCapture | None = None,
 ) -> subprocess.CompletedProcess[str]:
     _terminate_process_group(process)
-    try:
-        stdout, stderr = process.communicate(timeout=max(0.0, float(timeout_seconds)))
-    except subprocess.TimeoutExpired:
-        _kill_process_group(process)
-        stdout, stderr = process.communicate()
+    if capture is None:
+        try:
+            stdout, stderr = process.communicate(timeout=max(0.0, float(timeout_seconds)))
+        except subprocess.TimeoutExpired:
+            _kill_process_group(process)
+            stdout, stderr = process.communicate()
+        stdout, stderr = _text(stdout), _text(stderr)
+    else:
+        try:
+            process.wait(timeout=max(0.0, float(timeout_seconds)))
+        except subprocess.TimeoutExpired:
+            _kill_process_group(process)
+            process.wait()
+        stdout, stderr = capture.finish(timeout=max(0.0, float(timeout_seconds)))
     stderr = _append_reason(stderr, reason)
     return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
 
@@ -95,7 +159,11 @@ def _terminate_running_process(
     command: list[str],
     timeout_seconds: float,
     reason: str,
+    capture: ProcessOutputCapture | None = None,
 ) -> None:
+    if capture is not None:
+        # The failing caller will not drain again; let readers discard output.
+        capture.abort()
     if process.poll() is not None:
         return
     _terminate_process(
@@ -103,6 +171,7 @@ def _terminate_running_process(
         command=command,
         timeout_seconds=timeout_seconds,
         reason=reason,
+        capture=capture,
     )
 
 
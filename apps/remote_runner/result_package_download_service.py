@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import hashlib
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +8,7 @@ from core.contracts.result_package_remote_endpoints import RESULT_PACKAGE_DOWNLO
 
 from .config import RemoteRunnerConfig
 from .result_package_storage import fetch_result_package_export
+from .verified_digest_cache import verified_file_stats
 
 
 RESULT_PACKAGE_DOWNLOAD_MEDIA_TYPE = "application/zip"
@@ -50,7 +50,7 @@ def build_result_package_download(
     size_bytes = package_path.stat().st_size
     if size_bytes != int(record["sizeBytes"]):
         raise ValueError("RESULT_PACKAGE_SIZE_MISMATCH")
-    sha256 = _file_sha256(package_path)
+    sha256 = verified_file_stats(cfg, package_path)[1]
     if sha256 != record["sha256"]:
         raise ValueError("RESULT_PACKAGE_CHECKSUM_MISMATCH")
 
@@ -76,6 +76,8 @@ def _download_headers(record: dict[str, Any], filename: str) -> dict[str, str]:
     return {
         "Cache-Control": "private, no-store",
         "Content-Disposition": f'attachment; filename="{filename}"',
+        # Strong validator for If-Range: the package bytes are immutable per digest.
+        "ETag": f'"{record["sha256"]}"',
         "X-Content-Type-Options": "nosniff",
         "X-H2OMeta-Result-Id": record["resultId"],
         "X-H2OMeta-Package-Export-Id": record["packageExportId"],
@@ -85,14 +87,6 @@ def _download_headers(record: dict[str, Any], filename: str) -> dict[str, str]:
     }
 
 
-def _file_sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _is_relative_to(path: Path, root: Path) -> bool:
     try:
         path.relative_to(root)
@@ -4,7 +4,7 @@ from typing import Any
 
 from .artifact_output_labels import safe_artifact_output_label
 from .config import RemoteRunnerConfig
-from .execution_query_storage import fetch_result, fetch_run_results, list_results
+from .execution_query_storage import fetch_result, fetch_run_results, list_results, next_result_page_cursor
 from .governance_audit import record_governance_audit_event
 
 
@@ -43,8 +43,9 @@ def governed_fetch_run_results(cfg: RemoteRunnerConfig, run_id: str) -> dict[str
     return public
 
 
-def governed_list_results(cfg: RemoteRunnerConfig) -> list[dict[str, Any]]:
-    items = [public_result_summary(item) for item in list_results(cfg)]
+def governed_list_results(cfg: RemoteRunnerConfig, **query: Any) -> dict[str, Any]:
+    raw_items = list_results(cfg, **query)
+    items = [public_result_summary(item) for item in raw_items]
     record_governance_audit_event(
         cfg,
         action="result.list",
@@ -53,7 +54,7 @@ def governed_list_results(cfg: RemoteRunnerConfig) -> list[dict[str, Any]]:
         subject_id="query",
         details={"returnedCount": len(items)},
     )
-    return items
+    return {"items": items, "nextCursor": next_result_page_cursor(raw_items, query.get("limit"))}
 
 
 def governed_fetch_result(cfg: RemoteRunnerConfig, result_id: str) -> dict[str, Any]:
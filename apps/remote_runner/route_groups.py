@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import os
+import threading
+import time
+from typing import Any
+
+from fastapi import FastAPI
+
+from core.env_bool import parse_strict_env_bool
+
+from .startup_timing import STARTUP_TIMELINE
+
+
+_ALL_ROUTE_PATHS = ("/openapi.json", "/docs", "/redoc")
+
+
+@dataclass(frozen=True)
+class RouteGroup:
+    name: str
+    path_prefixes: tuple[str, ...]
+    include: Callable[[FastAPI], None]
+
+
+def lazy_route_groups_enabled() -> bool:
+    return bool(
+        parse_strict_env_bool(
+            os.environ.get("H2OMETA_REMOTE_LAZY_ROUTE_GROUPS"),
+            name="H2OMETA_REMOTE_LAZY_ROUTE_GROUPS",
+            default=False,
+        )
+    )
+
+
+class RouteGroupRegistry:
+    """Includes rarely used routers on the first request under their prefix.
+
+    Starlette matches against ``app.router.routes`` on every request, so a
+    router included from middleware serves the request that triggered it.
+    """
+
+    def __init__(self, app: FastAPI, groups: tuple[RouteGroup, ...]) -> None:
+        self._app = app
+        self._groups = groups
+        self._loaded: set[str] = set()
+        self._lock = threading.Lock()
+
+    def register(self, *, lazy: bool | None = None) -> None:
+        if not (lazy_route_groups_enabled() if lazy is None else lazy):
+            for group in self._groups:
+                self._load(group, lazy=False)
+            return
+        for group in self._groups:
+            STARTUP_TIMELINE.record_route_group(group.name, lazy=True, loaded=False)
+        self._app.middleware("http")(self._load_on_demand)
+
+    def loaded_groups(self) -> set[str]:
+        with self._lock:
+            return set(self._loaded)
+
+    def ensure_loaded_for(self, path: str) -> None:
+        load_all = path in _ALL_ROUTE_PATHS
+        for group in self._groups:
+            if group.name not in self._loaded and (load_all or path.startswith(group.path_prefixes)):
+                self._load(group, lazy=True)
+
+    async def _load_on_demand(self, request: Any, call_next: Callable[[Any], Awaitable[Any]]) -> Any:
+        if len(self._loaded) < len(self._groups):
+            self.ensure_loaded_for(request.url.path)
+        return await call_next(request)
+
+    def _load(self, group: RouteGroup, *, lazy: bool) -> None:
+        with self._lock:
+            if group.name in self._loaded:
+                return
+            started = time.perf_counter()
+            group.include(self._app)
+            self._app.openapi_schema = None
+            self._loaded.add(group.name)
+        STARTUP_TIMELINE.record_route_group(group.name, lazy=lazy, loaded=True, seconds=time.perf_counter() - started)
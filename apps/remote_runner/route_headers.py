@@ -10,3 +10,4 @@ from fastapi import Header
 AuthorizationHeader = Annotated[str | None, Header()]
 IdempotencyKeyHeader = Annotated[str | None, Header(alias="Idempotency-Key")]
 RequestIdHeader = Annotated[str | None, Header(alias="X-Request-Id")]
+LastEventIdHeader = Annotated[str | None, Header(alias="Last-Event-ID")]
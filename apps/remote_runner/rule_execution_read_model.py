@@ -5,7 +5,7 @@ from typing import Any
 
 from .config import RemoteRunnerConfig
 from .execution_query_storage import fetch_run_results
-from .log_storage import fetch_log_lines
+from .log_storage import fetch_log_tail
 from .rule_execution_storage import fetch_run_rules
 from .run_failure_locator_read_model import (
     build_rule_log_context,
@@ -18,6 +18,7 @@ from .run_failure_locator_read_model import (
 
 RUN_RULES_PUBLIC_SCHEMA = "run-rules.v1"
 RUN_RULES_SUMMARY_SCHEMA = "run-rules-summary.v1"
+RULE_STDERR_TAIL_LINES = 200
 
 
 def fetch_public_run_rules(cfg: RemoteRunnerConfig, run_id: str) -> dict[str, Any]:
@@ -25,7 +26,7 @@ def fetch_public_run_rules(cfg: RemoteRunnerConfig, run_id: str) -> dict[str, An
     results = fetch_run_results(cfg, run_id)
     artifacts = _dict_items(results.get("artifacts"))
     result_id = _canonical_result_id_for_run(run_id)
-    stderr_lines = _log_lines(fetch_log_lines(cfg, run_id, "stderr", None))
+    stderr_lines = _log_lines(fetch_log_tail(cfg, run_id, "stderr", RULE_STDERR_TAIL_LINES))
     items = [
         _public_rule(cfg, result_id=result_id, rule=rule, artifacts=artifacts, stderr_lines=stderr_lines)
         for rule in _dict_items(raw_rules.get("items"))
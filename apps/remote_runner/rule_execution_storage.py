@@ -10,6 +10,37 @@ from .errors import RemoteRunnerNotFoundError
 from .storage_core import get_connection, now_iso
 
 
+_UPSERT_RUN_RULE_SQL = """
+    INSERT INTO run_rules (
+        run_rule_id, run_id, rule_name, step_id, runtime_status_key, status,
+        attempt_id, lease_generation, attempt_number, started_at, finished_at, exit_code,
+        message, command_summary, inputs_json, outputs_json, wildcards_json, logs_json,
+        updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(run_id, rule_name, attempt_id, lease_generation) DO UPDATE SET
+        step_id = excluded.step_id,
+        runtime_status_key = excluded.runtime_status_key,
+        status = excluded.status,
+        attempt_number = excluded.attempt_number,
+        started_at = COALESCE(excluded.started_at, run_rules.started_at),
+        finished_at = excluded.finished_at,
+        exit_code = excluded.exit_code,
+        message = excluded.message,
+        command_summary = excluded.command_summary,
+        inputs_json = excluded.inputs_json,
+        outputs_json = excluded.outputs_json,
+        wildcards_json = excluded.wildcards_json,
+        logs_json = excluded.logs_json,
+        updated_at = excluded.updated_at
+"""
+_INSERT_RUN_RULE_EVENT_SQL = """
+    INSERT INTO run_rule_events (
+        rule_event_id, run_id, run_rule_id, rule_name, step_id, event_type,
+        status, attempt_id, lease_generation, attempt_number, message, created_at, details_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def upsert_run_rule_state(
     cfg: RemoteRunnerConfig,
     *,
@@ -32,7 +63,26 @@ def upsert_run_rule_state(
     logs: list[str] | None = None,
     occurred_at: str | None = None,
 ) -> dict[str, Any]:
-    timestamp = occurred_at or now_iso()
+    state = {
+        "run_id": run_id,
+        "rule_name": rule_name,
+        "status": status,
+        "attempt_id": attempt_id,
+        "lease_generation": lease_generation,
+        "attempt_number": attempt_number,
+        "step_id": step_id,
+        "runtime_status_key": runtime_status_key,
+        "started_at": started_at,
+        "finished_at": finished_at,
+        "exit_code": exit_code,
+        "message": message,
+        "command_summary": command_summary,
+        "inputs": inputs,
+        "outputs": outputs,
+        "wildcards": wildcards,
+        "logs": logs,
+        "occurred_at": occurred_at,
+    }
     with get_connection(cfg) as connection:
         _require_current_attempt(
             connection,
@@ -40,63 +90,9 @@ def upsert_run_rule_state(
             attempt_id=attempt_id,
             lease_generation=lease_generation,
         )
-        attempt_row = connection.execute(
-            "SELECT attempt_number FROM run_attempts WHERE attempt_id = ?",
-            (attempt_id,),
-        ).fetchone()
-        resolved_attempt_number = (
-            attempt_number
-            if attempt_number is not None
-            else (int(attempt_row["attempt_number"]) if attempt_row else None)
-        )
-        rule_id = _run_rule_id(run_id, rule_name, attempt_id, lease_generation)
-        connection.execute(
-            """
-            INSERT INTO run_rules (
-                run_rule_id, run_id, rule_name, step_id, runtime_status_key, status,
-                attempt_id, lease_generation, attempt_number, started_at, finished_at, exit_code,
-                message, command_summary, inputs_json, outputs_json, wildcards_json, logs_json,
-                updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(run_id, rule_name, attempt_id, lease_generation) DO UPDATE SET
-                step_id = excluded.step_id,
-                runtime_status_key = excluded.runtime_status_key,
-                status = excluded.status,
-                attempt_number = excluded.attempt_number,
-                started_at = COALESCE(excluded.started_at, run_rules.started_at),
-                finished_at = excluded.finished_at,
-                exit_code = excluded.exit_code,
-                message = excluded.message,
-                command_summary = excluded.command_summary,
-                inputs_json = excluded.inputs_json,
-                outputs_json = excluded.outputs_json,
-                wildcards_json = excluded.wildcards_json,
-                logs_json = excluded.logs_json,
-                updated_at = excluded.updated_at
-            """,
-            (
-                rule_id,
-                _required_text(run_id, "RUN_ID_REQUIRED"),
-                _required_text(rule_name, "RULE_NAME_REQUIRED"),
-                _optional_text(step_id) or "",
-                _optional_text(runtime_status_key) or "",
-                _required_text(status, "RULE_STATUS_REQUIRED"),
-                _required_text(attempt_id, "ATTEMPT_ID_REQUIRED"),
-                int(lease_generation),
-                int(resolved_attempt_number) if resolved_attempt_number is not None else None,
-                started_at,
-                finished_at,
-                exit_code,
-                str(message or ""),
-                str(command_summary or ""),
-                _json_list(inputs or []),
-                _json_list(outputs or []),
-                _json_object(wildcards or {}),
-                _json_list(logs or []),
-                timestamp,
-            ),
-        )
-        row = connection.execute("SELECT * FROM run_rules WHERE run_rule_id = ?", (rule_id,)).fetchone()
+        params = _rule_state_params(state, _stored_attempt_number(connection, attempt_id))
+        connection.execute(_UPSERT_RUN_RULE_SQL, params)
+        row = connection.execute("SELECT * FROM run_rules WHERE run_rule_id = ?", (params[0],)).fetchone()
         connection.commit()
     return _rule_row_to_dict(row, []) if row is not None else {}
 
@@ -116,7 +112,19 @@ def append_run_rule_event(
     details: dict[str, Any] | None = None,
     occurred_at: str | None = None,
 ) -> dict[str, Any]:
-    timestamp = occurred_at or now_iso()
+    event = {
+        "run_id": run_id,
+        "rule_name": rule_name,
+        "event_type": event_type,
+        "status": status,
+        "attempt_id": attempt_id,
+        "lease_generation": lease_generation,
+        "attempt_number": attempt_number,
+        "step_id": step_id,
+        "message": message,
+        "details": details,
+        "occurred_at": occurred_at,
+    }
     with get_connection(cfg) as connection:
         _require_current_attempt(
             connection,
@@ -124,49 +132,68 @@ def append_run_rule_event(
             attempt_id=attempt_id,
             lease_generation=lease_generation,
         )
-        rule_id = _run_rule_id(run_id, rule_name, attempt_id, lease_generation)
-        row = connection.execute(
-            "SELECT attempt_number FROM run_attempts WHERE attempt_id = ?",
-            (attempt_id,),
-        ).fetchone()
-        resolved_attempt_number = attempt_number if attempt_number is not None else (int(row["attempt_number"]) if row else None)
-        event_id = f"rre_{uuid.uuid4().hex[:12]}"
-        connection.execute(
-            """
-            INSERT INTO run_rule_events (
-                rule_event_id, run_id, run_rule_id, rule_name, step_id, event_type,
-                status, attempt_id, lease_generation, attempt_number, message, created_at, details_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event_id,
-                _required_text(run_id, "RUN_ID_REQUIRED"),
-                rule_id,
-                _required_text(rule_name, "RULE_NAME_REQUIRED"),
-                _optional_text(step_id) or "",
-                _required_text(event_type, "RULE_EVENT_TYPE_REQUIRED"),
-                _required_text(status, "RULE_STATUS_REQUIRED"),
-                _required_text(attempt_id, "ATTEMPT_ID_REQUIRED"),
-                int(lease_generation),
-                int(resolved_attempt_number) if resolved_attempt_number is not None else 0,
-                str(message or ""),
-                timestamp,
-                _json_object(details or {}),
-            ),
-        )
+        params = _rule_event_params(event, _stored_attempt_number(connection, attempt_id))
+        connection.execute(_INSERT_RUN_RULE_EVENT_SQL, params)
         connection.commit()
     return {
-        "ruleEventId": event_id,
+        "ruleEventId": params[0],
         "runId": run_id,
         "ruleName": rule_name,
         "eventType": event_type,
         "status": status,
         "attemptId": attempt_id,
         "leaseGeneration": int(lease_generation),
-        "createdAt": timestamp,
+        "createdAt": params[11],
     }
 
 
+def write_run_rule_projection_batch(
+    cfg: RemoteRunnerConfig,
+    *,
+    rule_states: list[dict[str, Any]],
+    rule_events: list[dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Apply a batch of rule upserts and rule events in one transaction.
+
+    Items take the keyword arguments of ``upsert_run_rule_state`` and
+    ``append_run_rule_event``. Returns the stored rules keyed by run_rule_id.
+    """
+    if not rule_states and not rule_events:
+        return {}
+    with get_connection(cfg) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        attempt_numbers: dict[str, int | None] = {}
+        for item in [*rule_states, *rule_events]:
+            attempt_id = str(item["attempt_id"])
+            if attempt_id in attempt_numbers:
+                continue
+            _require_current_attempt(
+                connection,
+                run_id=item["run_id"],
+                attempt_id=attempt_id,
+                lease_generation=item["lease_generation"],
+            )
+            attempt_numbers[attempt_id] = _stored_attempt_number(connection, attempt_id)
+        state_params = [_rule_state_params(item, attempt_numbers[str(item["attempt_id"])]) for item in rule_states]
+        connection.executemany(_UPSERT_RUN_RULE_SQL, state_params)
+        connection.executemany(
+            _INSERT_RUN_RULE_EVENT_SQL,
+            [_rule_event_params(item, attempt_numbers[str(item["attempt_id"])]) for item in rule_events],
+        )
+        rule_ids = sorted({params[0] for params in state_params})
+        rows = []
+        for offset in range(0, len(rule_ids), 500):
+            chunk = rule_ids[offset : offset + 500]
+            rows.extend(
+                connection.execute(
+                    f"SELECT * FROM run_rules WHERE run_rule_id IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall()
+            )
+        connection.commit()
+    return {str(row["run_rule_id"]): _rule_row_to_dict(row, []) for row in rows}
+
+
 def fetch_run_rules(cfg: RemoteRunnerConfig, run_id: str) -> dict[str, Any]:
     with get_connection(cfg) as connection:
         run = connection.execute("SELECT run_id FROM runs WHERE run_id = ?", (run_id,)).fetchone()
@@ -267,6 +294,68 @@ def _require_current_attempt(
         raise RuntimeError("RUN_RULE_EVENT_STALE_ATTEMPT")
 
 
+def _stored_attempt_number(connection: Any, attempt_id: str) -> int | None:
+    row = connection.execute(
+        "SELECT attempt_number FROM run_attempts WHERE attempt_id = ?",
+        (attempt_id,),
+    ).fetchone()
+    return int(row["attempt_number"]) if row else None
+
+
+def _rule_state_params(state: dict[str, Any], stored_attempt_number: int | None) -> tuple[Any, ...]:
+    run_id = _required_text(state["run_id"], "RUN_ID_REQUIRED")
+    rule_name = _required_text(state["rule_name"], "RULE_NAME_REQUIRED")
+    attempt_id = _required_text(state["attempt_id"], "ATTEMPT_ID_REQUIRED")
+    lease_generation = int(state["lease_generation"])
+    attempt_number = state.get("attempt_number")
+    resolved_attempt_number = attempt_number if attempt_number is not None else stored_attempt_number
+    return (
+        _run_rule_id(run_id, rule_name, attempt_id, lease_generation),
+        run_id,
+        rule_name,
+        _optional_text(state.get("step_id")) or "",
+        _optional_text(state.get("runtime_status_key")) or "",
+        _required_text(state["status"], "RULE_STATUS_REQUIRED"),
+        attempt_id,
+        lease_generation,
+        int(resolved_attempt_number) if resolved_attempt_number is not None else None,
+        state.get("started_at"),
+        state.get("finished_at"),
+        state.get("exit_code"),
+        str(state.get("message") or ""),
+        str(state.get("command_summary") or ""),
+        _json_list(state.get("inputs") or []),
+        _json_list(state.get("outputs") or []),
+        _json_object(state.get("wildcards") or {}),
+        _json_list(state.get("logs") or []),
+        state.get("occurred_at") or now_iso(),
+    )
+
+
+def _rule_event_params(event: dict[str, Any], stored_attempt_number: int | None) -> tuple[Any, ...]:
+    run_id = _required_text(event["run_id"], "RUN_ID_REQUIRED")
+    rule_name = _required_text(event["rule_name"], "RULE_NAME_REQUIRED")
+    attempt_id = _required_text(event["attempt_id"], "ATTEMPT_ID_REQUIRED")
+    lease_generation = int(event["lease_generation"])
+    attempt_number = event.get("attempt_number")
+    resolved_attempt_number = attempt_number if attempt_number is not None else stored_attempt_number
+    return (
+        f"rre_{uuid.uuid4().hex[:12]}",
+        run_id,
+        _run_rule_id(run_id, rule_name, attempt_id, lease_generation),
+        rule_name,
+        _optional_text(event.get("step_id")) or "",
+        _required_text(event["event_type"], "RULE_EVENT_TYPE_REQUIRED"),
+        _required_text(event["status"], "RULE_STATUS_REQUIRED"),
+        attempt_id,
+        lease_generation,
+        int(resolved_attempt_number) if resolved_attempt_number is not None else 0,
+        str(event.get("message") or ""),
+        event.get("occurred_at") or now_iso(),
+        _json_object(event.get("details") or {}),
+    )
+
+
 def _run_rule_id(run_id: str, rule_name: str, attempt_id: str, lease_generation: int) -> str:
     source = f"{run_id}:{rule_name}:{attempt_id}:{int(lease_generation)}".encode("utf-8")
     return f"rr_{hashlib.sha256(source).hexdigest()[:16]}"
@@ -393,8 +393,8 @@ def _record_staged_materialization(connection: Any, *, target: dict[str, Any], o
         """
         INSERT INTO artifact_materializations (
             materialization_id, artifact_blob_id, storage_backend,
-            storage_uri, local_path, created_at
-        ) VALUES (?, ?, 'local', ?, ?, ?)
+            storage_uri, local_path, created_at, materialization_method
+        ) VALUES (?, ?, 'local', ?, ?, ?, ?)
         """,
         (
             materialization_id,
@@ -402,6 +402,7 @@ def _record_staged_materialization(connection: Any, *, target: dict[str, Any], o
             target["storageUri"],
             target["localPath"],
             occurred_at,
+            str(target.get("materializationMethod") or ""),
         ),
     )
     return {"materializationId": materialization_id, "created": True}
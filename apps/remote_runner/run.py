@@ -8,8 +8,11 @@ import uvicorn
 
 from core.logging_config import configure_structured_logging
 
-from .config import ensure_runtime_layout, load_remote_runner_config, write_runtime_state
-from .main import app
+from .startup_timing import STARTUP_TIMELINE
+
+with STARTUP_TIMELINE.phase("import"):
+    from .config import ensure_runtime_layout, load_remote_runner_config, write_runtime_state
+    from .main import app
 
 
 LOGGER = logging.getLogger("h2ometa.remote_runner")
@@ -27,7 +30,8 @@ def main() -> None:
     configure_structured_logging()
     _set_process_name()
     cfg = load_remote_runner_config()
-    ensure_runtime_layout(cfg)
+    with STARTUP_TIMELINE.phase("schema_check"):
+        ensure_runtime_layout(cfg)
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     sock.bind((cfg.bind_host, int(cfg.bind_port)))
@@ -56,6 +56,7 @@ def fetch_run_execution_context(cfg: RemoteRunnerConfig, run_id: str) -> dict[st
         active_lease=active_lease,
         managed_work_dir=cfg.work_dir,
         managed_results_dir=cfg.results_dir,
+        cfg=cfg,
     )
     rule_output_invalidation_plan = build_rule_output_invalidation_plan(
         cfg,
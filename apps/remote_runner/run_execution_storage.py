@@ -7,8 +7,9 @@ from typing import Any
 
 from .config import RemoteRunnerConfig
 from .event_contracts import append_run_event_v2, record_run_command
-from .execution_policy import heartbeat_timeout_seconds_for_job
-from .execution_decision_logging import log_admission_wait, log_claim_accepted
+from .admission_backfill import dead_letter_if_oversized, select_backfill_job
+from .execution_policy import heartbeat_timeout_seconds_for_job, resource_request_for_job
+from .execution_decision_logging import log_admission_wait, log_claim_accepted, resource_request_to_dict
 from .execution_lifecycle_guard import read_execution_lifecycle_maintenance_for_connection
 from .execution_resume_claim_preflight import run_resume_execution_options_requested
 from .metrics import record_run_attempt_claimed, record_run_attempt_completed
@@ -16,10 +17,12 @@ from .admission_storage import (
     admission_wait_reason,
     mark_worker_slot_idle,
     mark_worker_slot_running,
+    record_admission_wait,
     record_resource_allocation,
     release_resource_allocation,
 )
 from .resource_pool import ResourceRequest
+from .run_job_wakeup import get_run_job_wakeup, notify_run_jobs_claimable
 from .execution_job_records import run_job_row_to_dict
 from .run_execution_state_machine import RunExecutionStateMachine
 from .execution_storage_primitives import (
@@ -49,6 +52,7 @@ def enqueue_run_job(
     retry_policy: dict[str, Any] | None = None,
     timeout_policy: dict[str, Any] | None = None,
     execution_options: dict[str, Any] | None = None,
+    resource_policy: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     queued_at = optional_text(available_at) or now_iso()
     with get_connection(cfg) as connection:
@@ -63,8 +67,10 @@ def enqueue_run_job(
             retry_policy=retry_policy,
             timeout_policy=timeout_policy,
             execution_options=execution_options,
+            resource_policy=resource_policy,
         )
         connection.commit()
+        notify_run_jobs_claimable("enqueued", run_id=run_id, available_at=queued_at)
         return run_job_row_to_dict(row)
 
 
@@ -80,6 +86,7 @@ def enqueue_run_job_record(
     retry_policy: dict[str, Any] | None = None,
     timeout_policy: dict[str, Any] | None = None,
     execution_options: dict[str, Any] | None = None,
+    resource_policy: dict[str, Any] | None = None,
 ) -> sqlite3.Row:
     normalized_run_id = required_text(run_id, "RUN_ID_REQUIRED")
     normalized_queue_name = required_text(queue_name, "QUEUE_NAME_REQUIRED")
@@ -98,8 +105,8 @@ def enqueue_run_job_record(
         INSERT INTO run_jobs (
             job_id, run_id, state, queue_name, priority, available_at,
             wait_reason_json, attempt_count, max_attempts, retry_policy_json, timeout_policy_json,
-            execution_options_json, dead_lettered_at, created_at, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            execution_options_json, resource_request_json, dead_lettered_at, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             job_id,
@@ -114,6 +121,7 @@ def enqueue_run_job_record(
             stable_json(retry_policy or {}),
             stable_json(timeout_policy or {}),
             stable_json(execution_options or {}),
+            stable_json(resource_policy or {}),
             None,
             available_at,
             available_at,
@@ -155,7 +163,7 @@ def claim_next_run_job(
     normalized_slot_id = required_text(slot_id, "SLOT_ID_REQUIRED")
     normalized_queue_name = required_text(queue_name, "QUEUE_NAME_REQUIRED")
     claimed_at = optional_text(now) or now_iso()
-    request = resource_request or ResourceRequest()
+    default_request = resource_request or ResourceRequest()
     capacity = resource_capacity or ResourceRequest(cpu=max(1, int(max_active_slots)))
     with get_connection(cfg) as connection:
         connection.execute("BEGIN IMMEDIATE")
@@ -163,9 +171,14 @@ def claim_next_run_job(
             connection.commit()
             return None
         job = _select_claimable_job(connection, claimed_at, normalized_queue_name)
+        while job is not None and dead_letter_if_oversized(
+            connection, job, default_request=default_request, capacity=capacity, now=claimed_at
+        ):
+            job = _select_claimable_job(connection, claimed_at, normalized_queue_name)
         if job is None:
             connection.commit()
             return None
+        request = resource_request_for_job(job, default=default_request)
         wait_reason = admission_wait_reason(
             connection,
             worker_id=normalized_worker_id,
@@ -174,15 +187,28 @@ def claim_next_run_job(
             capacity=capacity,
             max_active_slots=max_active_slots,
         )
+        claim_reason_code = ""
+        backfill = None
         if wait_reason is not None:
-            connection.execute(
-                """
-                UPDATE run_jobs
-                SET wait_reason_json = ?, updated_at = ?
-                WHERE job_id = ?
-                """,
-                (stable_json(wait_reason), claimed_at, job["job_id"]),
+            backfill = select_backfill_job(
+                cfg,
+                connection,
+                head=job,
+                head_request=request,
+                head_wait_reason=wait_reason,
+                now=claimed_at,
+                queue_name=normalized_queue_name,
+                default_request=default_request,
+                capacity=capacity,
             )
+        if backfill is not None:
+            wait_reason = backfill.head_wait_reason
+            if backfill.job is not None and backfill.request is not None:
+                record_admission_wait(connection, job, wait_reason, claimed_at)
+                job, request, wait_reason = backfill.job, backfill.request, None
+                claim_reason_code = "ADMISSION_BACKFILLED"
+        if wait_reason is not None:
+            record_admission_wait(connection, job, wait_reason, claimed_at)
             log_admission_wait(
                 wait_reason=wait_reason,
                 job=job,
@@ -335,6 +361,7 @@ def claim_next_run_job(
             session_id=normalized_session_id,
             slot_id=normalized_slot_id,
             request=request,
+            reason_code=claim_reason_code,
         )
         connection.commit()
 
@@ -351,7 +378,8 @@ def claim_next_run_job(
             (job["job_id"],),
         ).fetchone()
         record_run_attempt_claimed(queued_at=str(claimed_job["created_at"] or ""), claimed_at=claimed_at)
-        return _claim_to_dict(claimed_job, attempt, lease)
+        get_run_job_wakeup().record_claimed(str(job["run_id"]))
+        return {**_claim_to_dict(claimed_job, attempt, lease), "resourceRequest": resource_request_to_dict(request)}
 
 
 def heartbeat_run_attempt(
@@ -571,6 +599,7 @@ def complete_run_attempt(
         ):
             release_resource_allocation(connection, attempt_id=normalized_attempt_id, released_at=finished_at)
             connection.commit()
+            notify_run_jobs_claimable("lease_released")
             return {"accepted": False, "reason": "already_terminal"}
         lease_guard = _current_lease_guard(lease, normalized_attempt_id, lease_generation)
         if not lease_guard.accepted:
@@ -583,6 +612,7 @@ def complete_run_attempt(
                 run=run,
             )
             connection.commit()
+            notify_run_jobs_claimable("lease_released")
             return {"accepted": False, "reason": lease_guard.reason}
 
         connection.execute(
@@ -626,6 +656,7 @@ def complete_run_attempt(
             occurred_at=finished_at,
         )
         connection.commit()
+        notify_run_jobs_claimable("lease_released")
         record_run_attempt_completed(
             started_at=str(attempt["started_at"] or ""),
             finished_at=finished_at,
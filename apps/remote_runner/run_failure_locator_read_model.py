@@ -6,13 +6,14 @@ from typing import Any
 
 from .config import RemoteRunnerConfig
 from .execution_query_storage import fetch_run_events, fetch_run_results, require_run
-from .log_storage import fetch_log_lines
+from .log_storage import fetch_log_tail
 from .result_preview_service import build_result_preview_data
 from .rule_execution_storage import fetch_run_rules
 
 
 RUN_FAILURE_LOCATOR_SCHEMA = "run-failure-locator.v1"
 RUN_RULE_LOG_CONTEXT_SCHEMA = "run-rule-log-context.v1"
+LOCATOR_LOG_TAIL_LINES = 200
 
 
 def fetch_run_failure_locator(cfg: RemoteRunnerConfig, run_id: str) -> dict[str, Any]:
@@ -43,12 +44,11 @@ def fetch_run_failure_locator(cfg: RemoteRunnerConfig, run_id: str) -> dict[str,
         }
 
     events = fetch_run_events(cfg, run_id)
-    stdout = fetch_log_lines(cfg, run_id, "stdout", None)
-    stderr = fetch_log_lines(cfg, run_id, "stderr", None)
+    stdout = fetch_log_tail(cfg, run_id, "stdout", LOCATOR_LOG_TAIL_LINES)
+    stderr = fetch_log_tail(cfg, run_id, "stderr", LOCATOR_LOG_TAIL_LINES)
     results = fetch_run_results(cfg, run_id)
     rules = fetch_run_rules(cfg, run_id)
     rule_items = _dict_items(rules.get("items"))
-    stdout_lines = _log_lines(stdout)
     stderr_lines = _log_lines(stderr)
     failed_rule = _latest_failed_rule(rule_items) or _failed_rule_from_stderr(rule_items, stderr_lines)
     failure_event = _latest_failure_event(failed_rule.get("events") or []) if failed_rule else _latest_failure_event(events)
@@ -65,7 +65,7 @@ def fetch_run_failure_locator(cfg: RemoteRunnerConfig, run_id: str) -> dict[str,
                 "Run failed before a rule failure could be identified.",
             ),
             "runEvent": _failure_event_summary(failure_event),
-            "logContext": _log_context(stdout_lines, stderr_lines),
+            "logContext": _log_context(stdout, stderr),
             "artifactContext": _artifact_context(artifacts, []),
             "ruleLogContext": _rule_log_context_base("NO_FAILED_RULE", "No failed rule was identified for rule log lookup."),
         }
@@ -87,7 +87,7 @@ def fetch_run_failure_locator(cfg: RemoteRunnerConfig, run_id: str) -> dict[str,
             ),
         ),
         "runEvent": _failure_event_summary(failure_event),
-        "logContext": _log_context(stdout_lines, stderr_lines),
+        "logContext": _log_context(stdout, stderr),
         "artifactContext": _artifact_context(artifacts, related_artifacts),
     }
     return {
@@ -406,11 +406,11 @@ def _latest_failure_event(events: Any) -> dict[str, Any] | None:
     return None
 
 
-def _log_context(stdout_lines: list[str], stderr_lines: list[str]) -> dict[str, Any]:
+def _log_context(stdout: dict[str, Any], stderr: dict[str, Any]) -> dict[str, Any]:
     return {
-        "stdoutLineCount": len(stdout_lines),
-        "stderrLineCount": len(stderr_lines),
-        "stderrTail": stderr_lines[-30:],
+        "stdoutLineCount": int(stdout.get("lineCount") or 0),
+        "stderrLineCount": int(stderr.get("lineCount") or 0),
+        "stderrTail": _log_lines(stderr)[-30:],
     }
 
 
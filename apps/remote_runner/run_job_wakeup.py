@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime, timezone
+import heapq
+import threading
+import time
+
+from .metrics import record_run_job_enqueue_to_claim
+
+
+MAX_PENDING_DUE_WAKEUPS = 1024
+MAX_TRACKED_ENQUEUES = 4096
+
+
+class RunJobWakeup:
+    """In-process signal that run jobs may have become claimable.
+
+    Storage calls ``notify`` after committing a change that can make a job
+    claimable; idle worker slots block in ``wait`` instead of re-polling
+    SQLite. A notification can be deferred to a job's ``available_at`` so
+    retry backoff also wakes workers on time. Waiters compare generations,
+    so a signal sent between a failed claim and the wait is never lost.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._due: list[float] = []
+        self._enqueued: OrderedDict[str, float] = OrderedDict()
+        self._counts: dict[str, int] = {}
+
+    def generation(self) -> int:
+        with self._condition:
+            return self._generation
+
+    def notify(self, reason: str, *, run_id: str | None = None, delay_seconds: float = 0.0) -> None:
+        now = time.monotonic()
+        with self._condition:
+            self._counts[reason] = self._counts.get(reason, 0) + 1
+            if run_id and reason == "enqueued":
+                self._enqueued[run_id] = now
+                self._enqueued.move_to_end(run_id)
+                while len(self._enqueued) > MAX_TRACKED_ENQUEUES:
+                    self._enqueued.popitem(last=False)
+            if delay_seconds > 0:
+                # Past the cap the timed safety poll still picks the job up.
+                if len(self._due) < MAX_PENDING_DUE_WAKEUPS:
+                    heapq.heappush(self._due, now + delay_seconds)
+                    self._condition.notify_all()
+                return
+            self._generation += 1
+            self._condition.notify_all()
+
+    def notify_available(self, reason: str, available_at: str | None, *, run_id: str | None = None) -> None:
+        """Notify now, or once ``available_at`` (an ISO timestamp) has passed."""
+        self.notify(reason, run_id=run_id, delay_seconds=_seconds_until(available_at))
+
+    def interrupt(self) -> None:
+        """Wake every waiter so it can re-check its stop condition."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def wait(
+        self,
+        generation: int,
+        timeout_seconds: float,
+        *,
+        interrupted: Callable[[], bool] | None = None,
+    ) -> bool:
+        """Block until a notification newer than ``generation`` or the timeout; returns True when notified."""
+        deadline = time.monotonic() + max(0.0, timeout_seconds)
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while self._due and self._due[0] <= now:
+                    heapq.heappop(self._due)
+                    self._generation += 1
+                if self._generation != generation:
+                    return True
+                if interrupted is not None and interrupted():
+                    return False
+                remaining = deadline - now
+                if remaining <= 0:
+                    return False
+                if self._due:
+                    remaining = min(remaining, self._due[0] - now)
+                self._condition.wait(remaining)
+
+    def record_claimed(self, run_id: str) -> None:
+        with self._condition:
+            enqueued_at = self._enqueued.pop(run_id, None)
+        if enqueued_at is not None:
+            record_run_job_enqueue_to_claim(time.monotonic() - enqueued_at)
+
+    def snapshot(self) -> dict[str, object]:
+        with self._condition:
+            return {
+                "generation": self._generation,
+                "pendingDueWakeups": len(self._due),
+                "notifications": dict(sorted(self._counts.items())),
+            }
+
+
+_WAKEUP = RunJobWakeup()
+
+
+def get_run_job_wakeup() -> RunJobWakeup:
+    return _WAKEUP
+
+
+def notify_run_jobs_claimable(reason: str, *, run_id: str | None = None, available_at: str | None = None) -> None:
+    _WAKEUP.notify_available(reason, available_at, run_id=run_id)
+
+
+def _seconds_until(available_at: str | None) -> float:
+    if not available_at:
+        return 0.0
+    try:
+        due = datetime.strptime(available_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return 0.0
+    return max(0.0, (due - datetime.now(timezone.utc)).total_seconds())
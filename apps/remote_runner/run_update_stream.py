@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+import json
+import time
+from typing import Any
+
+import anyio
+
+from core.async_boundary import run_sync
+
+from .config import RemoteRunnerConfig
+from .errors import RemoteRunnerNotFoundError
+from .log_storage import LOG_STREAMS, fetch_log_lines
+from .run_execution_state_machine import TERMINAL_RUN_STATUSES
+from .storage_core import get_connection
+
+RUN_UPDATE_POLL_SECONDS = 0.5
+RUN_UPDATE_HEARTBEAT_SECONDS = 15.0
+RUN_UPDATE_LOG_WINDOW_BYTES = 64 * 1024
+RUN_UPDATE_RETRY_MILLISECONDS = 2000
+
+
+@dataclass
+class RunUpdateCursor:
+    """Resume position of one stream; serialized as the SSE event id.
+
+    The id is ``state_version:stdout:stderr:rules_updated_at``. Rules at the
+    watermark itself are replayed on resume because their signatures are not
+    part of the id; clients key rule events by ``ruleName`` anyway.
+    """
+
+    state_version: int = -1
+    log_offsets: dict[str, int] = field(default_factory=lambda: dict.fromkeys(LOG_STREAMS, 0))
+    rules_updated_at: str = ""
+    rule_signatures: dict[str, tuple[Any, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def parse(
+        cls,
+        last_event_id: str | None = None,
+        *,
+        stdout_cursor: str | None = None,
+        stderr_cursor: str | None = None,
+    ) -> RunUpdateCursor:
+        cursor = cls()
+        if str(last_event_id or "").strip():
+            # The watermark is an ISO timestamp and may itself contain colons.
+            parts = str(last_event_id).strip().split(":", 3)
+            if len(parts) < 3:
+                raise ValueError("RUN_UPDATE_CURSOR_INVALID")
+            cursor.state_version = _parse_int(parts[0], minimum=-1)
+            cursor.log_offsets = {"stdout": _parse_int(parts[1]), "stderr": _parse_int(parts[2])}
+            cursor.rules_updated_at = parts[3] if len(parts) == 4 else ""
+            return cursor
+        for stream, value in (("stdout", stdout_cursor), ("stderr", stderr_cursor)):
+            if str(value or "").strip():
+                cursor.log_offsets[stream] = _parse_int(str(value))
+        return cursor
+
+    @property
+    def resumed(self) -> bool:
+        return self.state_version >= 0 or any(self.log_offsets.values())
+
+    def event_id(self) -> str:
+        return (
+            f"{self.state_version}:{self.log_offsets['stdout']}:{self.log_offsets['stderr']}:{self.rules_updated_at}"
+        )
+
+
+@dataclass(frozen=True)
+class RunUpdateBatch:
+    events: list[tuple[str, dict[str, Any]]]
+    terminal: bool
+    logs_pending: bool
+
+
+def collect_run_updates(cfg: RemoteRunnerConfig, run_id: str, cursor: RunUpdateCursor) -> RunUpdateBatch:
+    """Return events committed since ``cursor`` and advance it past them.
+
+    The run row is read before rules and logs, so once a terminal status is
+    observed every log line written before it is already visible.
+    """
+    with get_connection(cfg) as connection:
+        run = connection.execute(
+            """
+            SELECT status, stage, message, state_version, last_updated_at
+            FROM runs WHERE run_id = ?
+            """,
+            (run_id,),
+        ).fetchone()
+        if run is None:
+            raise RemoteRunnerNotFoundError("RUN_NOT_FOUND")
+        rules = connection.execute(
+            """
+            SELECT run_rule_id, rule_name, status, attempt_id, started_at, finished_at, exit_code, updated_at
+            FROM run_rules
+            WHERE run_id = ? AND updated_at >= ?
+            ORDER BY updated_at, run_rule_id
+            """,
+            (run_id, cursor.rules_updated_at),
+        ).fetchall()
+    events: list[tuple[str, dict[str, Any]]] = []
+    if int(run["state_version"]) != cursor.state_version:
+        cursor.state_version = int(run["state_version"])
+        events.append(
+            (
+                "status",
+                {
+                    "runId": run_id,
+                    "status": run["status"],
+                    "stage": run["stage"],
+                    "message": run["message"],
+                    "stateVersion": cursor.state_version,
+                    "lastUpdatedAt": run["last_updated_at"],
+                },
+            )
+        )
+    events.extend(("rule", rule) for rule in _changed_rules(rules, cursor))
+    logs_pending = False
+    for stream in LOG_STREAMS:
+        page = fetch_log_lines(
+            cfg,
+            run_id,
+            stream,
+            str(cursor.log_offsets[stream]),
+            max_bytes=RUN_UPDATE_LOG_WINDOW_BYTES,
+        )
+        next_offset = int(page["nextCursor"] or 0)
+        if page["lines"]:
+            events.append(
+                (
+                    "log",
+                    {
+                        "runId": run_id,
+                        "stream": stream,
+                        "cursor": str(cursor.log_offsets[stream]),
+                        "nextCursor": str(next_offset),
+                        "lines": page["lines"],
+                    },
+                )
+            )
+        cursor.log_offsets[stream] = next_offset
+        logs_pending = logs_pending or bool(page.get("hasMore"))
+    return RunUpdateBatch(events=events, terminal=run["status"] in TERMINAL_RUN_STATUSES, logs_pending=logs_pending)
+
+
+async def iter_run_update_stream(
+    cfg: RemoteRunnerConfig,
+    run_id: str,
+    cursor: RunUpdateCursor,
+    *,
+    poll_seconds: float = RUN_UPDATE_POLL_SECONDS,
+    heartbeat_seconds: float = RUN_UPDATE_HEARTBEAT_SECONDS,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], Awaitable[None]] = anyio.sleep,
+) -> AsyncIterator[bytes]:
+    """Yield SSE frames until the run is terminal and its logs are drained.
+
+    Only the poll itself runs in a worker thread; an idle stream waits on the
+    event loop, so open streams do not hold threadpool slots between polls.
+    """
+    yield f"retry: {RUN_UPDATE_RETRY_MILLISECONDS}\n\n".encode("ascii")
+    last_sent = clock()
+    while True:
+        batch = await run_sync(collect_run_updates, cfg, run_id, cursor)
+        for event, payload in batch.events:
+            yield format_sse_event(event, payload, event_id=cursor.event_id())
+            last_sent = clock()
+        if batch.terminal and not batch.logs_pending:
+            yield format_sse_event("end", {"runId": run_id}, event_id=cursor.event_id())
+            return
+        if batch.logs_pending:
+            continue
+        if clock() - last_sent >= heartbeat_seconds:
+            yield b": keepalive\n\n"
+            last_sent = clock()
+        await sleep(poll_seconds)
+
+
+def format_sse_event(event: str, payload: dict[str, Any], *, event_id: str | None = None) -> bytes:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(payload, ensure_ascii=False, separators=(',', ':'))}")
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+def _changed_rules(rows: list[Any], cursor: RunUpdateCursor) -> list[dict[str, Any]]:
+    changed: list[dict[str, Any]] = []
+    for row in rows:
+        signature = (row["status"], row["attempt_id"], row["exit_code"], row["updated_at"])
+        if cursor.rule_signatures.get(row["run_rule_id"]) == signature:
+            continue
+        cursor.rule_signatures[row["run_rule_id"]] = signature
+        cursor.rules_updated_at = max(cursor.rules_updated_at, str(row["updated_at"]))
+        changed.append(
+            {
+                "ruleName": row["rule_name"],
+                "status": row["status"],
+                "attemptId": row["attempt_id"],
+                "startedAt": row["started_at"],
+                "finishedAt": row["finished_at"],
+                "exitCode": row["exit_code"],
+                "updatedAt": row["updated_at"],
+            }
+        )
+    return changed
+
+
+def _parse_int(value: str, *, minimum: int = 0) -> int:
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("RUN_UPDATE_CURSOR_INVALID") from exc
+    if parsed < minimum:
+        raise ValueError("RUN_UPDATE_CURSOR_INVALID")
+    return parsed
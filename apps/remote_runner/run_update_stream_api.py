@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any
+
+from .config import RemoteRunnerConfig
+from .execution_observability_governance import record_run_update_stream_audit
+from .execution_query_storage import require_run
+from .route_utils import authorized_config, run_sync
+from .run_update_stream import RunUpdateCursor, iter_run_update_stream
+
+RUN_UPDATE_STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def open_run_update_stream_from_request(
+    run_id: str,
+    authorization: str | None,
+    *,
+    last_event_id: str | None = None,
+    stdout_cursor: str | None = None,
+    stderr_cursor: str | None = None,
+) -> dict[str, Any]:
+    cfg = await run_sync(_authorized_run_update_stream_config, authorization)
+    cursor = RunUpdateCursor.parse(last_event_id, stdout_cursor=stdout_cursor, stderr_cursor=stderr_cursor)
+    await run_sync(require_run, cfg, run_id)
+    await run_sync(record_run_update_stream_audit, cfg, run_id, resumed=cursor.resumed)
+    return {
+        "body": iter_run_update_stream(cfg, run_id, cursor),
+        "mediaType": "text/event-stream",
+        "headers": dict(RUN_UPDATE_STREAM_HEADERS),
+    }
+
+
+def _authorized_run_update_stream_config(authorization: str | None) -> RemoteRunnerConfig:
+    return authorized_config(authorization, action="run.updates.stream")
@@ -160,7 +160,7 @@ def process_next_run_job(
                 if resource_pool is not None:
                     executor_kwargs["resource_pool"] = resource_pool
                 if resource_request is not None:
-                    executor_kwargs["resource_request"] = resource_request
+                    executor_kwargs["resource_request"] = _claimed_resource_request(claim, resource_request)
             executor(
                 cfg,
                 **executor_kwargs,
@@ -236,6 +236,20 @@ def process_next_run_job(
     finally:
         clear_log_context()
 
+
+def _claimed_resource_request(claim: dict[str, Any], fallback: ResourceRequest) -> ResourceRequest:
+    granted = claim.get("resourceRequest")
+    if not isinstance(granted, dict):
+        return fallback
+    request = ResourceRequest(
+        cpu=int(granted.get("cpu", fallback.cpu)),
+        memory_mb=int(granted.get("memoryMb", fallback.memory_mb)),
+        disk_mb=int(granted.get("diskMb", fallback.disk_mb)),
+        gpu=int(granted.get("gpu", fallback.gpu)),
+    )
+    return fallback if request == fallback else request
+
+
 def _exit_code_for_attempt_state(state: str) -> int:
     if state == "succeeded":
         return 0
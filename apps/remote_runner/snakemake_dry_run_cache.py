@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import sqlite3
+import subprocess
+import time
+from typing import Any, Callable
+
+from .config import RemoteRunnerConfig
+from .execution_plan_hash import stable_plan_hash
+from .storage_core import get_connection, now_iso
+from .workflow_runtime_config import get_workflow_profile_dir
+
+DEFAULT_DRY_RUN_CACHE_MAX_ENTRIES = 512
+DRY_RUN_PLAN_SCHEMA_VERSION = "snakemake-dry-run-plan.v1"
+
+
+@dataclass(frozen=True)
+class DryRunCacheScope:
+    """Run-specific values that are swapped for placeholders in cached plans and output."""
+
+    run_id: str
+    request_id: str
+    work_dir: Path
+    result_dir: Path
+
+    def _pairs(self) -> list[tuple[str, str]]:
+        pairs = [
+            (str(self.work_dir), "{workDir}"),
+            (str(self.result_dir), "{resultDir}"),
+            (self.run_id, "{runId}"),
+            (self.request_id, "{requestId}"),
+        ]
+        # Longest first so a result dir nested in the work dir is not half-replaced.
+        return sorted((pair for pair in pairs if pair[0]), key=lambda pair: len(pair[0]), reverse=True)
+
+    def normalize(self, text: str) -> str:
+        for value, placeholder in self._pairs():
+            text = text.replace(value, placeholder)
+        return text
+
+    def restore(self, text: str) -> str:
+        for value, placeholder in self._pairs():
+            text = text.replace(placeholder, value)
+        return text
+
+
+@dataclass(frozen=True)
+class DryRunCacheKey:
+    cache_key: str
+    plan_hash: str
+
+
+def dry_run_cache_key(
+    cfg: RemoteRunnerConfig,
+    *,
+    snakefile: Path,
+    config_path: Path,
+    scope: DryRunCacheScope,
+    execution_options: dict[str, Any],
+) -> DryRunCacheKey | None:
+    """Return the cache key for a dry run, or ``None`` when its outcome depends on workdir state."""
+    if execution_options.get("forcerun_rules") or execution_options.get("rerun_incomplete"):
+        return None
+    if (scope.work_dir / ".snakemake").exists() or _has_entries(scope.result_dir):
+        return None
+    try:
+        config_text = config_path.read_text(encoding="utf-8")
+        config = json.loads(config_text)
+    except (OSError, ValueError):
+        return None
+    profile_dir = get_workflow_profile_dir(cfg)
+    plan = {
+        "schemaVersion": DRY_RUN_PLAN_SCHEMA_VERSION,
+        "snakemake": {
+            "command": str(cfg.snakemake_command or ""),
+            "version": str(cfg.snakemake_version or ""),
+            "profile": _tree_fingerprint(profile_dir, scope) if profile_dir is not None else None,
+        },
+        "workflow": {
+            "snakefile": scope.normalize(str(snakefile)),
+            "files": _tree_fingerprint(snakefile.parent, scope),
+        },
+        "config": json.loads(scope.normalize(config_text)),
+        "targets": [scope.normalize(str(path)) for path in execution_options.get("target_paths") or []],
+    }
+    plan_hash = stable_plan_hash(plan)
+    inputs = sorted(_input_fingerprints(config, scope))
+    digest = hashlib.sha256(f"{plan_hash}\n{json.dumps(inputs, separators=(',', ':'))}".encode("utf-8"))
+    return DryRunCacheKey(cache_key=digest.hexdigest(), plan_hash=plan_hash)
+
+
+def run_dry_run_with_cache(
+    cfg: RemoteRunnerConfig,
+    execute: Callable[[], Any],
+    *,
+    snakefile: Path,
+    config_path: Path,
+    scope: DryRunCacheScope,
+    execution_options: dict[str, Any],
+    clock: Callable[[], float] = time.perf_counter,
+) -> Any:
+    """Run ``snakemake -n`` unless an identical plan with identical inputs already passed."""
+    max_entries = int(getattr(cfg, "dry_run_cache_max_entries", DEFAULT_DRY_RUN_CACHE_MAX_ENTRIES))
+    key = None
+    if max_entries > 0:
+        key = dry_run_cache_key(
+            cfg,
+            snakefile=snakefile,
+            config_path=config_path,
+            scope=scope,
+            execution_options=execution_options,
+        )
+    if key is not None:
+        cached = _lookup(cfg, key)
+        if cached is not None:
+            return subprocess.CompletedProcess(
+                ["snakemake", "-n"],
+                0,
+                scope.restore(cached["stdout"]),
+                scope.restore(cached["stderr"]),
+            )
+    started = clock()
+    result = execute()
+    if key is not None and result.returncode == 0:
+        _store(
+            cfg,
+            key,
+            stdout=scope.normalize(str(result.stdout or "")),
+            stderr=scope.normalize(str(result.stderr or "")),
+            duration_seconds=max(0.0, clock() - started),
+            max_entries=max_entries,
+        )
+    return result
+
+
+def collect_dry_run_cache_metrics(cfg: RemoteRunnerConfig) -> dict[str, Any]:
+    with get_connection(cfg) as connection:
+        row = connection.execute(
+            """
+            SELECT COUNT(*) AS entries,
+                   COALESCE(SUM(hit_count), 0) AS hits,
+                   COALESCE(SUM(miss_count), 0) AS misses,
+                   COALESCE(SUM(saved_seconds), 0) AS saved_seconds
+            FROM snakemake_dry_run_cache
+            """
+        ).fetchone()
+    hits = int(row["hits"])
+    lookups = hits + int(row["misses"])
+    return {
+        "entries": int(row["entries"]),
+        "hits": hits,
+        "misses": int(row["misses"]),
+        "hitRatio": round(hits / lookups, 4) if lookups else 0.0,
+        "savedSeconds": round(float(row["saved_seconds"]), 3),
+    }
+
+
+def _lookup(cfg: RemoteRunnerConfig, key: DryRunCacheKey) -> dict[str, str] | None:
+    try:
+        with get_connection(cfg) as connection:
+            row = connection.execute(
+                "SELECT stdout, stderr FROM snakemake_dry_run_cache WHERE cache_key = ?",
+                (key.cache_key,),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                """
+                UPDATE snakemake_dry_run_cache
+                SET hit_count = hit_count + 1,
+                    saved_seconds = saved_seconds + duration_seconds,
+                    last_used_at = ?
+                WHERE cache_key = ?
+                """,
+                (now_iso(), key.cache_key),
+            )
+            connection.commit()
+    except sqlite3.Error:
+        # The cache is an optimisation; fall back to a real dry run.
+        return None
+    return {"stdout": row["stdout"], "stderr": row["stderr"]}
+
+
+def _store(
+    cfg: RemoteRunnerConfig,
+    key: DryRunCacheKey,
+    *,
+    stdout: str,
+    stderr: str,
+    duration_seconds: float,
+    max_entries: int,
+) -> None:
+    now = now_iso()
+    try:
+        with get_connection(cfg) as connection:
+            connection.execute(
+                """
+                INSERT INTO snakemake_dry_run_cache (
+                    cache_key, plan_hash, stdout, stderr, duration_seconds, miss_count, created_at, last_used_at
+                ) VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    stdout = excluded.stdout,
+                    stderr = excluded.stderr,
+                    duration_seconds = excluded.duration_seconds,
+                    miss_count = miss_count + 1,
+                    last_used_at = excluded.last_used_at
+                """,
+                (key.cache_key, key.plan_hash, stdout, stderr, duration_seconds, now, now),
+            )
+            connection.execute(
+                """
+                DELETE FROM snakemake_dry_run_cache
+                WHERE cache_key NOT IN (
+                    SELECT cache_key FROM snakemake_dry_run_cache
+                    ORDER BY last_used_at DESC, cache_key
+                    LIMIT ?
+                )
+                """,
+                (max_entries,),
+            )
+            connection.commit()
+    except sqlite3.Error:
+        return
+
+
+def _has_entries(path: Path) -> bool:
+    try:
+        return any(path.iterdir())
+    except OSError:
+        return False
+
+
+def _tree_fingerprint(root: Path, scope: DryRunCacheScope) -> list[tuple[str, str]] | None:
+    if not root.is_dir():
+        return None
+    entries: list[tuple[str, str]] = []
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name != ".snakemake")
+        for filename in sorted(filenames):
+            path = Path(directory) / filename
+            try:
+                content = path.read_bytes()
+            except OSError:
+                continue
+            normalized = scope.normalize(content.decode("utf-8", errors="surrogateescape"))
+            digest = hashlib.sha256(normalized.encode("utf-8", errors="surrogateescape")).hexdigest()
+            entries.append((path.relative_to(root).as_posix(), digest))
+    return entries
+
+
+def _input_fingerprints(config: Any, scope: DryRunCacheScope) -> set[tuple[str, int, int, bool]]:
+    fingerprints: set[tuple[str, int, int, bool]] = set()
+    for value in _string_leaves(config):
+        if not value.startswith("/") or value.startswith(str(scope.result_dir)):
+            continue
+        try:
+            stat = os.stat(value)
+        except OSError:
+            fingerprints.add((scope.normalize(value), -1, -1, False))
+            continue
+        is_dir = os.path.isdir(value)
+        # Inputs restored into the fresh work dir get a new mtime every run; their
+        # content is already pinned by the sha256 recorded next to them in the config.
+        mtime_ns = 0 if value.startswith(str(scope.work_dir)) else stat.st_mtime_ns
+        fingerprints.add((scope.normalize(value), 0 if is_dir else stat.st_size, mtime_ns, is_dir))
+    return fingerprints
+
+
+def _string_leaves(value: Any):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _string_leaves(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _string_leaves(item)
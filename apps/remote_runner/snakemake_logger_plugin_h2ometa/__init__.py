@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 try:
     from snakemake_interface_logger_plugins.base import LogHandlerBase
@@ -21,6 +23,10 @@ except ModuleNotFoundError:
 
 
 SCHEMA_VERSION = "h2ometa.snakemake.event.v1"
+EVENT_BUFFER_MAX_BYTES = 64 * 1024
+EVENT_BUFFER_MAX_SECONDS = 0.5
+# The live projector advances rule state on these, so they are never held back.
+FLUSH_EVENTS = {"ERROR", "JOB_ERROR", "JOB_FINISHED", "JOB_STARTED"}
 
 
 @dataclass
@@ -46,6 +52,13 @@ class LogHandler(LogHandlerBase):
         self._event_path = Path(raw_path)
         self._event_path.parent.mkdir(parents=True, exist_ok=True)
         self.baseFilename = str(self._event_path)
+        self._handle: BinaryIO | None = None
+        self._buffer: list[bytes] = []
+        self._buffered_bytes = 0
+        self._buffered_since = 0.0
+        self._buffer_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher: threading.Thread | None = None
 
     @property
     def writes_to_stream(self) -> bool:
@@ -68,10 +81,72 @@ class LogHandler(LogHandlerBase):
         return False
 
     def emit(self, record: logging.LogRecord) -> None:
+        """Buffer one JSONL line; whole lines reach the file on job-state events, size or age."""
         payload = _event_payload(record)
-        with self._event_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str))
-            handle.write("\n")
+        line = (json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str) + "\n").encode("utf-8")
+        with self._buffer_lock:
+            if self._closed.is_set():
+                self._write_now([line])
+                return
+            if not self._buffer:
+                self._buffered_since = time.monotonic()
+            self._buffer.append(line)
+            self._buffered_bytes += len(line)
+            if (
+                payload["event"] in FLUSH_EVENTS
+                or self._buffered_bytes >= EVENT_BUFFER_MAX_BYTES
+                or time.monotonic() - self._buffered_since >= EVENT_BUFFER_MAX_SECONDS
+            ):
+                self._flush_buffer()
+                return
+        self._ensure_flusher()
+
+    def flush(self) -> None:
+        with self._buffer_lock:
+            self._flush_buffer()
+
+    def close(self) -> None:
+        self._closed.set()
+        with self._buffer_lock:
+            self._flush_buffer()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+        parent_close = getattr(super(), "close", None)
+        if callable(parent_close):
+            parent_close()
+
+    def _flush_buffer(self) -> None:
+        if not self._buffer:
+            return
+        lines, self._buffer, self._buffered_bytes = self._buffer, [], 0
+        self._write_now(lines)
+
+    def _write_now(self, lines: list[bytes]) -> None:
+        if self._handle is None:
+            self._handle = self._event_path.open("ab")
+        # One write of complete lines, so a tailing reader never has to stitch records together.
+        self._handle.write(b"".join(lines))
+        self._handle.flush()
+        if self._closed.is_set():
+            self._handle.close()
+            self._handle = None
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None:
+            return
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="h2ometa-snakemake-event-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(EVENT_BUFFER_MAX_SECONDS):
+            with self._buffer_lock:
+                if self._buffer and time.monotonic() - self._buffered_since >= EVENT_BUFFER_MAX_SECONDS:
+                    self._flush_buffer()
 
 
 def _event_payload(record: logging.LogRecord) -> dict[str, Any]:
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+from typing import Any
+
+from .config import RemoteRunnerConfig
+from .resource_pool import ResourceRequest
+from .storage_core import get_connection
+
+
+SNAKEMAKE_RESOURCE_STRATEGY_BALANCED = "balanced"
+SNAKEMAKE_RESOURCE_STRATEGY_PARALLEL_RULES = "parallel_rules"
+SNAKEMAKE_RESOURCE_STRATEGY_THREADED_TOOLS = "threaded_tools"
+SNAKEMAKE_RESOURCE_STRATEGIES = {
+    SNAKEMAKE_RESOURCE_STRATEGY_BALANCED,
+    SNAKEMAKE_RESOURCE_STRATEGY_PARALLEL_RULES,
+    SNAKEMAKE_RESOURCE_STRATEGY_THREADED_TOOLS,
+}
+RULE_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+@dataclass(frozen=True)
+class SnakemakeResourcePolicy:
+    """How a pipeline splits its allocation between parallel rules and multi-threaded tools.
+
+    Declared in the pipeline manifest as ``execution.snakemakeResources``.
+    """
+
+    strategy: str = SNAKEMAKE_RESOURCE_STRATEGY_BALANCED
+    max_threads_per_rule: int = 0
+    rule_threads: tuple[tuple[str, int], ...] = ()
+
+
+@dataclass(frozen=True)
+class SnakemakeResourcePlan:
+    cores: int
+    memory_mb: int = 0
+    disk_mb: int = 0
+    gpu: int = 0
+    max_threads_per_rule: int = 1
+    rule_threads: tuple[tuple[str, int], ...] = ()
+    strategy: str = SNAKEMAKE_RESOURCE_STRATEGY_BALANCED
+
+    def command_args(self) -> list[str]:
+        args = ["--cores", str(self.cores)]
+        resources = [
+            f"{name}={value}"
+            for name, value in (("mem_mb", self.memory_mb), ("disk_mb", self.disk_mb), ("gpu", self.gpu))
+            if value > 0
+        ]
+        if resources:
+            args.extend(["--resources", *resources])
+        args.extend(["--max-threads", str(self.max_threads_per_rule)])
+        if self.rule_threads:
+            args.extend(["--set-threads", *[f"{rule}={threads}" for rule, threads in self.rule_threads]])
+        return args
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "strategy": self.strategy,
+            "cores": self.cores,
+            "memoryMb": self.memory_mb,
+            "diskMb": self.disk_mb,
+            "gpu": self.gpu,
+            "maxThreadsPerRule": self.max_threads_per_rule,
+            "ruleThreads": dict(self.rule_threads),
+        }
+
+
+def snakemake_resource_policy(execution: dict[str, Any] | None) -> SnakemakeResourcePolicy:
+    raw = (execution or {}).get("snakemakeResources")
+    if raw is None:
+        return SnakemakeResourcePolicy()
+    if not isinstance(raw, dict):
+        raise ValueError("SNAKEMAKE_RESOURCE_POLICY_INVALID")
+    strategy = str(raw.get("strategy") or SNAKEMAKE_RESOURCE_STRATEGY_BALANCED).strip()
+    if strategy not in SNAKEMAKE_RESOURCE_STRATEGIES:
+        raise ValueError("SNAKEMAKE_RESOURCE_STRATEGY_INVALID")
+    max_threads = _non_negative_int(raw.get("maxThreadsPerRule", 0), "SNAKEMAKE_RESOURCE_MAX_THREADS_INVALID")
+    rule_threads_raw = raw.get("ruleThreads") or {}
+    if not isinstance(rule_threads_raw, dict):
+        raise ValueError("SNAKEMAKE_RESOURCE_RULE_THREADS_INVALID")
+    rule_threads: list[tuple[str, int]] = []
+    for rule, threads in sorted(rule_threads_raw.items()):
+        if not RULE_NAME_RE.fullmatch(str(rule)):
+            raise ValueError("SNAKEMAKE_RESOURCE_RULE_THREADS_INVALID")
+        value = _non_negative_int(threads, "SNAKEMAKE_RESOURCE_RULE_THREADS_INVALID")
+        if value < 1:
+            raise ValueError("SNAKEMAKE_RESOURCE_RULE_THREADS_INVALID")
+        rule_threads.append((str(rule), value))
+    return SnakemakeResourcePolicy(strategy=strategy, max_threads_per_rule=max_threads, rule_threads=tuple(rule_threads))
+
+
+def build_snakemake_resource_plan(
+    allocation: ResourceRequest,
+    policy: SnakemakeResourcePolicy | None = None,
+) -> SnakemakeResourcePlan:
+    """Translate an admitted allocation into Snakemake's global and per-rule limits."""
+    resolved = policy or SnakemakeResourcePolicy()
+    cores = max(1, int(allocation.cpu))
+    if resolved.strategy == SNAKEMAKE_RESOURCE_STRATEGY_PARALLEL_RULES:
+        per_rule = 1
+    elif resolved.strategy == SNAKEMAKE_RESOURCE_STRATEGY_THREADED_TOOLS:
+        per_rule = cores
+    else:
+        # Leave room for at least two rules to run side by side.
+        per_rule = max(1, cores // 2)
+    if resolved.max_threads_per_rule:
+        per_rule = resolved.max_threads_per_rule
+    per_rule = min(per_rule, cores)
+    return SnakemakeResourcePlan(
+        cores=cores,
+        memory_mb=max(0, int(allocation.memory_mb)),
+        disk_mb=max(0, int(allocation.disk_mb)),
+        gpu=max(0, int(allocation.gpu)),
+        max_threads_per_rule=per_rule,
+        rule_threads=tuple((rule, min(threads, cores)) for rule, threads in resolved.rule_threads),
+        strategy=resolved.strategy,
+    )
+
+
+def attempt_resource_allocation(cfg: RemoteRunnerConfig, attempt_id: str | None) -> ResourceRequest | None:
+    if not attempt_id:
+        return None
+    with get_connection(cfg) as connection:
+        row = connection.execute(
+            "SELECT cpu, memory_mb, disk_mb, gpu FROM run_resource_allocations WHERE attempt_id = ?",
+            (attempt_id,),
+        ).fetchone()
+    if row is None:
+        return None
+    return ResourceRequest(
+        cpu=int(row["cpu"]),
+        memory_mb=int(row["memory_mb"]),
+        disk_mb=int(row["disk_mb"]),
+        gpu=int(row["gpu"]),
+    )
+
+
+def attempt_snakemake_resource_plan(
+    cfg: RemoteRunnerConfig,
+    *,
+    attempt_id: str | None,
+    fallback: ResourceRequest | None,
+    execution: dict[str, Any] | None,
+) -> SnakemakeResourcePlan | None:
+    """Plan from the attempt's recorded allocation, else the request it was admitted with."""
+    allocation = attempt_resource_allocation(cfg, attempt_id) or fallback
+    if allocation is None:
+        return None
+    return build_snakemake_resource_plan(allocation, snakemake_resource_policy(execution))
+
+
+def _non_negative_int(value: Any, code: str) -> int:
+    if isinstance(value, bool):
+        raise ValueError(code)
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(code) from exc
+    if parsed < 0:
+        raise ValueError(code)
+    return parsed
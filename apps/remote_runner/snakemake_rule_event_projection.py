@@ -2,15 +2,72 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+import time
 from typing import Any
 
 from .config import RemoteRunnerConfig
-from .rule_execution_storage import append_run_rule_event, fetch_run_rules, upsert_run_rule_state
+from .metrics import record_rule_projection_batch
+from .rule_execution_storage import fetch_run_rules, write_run_rule_projection_batch
 
 RULE_TERMINAL_STATUSES = {"blocked", "failed", "skipped", "succeeded"}
 SNAKEMAKE_RULE_EVENTS = {"JOB_ERROR", "JOB_FINISHED", "JOB_INFO", "JOB_STARTED", "SHELLCMD"}
 
 
+class _RuleProjectionBatch:
+    """Stage rule upserts and events so one poll is written in a single transaction.
+
+    ``upsert_rule_state`` returns the merged rule as the row would read after the
+    write, so later events in the same poll see it before the batch is flushed.
+    """
+
+    def __init__(self, cfg: RemoteRunnerConfig) -> None:
+        self._cfg = cfg
+        self._rule_states: list[dict[str, Any]] = []
+        self._rule_events: list[dict[str, Any]] = []
+
+    def upsert_rule_state(self, *, current: dict[str, Any], **state: Any) -> dict[str, Any]:
+        self._rule_states.append(state)
+        return {
+            **current,
+            "ruleName": state["rule_name"],
+            "stepId": state.get("step_id") or "",
+            "runtimeStatusKey": state.get("runtime_status_key") or "",
+            "status": state["status"],
+            "attemptId": state["attempt_id"],
+            "leaseGeneration": state["lease_generation"],
+            "startedAt": state.get("started_at") or current.get("startedAt"),
+            "finishedAt": state.get("finished_at"),
+            "exitCode": state.get("exit_code"),
+            "message": state.get("message") or "",
+            "commandSummary": state.get("command_summary") or "",
+            "inputs": list(state.get("inputs") or []),
+            "outputs": list(state.get("outputs") or []),
+            "wildcards": dict(state.get("wildcards") or {}),
+            "logs": list(state.get("logs") or []),
+        }
+
+    def append_rule_event(self, **event: Any) -> None:
+        self._rule_events.append(event)
+
+    def flush(self, rules_by_name: dict[str, dict[str, Any]]) -> int:
+        """Write everything staged so far; returns the number of rows written."""
+        rows = len(self._rule_states) + len(self._rule_events)
+        if rows == 0:
+            return 0
+        started = time.perf_counter()
+        stored = write_run_rule_projection_batch(
+            self._cfg,
+            rule_states=self._rule_states,
+            rule_events=self._rule_events,
+        )
+        record_rule_projection_batch(rows=rows, seconds=time.perf_counter() - started)
+        self._rule_states = []
+        self._rule_events = []
+        for rule in stored.values():
+            rules_by_name[str(rule["ruleName"])] = rule
+        return rows
+
+
 class SnakemakeRuleEventProjector:
     def __init__(
         self,
@@ -42,8 +99,9 @@ class SnakemakeRuleEventProjector:
         self._poll(require_complete_line=False)
         if self._event_count == 0:
             return self._result(False, self._last_reason, new_event_count=0)
+        batch = _RuleProjectionBatch(self._cfg)
         terminal_count = _project_workflow_terminal_rules(
-            self._cfg,
+            batch,
             run_id=self._run_id,
             attempt_id=str(self._attempt_id),
             lease_generation=int(self._lease_generation),
@@ -51,8 +109,9 @@ class SnakemakeRuleEventProjector:
             rules_by_name=self._rules_by_name,
             workflow_succeeded=workflow_succeeded,
         )
+        batch_size = batch.flush(self._rules_by_name)
         self._event_count += terminal_count
-        return self._result(True, "snakemake_logger", new_event_count=terminal_count)
+        return self._result(True, "snakemake_logger", new_event_count=terminal_count, batch_size=batch_size)
 
     def _poll(self, *, require_complete_line: bool) -> dict[str, Any]:
         if not _has_attempt_context(self._attempt_id, self._lease_generation):
@@ -67,8 +126,9 @@ class SnakemakeRuleEventProjector:
             self._offset,
             require_complete_line=require_complete_line,
         )
+        batch = _RuleProjectionBatch(self._cfg)
         new_count = _project_event_records(
-            self._cfg,
+            batch,
             run_id=self._run_id,
             attempt_id=str(self._attempt_id),
             lease_generation=int(self._lease_generation),
@@ -77,12 +137,18 @@ class SnakemakeRuleEventProjector:
             job_rules=self._job_rules,
             rules_by_name=self._rules_by_name,
         )
+        batch_size = batch.flush(self._rules_by_name)
         self._event_count += new_count
         if new_count > 0:
             self._last_reason = "snakemake_logger_live"
         elif self._event_count == 0:
             self._last_reason = "no_rule_events"
-        return self._result(self._event_count > 0, self._last_reason, new_event_count=new_count)
+        return self._result(
+            self._event_count > 0,
+            self._last_reason,
+            new_event_count=new_count,
+            batch_size=batch_size,
+        )
 
     def _ensure_rules_loaded(self) -> None:
         if self._rules_loaded:
@@ -95,12 +161,20 @@ class SnakemakeRuleEventProjector:
         )
         self._rules_loaded = True
 
-    def _result(self, projected: bool, reason: str, *, new_event_count: int) -> dict[str, Any]:
+    def _result(
+        self,
+        projected: bool,
+        reason: str,
+        *,
+        new_event_count: int,
+        batch_size: int = 0,
+    ) -> dict[str, Any]:
         return {
             "projected": projected,
             "reason": reason,
             "eventCount": self._event_count,
             "newEventCount": new_event_count,
+            "batchSize": batch_size,
         }
 
 
@@ -122,8 +196,9 @@ def project_snakemake_rule_events(
     records = _read_event_records(event_log_path)
     job_rules: dict[str, str] = {}
     rules_by_name = _attempt_rules_by_name(cfg, run_id, str(attempt_id), int(lease_generation))
+    batch = _RuleProjectionBatch(cfg)
     projected_count = _project_event_records(
-        cfg,
+        batch,
         run_id=run_id,
         attempt_id=str(attempt_id),
         lease_generation=int(lease_generation),
@@ -136,7 +211,7 @@ def project_snakemake_rule_events(
     if projected_count == 0:
         return {"projected": False, "reason": "no_rule_events", "eventCount": 0}
     projected_count += _project_workflow_terminal_rules(
-        cfg,
+        batch,
         run_id=run_id,
         attempt_id=str(attempt_id),
         lease_generation=int(lease_generation),
@@ -144,10 +219,12 @@ def project_snakemake_rule_events(
         rules_by_name=rules_by_name,
         workflow_succeeded=workflow_succeeded,
     )
+    batch.flush(rules_by_name)
     return {"projected": True, "reason": "snakemake_logger", "eventCount": projected_count}
 
+
 def _project_event_records(
-    cfg: RemoteRunnerConfig,
+    batch: _RuleProjectionBatch,
     *,
     run_id: str,
     attempt_id: str,
@@ -164,7 +241,7 @@ def _project_event_records(
             continue
         if event == "JOB_INFO":
             projected_count += _project_job_info(
-                cfg,
+                batch,
                 run_id=run_id,
                 attempt_id=attempt_id,
                 lease_generation=lease_generation,
@@ -175,7 +252,7 @@ def _project_event_records(
             )
         elif event == "JOB_STARTED":
             projected_count += _project_job_started(
-                cfg,
+                batch,
                 run_id=run_id,
                 attempt_id=attempt_id,
                 lease_generation=lease_generation,
@@ -186,7 +263,7 @@ def _project_event_records(
             )
         elif event == "SHELLCMD":
             projected_count += _project_shellcmd(
-                cfg,
+                batch,
                 run_id=run_id,
                 attempt_id=attempt_id,
                 lease_generation=lease_generation,
@@ -197,7 +274,7 @@ def _project_event_records(
             )
         elif event == "JOB_FINISHED":
             projected_count += _project_terminal_event(
-                cfg,
+                batch,
                 run_id=run_id,
                 attempt_id=attempt_id,
                 lease_generation=lease_generation,
@@ -212,7 +289,7 @@ def _project_event_records(
             )
         elif event == "JOB_ERROR":
             projected_count += _project_terminal_event(
-                cfg,
+                batch,
                 run_id=run_id,
                 attempt_id=attempt_id,
                 lease_generation=lease_generation,
@@ -229,7 +306,7 @@ def _project_event_records(
 
 
 def _project_workflow_terminal_rules(
-    cfg: RemoteRunnerConfig,
+    batch: _RuleProjectionBatch,
     *,
     run_id: str,
     attempt_id: str,
@@ -240,7 +317,7 @@ def _project_workflow_terminal_rules(
 ) -> int:
     if workflow_succeeded is True:
         return _mark_unfinished_rules(
-            cfg,
+            batch,
             run_id=run_id,
             attempt_id=attempt_id,
             lease_generation=lease_generation,
@@ -252,7 +329,7 @@ def _project_workflow_terminal_rules(
         )
     if workflow_succeeded is False:
         return _mark_unfinished_rules(
-            cfg,
+            batch,
             run_id=run_id,
             attempt_id=attempt_id,
             lease_generation=lease_generation,
@@ -266,7 +343,7 @@ def _project_workflow_terminal_rules(
 
 
 def _project_job_info(
-    cfg: RemoteRunnerConfig,
+    batch: _RuleProjectionBatch,
     *,
     run_id: str,
     attempt_id: str,
@@ -284,8 +361,8 @@ def _project_job_info(
         job_rules[job_id] = rule_name
     current = rules_by_name.get(rule_name, {})
     status = _non_terminal_status(str(current.get("status") or "planned"))
-    updated = upsert_run_rule_state(
-        cfg,
+    updated = batch.upsert_rule_state(
+        current=current,
         run_id=run_id,
         rule_name=rule_name,
         step_id=str(current.get("stepId") or ""),
@@ -302,8 +379,7 @@ def _project_job_info(
         occurred_at=_created_at(record),
     )
     rules_by_name[rule_name] = updated
-    append_run_rule_event(
-        cfg,
+    batch.append_rule_event(
         run_id=run_id,
         rule_name=rule_name,
         step_id=str(updated.get("stepId") or ""),
@@ -320,7 +396,7 @@ def _project_job_info(
 
 
 def _project_job_started(
-    cfg: RemoteRunnerConfig,
+    batch: _RuleProjectionBatch,
     *,
     run_id: str,
     attempt_id: str,
@@ -336,8 +412,8 @@ def _project_job_started(
         if not rule_name:
             continue
         current = rules_by_name.get(rule_name, {})
-        updated = upsert_run_rule_state(
-            cfg,
+        updated = batch.upsert_rule_state(
+            current=current,
             run_id=run_id,
             rule_name=rule_name,
             step_id=str(current.get("stepId") or ""),
@@ -355,8 +431,7 @@ def _project_job_started(
             occurred_at=_created_at(record),
         )
         rules_by_name[rule_name] = updated
-        append_run_rule_event(
-            cfg,
+        batch.append_rule_event(
             run_id=run_id,
             rule_name=rule_name,
             step_id=str(updated.get("stepId") or ""),
@@ -374,7 +449,7 @@ def _project_job_started(
 
 
 def _project_shellcmd(
-    cfg: RemoteRunnerConfig,
+    batch: _RuleProjectionBatch,
     *,
     run_id: str,
     attempt_id: str,
@@ -390,8 +465,8 @@ def _project_shellcmd(
         return 0
     current = rules_by_name.get(rule_name, {})
     status = _non_terminal_status(str(current.get("status") or "running"))
-    updated = upsert_run_rule_state(
-        cfg,
+    updated = batch.upsert_rule_state(
+        current=current,
         run_id=run_id,
         rule_name=rule_name,
         step_id=str(current.get("stepId") or ""),
@@ -408,8 +483,7 @@ def _project_shellcmd(
         occurred_at=_created_at(record),
     )
     rules_by_name[rule_name] = updated
-    append_run_rule_event(
-        cfg,
+    batch.append_rule_event(
         run_id=run_id,
         rule_name=rule_name,
         step_id=str(updated.get("stepId") or ""),
@@ -426,7 +500,7 @@ def _project_shellcmd(
 
 
 def _project_terminal_event(
-    cfg: RemoteRunnerConfig,
+    batch: _RuleProjectionBatch,
     *,
     run_id: str,
     attempt_id: str,
@@ -444,8 +518,8 @@ def _project_terminal_event(
     if not rule_name:
         return 0
     current = rules_by_name.get(rule_name, {})
-    updated = upsert_run_rule_state(
-        cfg,
+    updated = batch.upsert_rule_state(
+        current=current,
         run_id=run_id,
         rule_name=rule_name,
         step_id=str(current.get("stepId") or ""),
@@ -465,8 +539,7 @@ def _project_terminal_event(
         occurred_at=_created_at(record),
     )
     rules_by_name[rule_name] = updated
-    append_run_rule_event(
-        cfg,
+    batch.append_rule_event(
         run_id=run_id,
         rule_name=rule_name,
         step_id=str(updated.get("stepId") or ""),
@@ -483,7 +556,7 @@ def _project_terminal_event(
 
 
 def _mark_unfinished_rules(
-    cfg: RemoteRunnerConfig,
+    batch: _RuleProjectionBatch,
     *,
     run_id: str,
     attempt_id: str,
@@ -498,8 +571,8 @@ def _mark_unfinished_rules(
     for rule_name, current in list(rules_by_name.items()):
         if str(current.get("status") or "") in RULE_TERMINAL_STATUSES:
             continue
-        updated = upsert_run_rule_state(
-            cfg,
+        updated = batch.upsert_rule_state(
+            current=current,
             run_id=run_id,
             rule_name=rule_name,
             step_id=str(current.get("stepId") or ""),
@@ -516,8 +589,7 @@ def _mark_unfinished_rules(
             logs=_string_list(current.get("logs")),
         )
         rules_by_name[rule_name] = updated
-        append_run_rule_event(
-            cfg,
+        batch.append_rule_event(
             run_id=run_id,
             rule_name=rule_name,
             step_id=str(updated.get("stepId") or ""),
@@ -559,27 +631,27 @@ def _read_event_records_since(
     start = max(0, int(offset))
     if path.stat().st_size < start:
         start = 0
-    records: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         handle.seek(start)
-        while True:
-            line_start = handle.tell()
-            line = handle.readline()
-            if not line:
-                break
-            if require_complete_line and not line.endswith("\n"):
-                handle.seek(line_start)
+        data = handle.read()
+    records: list[dict[str, Any]] = []
+    position = 0
+    while position < len(data):
+        newline = data.find(b"\n", position)
+        if newline < 0:
+            # The logger may still be writing this line; re-read it from its start next poll.
+            if require_complete_line:
                 break
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                payload = json.loads(stripped)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(payload, dict):
-                records.append(payload)
-        return records, handle.tell()
+            line, position = data[position:], len(data)
+        else:
+            line, position = data[position:newline], newline + 1
+        try:
+            payload = json.loads(line.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            continue
+        if isinstance(payload, dict):
+            records.append(payload)
+    return records, start + position
 
 
 def _attempt_rules_by_name(
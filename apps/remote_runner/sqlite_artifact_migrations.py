@@ -206,6 +206,35 @@ def ensure_result_package_export_retired_at(connection: sqlite3.Connection) -> N
     )
 
 
+def ensure_artifact_materialization_method(connection: sqlite3.Connection) -> None:
+    _ensure_columns(
+        connection,
+        "artifact_materializations",
+        {
+            "materialization_method": "TEXT NOT NULL DEFAULT ''",
+        },
+    )
+
+
+def migrate_artifact_materialization_method_schema(
+    connection: sqlite3.Connection,
+    *,
+    record_migration: RecordMigration,
+    version: int,
+    name: str,
+) -> None:
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        _ensure_schema_migrations_table(connection)
+        ensure_artifact_materialization_method(connection)
+        record_migration(connection, version, name)
+        connection.execute(f"PRAGMA user_version = {version}")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+
+
 def migrate_artifact_lifecycle_schema(
     connection: sqlite3.Connection,
     *,
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Callable
+
+DEFAULT_MAX_IDLE_CONNECTIONS = 8
+DEFAULT_MAX_POOLED_DATABASES = 8
+DEFAULT_IDLE_TIMEOUT_SECONDS = 300.0
+
+ConnectionFactory = Callable[[str], sqlite3.Connection]
+SchemaValidator = Callable[[sqlite3.Connection], None]
+
+
+@dataclass(frozen=True)
+class SQLiteDatabaseIdentity:
+    path: str
+    device: int
+    inode: int
+
+
+class _DatabasePool:
+    __slots__ = ("identity", "idle", "in_use", "validated_schema_cookies")
+
+    def __init__(self, identity: SQLiteDatabaseIdentity) -> None:
+        self.identity = identity
+        self.idle: list[tuple[sqlite3.Connection, float]] = []
+        self.in_use = 0
+        self.validated_schema_cookies: set[tuple[int, int]] = set()
+
+
+class SQLiteConnectionPool:
+    """Process-wide pool of warm runtime connections keyed by database file identity.
+
+    Each checked-out connection is owned by exactly one caller until its ``with``
+    block exits; idle connections are reused LIFO so the most recently warmed
+    page cache is handed out first. The schema contract is validated once per
+    database file and schema cookie instead of on every checkout.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_databases: int = DEFAULT_MAX_POOLED_DATABASES,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        self._max_databases = max(1, int(max_databases))
+        self._idle_timeout_seconds = max(0.0, float(idle_timeout_seconds))
+        self._lock = threading.Lock()
+        self._pools: OrderedDict[SQLiteDatabaseIdentity, _DatabasePool] = OrderedDict()
+        self._pid = os.getpid()
+        self._hits = 0
+        self._misses = 0
+        self._schema_validations = 0
+        self._discarded = 0
+        self._evicted = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    def acquire(
+        self,
+        db_path: Path,
+        *,
+        max_idle: int,
+        connect: ConnectionFactory,
+        validate_schema: SchemaValidator,
+    ) -> sqlite3.Connection:
+        started = time.perf_counter()
+        identity = database_identity(db_path)
+        connection, pool = self._checkout_idle(identity)
+        if connection is None:
+            connection = self._open_validated(identity, pool, connect=connect, validate_schema=validate_schema)
+        release_limit = max(0, int(max_idle))
+        connection._pool_release = lambda released: self.release(identity, released, max_idle=release_limit)
+        self._record_wait(time.perf_counter() - started)
+        return connection
+
+    def release(self, identity: SQLiteDatabaseIdentity, connection: sqlite3.Connection, *, max_idle: int) -> None:
+        reusable = _reset_for_reuse(connection)
+        to_close: list[sqlite3.Connection] = []
+        with self._lock:
+            self._reset_after_fork_locked()
+            pool = self._pools.get(identity)
+            if pool is not None:
+                pool.in_use = max(0, pool.in_use - 1)
+            if reusable and pool is not None and len(pool.idle) < max_idle:
+                pool.idle.append((connection, time.monotonic()))
+                connection = None
+            else:
+                self._discarded += 1
+            to_close.extend(self._evict_expired_locked())
+        if connection is not None:
+            to_close.append(connection)
+        _close_all(to_close)
+
+    def close_all(self) -> None:
+        with self._lock:
+            connections = [
+                connection
+                for pool in self._pools.values()
+                for connection, _ in pool.idle
+            ]
+            self._pools.clear()
+        _close_all(connections)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            checkouts = self._hits + self._misses
+            return {
+                "databases": len(self._pools),
+                "idleConnections": sum(len(pool.idle) for pool in self._pools.values()),
+                "inUseConnections": sum(pool.in_use for pool in self._pools.values()),
+                "checkouts": checkouts,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hitRatio": round(self._hits / checkouts, 4) if checkouts else 0.0,
+                "schemaValidations": self._schema_validations,
+                "discardedConnections": self._discarded,
+                "evictedConnections": self._evicted,
+                "waitSeconds": {
+                    "total": round(self._wait_seconds_total, 6),
+                    "max": round(self._wait_seconds_max, 6),
+                    "avg": round(self._wait_seconds_total / checkouts, 6) if checkouts else 0.0,
+                },
+            }
+
+    def _checkout_idle(self, identity: SQLiteDatabaseIdentity) -> tuple[sqlite3.Connection | None, _DatabasePool]:
+        to_close: list[sqlite3.Connection] = []
+        connection: sqlite3.Connection | None = None
+        with self._lock:
+            self._reset_after_fork_locked()
+            pool = self._pools.get(identity)
+            if pool is None:
+                pool = _DatabasePool(identity)
+                self._pools[identity] = pool
+                to_close.extend(self._evict_databases_locked())
+            self._pools.move_to_end(identity)
+            while pool.idle:
+                candidate, _ = pool.idle.pop()
+                if _connection_is_open(candidate):
+                    connection = candidate
+                    break
+                self._discarded += 1
+            if connection is not None:
+                self._hits += 1
+            else:
+                self._misses += 1
+            pool.in_use += 1
+        _close_all(to_close)
+        return connection, pool
+
+    def _open_validated(
+        self,
+        identity: SQLiteDatabaseIdentity,
+        pool: _DatabasePool,
+        *,
+        connect: ConnectionFactory,
+        validate_schema: SchemaValidator,
+    ) -> sqlite3.Connection:
+        try:
+            connection = connect(identity.path)
+        except BaseException:
+            self._release_slot(pool)
+            raise
+        try:
+            cookie = _schema_cookie(connection)
+            with self._lock:
+                validated = cookie in pool.validated_schema_cookies
+            if not validated:
+                validate_schema(connection)
+                with self._lock:
+                    pool.validated_schema_cookies.add(cookie)
+                    self._schema_validations += 1
+        except BaseException:
+            self._release_slot(pool)
+            connection.close()
+            raise
+        return connection
+
+    def _release_slot(self, pool: _DatabasePool) -> None:
+        with self._lock:
+            pool.in_use = max(0, pool.in_use - 1)
+
+    def _record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._wait_seconds_total += seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, seconds)
+
+    def _evict_databases_locked(self) -> list[sqlite3.Connection]:
+        evicted: list[sqlite3.Connection] = []
+        while len(self._pools) > self._max_databases:
+            _, pool = self._pools.popitem(last=False)
+            evicted.extend(connection for connection, _ in pool.idle)
+            self._evicted += len(pool.idle)
+            pool.idle.clear()
+        return evicted
+
+    def _evict_expired_locked(self) -> list[sqlite3.Connection]:
+        if self._idle_timeout_seconds <= 0:
+            return []
+        cutoff = time.monotonic() - self._idle_timeout_seconds
+        evicted: list[sqlite3.Connection] = []
+        for pool in self._pools.values():
+            fresh = [(connection, idle_since) for connection, idle_since in pool.idle if idle_since >= cutoff]
+            if len(fresh) != len(pool.idle):
+                evicted.extend(connection for connection, idle_since in pool.idle if idle_since < cutoff)
+                pool.idle = fresh
+        self._evicted += len(evicted)
+        return evicted
+
+    def _reset_after_fork_locked(self) -> None:
+        pid = os.getpid()
+        if pid == self._pid:
+            return
+        # Connections inherited across fork() must never be reused by the child.
+        self._pools.clear()
+        self._pid = pid
+
+
+def database_identity(db_path: Path) -> SQLiteDatabaseIdentity:
+    resolved = Path(db_path).resolve()
+    stat = resolved.stat()
+    return SQLiteDatabaseIdentity(path=str(resolved), device=int(stat.st_dev), inode=int(stat.st_ino))
+
+
+_POOL = SQLiteConnectionPool()
+
+
+def get_connection_pool() -> SQLiteConnectionPool:
+    return _POOL
+
+
+def connection_pool_stats() -> dict[str, Any]:
+    return _POOL.stats()
+
+
+def close_connection_pool() -> None:
+    _POOL.close_all()
+
+
+def _schema_cookie(connection: sqlite3.Connection) -> tuple[int, int]:
+    schema_version = connection.execute("PRAGMA schema_version").fetchone()[0]
+    user_version = connection.execute("PRAGMA user_version").fetchone()[0]
+    return int(schema_version or 0), int(user_version or 0)
+
+
+def _reset_for_reuse(connection: sqlite3.Connection) -> bool:
+    if not _connection_is_open(connection):
+        return False
+    try:
+        if connection.in_transaction:
+            connection.rollback()
+    except sqlite3.Error:
+        return False
+    connection.row_factory = sqlite3.Row
+    return True
+
+
+def _connection_is_open(connection: sqlite3.Connection) -> bool:
+    try:
+        connection.total_changes
+    except sqlite3.ProgrammingError:
+        return False
+    return True
+
+
+def _close_all(connections: list[sqlite3.Connection]) -> None:
+    for connection in connections:
+        try:
+            connection.close()
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable
+
+
+RecordMigration = Callable[[sqlite3.Connection, int, str], None]
+
+
+def ensure_snakemake_dry_run_cache(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS snakemake_dry_run_cache (
+            cache_key TEXT PRIMARY KEY,
+            plan_hash TEXT NOT NULL,
+            stdout TEXT NOT NULL DEFAULT '',
+            stderr TEXT NOT NULL DEFAULT '',
+            duration_seconds REAL NOT NULL DEFAULT 0,
+            hit_count INTEGER NOT NULL DEFAULT 0,
+            miss_count INTEGER NOT NULL DEFAULT 0,
+            saved_seconds REAL NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            last_used_at TEXT NOT NULL
+        )
+        """
+    )
+    connection.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_snakemake_dry_run_cache_last_used
+        ON snakemake_dry_run_cache(last_used_at)
+        """
+    )
+
+
+def migrate_snakemake_dry_run_cache_schema(
+    connection: sqlite3.Connection,
+    *,
+    record_migration: RecordMigration,
+    version: int,
+    name: str,
+) -> None:
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        _ensure_schema_migrations_table(connection)
+        ensure_snakemake_dry_run_cache(connection)
+        record_migration(connection, version, name)
+        connection.execute(f"PRAGMA user_version = {int(version)}")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+
+
+def _ensure_schema_migrations_table(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+        """
+    )
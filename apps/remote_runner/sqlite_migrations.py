@@ -10,6 +10,7 @@ from .sqlite_artifact_migrations import (
     ensure_artifact_cache,
     ensure_artifact_cache_pins,
     ensure_artifact_lifecycle,
+    ensure_artifact_materialization_method,
     ensure_artifact_storage_columns,
     ensure_result_package_export_byte_state,
     ensure_result_package_export_payload_mode,
@@ -18,6 +19,7 @@ from .sqlite_artifact_migrations import (
     migrate_artifact_cache_pin_schema,
     migrate_artifact_cache_schema,
     migrate_artifact_lifecycle_schema,
+    migrate_artifact_materialization_method_schema,
     migrate_result_package_byte_state_schema,
     migrate_result_package_payload_mode_schema,
     migrate_result_package_retired_at_schema,
@@ -31,7 +33,19 @@ from .sqlite_artifact_lifecycle_policy_migrations import (
     ensure_artifact_lifecycle_policies,
     migrate_artifact_lifecycle_policy_schema,
 )
+from .sqlite_dry_run_cache_migrations import ensure_snakemake_dry_run_cache, migrate_snakemake_dry_run_cache_schema
+from .sqlite_run_job_resource_migrations import (
+    ensure_run_job_resource_requests,
+    migrate_run_job_resource_request_schema,
+)
+from .sqlite_run_listing_migrations import ensure_run_listing_indexes, migrate_run_listing_index_schema
 from .sqlite_schema_contract import REQUIRED_INDEXES, REQUIRED_TABLES, REQUIRED_TRIGGERS
+from .sqlite_trigger_readiness_manifest_migrations import (
+    ensure_workflow_trigger_readiness_path_manifest,
+    migrate_workflow_trigger_readiness_path_manifest_schema,
+)
+from .sqlite_upload_session_migrations import ensure_upload_sessions, migrate_upload_session_schema
+from .sqlite_verified_digest_migrations import ensure_verified_file_digests, migrate_verified_file_digest_schema
 from .sqlite_trigger_readiness_watcher_migrations import (
     ensure_workflow_trigger_readiness_watcher,
     migrate_workflow_trigger_readiness_watcher_schema,
@@ -46,7 +60,7 @@ from .sqlite_trigger_inbox_migrations import (
 from .storage_schema import SCHEMA_SQL
 from .tool_prepare_reservations import json_object, tool_prepare_job_reservation
 
-CURRENT_SCHEMA_VERSION = 17
+CURRENT_SCHEMA_VERSION = 24
 BASELINE_MIGRATION_NAME = "001_baseline_remote_runner_schema"
 RULE_LEVEL_RUN_STATE_MIGRATION_NAME = "002_rule_level_run_state"
 SCHEDULER_TRIGGER_MIGRATION_NAME = "003_scheduler_triggers"
@@ -64,7 +78,14 @@ RESULT_PACKAGE_BYTE_STATE_MIGRATION_NAME = "014_result_package_byte_state"
 ARTIFACT_LEDGER_INVALIDATION_MIGRATION_NAME = "015_artifact_ledger_invalidation"
 RESULT_PACKAGE_RETIRED_AT_MIGRATION_NAME = "016_result_package_retired_at"
 ARTIFACT_LIFECYCLE_POLICY_MIGRATION_NAME = "017_artifact_lifecycle_policy"
-CURRENT_SCHEMA_MIGRATION_NAME = ARTIFACT_LIFECYCLE_POLICY_MIGRATION_NAME
+RUN_LISTING_INDEX_MIGRATION_NAME = "018_run_listing_indexes"
+SNAKEMAKE_DRY_RUN_CACHE_MIGRATION_NAME = "019_snakemake_dry_run_cache"
+RUN_JOB_RESOURCE_REQUEST_MIGRATION_NAME = "020_run_job_resource_requests"
+VERIFIED_FILE_DIGEST_MIGRATION_NAME = "021_verified_file_digests"
+UPLOAD_SESSION_MIGRATION_NAME = "022_upload_sessions"
+TRIGGER_READINESS_PATH_MANIFEST_MIGRATION_NAME = "023_trigger_readiness_path_manifest"
+ARTIFACT_MATERIALIZATION_METHOD_MIGRATION_NAME = "024_artifact_materialization_method"
+CURRENT_SCHEMA_MIGRATION_NAME = ARTIFACT_MATERIALIZATION_METHOD_MIGRATION_NAME
 DATABASE_MISSING_ERROR = "REMOTE_RUNNER_SQLITE_DATABASE_MISSING"
 SCHEMA_MIGRATION_REQUIRED_ERROR = "REMOTE_RUNNER_SQLITE_SCHEMA_MIGRATION_REQUIRED"
 SCHEMA_TOO_NEW_ERROR = "REMOTE_RUNNER_SQLITE_SCHEMA_TOO_NEW"
@@ -201,6 +222,62 @@ def migrate_runtime_schema(connection: sqlite3.Connection) -> None:
             version=17,
             name=ARTIFACT_LIFECYCLE_POLICY_MIGRATION_NAME,
         )
+        version = read_schema_version(connection)
+    if version == 17:
+        migrate_run_listing_index_schema(
+            connection,
+            record_migration=_record_migration,
+            version=18,
+            name=RUN_LISTING_INDEX_MIGRATION_NAME,
+        )
+        version = read_schema_version(connection)
+    if version == 18:
+        migrate_snakemake_dry_run_cache_schema(
+            connection,
+            record_migration=_record_migration,
+            version=19,
+            name=SNAKEMAKE_DRY_RUN_CACHE_MIGRATION_NAME,
+        )
+        version = read_schema_version(connection)
+    if version == 19:
+        migrate_run_job_resource_request_schema(
+            connection,
+            record_migration=_record_migration,
+            version=20,
+            name=RUN_JOB_RESOURCE_REQUEST_MIGRATION_NAME,
+        )
+        version = read_schema_version(connection)
+    if version == 20:
+        migrate_verified_file_digest_schema(
+            connection,
+            record_migration=_record_migration,
+            version=21,
+            name=VERIFIED_FILE_DIGEST_MIGRATION_NAME,
+        )
+        version = read_schema_version(connection)
+    if version == 21:
+        migrate_upload_session_schema(
+            connection,
+            record_migration=_record_migration,
+            version=22,
+            name=UPLOAD_SESSION_MIGRATION_NAME,
+        )
+        version = read_schema_version(connection)
+    if version == 22:
+        migrate_workflow_trigger_readiness_path_manifest_schema(
+            connection,
+            record_migration=_record_migration,
+            version=23,
+            name=TRIGGER_READINESS_PATH_MANIFEST_MIGRATION_NAME,
+        )
+        version = read_schema_version(connection)
+    if version == 23:
+        migrate_artifact_materialization_method_schema(
+            connection,
+            record_migration=_record_migration,
+            version=24,
+            name=ARTIFACT_MATERIALIZATION_METHOD_MIGRATION_NAME,
+        )
         return
     if version != 0:
         raise RemoteRunnerSQLiteSchemaError(f"REMOTE_RUNNER_SQLITE_SCHEMA_MIGRATION_MISSING: {version}")
@@ -211,6 +288,13 @@ def migrate_runtime_schema(connection: sqlite3.Connection) -> None:
         _apply_baseline_schema_migration(connection)
         _record_migration(connection, 15, ARTIFACT_LEDGER_INVALIDATION_MIGRATION_NAME)
         _record_migration(connection, 16, RESULT_PACKAGE_RETIRED_AT_MIGRATION_NAME)
+        _record_migration(connection, 17, ARTIFACT_LIFECYCLE_POLICY_MIGRATION_NAME)
+        _record_migration(connection, 18, RUN_LISTING_INDEX_MIGRATION_NAME)
+        _record_migration(connection, 19, SNAKEMAKE_DRY_RUN_CACHE_MIGRATION_NAME)
+        _record_migration(connection, 20, RUN_JOB_RESOURCE_REQUEST_MIGRATION_NAME)
+        _record_migration(connection, 21, VERIFIED_FILE_DIGEST_MIGRATION_NAME)
+        _record_migration(connection, 22, UPLOAD_SESSION_MIGRATION_NAME)
+        _record_migration(connection, 23, TRIGGER_READINESS_PATH_MANIFEST_MIGRATION_NAME)
         _record_migration(connection, CURRENT_SCHEMA_VERSION, CURRENT_SCHEMA_MIGRATION_NAME)
         connection.execute(f"PRAGMA user_version = {CURRENT_SCHEMA_VERSION}")
         connection.commit()
@@ -323,8 +407,15 @@ def _apply_baseline_schema_migration(connection: sqlite3.Connection) -> None:
     ensure_result_package_export_byte_state(connection)
     ensure_result_package_export_retired_at(connection)
     ensure_artifact_lifecycle_policies(connection)
+    ensure_run_listing_indexes(connection)
+    ensure_snakemake_dry_run_cache(connection)
+    ensure_run_job_resource_requests(connection)
+    ensure_verified_file_digests(connection)
+    ensure_upload_sessions(connection)
     ensure_workflow_trigger_inbox_signature_metadata(connection)
     ensure_workflow_trigger_readiness_watcher(connection)
+    ensure_workflow_trigger_readiness_path_manifest(connection)
+    ensure_artifact_materialization_method(connection)
 
 def _migrate_from_v1_to_v2(connection: sqlite3.Connection) -> None:
     try:
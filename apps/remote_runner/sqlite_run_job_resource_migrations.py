@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable
+
+
+RecordMigration = Callable[[sqlite3.Connection, int, str], None]
+
+
+def ensure_run_job_resource_requests(connection: sqlite3.Connection) -> None:
+    columns = {row["name"] for row in connection.execute("PRAGMA table_info(run_jobs)").fetchall()}
+    if "resource_request_json" not in columns:
+        connection.execute("ALTER TABLE run_jobs ADD COLUMN resource_request_json TEXT NOT NULL DEFAULT '{}'")
+
+
+def migrate_run_job_resource_request_schema(
+    connection: sqlite3.Connection,
+    *,
+    record_migration: RecordMigration,
+    version: int,
+    name: str,
+) -> None:
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        _ensure_schema_migrations_table(connection)
+        ensure_run_job_resource_requests(connection)
+        record_migration(connection, version, name)
+        connection.execute(f"PRAGMA user_version = {int(version)}")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+
+
+def _ensure_schema_migrations_table(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+        """
+    )
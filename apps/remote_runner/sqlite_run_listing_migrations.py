@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable
+
+
+RecordMigration = Callable[[sqlite3.Connection, int, str], None]
+
+
+def ensure_run_listing_indexes(connection: sqlite3.Connection) -> None:
+    run_columns = {str(row[1]) for row in connection.execute("PRAGMA table_info(runs)").fetchall()}
+    if {"submitted_at", "run_id"} <= run_columns:
+        connection.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_runs_submitted
+            ON runs(submitted_at DESC, run_id DESC)
+            """
+        )
+    if {"finished_at", "last_updated_at", "status", "run_id"} <= run_columns:
+        connection.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_runs_produced
+            ON runs(COALESCE(finished_at, last_updated_at) DESC, run_id DESC)
+            WHERE status IN ('completed', 'failed')
+            """
+        )
+    connection.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_artifacts_run
+        ON artifacts(run_id, created_at)
+        """
+    )
+
+
+def migrate_run_listing_index_schema(
+    connection: sqlite3.Connection,
+    *,
+    record_migration: RecordMigration,
+    version: int,
+    name: str,
+) -> None:
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        _ensure_schema_migrations_table(connection)
+        ensure_run_listing_indexes(connection)
+        record_migration(connection, version, name)
+        connection.execute(f"PRAGMA user_version = {int(version)}")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+
+
+def _ensure_schema_migrations_table(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+        """
+    )
@@ -31,6 +31,7 @@ REQUIRED_TABLES = {
     "runs",
     "schema_migrations",
     "service_state",
+    "snakemake_dry_run_cache",
     "tool_index",
     "tool_prepare_job_events",
     "tool_prepare_jobs",
@@ -38,12 +39,15 @@ REQUIRED_TABLES = {
     "tool_runtime_profiles",
     "tool_validation_results",
     "tools",
+    "upload_sessions",
     "uploads",
+    "verified_file_digests",
     "workflow_design_drafts",
     "workflow_backfill_launches",
     "workflow_backfill_partitions",
     "workflow_revisions",
     "workflow_trigger_readiness_observations",
+    "workflow_trigger_readiness_path_manifest",
     "workflow_trigger_inbox_events",
     "workflow_trigger_dispatches",
     "workflow_trigger_events",
@@ -57,6 +61,7 @@ REQUIRED_INDEXES = {
     "idx_artifact_cache_pins_entry_state",
     "idx_artifact_cache_pins_object",
     "idx_artifacts_lifecycle",
+    "idx_artifacts_run",
     "idx_candidate_outputs_attempt_generation_key",
     "idx_evidence_events_chain",
     "idx_evidence_events_subject",
@@ -80,6 +85,7 @@ REQUIRED_INDEXES = {
     "idx_run_rules_run_status",
     "idx_run_resource_allocations_active",
     "idx_run_workers_state_heartbeat",
+    "idx_snakemake_dry_run_cache_last_used",
     "idx_tool_index_search",
     "idx_tool_index_source_quality",
     "idx_tool_index_state_quality",
@@ -88,6 +94,8 @@ REQUIRED_INDEXES = {
     "idx_tool_runtime_profiles_revision",
     "idx_tool_validation_results_job",
     "idx_tool_validation_results_tool",
+    "idx_upload_sessions_state_expires",
+    "idx_verified_file_digests_verified_at",
     "idx_workflow_trigger_dispatches_run",
     "idx_workflow_trigger_dispatches_state",
     "idx_workflow_trigger_events_external",
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable
+
+
+RecordMigration = Callable[[sqlite3.Connection, int, str], None]
+
+
+def ensure_workflow_trigger_readiness_path_manifest(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS workflow_trigger_readiness_path_manifest (
+            watch_root TEXT NOT NULL,
+            relative_path TEXT NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            sha256 TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (watch_root, relative_path)
+        )
+        """
+    )
+
+
+def migrate_workflow_trigger_readiness_path_manifest_schema(
+    connection: sqlite3.Connection,
+    *,
+    record_migration: RecordMigration,
+    version: int,
+    name: str,
+) -> None:
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        _ensure_schema_migrations_table(connection)
+        ensure_workflow_trigger_readiness_path_manifest(connection)
+        record_migration(connection, version, name)
+        connection.execute(f"PRAGMA user_version = {int(version)}")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+
+
+def _ensure_schema_migrations_table(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+        """
+    )
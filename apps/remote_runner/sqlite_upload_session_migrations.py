@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable
+
+
+RecordMigration = Callable[[sqlite3.Connection, int, str], None]
+
+
+def ensure_upload_sessions(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS upload_sessions (
+            upload_session_id TEXT PRIMARY KEY,
+            filename TEXT NOT NULL,
+            mime_type TEXT NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            expected_sha256 TEXT NOT NULL DEFAULT '',
+            received_bytes INTEGER NOT NULL DEFAULT 0,
+            partial_path TEXT NOT NULL,
+            state TEXT NOT NULL,
+            upload_id TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            expires_at TEXT NOT NULL
+        )
+        """
+    )
+    connection.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_upload_sessions_state_expires
+        ON upload_sessions(state, expires_at)
+        """
+    )
+
+
+def migrate_upload_session_schema(
+    connection: sqlite3.Connection,
+    *,
+    record_migration: RecordMigration,
+    version: int,
+    name: str,
+) -> None:
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        _ensure_schema_migrations_table(connection)
+        ensure_upload_sessions(connection)
+        record_migration(connection, version, name)
+        connection.execute(f"PRAGMA user_version = {int(version)}")
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+
+
+def _ensure_schema_migrations_table(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+        """
+    )
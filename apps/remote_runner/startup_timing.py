@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+
+_RELEASE_MANIFEST = Path(__file__).resolve().parents[1] / "bootstrap_manifest.json"
+
+
+class StartupTimeline:
+    """Wall-clock breakdown of runner cold start, reported on ``/health/startup``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._created = time.perf_counter()
+        self._phases: dict[str, float] = {}
+        self._route_groups: dict[str, dict[str, Any]] = {}
+        self._ready_seconds: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._phases[name] = self._phases.get(name, 0.0) + max(0.0, seconds)
+
+    def mark_ready(self) -> None:
+        with self._lock:
+            self._ready_seconds = time.perf_counter() - self._created
+
+    def record_route_group(self, name: str, *, lazy: bool, loaded: bool, seconds: float = 0.0) -> None:
+        with self._lock:
+            self._route_groups[name] = {"lazy": lazy, "loaded": loaded, "loadMs": _ms(seconds)}
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "phasesMs": {name: _ms(seconds) for name, seconds in self._phases.items()},
+                "readyMs": None if self._ready_seconds is None else _ms(self._ready_seconds),
+                "routeGroups": {name: dict(group) for name, group in self._route_groups.items()},
+                "bytecode": _bundled_bytecode(),
+            }
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 3)
+
+
+def _bundled_bytecode() -> dict[str, Any] | None:
+    try:
+        manifest = json.loads(_RELEASE_MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    bytecode = manifest.get("bytecode") if isinstance(manifest, dict) else None
+    return dict(bytecode) if isinstance(bytecode, dict) else None
+
+
+STARTUP_TIMELINE = StartupTimeline()
+
+
+def startup_timing_snapshot() -> dict[str, Any]:
+    return STARTUP_TIMELINE.snapshot()
@@ -7,6 +7,7 @@ from typing import Any
 
 from .config import RemoteRunnerConfig
 from .database_backend_config import assert_supported_database_backend
+from .sqlite_connection_pool import DEFAULT_MAX_IDLE_CONNECTIONS, get_connection_pool
 from .sqlite_migrations import (
     DATABASE_MISSING_ERROR,
     RemoteRunnerSQLiteSchemaError,
@@ -24,14 +25,41 @@ def get_connection(cfg: RemoteRunnerConfig) -> sqlite3.Connection:
     db_path = Path(cfg.db_path)
     if not db_path.is_file():
         raise RemoteRunnerSQLiteSchemaError(DATABASE_MISSING_ERROR)
-    connection = sqlite3.connect(str(db_path), check_same_thread=False, factory=_ObservedConnection)
+    return get_connection_pool().acquire(
+        db_path,
+        max_idle=_pool_max_idle_connections(cfg),
+        connect=_open_runtime_connection,
+        validate_schema=ensure_runtime_schema_current,
+    )
+
+
+def _open_runtime_connection(db_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(db_path, check_same_thread=False, factory=_ObservedConnection)
     connection.row_factory = sqlite3.Row
     configure_runtime_connection(connection)
-    ensure_runtime_schema_current(connection)
     return connection
 
 
+def _pool_max_idle_connections(cfg: RemoteRunnerConfig) -> int:
+    raw = getattr(cfg, "sqlite_pool_max_idle_connections", DEFAULT_MAX_IDLE_CONNECTIONS)
+    try:
+        return max(0, int(raw))
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_IDLE_CONNECTIONS
+
+
 class _ObservedConnection(sqlite3.Connection):
+    _pool_release: Any = None
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> Any:
+        try:
+            return super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            release = self._pool_release
+            if release is not None:
+                self._pool_release = None
+                release(self)
+
     def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:
         try:
             return super().execute(sql, parameters)
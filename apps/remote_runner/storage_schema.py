@@ -441,6 +441,7 @@ CREATE TABLE IF NOT EXISTS artifact_materializations (
     deleted_at TEXT,
     gc_reason TEXT NOT NULL DEFAULT '',
     retention_until TEXT,
+    materialization_method TEXT NOT NULL DEFAULT '',
     UNIQUE(artifact_blob_id, storage_backend, storage_uri)
 );
 
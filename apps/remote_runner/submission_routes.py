@@ -2,13 +2,25 @@ from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 from core.contracts.remote_endpoints import REMOTE_ENDPOINTS, RUN_CREATE, UPLOAD_CREATE, remote_endpoint_success_status
+from core.contracts.submission_remote_endpoints import (
+    UPLOAD_SESSION_CHUNK,
+    UPLOAD_SESSION_COMPLETE,
+    UPLOAD_SESSION_CREATE,
+    UPLOAD_SESSION_READ,
+)
 
-from .api_models import RunCreateRequest, UploadCreateRequest
+from .api_models import RunCreateRequest, UploadCreateRequest, UploadSessionCreateRequest
 from .control_service import create_run_from_request, create_upload_from_request
 from .route_headers import AuthorizationHeader, IdempotencyKeyHeader, RequestIdHeader
+from .upload_session_api import (
+    append_upload_chunk_from_request,
+    complete_upload_session_from_request,
+    create_upload_session_from_request,
+    get_upload_session_from_request,
+)
 
 
 router = APIRouter()
@@ -22,6 +34,56 @@ async def create_upload(
     return await create_upload_from_request(payload, authorization)
 
 
+@router.post("/api/v1/upload-sessions", operation_id=REMOTE_ENDPOINTS[UPLOAD_SESSION_CREATE].operation_id)
+async def create_upload_session(
+    payload: UploadSessionCreateRequest,
+    authorization: AuthorizationHeader = None,
+) -> dict[str, Any]:
+    return await create_upload_session_from_request(payload, authorization)
+
+
+@router.get(
+    "/api/v1/upload-sessions/{upload_session_id}",
+    operation_id=REMOTE_ENDPOINTS[UPLOAD_SESSION_READ].operation_id,
+)
+async def get_upload_session(
+    upload_session_id: str,
+    authorization: AuthorizationHeader = None,
+) -> dict[str, Any]:
+    return await get_upload_session_from_request(upload_session_id, authorization)
+
+
+@router.post(
+    "/api/v1/upload-sessions/{upload_session_id}/chunks",
+    operation_id=REMOTE_ENDPOINTS[UPLOAD_SESSION_CHUNK].operation_id,
+)
+async def append_upload_session_chunk(
+    upload_session_id: str,
+    request: Request,
+    offset: int,
+    sha256: str,
+    authorization: AuthorizationHeader = None,
+) -> dict[str, Any]:
+    return await append_upload_chunk_from_request(
+        upload_session_id,
+        request.stream(),
+        authorization,
+        offset=offset,
+        sha256=sha256,
+    )
+
+
+@router.post(
+    "/api/v1/upload-sessions/{upload_session_id}/complete",
+    operation_id=REMOTE_ENDPOINTS[UPLOAD_SESSION_COMPLETE].operation_id,
+)
+async def complete_upload_session(
+    upload_session_id: str,
+    authorization: AuthorizationHeader = None,
+) -> dict[str, Any]:
+    return await complete_upload_session_from_request(upload_session_id, authorization)
+
+
 @router.post(
     "/api/v1/runs",
     operation_id=REMOTE_ENDPOINTS[RUN_CREATE].operation_id,
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+from collections.abc import Iterable
+import os
+from pathlib import Path
+import select
+import sys
+import time
+
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+DEFAULT_MAX_WATCHES = 4096
+DEFAULT_SETTLE_SECONDS = 0.5
+MAX_SETTLE_SECONDS = 5.0
+READ_BUFFER_BYTES = 64 * 1024
+
+
+def inotify_available() -> bool:
+    return sys.platform.startswith("linux") and _libc() is not None
+
+
+class InotifyWakeup:
+    """Wake the readiness watcher when a watched tree changes instead of polling it.
+
+    Directories are watched recursively up to ``max_watches``; a watched file is
+    covered through its parent directory, and a path that does not exist yet
+    through its nearest existing ancestor.
+    """
+
+    def __init__(self, *, max_watches: int = DEFAULT_MAX_WATCHES) -> None:
+        libc = _libc()
+        if libc is None or not sys.platform.startswith("linux"):
+            raise RuntimeError("WORKFLOW_TRIGGER_READINESS_WATCHER_INOTIFY_UNAVAILABLE")
+        if max_watches <= 0:
+            raise ValueError("WORKFLOW_TRIGGER_READINESS_WATCHER_INOTIFY_MAX_WATCHES_INVALID")
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._libc = libc
+        self._fd = fd
+        self._max_watches = max_watches
+        self._watches: dict[str, int] = {}
+
+    def watch_paths(self, paths: Iterable[Path]) -> int:
+        """Reconcile kernel watches with ``paths``; returns the number of watched directories."""
+        desired: list[str] = []
+        seen: set[str] = set()
+        for path in paths:
+            for directory in _watch_directories(Path(path).expanduser()):
+                if directory not in seen and len(desired) < self._max_watches:
+                    seen.add(directory)
+                    desired.append(directory)
+        for directory in [item for item in self._watches if item not in seen]:
+            self._libc.inotify_rm_watch(self._fd, self._watches.pop(directory))
+        for directory in desired:
+            if directory in self._watches:
+                continue
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd >= 0:
+                self._watches[directory] = wd
+        return len(self._watches)
+
+    def wait(self, timeout_seconds: float, *, settle_seconds: float = DEFAULT_SETTLE_SECONDS) -> bool:
+        """Block until an event arrives or the timeout passes; bursts are coalesced into one wakeup."""
+        if not self._readable(timeout_seconds):
+            return False
+        deadline = time.monotonic() + MAX_SETTLE_SECONDS
+        self._drain()
+        while time.monotonic() < deadline and self._readable(settle_seconds):
+            self._drain()
+        return True
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._watches.clear()
+
+    def _readable(self, timeout_seconds: float) -> bool:
+        readable, _, _ = select.select([self._fd], [], [], max(0.0, timeout_seconds))
+        return bool(readable)
+
+    def _drain(self) -> None:
+        try:
+            while os.read(self._fd, READ_BUFFER_BYTES):
+                continue
+        except BlockingIOError:
+            return
+
+
+def _watch_directories(path: Path) -> list[str]:
+    if path.is_dir():
+        directories = [str(path)]
+        for root, dirnames, _filenames in os.walk(path):
+            directories.extend(os.path.join(root, name) for name in sorted(dirnames))
+        return directories
+    anchor = path.parent
+    while not anchor.is_dir() and anchor != anchor.parent:
+        anchor = anchor.parent
+    return [str(anchor)]
+
+
+_LIBC: ctypes.CDLL | None = None
+_LIBC_LOADED = False
+
+
+def _libc() -> ctypes.CDLL | None:
+    global _LIBC, _LIBC_LOADED
+    if not _LIBC_LOADED:
+        _LIBC_LOADED = True
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            _LIBC = libc
+        except (OSError, AttributeError):
+            _LIBC = None
+    return _LIBC
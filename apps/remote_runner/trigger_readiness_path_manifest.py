@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+from .config import RemoteRunnerConfig
+from .storage_core import get_connection, now_iso
+from .verified_digest_cache import RACY_MTIME_WINDOW_NS
+
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def list_watch_path(path: Path) -> dict[str, Any]:
+    """Stat a watched file or tree once; returns its files and the newest mtime seen."""
+    root_stat = path.stat()
+    if path.is_file():
+        return {
+            "kind": "file",
+            "files": [("", int(root_stat.st_size), int(root_stat.st_mtime_ns))],
+            "latestMtimeNs": int(root_stat.st_mtime_ns),
+        }
+    if not path.is_dir():
+        raise ValueError("WORKFLOW_TRIGGER_READINESS_WATCHER_PATH_UNSUPPORTED")
+    files: list[tuple[str, int, int]] = []
+    latest = int(root_stat.st_mtime_ns)
+    pending = [(str(path), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                children = list(entries)
+        except OSError:
+            continue
+        for entry in children:
+            relative = f"{prefix}{entry.name}"
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    latest = max(latest, int(entry.stat(follow_symlinks=False).st_mtime_ns))
+                    pending.append((entry.path, f"{relative}/"))
+                elif entry.is_file():
+                    entry_stat = entry.stat()
+                    latest = max(latest, int(entry_stat.st_mtime_ns))
+                    files.append((relative, int(entry_stat.st_size), int(entry_stat.st_mtime_ns)))
+            except OSError:
+                continue
+    # Match the historical Path-ordered digest so existing observations stay stable.
+    files.sort(key=lambda item: item[0].split("/"))
+    return {"kind": "directory", "files": files, "latestMtimeNs": latest}
+
+
+def manifest_path_stats(cfg: RemoteRunnerConfig, path: Path, listing: dict[str, Any]) -> dict[str, Any]:
+    """Checksum a listed path, re-hashing only files whose size or mtime moved since the last scan."""
+    watch_root = str(path.resolve())
+    with get_connection(cfg) as connection:
+        rows = connection.execute(
+            """
+            SELECT relative_path, size_bytes, mtime_ns, sha256
+            FROM workflow_trigger_readiness_path_manifest
+            WHERE watch_root = ?
+            """,
+            (watch_root,),
+        ).fetchall()
+    known = {str(row["relative_path"]): row for row in rows}
+    digest = hashlib.sha256()
+    total_size = 0
+    checksum = ""
+    changed: list[tuple[str, str, int, int, str, str]] = []
+    scan = {"filesStatted": len(listing["files"]), "filesHashed": 0, "filesReused": 0, "bytesHashed": 0}
+    timestamp = now_iso()
+    for relative, size_bytes, mtime_ns in listing["files"]:
+        row = known.pop(relative, None)
+        if row is not None and int(row["size_bytes"]) == size_bytes and int(row["mtime_ns"]) == mtime_ns:
+            checksum = str(row["sha256"])
+            scan["filesReused"] += 1
+        else:
+            started_ns = time.time_ns()
+            hashed_size, checksum = _hash_file(path / relative if relative else path)
+            scan["filesHashed"] += 1
+            scan["bytesHashed"] += hashed_size
+            # Files still being written may change again within the same mtime tick.
+            if hashed_size == size_bytes and mtime_ns < started_ns - RACY_MTIME_WINDOW_NS:
+                changed.append((watch_root, relative, size_bytes, mtime_ns, checksum, timestamp))
+            size_bytes = hashed_size
+        if listing["kind"] == "directory":
+            digest.update(relative.encode("utf-8"))
+            digest.update(str(size_bytes).encode("utf-8"))
+            digest.update(checksum.encode("utf-8"))
+        total_size += size_bytes
+    if changed or known:
+        with get_connection(cfg) as connection:
+            connection.executemany(
+                """
+                INSERT INTO workflow_trigger_readiness_path_manifest (
+                    watch_root, relative_path, size_bytes, mtime_ns, sha256, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(watch_root, relative_path) DO UPDATE SET
+                    size_bytes = excluded.size_bytes,
+                    mtime_ns = excluded.mtime_ns,
+                    sha256 = excluded.sha256,
+                    updated_at = excluded.updated_at
+                """,
+                changed,
+            )
+            connection.executemany(
+                "DELETE FROM workflow_trigger_readiness_path_manifest WHERE watch_root = ? AND relative_path = ?",
+                [(watch_root, relative) for relative in known],
+            )
+            connection.commit()
+    if listing["kind"] == "directory":
+        checksum = digest.hexdigest()
+    return {
+        "kind": listing["kind"],
+        "sizeBytes": total_size,
+        "fileCount": len(listing["files"]),
+        "checksum": checksum,
+        "scan": scan,
+    }
+
+
+def prune_path_manifests(cfg: RemoteRunnerConfig, watch_roots: set[str]) -> int:
+    """Drop manifests for roots no enabled trigger watches any more."""
+    with get_connection(cfg) as connection:
+        stale = [
+            str(row["watch_root"])
+            for row in connection.execute("SELECT DISTINCT watch_root FROM workflow_trigger_readiness_path_manifest")
+            if str(row["watch_root"]) not in watch_roots
+        ]
+        connection.executemany(
+            "DELETE FROM workflow_trigger_readiness_path_manifest WHERE watch_root = ?",
+            [(root,) for root in stale],
+        )
+        connection.commit()
+    return len(stale)
+
+
+def _hash_file(path: Path) -> tuple[int, str]:
+    digest = hashlib.sha256()
+    size_bytes = 0
+    with Path(path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_BYTES), b""):
+            size_bytes += len(chunk)
+            digest.update(chunk)
+    return size_bytes, digest.hexdigest()
@@ -15,6 +15,8 @@ from .api_models import WorkflowTriggerReadinessEventRequest
 from .config import RemoteRunnerConfig, load_remote_runner_config
 from .databases import fetch_reference_database
 from .storage_core import now_iso
+from .trigger_readiness_inotify import InotifyWakeup, inotify_available
+from .trigger_readiness_path_manifest import list_watch_path, manifest_path_stats, prune_path_manifests
 from .trigger_readiness_watcher_storage import fetch_readiness_observation, upsert_readiness_observation
 from .trigger_service import READINESS_RESOURCE_TYPES_BY_SOURCE, READINESS_TRIGGER_SOURCES
 from .trigger_service import submit_workflow_trigger_readiness_event_from_request
@@ -25,6 +27,14 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_READINESS_WATCHER_POLL_INTERVAL_SECONDS = 60.0
 DEFAULT_READINESS_WATCHER_LIMIT = 100
 READINESS_WATCHER_ACTOR = "workflow-trigger-readiness-watcher"
+READINESS_WATCHER_WAKEUP_POLL = "poll"
+READINESS_WATCHER_WAKEUP_INOTIFY = "inotify"
+READINESS_WATCHER_WAKEUP_AUTO = "auto"
+READINESS_WATCHER_WAKEUP_MODES = {
+    READINESS_WATCHER_WAKEUP_POLL,
+    READINESS_WATCHER_WAKEUP_INOTIFY,
+    READINESS_WATCHER_WAKEUP_AUTO,
+}
 
 
 class WorkflowTriggerReadinessWatcherSupervisor:
@@ -34,14 +44,18 @@ class WorkflowTriggerReadinessWatcherSupervisor:
         *,
         poll_interval_seconds: float = DEFAULT_READINESS_WATCHER_POLL_INTERVAL_SECONDS,
         limit: int = DEFAULT_READINESS_WATCHER_LIMIT,
+        wakeup: str = READINESS_WATCHER_WAKEUP_POLL,
     ) -> None:
         if poll_interval_seconds <= 0:
             raise ValueError("WORKFLOW_TRIGGER_READINESS_WATCHER_POLL_INTERVAL_INVALID")
         if limit <= 0:
             raise ValueError("WORKFLOW_TRIGGER_READINESS_WATCHER_LIMIT_INVALID")
+        if wakeup not in READINESS_WATCHER_WAKEUP_MODES:
+            raise ValueError("WORKFLOW_TRIGGER_READINESS_WATCHER_WAKEUP_INVALID")
         self._cfg = cfg
         self._poll_interval_seconds = poll_interval_seconds
         self._limit = limit
+        self._inotify = _open_inotify_wakeup(wakeup)
         self._stop_event = threading.Event()
         self._thread = threading.Thread(
             target=self._run_loop,
@@ -52,19 +66,42 @@ class WorkflowTriggerReadinessWatcherSupervisor:
     def start(self) -> None:
         self._thread.start()
 
+    @property
+    def wakeup(self) -> str:
+        return READINESS_WATCHER_WAKEUP_POLL if self._inotify is None else READINESS_WATCHER_WAKEUP_INOTIFY
+
     def stop(self, *, timeout_seconds: float = 5.0) -> None:
         self._stop_event.set()
         self._thread.join(timeout=timeout_seconds)
 
     def _run_loop(self) -> None:
-        while not self._stop_event.is_set():
-            try:
-                result = run_workflow_trigger_readiness_watcher_once(self._cfg, limit=self._limit)
-                if result["errors"]:
-                    LOGGER.warning("Workflow trigger readiness watcher completed with errors: %s", result["errors"])
-            except Exception:  # noqa: BLE001 - watcher must keep polling after transient storage/runtime errors.
-                LOGGER.exception("Workflow trigger readiness watcher loop failed.")
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    result = run_workflow_trigger_readiness_watcher_once(self._cfg, limit=self._limit)
+                    if result["errors"]:
+                        LOGGER.warning("Workflow trigger readiness watcher completed with errors: %s", result["errors"])
+                except Exception:  # noqa: BLE001 - watcher must keep polling after transient storage/runtime errors.
+                    LOGGER.exception("Workflow trigger readiness watcher loop failed.")
+                self._wait_for_next_tick()
+        finally:
+            if self._inotify is not None:
+                self._inotify.close()
+
+    def _wait_for_next_tick(self) -> None:
+        if self._inotify is None:
             self._stop_event.wait(self._poll_interval_seconds)
+            return
+        try:
+            self._inotify.watch_paths(watched_local_paths(self._cfg))
+        except Exception:  # noqa: BLE001 - fall back to the poll interval until watches can be refreshed.
+            LOGGER.exception("Workflow trigger readiness watcher could not refresh inotify watches.")
+        # The poll interval still bounds the wait so stability windows elapse without events.
+        deadline = time.monotonic() + self._poll_interval_seconds
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._inotify.wait(min(remaining, 1.0)):
+                return
 
 
 def run_workflow_trigger_readiness_watcher_once(
@@ -81,11 +118,15 @@ def run_workflow_trigger_readiness_watcher_once(
     submitted = 0
     unchanged = 0
     observations: list[dict[str, Any]] = []
+    scans: list[dict[str, Any]] = []
     errors: list[dict[str, str]] = []
+    watch_roots: set[str] = set()
+    limited = False
 
     for trigger in _enabled_readiness_triggers(cfg):
         if checked >= limit:
             skipped += 1
+            limited = True
             continue
         checked += 1
         try:
@@ -93,7 +134,11 @@ def run_workflow_trigger_readiness_watcher_once(
             if plan is None:
                 skipped += 1
                 continue
+            if plan["adapter"] == "local_path":
+                watch_roots.add(str(Path(plan["path"]).expanduser().resolve()))
             observation = _observe_watch_plan(cfg, plan)
+            if "scan" in observation:
+                scans.append({"triggerId": str(trigger["triggerId"]), **observation["scan"]})
             if observation["state"] == "missing":
                 missing += 1
                 observations.append(_record_observation(cfg, trigger=trigger, plan=plan, observation=observation))
@@ -126,6 +171,8 @@ def run_workflow_trigger_readiness_watcher_once(
             except Exception:  # noqa: BLE001 - error persistence is best effort for malformed legacy rows.
                 LOGGER.exception("Failed to record workflow trigger readiness watcher error.")
 
+    if not limited and not errors:
+        prune_path_manifests(cfg, watch_roots)
     return {
         "schemaVersion": "workflow-trigger-readiness-watcher-tick.v1",
         "checked": checked,
@@ -135,21 +182,36 @@ def run_workflow_trigger_readiness_watcher_once(
         "submitted": submitted,
         "unchanged": unchanged,
         "observations": observations,
+        "scans": scans,
         "errors": errors,
         "evaluatedAt": now_iso(),
     }
 
 
+def watched_local_paths(cfg: RemoteRunnerConfig) -> list[Path]:
+    paths: list[Path] = []
+    for trigger in _enabled_readiness_triggers(cfg):
+        try:
+            plan = _watch_plan(trigger)
+        except ValueError:
+            continue
+        if plan is not None and plan["adapter"] == "local_path":
+            paths.append(Path(plan["path"]).expanduser())
+    return paths
+
+
 def start_workflow_trigger_readiness_watcher_supervisor(
     cfg: RemoteRunnerConfig,
     *,
     poll_interval_seconds: float = DEFAULT_READINESS_WATCHER_POLL_INTERVAL_SECONDS,
     limit: int = DEFAULT_READINESS_WATCHER_LIMIT,
+    wakeup: str = READINESS_WATCHER_WAKEUP_POLL,
 ) -> WorkflowTriggerReadinessWatcherSupervisor:
     supervisor = WorkflowTriggerReadinessWatcherSupervisor(
         cfg,
         poll_interval_seconds=poll_interval_seconds,
         limit=limit,
+        wakeup=wakeup,
     )
     supervisor.start()
     return supervisor
@@ -165,6 +227,7 @@ def start_configured_workflow_trigger_readiness_watcher_supervisor() -> (
         cfg,
         poll_interval_seconds=_configured_poll_interval_seconds(),
         limit=_configured_limit(),
+        wakeup=_configured_wakeup(),
     )
 
 
@@ -233,9 +296,11 @@ def _observe_watch_plan(cfg: RemoteRunnerConfig, plan: dict[str, Any]) -> dict[s
             "observedAt": observed_at,
             "safeDetails": {"pathHash": _stable_hash(str(path)), "exists": False},
         }
+    started = time.perf_counter()
+    listing = list_watch_path(path)
     stability_seconds = int(plan.get("stabilitySeconds") or 0)
     if stability_seconds > 0:
-        age_seconds = max(0, int(time.time() - _path_latest_mtime(path)))
+        age_seconds = max(0, int(time.time() - listing["latestMtimeNs"] / 1_000_000_000))
         if age_seconds < stability_seconds:
             path_hash = _stable_hash(str(path))
             return {
@@ -257,8 +322,9 @@ def _observe_watch_plan(cfg: RemoteRunnerConfig, plan: dict[str, Any]) -> dict[s
                     "ageSeconds": age_seconds,
                     "stabilitySeconds": stability_seconds,
                 },
+                "scan": _scan_cost(listing, started=started),
             }
-    stats = _path_stats(path)
+    stats = manifest_path_stats(cfg, path, listing)
     observation_hash = _stable_hash(
         {
             "state": "ready",
@@ -284,6 +350,7 @@ def _observe_watch_plan(cfg: RemoteRunnerConfig, plan: dict[str, Any]) -> dict[s
         "hash": observation_hash,
         "observedAt": observed_at,
         "safeDetails": safe_details,
+        "scan": _scan_cost(listing, started=started, hashed=stats["scan"]),
     }
 
 
@@ -434,45 +501,15 @@ def _already_dispatched(previous: dict[str, Any] | None, observation: dict[str,
     )
 
 
-def _path_stats(path: Path) -> dict[str, Any]:
-    if path.is_file():
-        size, checksum = _file_stats(path)
-        return {"kind": "file", "sizeBytes": size, "fileCount": 1, "checksum": checksum}
-    if path.is_dir():
-        digest = hashlib.sha256()
-        total_size = 0
-        file_count = 0
-        for child in sorted(item for item in path.rglob("*") if item.is_file()):
-            relative = child.relative_to(path).as_posix()
-            size, checksum = _file_stats(child)
-            digest.update(relative.encode("utf-8"))
-            digest.update(str(size).encode("utf-8"))
-            digest.update(checksum.encode("utf-8"))
-            total_size += size
-            file_count += 1
-        return {"kind": "directory", "sizeBytes": total_size, "fileCount": file_count, "checksum": digest.hexdigest()}
-    raise ValueError("WORKFLOW_TRIGGER_READINESS_WATCHER_PATH_UNSUPPORTED")
-
-
-def _path_latest_mtime(path: Path) -> float:
-    latest = path.stat().st_mtime
-    if path.is_dir():
-        for child in path.rglob("*"):
-            try:
-                latest = max(latest, child.stat().st_mtime)
-            except OSError:
-                continue
-    return latest
-
-
-def _file_stats(path: Path) -> tuple[int, str]:
-    digest = hashlib.sha256()
-    size = 0
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            size += len(chunk)
-            digest.update(chunk)
-    return size, digest.hexdigest()
+def _scan_cost(listing: dict[str, Any], *, started: float, hashed: dict[str, int] | None = None) -> dict[str, Any]:
+    return {
+        "filesStatted": len(listing["files"]),
+        "filesHashed": 0,
+        "filesReused": 0,
+        "bytesHashed": 0,
+        **(hashed or {}),
+        "durationMs": round((time.perf_counter() - started) * 1000, 3),
+    }
 
 
 def _watch_path(watch: dict[str, Any], resource_uri: str) -> str:
@@ -569,3 +606,25 @@ def _configured_limit() -> int:
     if value <= 0:
         raise ValueError("WORKFLOW_TRIGGER_READINESS_WATCHER_LIMIT_INVALID")
     return value
+
+
+def _configured_wakeup() -> str:
+    value = str(os.environ.get("H2OMETA_TRIGGER_READINESS_WATCHER_WAKEUP", "") or "").strip().lower()
+    if not value:
+        return READINESS_WATCHER_WAKEUP_POLL
+    if value not in READINESS_WATCHER_WAKEUP_MODES:
+        raise ValueError("WORKFLOW_TRIGGER_READINESS_WATCHER_WAKEUP_INVALID")
+    return value
+
+
+def _open_inotify_wakeup(wakeup: str) -> InotifyWakeup | None:
+    if wakeup == READINESS_WATCHER_WAKEUP_POLL:
+        return None
+    if inotify_available():
+        try:
+            return InotifyWakeup()
+        except OSError:
+            LOGGER.exception("Workflow trigger readiness watcher could not initialize inotify.")
+    if wakeup == READINESS_WATCHER_WAKEUP_INOTIFY:
+        LOGGER.warning("Workflow trigger readiness watcher inotify wakeup unavailable; polling instead.")
+    return None
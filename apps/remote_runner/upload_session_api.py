@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+from .api_models import UploadSessionCreateRequest
+from .errors import UploadTooLargeError
+from .route_utils import authorized_config, data_response, run_sync
+from .upload_session_storage import (
+    MAX_UPLOAD_CHUNK_BYTES,
+    append_upload_chunk,
+    complete_upload_session,
+    create_upload_session,
+    require_upload_session,
+)
+
+
+async def create_upload_session_from_request(
+    payload: UploadSessionCreateRequest,
+    authorization: str | None,
+) -> dict[str, Any]:
+    cfg = await run_sync(authorized_config, authorization)
+    session = await run_sync(
+        create_upload_session,
+        cfg,
+        filename=payload.filename,
+        size_bytes=payload.sizeBytes,
+        mime_type=payload.mimeType,
+        sha256=payload.sha256,
+    )
+    return data_response(session)
+
+
+async def get_upload_session_from_request(upload_session_id: str, authorization: str | None) -> dict[str, Any]:
+    cfg = await run_sync(authorized_config, authorization)
+    return data_response(await run_sync(require_upload_session, cfg, upload_session_id))
+
+
+async def append_upload_chunk_from_request(
+    upload_session_id: str,
+    body: AsyncIterator[bytes],
+    authorization: str | None,
+    *,
+    offset: int,
+    sha256: str,
+) -> dict[str, Any]:
+    cfg = await run_sync(authorized_config, authorization)
+    content = await _read_bounded_body(body, MAX_UPLOAD_CHUNK_BYTES)
+    session = await run_sync(
+        append_upload_chunk,
+        cfg,
+        upload_session_id,
+        offset=offset,
+        content=content,
+        sha256=sha256,
+    )
+    return data_response(session)
+
+
+async def complete_upload_session_from_request(upload_session_id: str, authorization: str | None) -> dict[str, Any]:
+    cfg = await run_sync(authorized_config, authorization)
+    return data_response(await run_sync(complete_upload_session, cfg, upload_session_id))
+
+
+async def _read_bounded_body(body: AsyncIterator[bytes], limit: int) -> bytes:
+    # Stop reading as soon as the chunk is over the limit instead of buffering it.
+    buffer = bytearray()
+    async for block in body:
+        buffer.extend(block)
+        if len(buffer) > limit:
+            raise UploadTooLargeError("UPLOAD_CHUNK_TOO_LARGE")
+    return bytes(buffer)
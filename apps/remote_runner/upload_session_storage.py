@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import re
+import shutil
+import sqlite3
+import threading
+import uuid
+from typing import Any
+
+from .config import RemoteRunnerConfig
+from .errors import RemoteRunnerNotFoundError, RemoteRunnerOperationBlockedError, UploadTooLargeError
+from .execution_storage_primitives import add_seconds
+from .storage_core import get_connection, now_iso
+from .upload_storage import fetch_upload, insert_upload_record, new_upload_id
+
+
+UPLOAD_SESSION_SCHEMA_VERSION = "upload-session.v1"
+UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+MAX_UPLOAD_CHUNK_BYTES = 64 * 1024 * 1024
+DEFAULT_UPLOAD_SESSION_TTL_SECONDS = 24 * 3600
+PARTIAL_UPLOADS_DIR_NAME = ".partial"
+_SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+_LOCKS_GUARD = threading.Lock()
+_SESSION_LOCKS: dict[str, threading.Lock] = {}
+# Running whole-file digests keyed by session, valid while chunks arrive in
+# order in this process; anything else falls back to re-reading the file.
+_SESSION_DIGESTS: dict[str, tuple[int, Any]] = {}
+
+
+def create_upload_session(
+    cfg: RemoteRunnerConfig,
+    *,
+    filename: str,
+    size_bytes: int,
+    mime_type: str = "",
+    sha256: str = "",
+) -> dict[str, Any]:
+    name = Path(str(filename or "")).name
+    if not name or name in {".", ".."}:
+        raise ValueError("UPLOAD_FILENAME_INVALID")
+    if int(size_bytes) < 0:
+        raise ValueError("UPLOAD_SESSION_SIZE_INVALID")
+    expected_sha256 = _normalized_sha256(sha256, required=False)
+    partial_dir = Path(cfg.uploads_dir) / PARTIAL_UPLOADS_DIR_NAME
+    partial_dir.mkdir(parents=True, exist_ok=True)
+    if shutil.disk_usage(partial_dir).free < int(size_bytes):
+        raise UploadTooLargeError("UPLOAD_SESSION_STORAGE_INSUFFICIENT")
+    expire_upload_sessions(cfg)
+    upload_session_id = f"ups_{uuid.uuid4().hex[:16]}"
+    partial_path = partial_dir / upload_session_id
+    partial_path.touch(exist_ok=False)
+    now = now_iso()
+    with get_connection(cfg) as connection:
+        connection.execute(
+            """
+            INSERT INTO upload_sessions (
+                upload_session_id, filename, mime_type, size_bytes, expected_sha256,
+                received_bytes, partial_path, state, created_at, updated_at, expires_at
+            ) VALUES (?, ?, ?, ?, ?, 0, ?, 'open', ?, ?, ?)
+            """,
+            (
+                upload_session_id,
+                name,
+                mime_type or "application/octet-stream",
+                int(size_bytes),
+                expected_sha256,
+                str(partial_path),
+                now,
+                now,
+                add_seconds(now, _session_ttl_seconds(cfg)),
+            ),
+        )
+        connection.commit()
+    return require_upload_session(cfg, upload_session_id)
+
+
+def fetch_upload_session(cfg: RemoteRunnerConfig, upload_session_id: str) -> dict[str, Any] | None:
+    with get_connection(cfg) as connection:
+        row = _fetch_session_row(connection, upload_session_id)
+    return _session_payload(row) if row is not None else None
+
+
+def require_upload_session(cfg: RemoteRunnerConfig, upload_session_id: str) -> dict[str, Any]:
+    session = fetch_upload_session(cfg, upload_session_id)
+    if session is None:
+        raise RemoteRunnerNotFoundError("UPLOAD_SESSION_NOT_FOUND")
+    return session
+
+
+def append_upload_chunk(
+    cfg: RemoteRunnerConfig,
+    upload_session_id: str,
+    *,
+    offset: int,
+    content: bytes,
+    sha256: str,
+) -> dict[str, Any]:
+    """Write one raw chunk at ``offset``; the offset must equal the bytes already received."""
+    if len(content) > MAX_UPLOAD_CHUNK_BYTES:
+        raise UploadTooLargeError("UPLOAD_CHUNK_TOO_LARGE")
+    if not content:
+        raise ValueError("UPLOAD_CHUNK_EMPTY")
+    if hashlib.sha256(content).hexdigest() != _normalized_sha256(sha256, required=True):
+        raise ValueError("UPLOAD_CHUNK_CHECKSUM_MISMATCH")
+    with _session_lock(cfg, upload_session_id):
+        session = _require_session_row(cfg, upload_session_id)
+        _require_open(session)
+        received = int(session["received_bytes"])
+        if int(offset) != received:
+            raise _offset_mismatch(received)
+        if received + len(content) > int(session["size_bytes"]):
+            raise UploadTooLargeError("UPLOAD_SESSION_SIZE_EXCEEDED")
+        _write_partial(Path(session["partial_path"]), offset=received, content=content)
+        _advance_digest(upload_session_id, offset=received, content=content)
+        now = now_iso()
+        with get_connection(cfg) as connection:
+            cursor = connection.execute(
+                """
+                UPDATE upload_sessions
+                SET received_bytes = ?, updated_at = ?, expires_at = ?
+                WHERE upload_session_id = ? AND state = 'open' AND received_bytes = ?
+                """,
+                (
+                    received + len(content),
+                    now,
+                    add_seconds(now, _session_ttl_seconds(cfg)),
+                    upload_session_id,
+                    received,
+                ),
+            )
+            connection.commit()
+        if cursor.rowcount != 1:
+            raise _offset_mismatch(int(_require_session_row(cfg, upload_session_id)["received_bytes"]))
+    return require_upload_session(cfg, upload_session_id)
+
+
+def complete_upload_session(cfg: RemoteRunnerConfig, upload_session_id: str) -> dict[str, Any]:
+    """Verify the assembled file and register it as a regular upload.
+
+    Completing an already completed session returns the same upload, so a
+    client that lost the response can simply retry.
+    """
+    with _session_lock(cfg, upload_session_id):
+        session = _require_session_row(cfg, upload_session_id)
+        if session["state"] == "completed":
+            upload = fetch_upload(cfg, str(session["upload_id"] or ""))
+            if upload is None:
+                raise RemoteRunnerNotFoundError("UPLOAD_NOT_FOUND")
+            return upload
+        _require_open(session)
+        size_bytes = int(session["size_bytes"])
+        if int(session["received_bytes"]) != size_bytes:
+            raise RemoteRunnerOperationBlockedError(
+                "UPLOAD_SESSION_INCOMPLETE",
+                {
+                    "code": "UPLOAD_SESSION_INCOMPLETE",
+                    "receivedBytes": int(session["received_bytes"]),
+                    "sizeBytes": size_bytes,
+                },
+            )
+        partial_path = Path(session["partial_path"])
+        sha256 = _session_sha256(upload_session_id, partial_path, size_bytes=size_bytes)
+        if session["expected_sha256"] and sha256 != session["expected_sha256"]:
+            _close_session(cfg, upload_session_id, state="failed")
+            _forget_session_lock(upload_session_id)
+            partial_path.unlink(missing_ok=True)
+            raise ValueError("UPLOAD_CHECKSUM_MISMATCH")
+        upload_id = new_upload_id()
+        target = Path(cfg.uploads_dir) / f"{upload_id}_{session['filename']}"
+        os.replace(partial_path, target)
+        row = {
+            "uploadId": upload_id,
+            "filename": session["filename"],
+            "path": str(target),
+            "sizeBytes": size_bytes,
+            "sha256": sha256,
+            "mimeType": session["mime_type"],
+            "uploadedAt": now_iso(),
+        }
+        with get_connection(cfg) as connection:
+            insert_upload_record(connection, row)
+            connection.execute(
+                """
+                UPDATE upload_sessions
+                SET state = 'completed', upload_id = ?, updated_at = ?
+                WHERE upload_session_id = ?
+                """,
+                (upload_id, row["uploadedAt"], upload_session_id),
+            )
+            connection.commit()
+    _forget_session_lock(upload_session_id)
+    return row
+
+
+def expire_upload_sessions(cfg: RemoteRunnerConfig, *, now: str | None = None) -> int:
+    """Drop partial files of open sessions that stopped receiving chunks."""
+    current = now or now_iso()
+    with get_connection(cfg) as connection:
+        rows = connection.execute(
+            """
+            SELECT upload_session_id, partial_path
+            FROM upload_sessions
+            WHERE state = 'open' AND expires_at <= ?
+            """,
+            (current,),
+        ).fetchall()
+    for row in rows:
+        with _session_lock(cfg, str(row["upload_session_id"])):
+            Path(str(row["partial_path"])).unlink(missing_ok=True)
+            _close_session(cfg, str(row["upload_session_id"]), state="expired")
+        _forget_session_lock(str(row["upload_session_id"]))
+    return len(rows)
+
+
+def _require_session_row(cfg: RemoteRunnerConfig, upload_session_id: str) -> sqlite3.Row:
+    with get_connection(cfg) as connection:
+        row = _fetch_session_row(connection, upload_session_id)
+    if row is None:
+        raise RemoteRunnerNotFoundError("UPLOAD_SESSION_NOT_FOUND")
+    return row
+
+
+def _fetch_session_row(connection: sqlite3.Connection, upload_session_id: str) -> sqlite3.Row | None:
+    return connection.execute(
+        "SELECT * FROM upload_sessions WHERE upload_session_id = ?",
+        (str(upload_session_id or "").strip(),),
+    ).fetchone()
+
+
+def _session_payload(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "schemaVersion": UPLOAD_SESSION_SCHEMA_VERSION,
+        "uploadSessionId": row["upload_session_id"],
+        "filename": row["filename"],
+        "mimeType": row["mime_type"],
+        "sizeBytes": int(row["size_bytes"]),
+        "sha256": row["expected_sha256"],
+        "receivedBytes": int(row["received_bytes"]),
+        "chunkSizeBytes": UPLOAD_CHUNK_BYTES,
+        "maxChunkBytes": MAX_UPLOAD_CHUNK_BYTES,
+        "state": row["state"],
+        "uploadId": row["upload_id"],
+        "createdAt": row["created_at"],
+        "updatedAt": row["updated_at"],
+        "expiresAt": row["expires_at"],
+    }
+
+
+def _require_open(session: sqlite3.Row) -> None:
+    if session["state"] != "open":
+        raise RemoteRunnerOperationBlockedError(
+            "UPLOAD_SESSION_NOT_OPEN",
+            {"code": "UPLOAD_SESSION_NOT_OPEN", "state": session["state"]},
+        )
+
+
+def _offset_mismatch(received_bytes: int) -> RemoteRunnerOperationBlockedError:
+    return RemoteRunnerOperationBlockedError(
+        "UPLOAD_SESSION_OFFSET_MISMATCH",
+        {"code": "UPLOAD_SESSION_OFFSET_MISMATCH", "receivedBytes": received_bytes},
+    )
+
+
+def _close_session(cfg: RemoteRunnerConfig, upload_session_id: str, *, state: str) -> None:
+    _SESSION_DIGESTS.pop(upload_session_id, None)
+    with get_connection(cfg) as connection:
+        connection.execute(
+            "UPDATE upload_sessions SET state = ?, updated_at = ? WHERE upload_session_id = ? AND state = 'open'",
+            (state, now_iso(), upload_session_id),
+        )
+        connection.commit()
+
+
+def _write_partial(path: Path, *, offset: int, content: bytes) -> None:
+    try:
+        with path.open("r+b") as handle:
+            handle.seek(offset)
+            handle.write(content)
+            # Bytes past the acknowledged offset belong to a chunk whose
+            # response never made it back; the resent chunk replaces them.
+            handle.truncate()
+            handle.flush()
+            os.fsync(handle.fileno())
+    except FileNotFoundError as exc:
+        raise ValueError("UPLOAD_SESSION_PARTIAL_MISSING") from exc
+
+
+def _advance_digest(upload_session_id: str, *, offset: int, content: bytes) -> None:
+    current = _SESSION_DIGESTS.get(upload_session_id)
+    if current is not None and current[0] == offset:
+        digest = current[1]
+    elif offset == 0:
+        digest = hashlib.sha256()
+    else:
+        _SESSION_DIGESTS.pop(upload_session_id, None)
+        return
+    digest.update(content)
+    _SESSION_DIGESTS[upload_session_id] = (offset + len(content), digest)
+
+
+def _session_sha256(upload_session_id: str, path: Path, *, size_bytes: int) -> str:
+    current = _SESSION_DIGESTS.pop(upload_session_id, None)
+    if current is not None and current[0] == size_bytes:
+        return current[1].hexdigest()
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _session_lock(cfg: RemoteRunnerConfig, upload_session_id: str) -> threading.Lock:
+    """Only open sessions get a shared lock; unknown or closed ids get a throwaway one."""
+    with get_connection(cfg) as connection:
+        session = _fetch_session_row(connection, upload_session_id)
+    with _LOCKS_GUARD:
+        if session is not None and session["state"] == "open":
+            return _SESSION_LOCKS.setdefault(upload_session_id, threading.Lock())
+        return _SESSION_LOCKS.get(upload_session_id) or threading.Lock()
+
+
+def _forget_session_lock(upload_session_id: str) -> None:
+    with _LOCKS_GUARD:
+        _SESSION_LOCKS.pop(upload_session_id, None)
+
+
+def _session_ttl_seconds(cfg: RemoteRunnerConfig) -> int:
+    return max(60, int(getattr(cfg, "upload_session_ttl_seconds", DEFAULT_UPLOAD_SESSION_TTL_SECONDS)))
+
+
+def _normalized_sha256(value: str, *, required: bool) -> str:
+    normalized = str(value or "").strip().lower()
+    if not normalized and not required:
+        return ""
+    if not _SHA256_PATTERN.match(normalized):
+        raise ValueError("UPLOAD_SHA256_INVALID")
+    return normalized
@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import binascii
 import hashlib
+import sqlite3
 import uuid
 from pathlib import Path
 from typing import Any
@@ -33,7 +34,7 @@ def persist_upload(
         raise ValueError("INVALID_UPLOAD_BASE64") from exc
     if len(content) > MAX_UPLOAD_BYTES:
         raise UploadTooLargeError("UPLOAD_TOO_LARGE")
-    upload_id = f"upl_{uuid.uuid4().hex[:12]}"
+    upload_id = new_upload_id()
     target = uploads_dir / f"{upload_id}_{Path(filename).name}"
     temp = target.with_suffix(target.suffix + ".tmp")
     temp.write_bytes(content)
@@ -50,25 +51,33 @@ def persist_upload(
         "uploadedAt": uploaded_at,
     }
     with get_connection(cfg) as connection:
-        connection.execute(
-            """
-            INSERT INTO uploads (upload_id, filename, path, size_bytes, sha256, mime_type, uploaded_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                row["uploadId"],
-                row["filename"],
-                row["path"],
-                row["sizeBytes"],
-                row["sha256"],
-                row["mimeType"],
-                row["uploadedAt"],
-            ),
-        )
+        insert_upload_record(connection, row)
         connection.commit()
     return row
 
 
+def new_upload_id() -> str:
+    return f"upl_{uuid.uuid4().hex[:12]}"
+
+
+def insert_upload_record(connection: sqlite3.Connection, row: dict[str, Any]) -> None:
+    connection.execute(
+        """
+        INSERT INTO uploads (upload_id, filename, path, size_bytes, sha256, mime_type, uploaded_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            row["uploadId"],
+            row["filename"],
+            row["path"],
+            row["sizeBytes"],
+            row["sha256"],
+            row["mimeType"],
+            row["uploadedAt"],
+        ),
+    )
+
+
 def fetch_upload(cfg: RemoteRunnerConfig, upload_id: str) -> dict[str, Any] | None:
     with get_connection(cfg) as connection:
         row = connection.execute("SELECT * FROM uploads WHERE upload_id = ?", (upload_id,)).fetchone()
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import stat
+import threading
+import time
+from typing import Any
+
+from .config import RemoteRunnerConfig, load_remote_runner_config
+from .storage_core import get_connection, now_iso
+
+
+LOGGER = logging.getLogger(__name__)
+HASH_CHUNK_BYTES = 1024 * 1024
+# Files modified this close to hashing may change again within the same mtime
+# tick, so their digest is not remembered (same rule as git's racy-clean check).
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+DEFAULT_SCRUBBER_POLL_INTERVAL_SECONDS = 3600.0
+DEFAULT_SCRUB_LIMIT = 64
+DEFAULT_REVERIFY_AFTER_SECONDS = 7 * 24 * 3600
+
+_COUNTERS_LOCK = threading.Lock()
+_COUNTERS = {"hits": 0, "misses": 0}
+
+
+def verified_file_stats(cfg: RemoteRunnerConfig, path: Path) -> tuple[int, str]:
+    """Return ``(size, sha256)`` of a regular file, reusing a digest verified for the same inode state."""
+    file_stat = os.stat(path, follow_symlinks=False)
+    if not stat.S_ISREG(file_stat.st_mode) or not getattr(cfg, "verified_digest_cache_enabled", True):
+        return _hash_file(path)
+    key = _stat_key(file_stat)
+    cached = _lookup(cfg, key)
+    if cached is not None:
+        _count("hits")
+        return file_stat.st_size, cached
+    _count("misses")
+    started_ns = time.time_ns()
+    size_bytes, sha256 = _hash_file(path)
+    settled = file_stat.st_mtime_ns < started_ns - RACY_MTIME_WINDOW_NS
+    if settled and _stat_key(os.stat(path, follow_symlinks=False)) == key:
+        _store(cfg, key, path=path, sha256=sha256)
+    return size_bytes, sha256
+
+
+def verified_digest_cache_metrics(cfg: RemoteRunnerConfig) -> dict[str, Any]:
+    with get_connection(cfg) as connection:
+        entries = connection.execute("SELECT COUNT(*) AS count FROM verified_file_digests").fetchone()["count"]
+    with _COUNTERS_LOCK:
+        hits, misses = _COUNTERS["hits"], _COUNTERS["misses"]
+    lookups = hits + misses
+    return {
+        "entries": int(entries),
+        "hits": hits,
+        "misses": misses,
+        "hitRatio": round(hits / lookups, 4) if lookups else 0.0,
+    }
+
+
+def scrub_verified_digests_once(
+    cfg: RemoteRunnerConfig,
+    *,
+    limit: int = DEFAULT_SCRUB_LIMIT,
+    reverify_after_seconds: int = DEFAULT_REVERIFY_AFTER_SECONDS,
+    now: float | None = None,
+) -> dict[str, int]:
+    """Re-hash the oldest verified digests and drop entries that no longer hold."""
+    if limit <= 0:
+        raise ValueError("VERIFIED_DIGEST_SCRUB_LIMIT_INVALID")
+    current = time.time() if now is None else float(now)
+    cutoff = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(current - max(0, int(reverify_after_seconds))))
+    with get_connection(cfg) as connection:
+        rows = connection.execute(
+            """
+            SELECT device, inode, size_bytes, mtime_ns, path, sha256
+            FROM verified_file_digests
+            WHERE verified_at <= ?
+            ORDER BY verified_at, device, inode
+            LIMIT ?
+            """,
+            (cutoff, int(limit)),
+        ).fetchall()
+    result = {"checked": len(rows), "reverified": 0, "evicted": 0, "mismatched": 0}
+    for row in rows:
+        key = (int(row["device"]), int(row["inode"]), int(row["size_bytes"]), int(row["mtime_ns"]))
+        path = Path(str(row["path"]))
+        try:
+            unchanged = _stat_key(os.stat(path, follow_symlinks=False)) == key
+            sha256 = _hash_file(path)[1] if unchanged else ""
+        except OSError:
+            unchanged, sha256 = False, ""
+        if unchanged and sha256 == row["sha256"]:
+            _execute(
+                cfg,
+                "UPDATE verified_file_digests SET verified_at = ? WHERE device = ? AND inode = ?",
+                now_iso(),
+                *key[:2],
+            )
+            result["reverified"] += 1
+            continue
+        _execute(cfg, "DELETE FROM verified_file_digests WHERE device = ? AND inode = ?", *key[:2])
+        if unchanged:
+            result["mismatched"] += 1
+            LOGGER.error(
+                "Verified digest no longer matches unchanged file metadata.",
+                extra={"event": "verified_digest.scrub.mismatch", "path": str(path)},
+            )
+        else:
+            result["evicted"] += 1
+    return result
+
+
+class VerifiedDigestScrubberSupervisor:
+    def __init__(
+        self,
+        cfg: RemoteRunnerConfig,
+        *,
+        poll_interval_seconds: float = DEFAULT_SCRUBBER_POLL_INTERVAL_SECONDS,
+        limit: int = DEFAULT_SCRUB_LIMIT,
+    ) -> None:
+        if poll_interval_seconds <= 0:
+            raise ValueError("VERIFIED_DIGEST_SCRUBBER_POLL_INTERVAL_INVALID")
+        if limit <= 0:
+            raise ValueError("VERIFIED_DIGEST_SCRUB_LIMIT_INVALID")
+        self._cfg = cfg
+        self._poll_interval_seconds = poll_interval_seconds
+        self._limit = limit
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name="h2ometa-verified-digest-scrubber",
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, *, timeout_seconds: float = 5.0) -> None:
+        self._stop_event.set()
+        self._thread.join(timeout=timeout_seconds)
+
+    def _run_loop(self) -> None:
+        # Scrubbing is never urgent; let startup traffic settle before the first pass.
+        while not self._stop_event.wait(self._poll_interval_seconds):
+            try:
+                result = scrub_verified_digests_once(self._cfg, limit=self._limit)
+                if result["mismatched"]:
+                    LOGGER.warning("Verified digest scrub found mismatches: %s", result)
+            except Exception:  # noqa: BLE001 - scrubber must keep polling after transient storage errors.
+                LOGGER.exception("Verified digest scrubber tick failed.")
+
+
+def start_configured_verified_digest_scrubber_supervisor() -> VerifiedDigestScrubberSupervisor | None:
+    cfg = load_remote_runner_config()
+    if not cfg.token or not _scrubber_enabled():
+        return None
+    supervisor = VerifiedDigestScrubberSupervisor(cfg, poll_interval_seconds=_configured_poll_interval_seconds())
+    supervisor.start()
+    return supervisor
+
+
+def _lookup(cfg: RemoteRunnerConfig, key: tuple[int, int, int, int]) -> str | None:
+    try:
+        with get_connection(cfg) as connection:
+            row = connection.execute(
+                """
+                SELECT sha256 FROM verified_file_digests
+                WHERE device = ? AND inode = ? AND size_bytes = ? AND mtime_ns = ?
+                """,
+                key,
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    return str(row["sha256"]) if row is not None else None
+
+
+def _store(cfg: RemoteRunnerConfig, key: tuple[int, int, int, int], *, path: Path, sha256: str) -> None:
+    try:
+        with get_connection(cfg) as connection:
+            # Callers may hash while holding a write transaction on another
+            # connection; never wait for the lock, just skip remembering.
+            busy_timeout = connection.execute("PRAGMA busy_timeout").fetchone()[0]
+            connection.execute("PRAGMA busy_timeout = 0")
+            try:
+                connection.execute(
+                    """
+                    INSERT INTO verified_file_digests (device, inode, size_bytes, mtime_ns, path, sha256, verified_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(device, inode) DO UPDATE SET
+                        size_bytes = excluded.size_bytes,
+                        mtime_ns = excluded.mtime_ns,
+                        path = excluded.path,
+                        sha256 = excluded.sha256,
+                        verified_at = excluded.verified_at
+                    """,
+                    (*key, str(path), sha256, now_iso()),
+                )
+                connection.commit()
+            except sqlite3.OperationalError:
+                connection.rollback()
+            finally:
+                connection.execute(f"PRAGMA busy_timeout = {int(busy_timeout)}")
+    except sqlite3.Error:
+        return
+
+
+def _execute(cfg: RemoteRunnerConfig, sql: str, *params: Any) -> None:
+    with get_connection(cfg) as connection:
+        connection.execute(sql, params)
+        connection.commit()
+
+
+def _stat_key(file_stat: os.stat_result) -> tuple[int, int, int, int]:
+    return int(file_stat.st_dev), int(file_stat.st_ino), int(file_stat.st_size), int(file_stat.st_mtime_ns)
+
+
+def _hash_file(path: Path) -> tuple[int, str]:
+    digest = hashlib.sha256()
+    size_bytes = 0
+    with Path(path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_BYTES), b""):
+            size_bytes += len(chunk)
+            digest.update(chunk)
+    return size_bytes, digest.hexdigest()
+
+
+def _count(name: str) -> None:
+    with _COUNTERS_LOCK:
+        _COUNTERS[name] += 1
+
+
+def _scrubber_enabled() -> bool:
+    value = str(os.environ.get("H2OMETA_VERIFIED_DIGEST_SCRUBBER", "1") or "").strip().lower()
+    return value in {"1", "true", "yes", "on"}
+
+
+def _configured_poll_interval_seconds() -> float:
+    raw = str(os.environ.get("H2OMETA_VERIFIED_DIGEST_SCRUBBER_POLL_SECONDS", "") or "").strip()
+    if not raw:
+        return DEFAULT_SCRUBBER_POLL_INTERVAL_SECONDS
+    value = float(raw)
+    if value <= 0:
+        raise ValueError("VERIFIED_DIGEST_SCRUBBER_POLL_INTERVAL_INVALID")
+    return value
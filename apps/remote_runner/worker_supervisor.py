@@ -11,6 +11,7 @@ from .config import load_remote_runner_config
 from .reconciler import run_active_reconciler_once
 from .resource_pool import ResourcePool
 from .worker_resource_config import build_run_worker_resource_plan
+from .run_job_wakeup import RunJobWakeup, get_run_job_wakeup
 from .run_worker import process_next_run_job
 from .run_worker_storage import (
     heartbeat_run_worker,
@@ -29,6 +30,7 @@ from .tool_prepare_jobs import run_tool_prepare_job
 
 
 LOGGER = logging.getLogger(__name__)
+DEFAULT_IDLE_POLL_INTERVAL_SECONDS = 10.0
 
 
 class RunWorkerSupervisor:
@@ -42,6 +44,8 @@ class RunWorkerSupervisor:
         error_backoff_seconds: float,
         queue_name: str = "default",
         concurrency_limit: int | None = None,
+        idle_poll_interval_seconds: float | None = None,
+        wakeup: RunJobWakeup | None = None,
     ) -> None:
         self._cfg = cfg
         self._worker_id = worker_id
@@ -53,6 +57,11 @@ class RunWorkerSupervisor:
             raise ValueError("P0_3B_MULTI_SLOT_GATE_REQUIRED")
         self._resource_pool = ResourcePool(self._resource_plan.resource_pool_config)
         self._poll_interval_seconds = poll_interval_seconds
+        # Idle slots block on the wakeup channel; this timed poll is only the safety net.
+        self._idle_poll_interval_seconds = (
+            poll_interval_seconds if idle_poll_interval_seconds is None else idle_poll_interval_seconds
+        )
+        self._wakeup = wakeup or get_run_job_wakeup()
         self._heartbeat_interval_seconds = heartbeat_interval_seconds
         self._error_backoff_seconds = error_backoff_seconds
         self._stop_event = threading.Event()
@@ -95,6 +104,7 @@ class RunWorkerSupervisor:
 
     def stop(self, *, timeout_seconds: float = 5.0) -> None:
         self._stop_event.set()
+        self._wakeup.interrupt()
         self._controller_thread.join(timeout=timeout_seconds)
         for thread in self._threads:
             thread.join(timeout=timeout_seconds)
@@ -109,6 +119,7 @@ class RunWorkerSupervisor:
                     self._stop_event.wait(self._poll_interval_seconds)
                     continue
                 self._heartbeat("idle")
+                generation = self._wakeup.generation()
                 result = process_next_run_job(
                     self._cfg,
                     worker_id=self._worker_id,
@@ -135,12 +146,14 @@ class RunWorkerSupervisor:
                 self._stop_event.wait(self._error_backoff_seconds)
                 continue
             if not result.get("claimed"):
-                self._stop_event.wait(self._poll_interval_seconds)
+                self._wakeup.wait(generation, self._idle_poll_interval_seconds, interrupted=self._stop_event.is_set)
 
     def _controller_loop(self) -> None:
         while not self._stop_event.is_set():
             try:
-                run_active_reconciler_once(self._cfg)
+                actions = run_active_reconciler_once(self._cfg)
+                if actions:
+                    self._notify_reconciled(actions)
             except Exception as exc:  # noqa: BLE001 - controller should stay alive after transient storage/process errors.
                 self._heartbeat(
                     "error",
@@ -154,6 +167,12 @@ class RunWorkerSupervisor:
                 continue
             self._stop_event.wait(self._poll_interval_seconds)
 
+    def _notify_reconciled(self, actions: list[dict[str, Any]]) -> None:
+        self._wakeup.notify("reconciled")
+        # Requeued jobs carry a retry backoff; wake idle slots when it elapses, not at the next safety poll.
+        for available_at in sorted({str(action["availableAt"]) for action in actions if action.get("availableAt")}):
+            self._wakeup.notify_available("reconciled", available_at)
+
     def _mark_attempt_claimed(self, slot_id: str, claim: dict[str, Any]) -> None:
         self._heartbeat("running", current_attempt_id=str(claim.get("attemptId") or ""))
         self._slot_heartbeat(slot_id, "running", current_attempt_id=str(claim.get("attemptId") or ""))
@@ -264,6 +283,7 @@ def start_run_worker_supervisor(
     heartbeat_interval_seconds: float = 15.0,
     error_backoff_seconds: float = 5.0,
     concurrency_limit: int | None = None,
+    idle_poll_interval_seconds: float | None = None,
 ) -> RunWorkerSupervisor:
     supervisor = RunWorkerSupervisor(
         cfg,
@@ -272,6 +292,7 @@ def start_run_worker_supervisor(
         heartbeat_interval_seconds=heartbeat_interval_seconds,
         error_backoff_seconds=error_backoff_seconds,
         concurrency_limit=concurrency_limit,
+        idle_poll_interval_seconds=idle_poll_interval_seconds,
     )
     supervisor.start()
     return supervisor
@@ -397,7 +418,7 @@ def start_configured_run_worker_supervisor() -> RunWorkerSupervisor | None:
     cfg = load_remote_runner_config()
     if not cfg.token or not _run_worker_enabled():
         return None
-    return start_run_worker_supervisor(cfg)
+    return start_run_worker_supervisor(cfg, idle_poll_interval_seconds=_idle_poll_interval_seconds())
 
 
 def start_configured_tool_prepare_worker_supervisor() -> ToolPrepareWorkerSupervisor | None:
@@ -412,6 +433,15 @@ def _run_worker_enabled() -> bool:
     return value not in {"0", "false", "no", "off"}
 
 
+def _idle_poll_interval_seconds() -> float:
+    raw = str(os.environ.get("H2OMETA_REMOTE_RUN_WORKER_IDLE_POLL_SECONDS", "") or "").strip()
+    try:
+        value = float(raw) if raw else DEFAULT_IDLE_POLL_INTERVAL_SECONDS
+    except ValueError:
+        return DEFAULT_IDLE_POLL_INTERVAL_SECONDS
+    return value if value > 0 else DEFAULT_IDLE_POLL_INTERVAL_SECONDS
+
+
 def _multi_slot_enabled() -> bool:
     value = str(os.environ.get("H2OMETA_REMOTE_ENABLE_MULTI_SLOT", "0") or "").strip().lower()
     return value in {"1", "true", "yes", "on"}
@@ -5,7 +5,10 @@ from pathlib import Path
 from typing import Any, Callable, Protocol
 
 from .config import RemoteRunnerConfig, build_workflow_runtime_environment, get_workflow_profile_dir
+from .process_output_capture import ProcessOutputCapture
 from .process_runner import ProcessPoll, ProcessStarted, ShouldCancel, run_process
+from .snakemake_dry_run_cache import DryRunCacheScope, run_dry_run_with_cache
+from .snakemake_resource_plan import SnakemakeResourcePlan
 
 
 class WorkflowRuntimeCommandError(RuntimeError):
@@ -25,6 +28,7 @@ class WorkflowEngineAdapter(Protocol):
         forcerun_rules: list[str] | None = None,
         rerun_incomplete: bool = False,
         target_paths: list[str] | None = None,
+        cache_scope: DryRunCacheScope | None = None,
     ) -> Any:
         ...
 
@@ -39,6 +43,8 @@ class WorkflowEngineAdapter(Protocol):
         rerun_incomplete: bool = False,
         target_paths: list[str] | None = None,
         on_poll: ProcessPoll | None = None,
+        output_capture: ProcessOutputCapture | None = None,
+        resource_plan: SnakemakeResourcePlan | None = None,
     ) -> Any:
         ...
 
@@ -68,17 +74,34 @@ class SnakemakeEngineAdapter:
         forcerun_rules: list[str] | None = None,
         rerun_incomplete: bool = False,
         target_paths: list[str] | None = None,
+        cache_scope: DryRunCacheScope | None = None,
     ) -> Any:
-        return self._execute(
-            self._execution_args(
-                snakefile=snakefile,
-                work_dir=work_dir,
-                config_path=config_path,
-                forcerun_rules=forcerun_rules,
-                rerun_incomplete=rerun_incomplete,
-                dry_run=True,
-                target_paths=target_paths,
+        def execute() -> Any:
+            return self._execute(
+                self._execution_args(
+                    snakefile=snakefile,
+                    work_dir=work_dir,
+                    config_path=config_path,
+                    forcerun_rules=forcerun_rules,
+                    rerun_incomplete=rerun_incomplete,
+                    dry_run=True,
+                    target_paths=target_paths,
+                )
             )
+
+        if cache_scope is None:
+            return execute()
+        return run_dry_run_with_cache(
+            self._cfg,
+            execute,
+            snakefile=snakefile,
+            config_path=config_path,
+            scope=cache_scope,
+            execution_options={
+                "forcerun_rules": forcerun_rules,
+                "rerun_incomplete": rerun_incomplete,
+                "target_paths": target_paths,
+            },
         )
 
     def run(
@@ -92,6 +115,8 @@ class SnakemakeEngineAdapter:
         rerun_incomplete: bool = False,
         target_paths: list[str] | None = None,
         on_poll: ProcessPoll | None = None,
+        output_capture: ProcessOutputCapture | None = None,
+        resource_plan: SnakemakeResourcePlan | None = None,
     ) -> Any:
         return self._execute(
             self._execution_args(
@@ -102,11 +127,19 @@ class SnakemakeEngineAdapter:
                 forcerun_rules=forcerun_rules,
                 rerun_incomplete=rerun_incomplete,
                 target_paths=target_paths,
+                resource_plan=resource_plan,
             ),
             on_poll=on_poll,
+            output_capture=output_capture,
         )
 
-    def _execute(self, command: list[str], *, on_poll: ProcessPoll | None = None) -> Any:
+    def _execute(
+        self,
+        command: list[str],
+        *,
+        on_poll: ProcessPoll | None = None,
+        output_capture: ProcessOutputCapture | None = None,
+    ) -> Any:
         env = build_workflow_runtime_environment(self._cfg)
         if self._run_command is not None:
             return self._run_command(
@@ -122,6 +155,7 @@ class SnakemakeEngineAdapter:
             on_process_started=self._on_process_started,
             on_poll=on_poll,
             poll_interval_seconds=self._poll_interval_seconds,
+            output_capture=output_capture,
         )
 
     def _execution_args(
@@ -135,6 +169,7 @@ class SnakemakeEngineAdapter:
         rerun_incomplete: bool = False,
         dry_run: bool = False,
         target_paths: list[str] | None = None,
+        resource_plan: SnakemakeResourcePlan | None = None,
     ) -> list[str]:
         profile_args = self._profile_args()
         normalized_forcerun_rules = normalize_forcerun_rules(forcerun_rules)
@@ -149,7 +184,8 @@ class SnakemakeEngineAdapter:
         if profile_args:
             command.extend(profile_args)
         else:
-            command.extend(["--cores", "1", "--use-conda"])
+            # Without an operator profile the attempt's admitted allocation sizes the run.
+            command.extend([*(resource_plan.command_args() if resource_plan else ["--cores", "1"]), "--use-conda"])
         command.extend(["--configfile", str(config_path)])
         if rerun_incomplete:
             command.append("--rerun-incomplete")
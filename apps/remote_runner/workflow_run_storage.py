@@ -13,6 +13,7 @@ from .execution_policy import execution_policy_from_run_spec
 from .execution_query_storage import fetch_run
 from .run_execution_storage import enqueue_run_job_record
 from .run_execution_state_machine import RunExecutionStateMachine
+from .run_job_wakeup import notify_run_jobs_claimable
 from .storage_core import get_connection, now_iso
 
 
@@ -179,6 +180,7 @@ def create_run_record(
             max_attempts=execution_policy.retry.max_attempts,
             retry_policy=execution_policy.retry.as_dict(),
             timeout_policy=execution_policy.timeout.as_dict(),
+            resource_policy=execution_policy.resources.as_dict(),
         )
         connection.execute(
             """
@@ -188,6 +190,7 @@ def create_run_record(
             (server_id, idempotency_key, payload_hash, run["runId"], "accepted"),
         )
         connection.commit()
+    notify_run_jobs_claimable("enqueued", run_id=run["runId"], available_at=submitted_at)
     return RunCreateRecordResult(run=run, status="accepted", created=True, reason="created")
 
 
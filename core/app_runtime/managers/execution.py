@@ -5,6 +5,8 @@ from typing import Any, Optional
 
 from core.app_runtime.errors import RuntimeServiceError
 from core.app_runtime.managers.base import BaseRuntimeManager
+from core.app_runtime.managers.execution_listing import ExecutionListingMixin
+from core.app_runtime.managers.result_package_stream import ResultPackageStreamMixin
 from core.contracts.remote_endpoints import (
     ARTIFACT_CACHE_ENTRIES_READ,
     ARTIFACT_CACHE_LOOKUP,
@@ -75,7 +77,7 @@ from core.contracts.result_package_remote_endpoints import (
 )
 
 
-class ExecutionManager(BaseRuntimeManager):
+class ExecutionManager(ExecutionListingMixin, ResultPackageStreamMixin, BaseRuntimeManager):
     def list_runs(self) -> list[dict[str, Any]]:
         return self.call_remote_endpoint(RUN_LIST, path_values={}, timeout=20)
 
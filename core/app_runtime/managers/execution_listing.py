@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from core.contracts.remote_endpoints import RESULT_LIST_PAGE, RUN_LIST_PAGE
+
+
+class ExecutionListingMixin:
+    """Keyset-paginated run and result listings; query values pass through to the runner as-is."""
+
+    def list_runs_page(self, query: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        return self.call_remote_endpoint(RUN_LIST_PAGE, path_values={}, query_values=dict(query or {}), timeout=20)
+
+    def list_results_page(self, query: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        return {"data": self.call_remote_endpoint(RESULT_LIST_PAGE, path_values={}, query_values=dict(query or {}))}
+
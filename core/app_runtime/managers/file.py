@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+import hashlib
+from typing import Any, BinaryIO, Optional
 
+from core.app_runtime.errors import RuntimeConflictError, RuntimeServiceError
 from core.app_runtime.managers.base import BaseRuntimeManager
 from core.contracts.remote_endpoints import UPLOAD_CREATE
+from core.contracts.submission_remote_endpoints import (
+    UPLOAD_SESSION_CHUNK,
+    UPLOAD_SESSION_COMPLETE,
+    UPLOAD_SESSION_CREATE,
+    UPLOAD_SESSION_READ,
+)
+
+
+UPLOAD_CHUNK_TIMEOUT_SECONDS = 120
+UPLOAD_MAX_CONSECUTIVE_FAILURES = 5
 
 
 class FileManager(BaseRuntimeManager):
@@ -20,6 +32,71 @@ class FileManager(BaseRuntimeManager):
             preferred_server_id=body.get("serverId"),
         )
 
+    def upload_file_chunked(
+        self,
+        source: BinaryIO,
+        *,
+        filename: str,
+        size_bytes: int,
+        mime_type: str = "application/octet-stream",
+        sha256: str = "",
+        server_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Upload a seekable binary stream in raw chunks, resuming after dropped connections."""
+        session = self.call_remote_endpoint(
+            UPLOAD_SESSION_CREATE,
+            path_values={},
+            payload={"filename": filename, "sizeBytes": int(size_bytes), "mimeType": mime_type, "sha256": sha256},
+            preferred_server_id=server_id,
+        )
+        path_values = {"upload_session_id": str(session["uploadSessionId"])}
+        chunk_bytes = int(session["chunkSizeBytes"])
+        offset: int | None = int(session["receivedBytes"])
+        failures = 0
+        while offset is None or offset < int(size_bytes):
+            chunk = b""
+            if offset is not None:
+                source.seek(offset)
+                chunk = source.read(min(chunk_bytes, int(size_bytes) - offset))
+                if not chunk:
+                    raise RuntimeServiceError("UPLOAD_SOURCE_TRUNCATED")
+            try:
+                if offset is None:
+                    session = self.call_remote_endpoint(
+                        UPLOAD_SESSION_READ,
+                        path_values=path_values,
+                        preferred_server_id=server_id,
+                    )
+                else:
+                    session = self.call_remote_endpoint(
+                        UPLOAD_SESSION_CHUNK,
+                        path_values=path_values,
+                        query_values={"offset": offset, "sha256": hashlib.sha256(chunk).hexdigest()},
+                        raw_body=chunk,
+                        preferred_server_id=server_id,
+                        timeout=UPLOAD_CHUNK_TIMEOUT_SECONDS,
+                    )
+            except RuntimeConflictError as exc:
+                payload = exc.payload if isinstance(exc.payload, dict) else {}
+                if payload.get("code") != "UPLOAD_SESSION_OFFSET_MISMATCH":
+                    raise
+                session = {"receivedBytes": payload["receivedBytes"]}
+            except RuntimeServiceError as exc:
+                # Only transport failures are retried; the runner rejected anything with a status.
+                if exc.status_code is not None or failures >= UPLOAD_MAX_CONSECUTIVE_FAILURES:
+                    raise
+                failures += 1
+                offset = None
+                continue
+            failures = 0
+            offset = int(session["receivedBytes"])
+        return self.call_remote_endpoint(
+            UPLOAD_SESSION_COMPLETE,
+            path_values=path_values,
+            preferred_server_id=server_id,
+            timeout=UPLOAD_CHUNK_TIMEOUT_SECONDS,
+        )
+
     def list_remote_files(
         self,
         path: str = "",
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+
+class ResultPackageStreamMixin:
+    """Streams result package bytes from the runner without buffering them locally."""
+
+    def open_result_package_download_stream(
+        self,
+        result_id: str,
+        package_export_id: str,
+        server_id: Optional[str] = None,
+        *,
+        range_header: Optional[str] = None,
+        if_range: Optional[str] = None,
+    ) -> dict[str, Any]:
+        return self.call_existing_runner(
+            "open_result_package_download_stream",
+            preferred_server_id=server_id,
+            result_id=result_id,
+            package_export_id=package_export_id,
+            range_header=range_header,
+            if_range=if_range,
+        )
@@ -7,6 +7,9 @@ class RunnerExecutionOperationsMixin:
     def list_runs(self) -> list[dict[str, Any]]:
         return self.execution.list_runs()
 
+    def list_runs_page(self, query: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        return self.execution.list_runs_page(query)
+
     def submit_run(self, payload: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         return self.execution.submit_run(payload)
 
@@ -270,6 +273,22 @@ class RunnerExecutionOperationsMixin:
     ) -> dict[str, Any]:
         return self.execution.get_run_logs(run_id, stream, cursor)
 
+    def open_run_update_stream(
+        self,
+        run_id: str,
+        *,
+        last_event_id: Optional[str] = None,
+        stdout_cursor: Optional[str] = None,
+        stderr_cursor: Optional[str] = None,
+    ) -> dict[str, Any]:
+        return self.execution.call_existing_runner(
+            "open_run_update_stream",
+            run_id=run_id,
+            last_event_id=last_event_id,
+            stdout_cursor=stdout_cursor,
+            stderr_cursor=stderr_cursor,
+        )
+
     def get_run_results(self, run_id: str) -> dict[str, Any]:
         return self.execution.get_run_results(run_id)
 
@@ -282,6 +301,9 @@ class RunnerExecutionOperationsMixin:
     def list_results(self) -> dict[str, Any]:
         return self.execution.list_results()
 
+    def list_results_page(self, query: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        return self.execution.list_results_page(query)
+
     def get_result(self, result_id: str) -> dict[str, Any]:
         return self.execution.get_result(result_id)
 
@@ -335,6 +357,23 @@ class RunnerExecutionOperationsMixin:
             server_id=server_id,
         )
 
+    def open_result_package_download_stream(
+        self,
+        result_id: str,
+        package_export_id: str,
+        server_id: Optional[str] = None,
+        *,
+        range_header: Optional[str] = None,
+        if_range: Optional[str] = None,
+    ) -> dict[str, Any]:
+        return self.execution.open_result_package_download_stream(
+            result_id,
+            package_export_id,
+            server_id=server_id,
+            range_header=range_header,
+            if_range=if_range,
+        )
+
     def retire_result_package(
         self,
         result_id: str,
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
 
 
 class RunnerFileOperationsMixin:
     def upload_file(self, payload: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         return self.files.upload_file(payload)
 
+    def upload_file_chunked(self, source: BinaryIO, **kwargs: Any) -> dict[str, Any]:
+        return self.files.upload_file_chunked(source, **kwargs)
+
     def list_remote_files(
         self,
         path: str = "",
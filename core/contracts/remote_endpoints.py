@@ -73,11 +73,13 @@ class RemoteEndpoint:
 
 
 RUN_LIST = "run.list"
+RUN_LIST_PAGE = "run.list_page"
 RUN_READ = "run.read"
 RUN_EVENTS_READ = "run.events.read"
 RUN_EXECUTION_CONTEXT_READ = "run.execution_context.read"
 RUN_ATTEMPTS_READ = "run.attempts.read"
 RUN_LOGS_READ = "run.logs.read"
+RUN_UPDATES_STREAM = "run.updates.stream"
 RUN_RESULTS_READ = "run.results.read"
 RUN_RULES_READ = "run.rules.read"
 RUN_FAILURE_LOCATOR_READ = "run.failure_locator.read"
@@ -96,6 +98,7 @@ RUN_RULE_CACHE_RESTORE_ADOPTION_PREPARE = "run.rule_cache_restore.adoption.prepa
 RUN_RULE_CACHE_RESTORE_ADOPTION_APPLY = "run.rule_cache_restore.adoption.apply"
 WORKFLOW_REVISION_READ = "workflow_revision.read"
 RESULT_LIST = "result.list"
+RESULT_LIST_PAGE = "result.list_page"
 RESULT_READ = "result.read"
 RESULT_PREVIEW_READ = "result.preview.read"
 RESULT_AUDIT_READ = "result.audit.read"
@@ -131,6 +134,17 @@ REMOTE_ENDPOINTS: dict[str, RemoteEndpoint] = {
         cache_scope="run-read-model",
         response_item_key="items",
     ),
+    RUN_LIST_PAGE: RemoteEndpoint(
+        endpoint_id=RUN_LIST_PAGE,
+        method="GET",
+        path_template="/api/v1/runs",
+        operation_id="listRunsPage",
+        governance_action=None,
+        request_schema=None,
+        response_schema="run-list.v1",
+        cache_scope="run-read-model",
+        query_params=("limit", "cursor", "status", "pipelineId", "submittedAfter", "submittedBefore"),
+    ),
     **{
         endpoint_id: RemoteEndpoint(endpoint_id=endpoint_id, **spec)
         for endpoint_id, spec in SUBMISSION_REMOTE_ENDPOINT_SPECS.items()
@@ -190,6 +204,17 @@ REMOTE_ENDPOINTS: dict[str, RemoteEndpoint] = {
         cache_scope="run-read-model",
         query_params=("stream", "cursor"),
     ),
+    RUN_UPDATES_STREAM: RemoteEndpoint(
+        endpoint_id=RUN_UPDATES_STREAM,
+        method="GET",
+        path_template="/api/v1/runs/{run_id}/stream",
+        operation_id="streamRunUpdates",
+        governance_action="run.updates.stream",
+        request_schema=None,
+        response_schema="run-update-stream.v1",
+        cache_scope="run-update-stream",
+        query_params=("stdoutCursor", "stderrCursor"),
+    ),
     RUN_RESULTS_READ: RemoteEndpoint(
         endpoint_id=RUN_RESULTS_READ,
         method="GET",
@@ -383,6 +408,17 @@ REMOTE_ENDPOINTS: dict[str, RemoteEndpoint] = {
         cache_scope="result-read-model",
         response_item_key="items",
     ),
+    RESULT_LIST_PAGE: RemoteEndpoint(
+        endpoint_id=RESULT_LIST_PAGE,
+        method="GET",
+        path_template="/api/v1/results",
+        operation_id="listResultsPage",
+        governance_action="result.list",
+        request_schema=None,
+        response_schema="result-list.v1",
+        cache_scope="result-read-model",
+        query_params=("limit", "cursor", "status", "pipelineId", "producedAfter", "producedBefore"),
+    ),
     RESULT_READ: RemoteEndpoint(
         endpoint_id=RESULT_READ,
         method="GET",
@@ -4,6 +4,10 @@ from typing import Any
 
 
 UPLOAD_CREATE = "upload.create"
+UPLOAD_SESSION_CREATE = "upload.session.create"
+UPLOAD_SESSION_READ = "upload.session.read"
+UPLOAD_SESSION_CHUNK = "upload.session.chunk"
+UPLOAD_SESSION_COMPLETE = "upload.session.complete"
 RUN_CREATE = "run.create"
 
 
@@ -17,6 +21,43 @@ SUBMISSION_REMOTE_ENDPOINT_SPECS: dict[str, dict[str, Any]] = {
         "response_schema": "upload.v1",
         "cache_scope": "upload-command",
     },
+    UPLOAD_SESSION_CREATE: {
+        "method": "POST",
+        "path_template": "/api/v1/upload-sessions",
+        "operation_id": "createUploadSession",
+        "governance_action": None,
+        "request_schema": "upload-session-create-request.v1",
+        "response_schema": "upload-session.v1",
+        "cache_scope": "upload-command",
+    },
+    UPLOAD_SESSION_READ: {
+        "method": "GET",
+        "path_template": "/api/v1/upload-sessions/{upload_session_id}",
+        "operation_id": "getUploadSession",
+        "governance_action": None,
+        "request_schema": None,
+        "response_schema": "upload-session.v1",
+        "cache_scope": "upload-command",
+    },
+    UPLOAD_SESSION_CHUNK: {
+        "method": "POST",
+        "path_template": "/api/v1/upload-sessions/{upload_session_id}/chunks",
+        "operation_id": "appendUploadSessionChunk",
+        "governance_action": None,
+        "request_schema": "upload-session-chunk.v1",
+        "response_schema": "upload-session.v1",
+        "cache_scope": "upload-command",
+        "query_params": ("offset", "sha256"),
+    },
+    UPLOAD_SESSION_COMPLETE: {
+        "method": "POST",
+        "path_template": "/api/v1/upload-sessions/{upload_session_id}/complete",
+        "operation_id": "completeUploadSession",
+        "governance_action": None,
+        "request_schema": None,
+        "response_schema": "upload.v1",
+        "cache_scope": "upload-command",
+    },
     RUN_CREATE: {
         "method": "POST",
         "path_template": "/api/v1/runs",
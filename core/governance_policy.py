@@ -293,6 +293,16 @@ HIGH_RISK_API_POLICIES: tuple[ApiGovernancePolicy, ...] = (
         "workflow-operator",
         "auditor",
     ),
+    remote_policy(
+        "GET",
+        "/api/v1/runs/{run_id}/stream",
+        "apps/remote_runner/execution_query_routes.py",
+        "run.updates.stream",
+        "run_update_stream",
+        "implemented",
+        "workflow-operator",
+        "auditor",
+    ),
     remote_policy(
         "GET",
         "/api/v1/runs/{run_id}/rules",
@@ -0,0 +1,200 @@
+"""SSH 通道并发闸门与可复用 SFTP 会话池。"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import paramiko
+
+# OpenSSH 默认 MaxSessions=10；留出终端与端口转发通道的余量。
+DEFAULT_MAX_CONCURRENT_CHANNELS = 6
+DEFAULT_SFTP_POOL_SIZE = 2
+# 这些异常说明 SFTP 会话本身已不可用，而不是单个文件操作失败。
+_BROKEN_SESSION_ERRORS = (paramiko.SSHException, EOFError, ConnectionError)
+
+
+def configured_max_concurrent_channels() -> int:
+    return _env_int(
+        "H2OMETA_SSH_MAX_CONCURRENT_CHANNELS",
+        DEFAULT_MAX_CONCURRENT_CHANNELS,
+        minimum=1,
+        error_code="SSH_CHANNEL_LIMIT_INVALID",
+    )
+
+
+def configured_sftp_pool_size() -> int:
+    return _env_int(
+        "H2OMETA_SSH_SFTP_POOL_SIZE",
+        DEFAULT_SFTP_POOL_SIZE,
+        minimum=0,
+        error_code="SSH_SFTP_POOL_SIZE_INVALID",
+    )
+
+
+class SSHChannelGate:
+    """限制同一 transport 上并发打开的通道数，并记录排队等待。"""
+
+    def __init__(self, max_concurrent: int | None = None) -> None:
+        self.max_concurrent = configured_max_concurrent_channels() if max_concurrent is None else int(max_concurrent)
+        if self.max_concurrent < 1:
+            raise ValueError("SSH_CHANNEL_LIMIT_INVALID")
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._operations: dict[str, dict[str, float]] = {}
+
+    @contextmanager
+    def slot(self, operation: str) -> Iterator[None]:
+        started = time.perf_counter()
+        queued = not self._slots.acquire(blocking=False)
+        if queued:
+            self._slots.acquire()
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            entry = self._operations.setdefault(
+                operation, {"count": 0, "queued": 0, "waitSecondsTotal": 0.0, "waitSecondsMax": 0.0}
+            )
+            entry["count"] += 1
+            entry["queued"] += int(queued)
+            entry["waitSecondsTotal"] += waited
+            entry["waitSecondsMax"] = max(entry["waitSecondsMax"], waited)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "maxConcurrent": self.max_concurrent,
+                "inFlight": self._in_flight,
+                "peakInFlight": self._peak_in_flight,
+                "operations": {
+                    name: {
+                        "count": int(entry["count"]),
+                        "queued": int(entry["queued"]),
+                        "waitSecondsTotal": round(entry["waitSecondsTotal"], 6),
+                        "waitSecondsMax": round(entry["waitSecondsMax"], 6),
+                    }
+                    for name, entry in sorted(self._operations.items())
+                },
+            }
+
+
+class SftpSessionPool:
+    """按 SSH client 复用 SFTP 会话；每个会话同一时刻只借给一个调用方。"""
+
+    def __init__(self, max_idle: int | None = None) -> None:
+        self.max_idle = configured_sftp_pool_size() if max_idle is None else int(max_idle)
+        if self.max_idle < 0:
+            raise ValueError("SSH_SFTP_POOL_SIZE_INVALID")
+        self._lock = threading.Lock()
+        self._client: Any = None
+        self._idle: list[Any] = []
+        self._opened = 0
+        self._reused = 0
+        self._discarded = 0
+
+    @contextmanager
+    def session(self, client: Any) -> Iterator[Any]:
+        sftp = self._checkout(client)
+        try:
+            yield sftp
+        except _BROKEN_SESSION_ERRORS:
+            self._discard(sftp)
+            raise
+        except BaseException:
+            self._release(client, sftp)
+            raise
+        self._release(client, sftp)
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._client = None
+        for sftp in idle:
+            _close_quietly(sftp)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "maxIdle": self.max_idle,
+                "idle": len(self._idle),
+                "opened": self._opened,
+                "reused": self._reused,
+                "discarded": self._discarded,
+            }
+
+    def _checkout(self, client: Any) -> Any:
+        stale: list[Any] = []
+        with self._lock:
+            if client is not self._client:
+                # 重连后旧 transport 上的会话全部作废。
+                stale, self._idle = self._idle, []
+                self._client = client
+            sftp = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if _session_open(candidate):
+                    sftp = candidate
+                    self._reused += 1
+                    break
+                stale.append(candidate)
+        for item in stale:
+            _close_quietly(item)
+        if sftp is not None:
+            return sftp
+        sftp = client.open_sftp()
+        with self._lock:
+            self._opened += 1
+        return sftp
+
+    def _release(self, client: Any, sftp: Any) -> None:
+        with self._lock:
+            if client is self._client and len(self._idle) < self.max_idle and _session_open(sftp):
+                self._idle.append(sftp)
+                return
+        _close_quietly(sftp)
+
+    def _discard(self, sftp: Any) -> None:
+        with self._lock:
+            self._discarded += 1
+        _close_quietly(sftp)
+
+
+def _session_open(sftp: Any) -> bool:
+    get_channel = getattr(sftp, "get_channel", None)
+    if get_channel is None:
+        return True
+    channel = get_channel()
+    return channel is None or not bool(getattr(channel, "closed", False))
+
+
+def _close_quietly(sftp: Any) -> None:
+    try:
+        sftp.close()
+    except (OSError, EOFError, paramiko.SSHException):
+        pass
+
+
+def _env_int(name: str, default: int, *, minimum: int, error_code: str) -> int:
+    raw = str(os.environ.get(name, "") or "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise ValueError(error_code) from exc
+    if value < minimum:
+        raise ValueError(error_code)
+    return value
@@ -10,6 +10,7 @@ from typing import Any, Tuple
 import paramiko
 
 from core.remote.local_tunnel import LocalTunnel
+from core.remote.ssh_channel_pool import SftpSessionPool, SSHChannelGate
 from core.remote.ssh_reconnect import SSHReconnectError, SSHReconnector
 from core.remote.terminal_session import TerminalSession
 
@@ -25,12 +26,18 @@ logger = logging.getLogger(__name__)
 
 
 class SSHService:
-    """SSH 服务 - 命令执行、文件传输、终端"""
+    """SSH 服务 - 命令执行、文件传输、终端
+
+    命令与文件传输各自在共享 transport 上打开独立通道并发执行，由
+    ``SSHChannelGate`` 限制并发数；``_lock`` 只保护连接、隧道与会话状态。
+    """
 
     def __init__(self, initial_client=None, connect_fn=None, max_retries=5):
         self._client = initial_client
         self._connect_fn = connect_fn
         self._lock = RLock()
+        self._channels = SSHChannelGate()
+        self._sftp_pool = SftpSessionPool()
         self._sessions = {}
         self._tunnels: dict[str, LocalTunnel] = {}
         self._reconnector = None
@@ -55,10 +62,9 @@ class SSHService:
             return False
 
     def run(self, cmd: str, timeout: int = 10) -> Tuple[int, str, str]:
-        with self._lock:
-            if not self._client:
-                raise RuntimeError("SSH not connected")
-            stdin, stdout, stderr = self._client.exec_command(cmd, timeout=timeout)
+        client = self._require_client()
+        with self._channels.slot("exec"):
+            stdin, stdout, stderr = client.exec_command(cmd, timeout=timeout)
             return (
                 stdout.channel.recv_exit_status(),
                 stdout.read().decode("utf-8", errors="ignore"),
@@ -66,16 +72,14 @@ class SSHService:
             )
 
     def upload(self, local: str, remote: str) -> None:
-        with self._lock:
-            sftp = self._client.open_sftp()
+        client = self._require_client()
+        with self._channels.slot("upload"), self._sftp_pool.session(client) as sftp:
             sftp.put(local, remote)
-            sftp.close()
 
     def download(self, remote: str, local: str) -> None:
-        with self._lock:
-            sftp = self._client.open_sftp()
+        client = self._require_client()
+        with self._channels.slot("download"), self._sftp_pool.session(client) as sftp:
             sftp.get(remote, local)
-            sftp.close()
 
     def list_directory(
         self,
@@ -85,16 +89,11 @@ class SSHService:
         limit: int = 500,
         offset: int = 0,
     ) -> dict[str, Any]:
-        with self._lock:
-            if not self._client:
-                raise RuntimeError("SSH not connected")
-            sftp = self._client.open_sftp()
-            try:
-                remote_path = self._normalize_sftp_input_path(path)
-                resolved_path = sftp.normalize(remote_path)
-                attrs = sftp.listdir_attr(resolved_path)
-            finally:
-                sftp.close()
+        client = self._require_client()
+        with self._channels.slot("list_directory"), self._sftp_pool.session(client) as sftp:
+            remote_path = self._normalize_sftp_input_path(path)
+            resolved_path = sftp.normalize(remote_path)
+            attrs = sftp.listdir_attr(resolved_path)
 
         items = []
         for attr in attrs:
@@ -136,6 +135,29 @@ class SSHService:
             "truncated": next_offset < total,
         }
 
+    def channel_metrics(self) -> dict[str, Any]:
+        return {
+            "schemaVersion": "ssh-channel-metrics.v1",
+            "channels": self._channels.snapshot(),
+            "sftpSessions": self._sftp_pool.snapshot(),
+            "tunnels": self._tunnel_traffic(),
+        }
+
+    def _tunnel_traffic(self) -> dict[str, Any]:
+        with self._lock:
+            tunnels = sorted(self._tunnels.items())
+        return {
+            name: tunnel.traffic_snapshot()
+            for name, tunnel in tunnels
+            if callable(getattr(tunnel, "traffic_snapshot", None))
+        }
+
+    def _require_client(self):
+        with self._lock:
+            if not self._client:
+                raise RuntimeError("SSH not connected")
+            return self._client
+
     def open_terminal_session(self, cols=120, rows=28) -> TerminalSession:
         with self._lock:
             t = self._client.get_transport()
@@ -247,6 +269,7 @@ class SSHService:
         if self._reconnector:
             self._reconnector.cancel()
         self._close_tunnels()
+        self._sftp_pool.close_all()
         for s in list(self._sessions.values()):
             s.close()
         self._sessions.clear()
@@ -269,12 +292,14 @@ class SSHService:
         logger.info("SSH reconnected")
         self._reconnecting = False
         self._close_tunnels()
+        self._sftp_pool.close_all()
         self._client = client
 
     def _on_failed(self, error):
         self._reconnecting = False
         logger.error("SSH reconnect failed: %s", error)
         self._close_tunnels()
+        self._sftp_pool.close_all()
         for s in list(self._sessions.values()):
             s.close(message="SSH disconnected")
         self._sessions.clear()
@@ -0,0 +1,429 @@
+"""Single event-loop forwarding engine behind ``LocalTunnel``.
+
+One selector thread per tunnel multiplexes every accepted connection and its
+``direct-tcpip`` channel. Reads grow from 64 KiB up to 1 MiB while a stream
+keeps filling them, and each direction stops reading once 4 MiB is queued so a
+slow peer pushes back instead of growing memory. Channel opens block on an SSH
+round trip, so they run on a small executor and hand the channel back to the
+loop through a wake-up socket.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import paramiko
+
+logger = logging.getLogger(__name__)
+
+KIB = 1024
+MIB = 1024 * KIB
+MIN_READ_BYTES = 64 * KIB
+MAX_READ_BYTES = 1 * MIB
+MAX_BUFFERED_BYTES = 4 * MIB
+CHANNEL_OPEN_WORKERS = 4
+# paramiko only signals channel readability; while data waits on the SSH window the loop polls, starting
+# this often and backing off while the window stays closed.
+CHANNEL_WINDOW_POLL_SECONDS = 0.002
+CHANNEL_WINDOW_POLL_MAX_SECONDS = 0.05
+_CHANNEL_ERRORS = (OSError, EOFError, paramiko.SSHException)
+
+
+@dataclass(frozen=True)
+class TunnelSettings:
+    window_size: int = 8 * MIB
+    max_packet_size: int = 32 * KIB
+    channel_open_timeout_seconds: float = 10.0
+
+    def __post_init__(self) -> None:
+        if not MIB <= self.window_size <= 1024 * MIB:
+            raise ValueError("SSH_TUNNEL_WINDOW_SIZE_INVALID")
+        if not 4 * KIB <= self.max_packet_size <= 256 * KIB:
+            raise ValueError("SSH_TUNNEL_MAX_PACKET_SIZE_INVALID")
+
+
+def configured_tunnel_settings() -> TunnelSettings:
+    defaults = TunnelSettings()
+    return TunnelSettings(
+        window_size=_env_int("H2OMETA_SSH_TUNNEL_WINDOW_MB", "SSH_TUNNEL_WINDOW_SIZE_INVALID", MIB)
+        or defaults.window_size,
+        max_packet_size=_env_int("H2OMETA_SSH_TUNNEL_MAX_PACKET_KB", "SSH_TUNNEL_MAX_PACKET_SIZE_INVALID", KIB)
+        or defaults.max_packet_size,
+    )
+
+
+class TunnelTraffic:
+    """Per-tunnel connection counts and byte rates, updated by the loop thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connections_total = 0
+        self.connections_active = 0
+        self.connections_peak = 0
+        self.channel_open_failures = 0
+        self.bytes_up = 0
+        self.bytes_down = 0
+        self._rate_started = time.monotonic()
+        self._rate_base = (0, 0)
+        self._rates = (0.0, 0.0)
+
+    def connection_opened(self) -> None:
+        with self._lock:
+            self.connections_total += 1
+            self.connections_active += 1
+            self.connections_peak = max(self.connections_peak, self.connections_active)
+
+    def connection_closed(self) -> None:
+        with self._lock:
+            self.connections_active -= 1
+
+    def open_failed(self) -> None:
+        with self._lock:
+            self.channel_open_failures += 1
+
+    def add(self, *, up: int = 0, down: int = 0) -> None:
+        with self._lock:
+            self.bytes_up += up
+            self.bytes_down += down
+
+    def roll(self, now: float) -> None:
+        with self._lock:
+            elapsed = now - self._rate_started
+            if elapsed < 1.0:
+                return
+            base_up, base_down = self._rate_base
+            self._rates = ((self.bytes_up - base_up) / elapsed, (self.bytes_down - base_down) / elapsed)
+            self._rate_base = (self.bytes_up, self.bytes_down)
+            self._rate_started = now
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "connectionsTotal": self.connections_total,
+                "connectionsActive": self.connections_active,
+                "connectionsPeak": self.connections_peak,
+                "channelOpenFailures": self.channel_open_failures,
+                "bytesUp": self.bytes_up,
+                "bytesDown": self.bytes_down,
+                "upBytesPerSecond": round(self._rates[0], 1),
+                "downBytesPerSecond": round(self._rates[1], 1),
+            }
+
+
+class _Flow:
+    """One accepted socket paired with its SSH channel."""
+
+    def __init__(self, sock: socket.socket, channel: Any) -> None:
+        self.sock = sock
+        self.channel = channel
+        self.to_channel = bytearray()
+        self.to_socket = bytearray()
+        self.up_read = MIN_READ_BYTES
+        self.down_read = MIN_READ_BYTES
+        self.sock_eof = False
+        self.channel_eof = False
+        self.channel_write_shut = False
+        self.sock_write_shut = False
+        self.sock_events = 0
+        self.channel_events = 0
+
+    @property
+    def finished(self) -> bool:
+        up_done = self.sock_eof and not self.to_channel
+        down_done = self.channel_eof and not self.to_socket
+        return up_done and down_done
+
+
+class TunnelForwarder:
+    def __init__(
+        self,
+        *,
+        name: str,
+        transport: Any,
+        remote_host: str,
+        remote_port: int,
+        local_host: str,
+        local_port: int,
+        settings: TunnelSettings | None = None,
+    ) -> None:
+        self.name = name
+        self.remote = (remote_host, remote_port)
+        self.settings = settings or configured_tunnel_settings()
+        self.traffic = TunnelTraffic()
+        self._transport = transport
+        self._listener = socket.create_server((local_host, local_port))
+        self._listener.setblocking(False)
+        self.server_address = self._listener.getsockname()[:2]
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ, "accept")
+        self._selector.register(self._wake_reader, selectors.EVENT_READ, "wake")
+        self._opener = ThreadPoolExecutor(CHANNEL_OPEN_WORKERS, thread_name_prefix=f"tunnel-{name}-open")
+        self._opened: deque[tuple[socket.socket, Future]] = deque()
+        # Guards ``_opened`` against opens that finish while the loop is shutting down.
+        self._opened_lock = threading.Lock()
+        self._stopped = False
+        self._flows: set[_Flow] = set()
+        self._closing = threading.Event()
+        self._channel_bytes_sent = 0
+        self._window_poll_seconds = CHANNEL_WINDOW_POLL_SECONDS
+
+    def serve_forever(self) -> None:
+        try:
+            while not self._closing.is_set():
+                waiting = any(flow.to_channel for flow in self._flows)
+                sent_before = self._channel_bytes_sent
+                for key, mask in self._selector.select(self._window_poll_seconds if waiting else 1.0):
+                    if key.data == "accept":
+                        self._accept()
+                    elif key.data == "wake":
+                        self._drain_wakeups()
+                    else:
+                        flow, side = key.data
+                        self._service(flow, side, mask)
+                for flow in list(self._flows):
+                    if flow.to_channel:
+                        self._pump(flow, self._send_to_channel)
+                self._adapt_window_poll(progressed=self._channel_bytes_sent != sent_before)
+                self.traffic.roll(time.monotonic())
+        finally:
+            self._shutdown()
+
+    def _adapt_window_poll(self, *, progressed: bool) -> None:
+        if progressed or not any(flow.to_channel for flow in self._flows):
+            self._window_poll_seconds = CHANNEL_WINDOW_POLL_SECONDS
+        else:
+            self._window_poll_seconds = min(self._window_poll_seconds * 2, CHANNEL_WINDOW_POLL_MAX_SECONDS)
+
+    def shutdown(self) -> None:
+        self._closing.set()
+        self._wake()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, peer = self._listener.accept()
+            except BlockingIOError:
+                return
+            except OSError:
+                logger.exception("Tunnel %s failed to accept a connection", self.name)
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            future = self._opener.submit(self._open_channel, peer)
+            future.add_done_callback(lambda done, sock=sock: self._channel_ready(sock, done))
+
+    def _open_channel(self, peer: tuple[str, int]) -> Any:
+        return self._transport.open_channel(
+            "direct-tcpip",
+            self.remote,
+            peer[:2],
+            window_size=self.settings.window_size,
+            max_packet_size=self.settings.max_packet_size,
+            timeout=self.settings.channel_open_timeout_seconds,
+        )
+
+    def _channel_ready(self, sock: socket.socket, future: Future) -> None:
+        with self._opened_lock:
+            if not self._stopped:
+                self._opened.append((sock, future))
+                self._wake()
+                return
+        # The loop has already drained ``_opened``; nobody else will release these.
+        _discard_open(sock, future)
+
+    def _drain_wakeups(self) -> None:
+        try:
+            while self._wake_reader.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        while self._opened:
+            sock, future = self._opened.popleft()
+            try:
+                channel = future.result()
+            except _CHANNEL_ERRORS:
+                logger.exception("Failed to open direct-tcpip channel")
+                channel = None
+            if channel is None or self._closing.is_set():
+                self.traffic.open_failed()
+                _close_socket(sock)
+                if channel is not None:
+                    _close_channel(channel)
+                continue
+            channel.settimeout(0.0)
+            flow = _Flow(sock, channel)
+            self._flows.add(flow)
+            self.traffic.connection_opened()
+            self._sync(flow)
+
+    def _service(self, flow: _Flow, side: str, mask: int) -> None:
+        if side == "sock" and mask & selectors.EVENT_WRITE:
+            self._pump(flow, self._send_to_socket)
+        if side == "sock" and mask & selectors.EVENT_READ:
+            self._pump(flow, self._read_socket)
+        if side == "channel":
+            self._pump(flow, self._read_channel)
+
+    def _pump(self, flow: _Flow, step) -> None:
+        if flow not in self._flows:
+            return
+        try:
+            step(flow)
+        except (BlockingIOError, socket.timeout):
+            pass
+        except _CHANNEL_ERRORS:
+            self._close_flow(flow)
+            return
+        if flow.finished:
+            self._close_flow(flow)
+            return
+        self._sync(flow)
+
+    def _read_socket(self, flow: _Flow) -> None:
+        data = flow.sock.recv(flow.up_read)
+        if not data:
+            flow.sock_eof = True
+        else:
+            flow.to_channel += data
+            self.traffic.add(up=len(data))
+            flow.up_read = _adapt(flow.up_read, len(data))
+        self._send_to_channel(flow)
+
+    def _send_to_channel(self, flow: _Flow) -> None:
+        while flow.to_channel and flow.channel.send_ready():
+            sent = flow.channel.send(memoryview(flow.to_channel)[: flow.up_read])
+            if not sent:
+                break
+            del flow.to_channel[:sent]
+            self._channel_bytes_sent += sent
+        if flow.sock_eof and not flow.to_channel and not flow.channel_write_shut:
+            flow.channel_write_shut = True
+            flow.channel.shutdown_write()
+
+    def _read_channel(self, flow: _Flow) -> None:
+        data = flow.channel.recv(flow.down_read)
+        if not data:
+            flow.channel_eof = True
+        else:
+            flow.to_socket += data
+            self.traffic.add(down=len(data))
+            flow.down_read = _adapt(flow.down_read, len(data))
+        self._send_to_socket(flow)
+
+    def _send_to_socket(self, flow: _Flow) -> None:
+        while flow.to_socket:
+            try:
+                sent = flow.sock.send(flow.to_socket)
+            except BlockingIOError:
+                break
+            del flow.to_socket[:sent]
+        if flow.channel_eof and not flow.to_socket and not flow.sock_write_shut:
+            flow.sock_write_shut = True
+            flow.sock.shutdown(socket.SHUT_WR)
+
+    def _sync(self, flow: _Flow) -> None:
+        sock_events = 0
+        if not flow.sock_eof and len(flow.to_channel) < MAX_BUFFERED_BYTES:
+            sock_events |= selectors.EVENT_READ
+        if flow.to_socket:
+            sock_events |= selectors.EVENT_WRITE
+        channel_events = 0
+        if not flow.channel_eof and len(flow.to_socket) < MAX_BUFFERED_BYTES:
+            channel_events = selectors.EVENT_READ
+        flow.sock_events = self._reregister(flow.sock, flow.sock_events, sock_events, (flow, "sock"))
+        flow.channel_events = self._reregister(flow.channel, flow.channel_events, channel_events, (flow, "channel"))
+
+    def _reregister(self, fileobj: Any, current: int, wanted: int, data: tuple[_Flow, str]) -> int:
+        if current == wanted:
+            return wanted
+        if not current:
+            self._selector.register(fileobj, wanted, data)
+        elif not wanted:
+            self._selector.unregister(fileobj)
+        else:
+            self._selector.modify(fileobj, wanted, data)
+        return wanted
+
+    def _close_flow(self, flow: _Flow) -> None:
+        if flow not in self._flows:
+            return
+        self._flows.discard(flow)
+        for fileobj, events in ((flow.sock, flow.sock_events), (flow.channel, flow.channel_events)):
+            if events:
+                self._selector.unregister(fileobj)
+        flow.sock_events = flow.channel_events = 0
+        _close_channel(flow.channel)
+        _close_socket(flow.sock)
+        self.traffic.connection_closed()
+
+    def _wake(self) -> None:
+        try:
+            self._wake_writer.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _shutdown(self) -> None:
+        for flow in list(self._flows):
+            self._close_flow(flow)
+        with self._opened_lock:
+            self._stopped = True
+            pending = list(self._opened)
+            self._opened.clear()
+        self._opener.shutdown(wait=False, cancel_futures=True)
+        self._selector.close()
+        self._listener.close()
+        self._wake_reader.close()
+        self._wake_writer.close()
+        for sock, future in pending:
+            _discard_open(sock, future)
+
+
+def _adapt(current: int, received: int) -> int:
+    if received >= current:
+        return min(current * 2, MAX_READ_BYTES)
+    if received < current // 4:
+        return max(current // 2, MIN_READ_BYTES)
+    return current
+
+
+def _discard_open(sock: socket.socket, future: Future) -> None:
+    _close_socket(sock)
+    if future.cancelled() or future.exception() is not None:
+        return
+    if future.result() is not None:
+        _close_channel(future.result())
+
+
+def _close_channel(channel: Any) -> None:
+    try:
+        channel.close()
+    except _CHANNEL_ERRORS:
+        pass
+
+
+def _close_socket(sock: socket.socket) -> None:
+    try:
+        sock.close()
+    except OSError:
+        pass
+
+
+def _env_int(name: str, error_code: str, unit: int) -> int:
+    raw = str(os.environ.get(name, "") or "").strip()
+    if not raw:
+        return 0
+    try:
+        return int(raw) * unit
+    except ValueError as exc:
+        raise ValueError(error_code) from exc
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import json
 import shlex
+import tempfile
+from pathlib import Path
 from typing import Any
 
+from core.remote_runner.delta_deploy import (
+    DEPLOY_MODE_DELTA,
+    configured_deploy_mode,
+    delta_cache_root,
+    load_or_build_delta_manifest,
+    remote_delta_command,
+    write_blob_archive,
+)
+
 
 class RemoteRunnerBootstrapBundleMixin:
     def _deploy_service_runtime_bundle(
@@ -11,7 +23,7 @@ class RemoteRunnerBootstrapBundleMixin:
         ssh_service,
         artifact: Any,
         paths: Any,
-    ) -> None:
+    ) -> dict[str, Any] | None:
         self._run_checked(
             ssh_service,
             "mkdir -p " + " ".join(shlex.quote(path) for path in paths.remote_directories()),
@@ -26,17 +38,26 @@ class RemoteRunnerBootstrapBundleMixin:
             step="clear previous remote runner service",
             timeout=20,
         )
-        ssh_service.upload(str(artifact.archive_path), paths.bundle)
-        self._run_checked(
-            ssh_service,
-            "rm -rf {release} && mkdir -p {release} && tar -xzf {bundle} -C {release} && chmod 0755 {release}/*.sh".format(
-                release=shlex.quote(paths.release),
-                bundle=shlex.quote(paths.bundle),
-            ),
-            step="extract remote runner bundle",
-            timeout=60,
-        )
         artifact_sha = str(getattr(artifact, "sha256", "") or "")
+        summary = None
+        if configured_deploy_mode() == DEPLOY_MODE_DELTA and artifact_sha and self._remote_has_python3(ssh_service):
+            summary = self._deploy_runtime_bundle_delta(
+                ssh_service,
+                archive_path=Path(artifact.archive_path),
+                artifact_sha=artifact_sha,
+                paths=paths,
+            )
+        else:
+            ssh_service.upload(str(artifact.archive_path), paths.bundle)
+            self._run_checked(
+                ssh_service,
+                "rm -rf {release} && mkdir -p {release} && tar -xzf {bundle} -C {release} && chmod 0755 {release}/*.sh".format(
+                    release=shlex.quote(paths.release),
+                    bundle=shlex.quote(paths.bundle),
+                ),
+                step="extract remote runner bundle",
+                timeout=60,
+            )
         if artifact_sha:
             self._write_remote_text_atomic(
                 ssh_service,
@@ -50,3 +71,76 @@ class RemoteRunnerBootstrapBundleMixin:
             paths.bundle,
             step="cleanup remote runner bundle",
         )
+        return summary
+
+    @staticmethod
+    def _remote_has_python3(ssh_service) -> bool:
+        exit_code, _stdout, _stderr = ssh_service.run("command -v python3 >/dev/null 2>&1", timeout=10)
+        return exit_code == 0
+
+    def _deploy_runtime_bundle_delta(
+        self,
+        ssh_service,
+        *,
+        archive_path: Path,
+        artifact_sha: str,
+        paths: Any,
+    ) -> dict[str, Any]:
+        cache_root = delta_cache_root()
+        manifest, manifest_path = load_or_build_delta_manifest(
+            archive_path,
+            archive_sha256=artifact_sha,
+            cache_root=cache_root,
+        )
+        remote_manifest = paths.delta_manifest()
+        blob_store = paths.delta_blob_store()
+        self._upload_remote_file_atomic(
+            ssh_service,
+            local_path=manifest_path,
+            remote_path=remote_manifest,
+            step="upload remote runner delta manifest",
+            timeout=10,
+        )
+        _exit_code, stdout, _stderr = self._run_checked(
+            ssh_service,
+            f"mkdir -p {shlex.quote(blob_store)} && " + remote_delta_command("missing", remote_manifest, blob_store),
+            step="diff remote runner blobs",
+            timeout=60,
+        )
+        try:
+            missing = [str(sha) for sha in json.loads(stdout)["missing"]]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise self._manager_error("diff remote runner blobs: unexpected output") from exc
+        transferred_bytes = 0
+        incoming = ""
+        if missing:
+            with tempfile.TemporaryDirectory(prefix="h2ometa-runner-delta-") as tmp_dir:
+                blob_archive = Path(tmp_dir) / "blobs.tar.gz"
+                write_blob_archive(cache_root, missing, blob_archive)
+                transferred_bytes = blob_archive.stat().st_size
+                ssh_service.upload(str(blob_archive), paths.bundle)
+            incoming = paths.bundle
+        _exit_code, stdout, _stderr = self._run_checked(
+            ssh_service,
+            remote_delta_command(
+                "apply",
+                remote_manifest,
+                blob_store,
+                paths.release,
+                incoming,
+                f"{paths.root}/releases",
+            ),
+            step="assemble remote runner release",
+            timeout=120,
+        )
+        self._cleanup_remote_bundle(ssh_service, remote_manifest, step="cleanup remote runner delta manifest")
+        applied = json.loads(stdout or "{}")
+        return {
+            "mode": DEPLOY_MODE_DELTA,
+            "files": int(manifest["fileCount"]),
+            "blobs": int(manifest["blobCount"]),
+            "missingBlobs": len(missing),
+            "transferredBytes": transferred_bytes,
+            "bundleBytes": int(manifest["totalBytes"]),
+            "gcRemovedBlobs": int(applied.get("gcRemovedBlobs") or 0),
+        }
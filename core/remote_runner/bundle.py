@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import compileall
+import hashlib
 import json
+import os
+import py_compile
+import re
 import shutil
+import subprocess
+import sys
 import tarfile
 import tempfile
 from dataclasses import dataclass
@@ -18,6 +25,7 @@ CORE_RUNTIME_HELPER_FILES = (
     "problem_responses.py",
     "problem_status.py",
 )
+_RUNTIME_LIB_RE = re.compile(r"^python(3\.\d+)$")
 
 
 @dataclass
@@ -26,6 +34,7 @@ class BuiltBootstrapBundle:
     platform: str
     bundle_dir: Path
     archive_path: Path
+    reused: bool = False
 
 
 class RemoteRunnerBundleBuilder:
@@ -35,14 +44,31 @@ class RemoteRunnerBundleBuilder:
         *,
         platform: str = "linux-64",
         runtime_dir: Path,
+        cache_dir: Path | None = None,
     ) -> BuiltBootstrapBundle:
+        """Build the runner bundle; with ``cache_dir`` an unchanged input set reuses the previous build."""
         if not runtime_dir.exists():
             raise FileNotFoundError(f"remote runner runtime directory not found: {runtime_dir}")
         runtime_python = runtime_dir / "bin" / "python"
         if not runtime_python.exists():
             raise FileNotFoundError(f"remote runner runtime python not found: {runtime_python}")
 
-        root = Path(tempfile.mkdtemp(prefix="h2ometa-remote-bundle-"))
+        archive_name = f"{REMOTE_RUNNER_ARTIFACT.name}-{version}-{platform}.tar.gz"
+        cached_root = None
+        if cache_dir is not None:
+            cached_root = cache_dir / self.input_fingerprint(version, platform=platform, runtime_dir=runtime_dir)
+            if (cached_root / archive_name).is_file() and (cached_root / "bundle").is_dir():
+                return BuiltBootstrapBundle(
+                    version=version,
+                    platform=platform,
+                    bundle_dir=cached_root / "bundle",
+                    archive_path=cached_root / archive_name,
+                    reused=True,
+                )
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            root = Path(tempfile.mkdtemp(prefix=".building-", dir=cache_dir))
+        else:
+            root = Path(tempfile.mkdtemp(prefix="h2ometa-remote-bundle-"))
         bundle_dir = root / "bundle"
         bundle_dir.mkdir(parents=True, exist_ok=True)
 
@@ -64,6 +90,7 @@ class RemoteRunnerBundleBuilder:
             ignore=shutil.ignore_patterns("__pycache__", "*.pyc", "*.pyo"),
         )
         shutil.copytree(runtime_dir, bundle_dir / "runtime", symlinks=True)
+        bytecode = self._compile_bytecode(bundle_dir, runtime_dir)
 
         manifest = {
             "service": REMOTE_RUNNER_ARTIFACT.service,
@@ -74,6 +101,8 @@ class RemoteRunnerBundleBuilder:
                 "python": "runtime/bin/python",
             },
         }
+        if bytecode is not None:
+            manifest["bytecode"] = bytecode
         self._write_text_lf(bundle_dir / "bootstrap_manifest.json", json.dumps(manifest, indent=2))
         self._write_text_lf(
             bundle_dir / "start_service.sh",
@@ -178,11 +207,79 @@ class RemoteRunnerBundleBuilder:
         for path in bundle_dir.glob("*.sh"):
             path.chmod(0o755)
 
-        archive_path = root / f"{REMOTE_RUNNER_ARTIFACT.name}-{version}-{platform}.tar.gz"
-        with tarfile.open(archive_path, "w:gz") as archive:
+        with tarfile.open(root / archive_name, "w:gz") as archive:
             archive.add(bundle_dir, arcname=".")
+        if cached_root is not None:
+            shutil.rmtree(cached_root, ignore_errors=True)
+            os.replace(root, cached_root)
+            root = cached_root
 
-        return BuiltBootstrapBundle(version=version, platform=platform, bundle_dir=bundle_dir, archive_path=archive_path)
+        return BuiltBootstrapBundle(
+            version=version,
+            platform=platform,
+            bundle_dir=root / "bundle",
+            archive_path=root / archive_name,
+        )
+
+    @staticmethod
+    def _compile_bytecode(bundle_dir: Path, runtime_dir: Path) -> dict[str, str] | None:
+        """Precompile the bundled sources for the runtime's interpreter so a fresh release skips compilation.
+
+        Checked-hash pycs stay valid when deploys do not preserve mtimes, and
+        are still rejected if a source file is edited in place.
+        """
+        versions = sorted(
+            match.group(1)
+            for path in (runtime_dir / "lib").glob("python3.*")
+            if path.is_dir() and (match := _RUNTIME_LIB_RE.match(path.name))
+        )
+        if len(versions) != 1:
+            return None
+        major, minor = versions[0].split(".")
+        cache_tag = f"cpython-{major}{minor}"
+        targets = [bundle_dir / "remote_runner", bundle_dir / "core"]
+        if cache_tag == sys.implementation.cache_tag:
+            for target in targets:
+                compileall.compile_dir(
+                    str(target),
+                    quiet=1,
+                    invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+                )
+        else:
+            command = [str(runtime_dir / "bin" / "python"), "-m", "compileall", "-q", "--invalidation-mode", "checked-hash"]
+            try:
+                subprocess.run([*command, *map(str, targets)], capture_output=True, timeout=300, check=False)
+            except (OSError, subprocess.SubprocessError):
+                return None
+        if not (bundle_dir / "remote_runner" / "__pycache__" / f"main.{cache_tag}.pyc").is_file():
+            return None
+        return {"cacheTag": cache_tag, "invalidationMode": "checked-hash"}
+
+    @staticmethod
+    def input_fingerprint(version: str, *, platform: str, runtime_dir: Path) -> str:
+        """Digest of everything a build reads: bundled sources by content, the runtime by path/size/mtime."""
+        digest = hashlib.sha256(f"{version}\0{platform}\0".encode("utf-8"))
+        repo_root = Path(__file__).resolve().parents[2]
+        sources = [Path(__file__).resolve(), repo_root / "core" / "__init__.py"]
+        sources += [repo_root / "core" / filename for filename in CORE_RUNTIME_HELPER_FILES]
+        for tree in (repo_root / "apps" / "remote_runner", repo_root / "core" / "contracts"):
+            sources += [
+                path
+                for path in sorted(tree.rglob("*"))
+                if path.is_file() and "__pycache__" not in path.parts and path.suffix not in {".pyc", ".pyo"}
+            ]
+        for path in sources:
+            digest.update(path.relative_to(repo_root).as_posix().encode("utf-8") + b"\0")
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        # The runtime is large and only ever replaced wholesale, so stat data is enough.
+        for directory, dirnames, filenames in os.walk(runtime_dir):
+            dirnames.sort()
+            for name in sorted(filenames + [d for d in dirnames if os.path.islink(os.path.join(directory, d))]):
+                path = Path(directory) / name
+                stat = path.lstat()
+                relative = path.relative_to(runtime_dir).as_posix()
+                digest.update(f"{relative}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode("utf-8"))
+        return digest.hexdigest()[:32]
 
     @staticmethod
     def _write_text_lf(path: Path, content: str) -> None:
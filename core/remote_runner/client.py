@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import json
 import http.client
-import urllib.error
-import urllib.request
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
+from core.remote_runner.http_pool import RunnerHttpExchange, get_runner_http_pool
+
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
 class RemoteRunnerClientError(RuntimeError):
     def __init__(self, message: str, *, status_code: int | None = None, detail: Any = None):
         super().__init__(message)
@@ -47,6 +51,8 @@ class RemoteRunnerHttpClient:
     base_url: str
     token: str
     timeout: int = 5
+    # Connect / first-byte / body timings of the most recent call; see ``runner_http_transport_stats``.
+    last_timing: dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
 
     def _request_json(
         self,
@@ -67,111 +73,118 @@ class RemoteRunnerHttpClient:
             body = bytes(raw_body)
         elif payload is not None:
             body = json.dumps(payload).encode("utf-8")
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-        }
+        headers = self._headers(extra_headers)
         if payload is not None:
             headers["Content-Type"] = "application/json"
+        exchange = self._open(method, path, headers=headers, body=body)
+        status_code = exchange.status
+        response_payload = self._read(exchange).decode("utf-8", errors="replace")
+        if 200 <= status_code < 300:
+            if enforce_status and status_code not in accepted:
+                raise RemoteRunnerClientError(
+                    f"runner http status {status_code} not accepted for {method} {path}",
+                    status_code=status_code,
+                    detail={
+                        "acceptedStatusCodes": sorted(accepted),
+                        "response": _decode_json_object(response_payload),
+                        "statusCode": status_code,
+                    },
+                )
+            return json.loads(response_payload)
+        if status_code in accepted:
+            decoded = json.loads(response_payload or "{}")
+            if isinstance(decoded, dict):
+                return decoded
+        detail_value = _http_error_detail_value(response_payload)
+        if status_code == 409 and isinstance(detail_value, dict):
+            raise RemoteRunnerConflictError(detail_value)
+        raise _http_status_error(status_code, response_payload)
+
+    def _request_bytes(self, method: str, path: str) -> dict[str, Any]:
+        exchange = self._open(method, path, headers=self._headers(None))
+        content = self._read(exchange)
+        if not 200 <= exchange.status < 300:
+            raise _http_status_error(exchange.status, content.decode("utf-8", errors="replace"))
+        return {"statusCode": exchange.status, "content": content, "headers": dict(exchange.headers)}
+
+    def _headers(self, extra_headers: dict[str, str] | None) -> dict[str, str]:
+        headers = {"Authorization": f"Bearer {self.token}"}
         if extra_headers:
             if any(str(key).lower() == "authorization" for key in extra_headers):
                 raise ValueError("REMOTE_RUNNER_EXTRA_HEADER_FORBIDDEN: Authorization")
             headers.update(extra_headers)
-        request = urllib.request.Request(
-            f"{self.base_url.rstrip('/')}/{path.lstrip('/')}",
-            headers=headers,
-            data=body,
-            method=method,
-        )
+        return headers
+
+    def _open(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str],
+        body: bytes | None = None,
+    ) -> RunnerHttpExchange:
         try:
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                status_code = int(response.status)
-                response_payload = response.read().decode("utf-8")
-                if enforce_status and status_code not in accepted:
-                    raise RemoteRunnerClientError(
-                        f"runner http status {status_code} not accepted for {method} {path}",
-                        status_code=status_code,
-                        detail={
-                            "acceptedStatusCodes": sorted(accepted),
-                            "response": _decode_json_object(response_payload),
-                            "statusCode": status_code,
-                        },
-                    )
-                return json.loads(response_payload)
-        except urllib.error.HTTPError as exc:
-            response_payload = exc.read().decode("utf-8", errors="replace")
-            if exc.code in accepted:
-                decoded = json.loads(response_payload or "{}")
-                if isinstance(decoded, dict):
-                    return decoded
-            detail_value = _http_error_detail_value(response_payload)
-            if exc.code == 409 and isinstance(detail_value, dict):
-                raise RemoteRunnerConflictError(detail_value) from exc
-            detail = _http_error_detail(response_payload)
-            message = f"runner http error {exc.code}"
-            if detail:
-                message = f"{message}: {detail}"
-            raise RemoteRunnerClientError(message, status_code=exc.code, detail=detail_value) from exc
-        except urllib.error.URLError as exc:
-            raise RemoteRunnerClientError(str(exc.reason) or "runner unreachable") from exc
-        except (http.client.RemoteDisconnected, ConnectionError, OSError) as exc:
+            exchange = get_runner_http_pool().open(
+                method,
+                f"{self.base_url.rstrip('/')}/{path.lstrip('/')}",
+                headers=headers,
+                body=body,
+                timeout=self.timeout,
+            )
+        except (http.client.HTTPException, ConnectionError, OSError) as exc:
             raise RemoteRunnerClientError(str(exc) or "runner unreachable") from exc
+        self.last_timing = exchange.timing
+        return exchange
 
-    def _request_bytes(self, method: str, path: str) -> dict[str, Any]:
-        request = urllib.request.Request(
-            f"{self.base_url.rstrip('/')}/{path.lstrip('/')}",
-            headers={"Authorization": f"Bearer {self.token}"},
-            method=method,
-        )
+    def _read(self, exchange: RunnerHttpExchange) -> bytes:
         try:
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                return {
-                    "statusCode": int(response.status),
-                    "content": response.read(),
-                    "headers": {key.lower(): value for key, value in response.headers.items()},
-                }
-        except urllib.error.HTTPError as exc:
-            response_payload = exc.read().decode("utf-8", errors="replace")
-            detail_value = _http_error_detail_value(response_payload)
-            detail = _http_error_detail(response_payload)
-            message = f"runner http error {exc.code}"
-            if detail:
-                message = f"{message}: {detail}"
-            raise RemoteRunnerClientError(message, status_code=exc.code, detail=detail_value) from exc
-        except urllib.error.URLError as exc:
-            raise RemoteRunnerClientError(str(exc.reason) or "runner unreachable") from exc
-        except (http.client.RemoteDisconnected, ConnectionError, OSError) as exc:
+            return exchange.read()
+        except (http.client.HTTPException, ConnectionError, OSError) as exc:
             raise RemoteRunnerClientError(str(exc) or "runner unreachable") from exc
 
+    def stream_bytes(
+        self,
+        path: str,
+        *,
+        extra_headers: dict[str, str] | None = None,
+        accepted_statuses: set[int] | None = None,
+    ) -> dict[str, Any]:
+        """Open a long-lived GET and return its headers plus a lazy chunk iterator.
+
+        Errors before the response starts are raised here unless their status is
+        in ``accepted_statuses``; the iterator hands the connection back to the
+        pool once exhausted and closes it if the caller stops early.
+        """
+        exchange = self._open("GET", path, headers=self._headers(extra_headers))
+        if 200 <= exchange.status < 300 or (accepted_statuses and exchange.status in accepted_statuses):
+            return {
+                "statusCode": exchange.status,
+                "headers": dict(exchange.headers),
+                "chunks": _iter_response_chunks(exchange),
+            }
+        raise _http_status_error(exchange.status, self._read(exchange).decode("utf-8", errors="replace"))
+
     def get_json(self, path: str, *, accepted_statuses: set[int] | None = None) -> dict[str, Any]:
         return self._request_json("GET", path, accepted_statuses=accepted_statuses)
 
     def probe_json(self, path: str, *, accepted_statuses: set[int] | None = None) -> dict[str, Any]:
         accepted = accepted_statuses or {200}
-        request = urllib.request.Request(
-            f"{self.base_url.rstrip('/')}/{path.lstrip('/')}",
-            headers={"Authorization": f"Bearer {self.token}"},
-            method="GET",
-        )
         try:
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                return {"httpStatus": int(response.status), "body": json.loads(response.read().decode("utf-8"))}
-        except urllib.error.HTTPError as exc:
-            response_payload = exc.read().decode("utf-8", errors="replace")
-            if exc.code in accepted:
-                return {"httpStatus": int(exc.code), "body": json.loads(response_payload or "{}")}
-            return {
-                "httpStatus": int(exc.code),
-                "body": _decode_json_object(response_payload),
-                "error": {
-                    "reasonCode": "RUNNER_HTTP_ERROR",
-                    "message": str(exc),
-                    "errorType": type(exc).__name__,
-                },
-            }
-        except urllib.error.URLError as exc:
-            return _runner_unreachable_probe(exc)
-        except (http.client.RemoteDisconnected, ConnectionError, OSError) as exc:
-            return _runner_unreachable_probe(exc)
+            exchange = self._open("GET", path, headers=self._headers(None))
+            response_payload = self._read(exchange).decode("utf-8", errors="replace")
+        except RemoteRunnerClientError as exc:
+            return _runner_unreachable_probe(exc.__cause__ or exc)
+        if 200 <= exchange.status < 300 or exchange.status in accepted:
+            return {"httpStatus": exchange.status, "body": json.loads(response_payload or "{}")}
+        return {
+            "httpStatus": exchange.status,
+            "body": _decode_json_object(response_payload),
+            "error": {
+                "reasonCode": "RUNNER_HTTP_ERROR",
+                "message": f"HTTP Error {exchange.status}: {exchange.reason}",
+                "errorType": "HTTPError",
+            },
+        }
 
     def post_json(
         self,
@@ -221,6 +234,21 @@ class RemoteRunnerHttpClient:
         return self._request_bytes("GET", path)
 
 
+def _iter_response_chunks(exchange: RunnerHttpExchange) -> Iterator[bytes]:
+    try:
+        yield from exchange.iter_chunks(STREAM_CHUNK_BYTES)
+    except (http.client.HTTPException, ConnectionError, OSError) as exc:
+        raise RemoteRunnerClientError(str(exc) or "runner stream interrupted") from exc
+
+
+def _http_status_error(status_code: int, response_payload: str) -> RemoteRunnerClientError:
+    detail = _http_error_detail(response_payload)
+    message = f"runner http error {status_code}"
+    if detail:
+        message = f"{message}: {detail}"
+    return RemoteRunnerClientError(message, status_code=status_code, detail=_http_error_detail_value(response_payload))
+
+
 def _decode_json_object(payload: str) -> dict[str, Any] | None:
     try:
         decoded = json.loads(payload or "{}")
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shlex
+import tarfile
+import tempfile
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from core.remote_runner.artifact_io import artifact_cache_root
+from core.remote_runner.artifact_models import RemoteRunnerArtifactError
+
+DELTA_MANIFEST_SCHEMA = "h2ometa.remote-runner-delta-manifest.v1"
+# Written into each assembled release; blob GC keeps whatever any release still lists.
+RELEASE_MANIFEST_NAME = ".h2ometa-delta-manifest.json"
+DEPLOY_MODE_ARCHIVE = "archive"
+DEPLOY_MODE_DELTA = "delta"
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+_READ_CHUNK_BYTES = 1024 * 1024
+
+
+def configured_deploy_mode() -> str:
+    raw = str(os.environ.get("H2OMETA_REMOTE_RUNNER_DEPLOY_MODE", "") or "").strip().lower()
+    if not raw:
+        return DEPLOY_MODE_ARCHIVE
+    if raw not in {DEPLOY_MODE_ARCHIVE, DEPLOY_MODE_DELTA}:
+        raise ValueError("REMOTE_RUNNER_DEPLOY_MODE_INVALID")
+    return raw
+
+
+def delta_cache_root() -> Path:
+    return artifact_cache_root() / "remote-runner-delta"
+
+
+def local_blob_path(cache_root: Path, sha256: str) -> Path:
+    return cache_root / "blobs" / sha256[:2] / sha256
+
+
+def load_or_build_delta_manifest(
+    archive_path: Path,
+    *,
+    archive_sha256: str,
+    cache_root: Path | None = None,
+) -> tuple[dict[str, Any], Path]:
+    """Split a runner bundle into sha256-addressed blobs plus a manifest of the tree.
+
+    The manifest is cached per archive digest, so an unchanged bundle is never
+    re-read; blobs are shared across archives, so a new version only writes the
+    files that actually changed.
+    """
+    root = cache_root or delta_cache_root()
+    if not _SHA256_RE.match(archive_sha256):
+        raise RemoteRunnerArtifactError("remote runner delta deploy requires the archive sha256")
+    manifest_path = root / "manifests" / f"{archive_sha256}.json"
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if all(local_blob_path(root, sha).exists() for sha in manifest_blob_digests(manifest)):
+            return manifest, manifest_path
+    entries: list[dict[str, Any]] = []
+    try:
+        with tarfile.open(archive_path, "r:gz") as archive:
+            for member in archive:
+                name = _member_path(member.name, archive_path)
+                if name is None:
+                    continue
+                entries.append(_manifest_entry(archive, member, name, root))
+    except (OSError, EOFError, tarfile.TarError) as exc:
+        raise RemoteRunnerArtifactError(
+            f"remote runner artifact is unreadable for delta deploy: {archive_path}"
+        ) from exc
+    entries.sort(key=lambda entry: entry["path"])
+    symlinks = {entry["path"] for entry in entries if entry["type"] == "symlink"}
+    for entry in entries:
+        # The remote side assembles in manifest order; never write through a symlinked directory.
+        if any(parent.as_posix() in symlinks for parent in PurePosixPath(entry["path"]).parents):
+            raise RemoteRunnerArtifactError(f"remote runner artifact nests files under a symlink: {archive_path}")
+    files = [entry for entry in entries if entry["type"] == "file"]
+    manifest = {
+        "schemaVersion": DELTA_MANIFEST_SCHEMA,
+        "archiveSha256": archive_sha256,
+        "entries": entries,
+        "fileCount": len(files),
+        "blobCount": len({entry["sha256"] for entry in files}),
+        "totalBytes": sum(int(entry["size"]) for entry in files),
+    }
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(manifest, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+    return manifest, manifest_path
+
+
+def manifest_blob_digests(manifest: dict[str, Any]) -> set[str]:
+    return {str(entry["sha256"]) for entry in manifest.get("entries", []) if entry.get("type") == "file"}
+
+
+def write_blob_archive(cache_root: Path, digests: list[str], destination: Path) -> int:
+    """Pack the given blobs as ``<aa>/<sha256>`` members; returns their total size."""
+    total = 0
+    with tarfile.open(destination, "w:gz", compresslevel=6) as archive:
+        for sha256 in sorted(digests):
+            path = local_blob_path(cache_root, sha256)
+            archive.add(path, arcname=f"{sha256[:2]}/{sha256}", recursive=False)
+            total += path.stat().st_size
+    return total
+
+
+def _member_path(raw_name: str, archive_path: Path) -> str | None:
+    normalized = raw_name.replace("\\", "/")
+    while normalized.startswith("./"):
+        normalized = normalized[2:]
+    normalized = normalized.rstrip("/")
+    if normalized in {"", "."}:
+        return None
+    posix_name = PurePosixPath(normalized)
+    if normalized.startswith("/") or posix_name.is_absolute() or ".." in posix_name.parts:
+        raise RemoteRunnerArtifactError(f"remote runner artifact has unsafe tar member: {archive_path}")
+    return posix_name.as_posix()
+
+
+def _manifest_entry(
+    archive: tarfile.TarFile,
+    member: tarfile.TarInfo,
+    name: str,
+    cache_root: Path,
+) -> dict[str, Any]:
+    mode = member.mode & 0o7777
+    if member.isdir():
+        return {"path": name, "type": "dir", "mode": mode}
+    if member.issym():
+        return {"path": name, "type": "symlink", "target": member.linkname}
+    if not (member.isfile() or member.islnk()):
+        raise RemoteRunnerArtifactError(f"remote runner artifact has unsupported member type: {name}")
+    source = archive.extractfile(member)
+    if source is None:
+        raise RemoteRunnerArtifactError(f"remote runner artifact member is unreadable: {name}")
+    sha256, size = _store_blob(source, cache_root)
+    return {"path": name, "type": "file", "mode": mode, "sha256": sha256, "size": size}
+
+
+def _store_blob(source: Any, cache_root: Path) -> tuple[str, int]:
+    staging = cache_root / "blobs" / "incoming"
+    staging.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(dir=staging, delete=False) as handle:
+        tmp_path = Path(handle.name)
+        for chunk in iter(lambda: source.read(_READ_CHUNK_BYTES), b""):
+            digest.update(chunk)
+            handle.write(chunk)
+            size += len(chunk)
+    sha256 = digest.hexdigest()
+    target = local_blob_path(cache_root, sha256)
+    if target.exists():
+        tmp_path.unlink()
+    else:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, target)
+    return sha256, size
+
+
+# Runs on the server with the system python3 (the same dependency the uninstall flow uses).
+REMOTE_DELTA_SCRIPT = r"""
+import hashlib, json, os, re, shutil, sys, tarfile
+MANIFEST_NAME = ".h2ometa-delta-manifest.json"
+mode, manifest_path, store = sys.argv[1:4]
+with open(manifest_path, encoding="utf-8") as handle:
+    manifest = json.load(handle)
+def blob(sha):
+    return os.path.join(store, sha[:2], sha)
+def safe(path):
+    parts = path.split("/")
+    if not path or path.startswith("/") or ".." in parts:
+        raise SystemExit("unsafe manifest path: " + path)
+    return path
+digests = sorted({e["sha256"] for e in manifest["entries"] if e["type"] == "file"})
+missing = [sha for sha in digests if not os.path.isfile(blob(sha))]
+if mode == "missing":
+    print(json.dumps({"missing": missing}))
+    raise SystemExit(0)
+release, incoming, releases_root = sys.argv[4:7]
+ingested = 0
+if incoming and os.path.exists(incoming):
+    with tarfile.open(incoming, "r:gz") as archive:
+        for member in archive:
+            sha = os.path.basename(member.name)
+            if not member.isfile() or not re.fullmatch(r"[0-9a-f]{64}", sha):
+                continue
+            target = blob(sha)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            digest = hashlib.sha256()
+            with archive.extractfile(member) as src, open(target + ".tmp", "wb") as dst:
+                for chunk in iter(lambda: src.read(1 << 20), b""):
+                    digest.update(chunk)
+                    dst.write(chunk)
+            if digest.hexdigest() != sha:
+                os.unlink(target + ".tmp")
+                raise SystemExit("blob checksum mismatch: " + sha)
+            os.chmod(target + ".tmp", 0o444)
+            os.replace(target + ".tmp", target)
+            ingested += 1
+    os.unlink(incoming)
+missing = [sha for sha in digests if not os.path.isfile(blob(sha))]
+if missing:
+    raise SystemExit("missing %d blobs after upload" % len(missing))
+staging = release + ".assembling"
+shutil.rmtree(staging, ignore_errors=True)
+os.makedirs(staging)
+directories = []
+for entry in manifest["entries"]:
+    path = os.path.join(staging, safe(entry["path"]))
+    if entry["type"] == "dir":
+        os.makedirs(path, exist_ok=True)
+        directories.append((path, entry["mode"]))
+        continue
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if entry["type"] == "symlink":
+        os.symlink(entry["target"], path)
+    else:
+        shutil.copyfile(blob(entry["sha256"]), path)
+        os.chmod(path, entry["mode"])
+for path, dir_mode in reversed(directories):
+    os.chmod(path, dir_mode | 0o700)
+for name in os.listdir(staging):
+    if name.endswith(".sh"):
+        os.chmod(os.path.join(staging, name), 0o755)
+with open(os.path.join(staging, MANIFEST_NAME), "w", encoding="utf-8") as handle:
+    json.dump(manifest, handle, separators=(",", ":"))
+shutil.rmtree(release, ignore_errors=True)
+os.rename(staging, release)
+referenced = set()
+for name in os.listdir(releases_root):
+    listed = os.path.join(releases_root, name, MANIFEST_NAME)
+    if os.path.isfile(listed):
+        with open(listed, encoding="utf-8") as handle:
+            referenced.update(e["sha256"] for e in json.load(handle)["entries"] if e["type"] == "file")
+removed = 0
+for prefix in os.listdir(store):
+    for sha in os.listdir(os.path.join(store, prefix)):
+        if sha not in referenced:
+            os.unlink(os.path.join(store, prefix, sha))
+            removed += 1
+print(json.dumps({"ingestedBlobs": ingested, "files": len(manifest["entries"]), "gcRemovedBlobs": removed}))
+"""
+
+
+def remote_delta_command(*args: str) -> str:
+    quoted = " ".join(shlex.quote(arg) for arg in args)
+    return f"python3 - {quoted} <<'H2OMETA_DELTA_DEPLOY'\n{REMOTE_DELTA_SCRIPT.strip()}\nH2OMETA_DELTA_DEPLOY"
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+import http.client
+import os
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+DEFAULT_MAX_IDLE_PER_HOST = 4
+# Below uvicorn's 5 s keep-alive so an idle socket is dropped here before the runner closes it.
+DEFAULT_IDLE_TIMEOUT_SECONDS = 4.0
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+# A reused socket the runner or the SSH tunnel already closed fails with one of these.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+_PHASES = ("connect", "firstByte", "body")
+
+PoolKey = tuple[str, str, int]
+
+
+class RunnerHttpTransportStats:
+    """Connection reuse counters and per-phase timings for runner HTTP calls."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters = {
+                "requests": 0,
+                "newConnections": 0,
+                "reusedConnections": 0,
+                "staleRetries": 0,
+                "idleEvictions": 0,
+            }
+            self._phases = {phase: [0, 0.0, 0.0] for phase in _PHASES}
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def observe(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._phases[phase]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            phases = {
+                f"{phase}Seconds": {
+                    "count": count,
+                    "totalSeconds": round(total, 6),
+                    "meanSeconds": round(total / count, 6) if count else 0.0,
+                    "maxSeconds": round(maximum, 6),
+                }
+                for phase, (count, total, maximum) in self._phases.items()
+            }
+            return {**self._counters, **phases}
+
+
+@dataclass
+class _IdleConnection:
+    connection: http.client.HTTPConnection
+    released_at: float
+
+
+class RunnerHttpExchange:
+    """One request's response; reading it to the end hands the connection back to the pool."""
+
+    def __init__(
+        self,
+        pool: RunnerHttpConnectionPool,
+        key: PoolKey,
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+        timing: dict[str, Any],
+    ) -> None:
+        self.status = int(response.status)
+        self.reason = str(response.reason or "")
+        self.headers = {key.lower(): value for key, value in response.getheaders()}
+        self.timing = timing
+        self._pool = pool
+        self._key = key
+        self._connection: http.client.HTTPConnection | None = connection
+        self._response = response
+
+    def read(self) -> bytes:
+        started = time.perf_counter()
+        try:
+            body = self._response.read()
+        except BaseException:
+            self.close()
+            raise
+        self._record_body(time.perf_counter() - started)
+        self.close()
+        return body
+
+    def iter_chunks(self, chunk_bytes: int) -> Iterator[bytes]:
+        started = time.perf_counter()
+        try:
+            while True:
+                chunk = self._response.read1(chunk_bytes)
+                if not chunk:
+                    self._record_body(time.perf_counter() - started)
+                    return
+                yield chunk
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        # read1() stops at Content-Length without marking the response closed.
+        if self._response.length == 0:
+            self._response.close()
+        if self._response.isclosed() and not self._response.will_close:
+            self._pool.release(self._key, connection)
+        else:
+            self._response.close()
+            connection.close()
+
+    def _record_body(self, seconds: float) -> None:
+        self.timing["bodySeconds"] = round(seconds, 6)
+        self._pool.stats.observe("body", seconds)
+
+
+class RunnerHttpConnectionPool:
+    """Keep-alive ``http.client`` connections per runner endpoint.
+
+    Each ``scheme://host:port`` keeps up to ``max_idle_per_host`` idle
+    connections; busier callers open extra ones that are closed on release.
+    Idle connections older than ``idle_timeout_seconds`` are evicted, and a
+    reused connection that turns out to be closed is retried once on a fresh
+    one when the request is safe to repeat.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_host: int | None = None,
+        idle_timeout_seconds: float | None = None,
+        stats: RunnerHttpTransportStats | None = None,
+    ) -> None:
+        self.max_idle_per_host = (
+            configured_max_idle_per_host() if max_idle_per_host is None else int(max_idle_per_host)
+        )
+        self.idle_timeout_seconds = (
+            configured_idle_timeout_seconds() if idle_timeout_seconds is None else float(idle_timeout_seconds)
+        )
+        if self.max_idle_per_host < 0:
+            raise ValueError("RUNNER_HTTP_POOL_SIZE_INVALID")
+        if self.idle_timeout_seconds < 0:
+            raise ValueError("RUNNER_HTTP_POOL_IDLE_TIMEOUT_INVALID")
+        self.stats = stats or RunnerHttpTransportStats()
+        self._lock = threading.Lock()
+        self._idle: dict[PoolKey, list[_IdleConnection]] = {}
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        body: bytes | None,
+        timeout: float,
+    ) -> RunnerHttpExchange:
+        key, target = _split_url(url)
+        retry_safe = method.upper() in IDEMPOTENT_METHODS or any(
+            name.lower() == "idempotency-key" for name in headers
+        )
+        self.stats.count("requests")
+        while True:
+            connection, reused = self._checkout(key, timeout)
+            timing: dict[str, Any] = {"reused": reused, "connectSeconds": 0.0}
+            sent = False
+            try:
+                if connection.sock is None:
+                    started = time.perf_counter()
+                    connection.connect()
+                    connect_seconds = time.perf_counter() - started
+                    timing["connectSeconds"] = round(connect_seconds, 6)
+                    self.stats.observe("connect", connect_seconds)
+                started = time.perf_counter()
+                connection.request(method, target, body=body, headers=headers)
+                sent = True
+                response = connection.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                connection.close()
+                if reused and (retry_safe or not sent):
+                    self.stats.count("staleRetries")
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            first_byte = time.perf_counter() - started
+            timing["firstByteSeconds"] = round(first_byte, 6)
+            self.stats.observe("firstByte", first_byte)
+            return RunnerHttpExchange(self, key, connection, response, timing)
+
+    def release(self, key: PoolKey, connection: http.client.HTTPConnection) -> None:
+        if connection.sock is None:
+            return
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(_IdleConnection(connection, time.monotonic()))
+                return
+        connection.close()
+
+    def idle_connections(self, key: PoolKey | None = None) -> int:
+        with self._lock:
+            if key is not None:
+                return len(self._idle.get(key, []))
+            return sum(len(items) for items in self._idle.values())
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for items in idle.values():
+            for item in items:
+                item.connection.close()
+
+    def _checkout(self, key: PoolKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        evicted: list[http.client.HTTPConnection] = []
+        reusable: http.client.HTTPConnection | None = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                item = idle.pop()
+                if now - item.released_at > self.idle_timeout_seconds:
+                    evicted.append(item.connection)
+                    continue
+                reusable = item.connection
+                break
+            # Anything older than the connection we took is older still; drop it too.
+            expired = [item for item in idle if now - item.released_at > self.idle_timeout_seconds]
+            if expired:
+                idle[:] = [item for item in idle if item not in expired]
+                evicted.extend(item.connection for item in expired)
+        for connection in evicted:
+            connection.close()
+            self.stats.count("idleEvictions")
+        if reusable is not None:
+            reusable.timeout = timeout
+            if reusable.sock is not None:
+                reusable.sock.settimeout(timeout)
+            self.stats.count("reusedConnections")
+            return reusable, True
+        scheme, host, port = key
+        factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        self.stats.count("newConnections")
+        return factory(host, port, timeout=timeout), False
+
+
+_POOL: RunnerHttpConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_runner_http_pool() -> RunnerHttpConnectionPool:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = RunnerHttpConnectionPool()
+        return _POOL
+
+
+def runner_http_transport_stats() -> dict[str, Any]:
+    pool = get_runner_http_pool()
+    return {**pool.stats.snapshot(), "idleConnections": pool.idle_connections()}
+
+
+def reset_runner_http_transport_stats() -> None:
+    get_runner_http_pool().stats.reset()
+
+
+def configured_max_idle_per_host() -> int:
+    raw = str(os.environ.get("H2OMETA_RUNNER_HTTP_POOL_SIZE", "") or "").strip()
+    try:
+        return int(raw) if raw else DEFAULT_MAX_IDLE_PER_HOST
+    except ValueError as exc:
+        raise ValueError("RUNNER_HTTP_POOL_SIZE_INVALID") from exc
+
+
+def configured_idle_timeout_seconds() -> float:
+    raw = str(os.environ.get("H2OMETA_RUNNER_HTTP_POOL_IDLE_SECONDS", "") or "").strip()
+    try:
+        return float(raw) if raw else DEFAULT_IDLE_TIMEOUT_SECONDS
+    except ValueError as exc:
+        raise ValueError("RUNNER_HTTP_POOL_IDLE_TIMEOUT_INVALID") from exc
+
+
+def _split_url(url: str) -> tuple[PoolKey, str]:
+    parsed = urlsplit(url)
+    scheme = (parsed.scheme or "http").lower()
+    if scheme not in {"http", "https"} or not parsed.hostname:
+        raise ValueError(f"RUNNER_HTTP_URL_UNSUPPORTED: {url}")
+    port = parsed.port or (443 if scheme == "https" else 80)
+    target = parsed.path or "/"
+    if parsed.query:
+        target = f"{target}?{parsed.query}"
+    return (scheme, parsed.hostname, port), target
@@ -76,6 +76,12 @@ class RemoteRunnerBootstrapLayout:
     def workflow_runtime_bundle(self, *, version: str, platform: str) -> str:
         return f"{self.tools}/workflow-runtime-{version}-{platform}.tar.gz"
 
+    def delta_blob_store(self) -> str:
+        return f"{self.root}/blobs/sha256"
+
+    def delta_manifest(self) -> str:
+        return self.bundle.removesuffix(".tar.gz") + ".delta-manifest.json"
+
     def remote_directories(self) -> tuple[str, ...]:
         return (
             f"{self.root}/releases",
@@ -3,7 +3,12 @@ from __future__ import annotations
 from typing import Any
 
 from config import resolve_runner_token
-from core.contracts.remote_endpoints import EXECUTION_LIFECYCLE_GUARD, EXECUTION_LIFECYCLE_GUARD_RELEASE
+from core.contracts.remote_endpoints import (
+    EXECUTION_LIFECYCLE_GUARD,
+    EXECUTION_LIFECYCLE_GUARD_RELEASE,
+    RUN_UPDATES_STREAM,
+    render_remote_endpoint_path,
+)
 from core.remote_runner.bundle import REMOTE_RUNNER_VERSION
 from core.remote_runner.client import RemoteRunnerClientError, RemoteRunnerConflictError, RemoteRunnerHttpClient
 from core.remote_runner.diagnostics import (
@@ -16,6 +21,9 @@ from core.remote_runner.endpoint_caller import call_remote_endpoint as execute_r
 from core.remote_runner.health import build_runner_health
 from core.remote_runner.layout import remote_runner_bootstrap_layout
 
+# Must exceed the runner's keepalive interval so an idle update stream is not cut off.
+RUN_UPDATE_STREAM_READ_TIMEOUT_SECONDS = 60
+
 
 def _is_manager_error(exc: Exception) -> bool:
     return exc.__class__.__name__ == "RemoteRunnerManagerError"
@@ -58,6 +66,21 @@ class RemoteRunnerProxyMixin:
             extra_headers=kwargs.get("extra_headers"),
         )
 
+    def open_run_update_stream(self, **kwargs) -> dict[str, Any]:
+        client = self._get_client(
+            server_id=str(kwargs["server_id"]),
+            ssh_service=kwargs["ssh_service"],
+            record=kwargs["server_record"],
+            timeout=RUN_UPDATE_STREAM_READ_TIMEOUT_SECONDS,
+        )
+        path = render_remote_endpoint_path(
+            RUN_UPDATES_STREAM,
+            {"run_id": kwargs["run_id"]},
+            query_values={"stdoutCursor": kwargs.get("stdout_cursor"), "stderrCursor": kwargs.get("stderr_cursor")},
+        )
+        last_event_id = str(kwargs.get("last_event_id") or "").strip()
+        return client.stream_bytes(path, extra_headers={"Last-Event-ID": last_event_id} if last_event_id else None)
+
     def get_health(self, **kwargs) -> dict[str, Any]:
         return self._get_health_with_runtime_state_resync(
             server_id=str(kwargs["server_id"]),
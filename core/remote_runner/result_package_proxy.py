@@ -5,6 +5,10 @@ from typing import Any
 from core.contracts.remote_endpoints import render_remote_endpoint_path
 from core.contracts.result_package_remote_endpoints import RESULT_PACKAGE_DOWNLOAD
 
+# Byte-range requests are forwarded verbatim so an interrupted download can
+# resume; the runner answers 416 when the range no longer fits the package.
+RESULT_PACKAGE_RANGE_HEADERS = {"range_header": "Range", "if_range": "If-Range"}
+
 
 class RemoteRunnerResultPackageProxyMixin:
     def _result_package_client(self, kwargs: dict[str, Any]):
@@ -27,3 +31,19 @@ class RemoteRunnerResultPackageProxyMixin:
             },
         )
         return client.download_bytes(path)
+
+    def open_result_package_download_stream(self, **kwargs) -> dict[str, Any]:
+        client = self._result_package_client({**kwargs, "timeout": 60})
+        path = render_remote_endpoint_path(
+            RESULT_PACKAGE_DOWNLOAD,
+            {
+                "result_id": kwargs["result_id"],
+                "package_export_id": kwargs["package_export_id"],
+            },
+        )
+        headers = {
+            header: str(kwargs[key]).strip()
+            for key, header in RESULT_PACKAGE_RANGE_HEADERS.items()
+            if str(kwargs.get(key) or "").strip()
+        }
+        return client.stream_bytes(path, extra_headers=headers or None, accepted_statuses={416})
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import runpy
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "apps" / "remote_runner" / "pipelines" / "moving-pictures-16s-rulegraph-v1" / "workflow" / "scripts"
+
+
+def write_demultiplexed_reads(path: Path, *, reads: int, read_length: int, seed: int = 16) -> None:
+    rng = random.Random(seed)
+    samples = [f"sample-{index}" for index in range(8)]
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write("sample_id\tsequence\tquality\n")
+        for _ in range(reads):
+            length = rng.randint(read_length // 2, read_length)
+            sequence = "".join(rng.choice("ACGT") for _ in range(length))
+            floor = rng.randint(2, 30)
+            quality = "".join(chr(33 + rng.randint(floor, 41)) for _ in range(length))
+            handle.write(f"{rng.choice(samples)}\t{sequence}\t{quality}\n")
+
+
+def legacy_quality_filter(reads_path: Path, output_path: Path, *, min_mean_quality: int, min_length: int) -> None:
+    """The per-read, per-character filter the pipeline shipped before the batch engine."""
+    with reads_path.open("r", encoding="utf-8", errors="replace") as source, output_path.open(
+        "w", encoding="utf-8", newline=""
+    ) as target:
+        target.write("sample_id\tsequence\n")
+        next(source, None)
+        for line in source:
+            sample_id, sequence, quality = line.rstrip("\n").split("\t", 2)
+            if len(sequence) < min_length:
+                continue
+            mean = sum(ord(char) - 33 for char in quality) / len(quality) if quality else 0.0
+            if mean < min_mean_quality:
+                continue
+            target.write(f"{sample_id}\t{sequence}\n")
+
+
+def batch_quality_filter(
+    reads_path: Path,
+    output_path: Path,
+    qc_path: Path,
+    *,
+    min_mean_quality: int,
+    min_length: int,
+) -> None:
+    outputs = SimpleNamespace(reads=str(output_path), qc=str(qc_path))
+    saved_path, saved_common = list(sys.path), sys.modules.pop("common", None)
+    try:
+        runpy.run_path(
+            str(SCRIPTS_DIR / "quality_filter.py"),
+            init_globals={
+                "snakemake": SimpleNamespace(
+                    config={"params": {"min_mean_quality": min_mean_quality, "min_length": min_length}},
+                    input=SimpleNamespace(reads=str(reads_path)),
+                    output=outputs,
+                    scriptdir=str(SCRIPTS_DIR),
+                )
+            },
+        )
+    finally:
+        # The pipeline scripts import a bare ``common``; keep it from shadowing other script dirs.
+        sys.path[:] = saved_path
+        sys.modules.pop("common", None)
+        if saved_common is not None:
+            sys.modules["common"] = saved_common
+
+
+def run_benchmark(
+    work_dir: Path,
+    *,
+    reads: int,
+    read_length: int = 250,
+    min_mean_quality: int = 20,
+    min_length: int = 120,
+) -> dict[str, Any]:
+    reads_path = work_dir / "demultiplexed.tsv"
+    write_demultiplexed_reads(reads_path, reads=reads, read_length=read_length)
+    legacy_path = work_dir / "legacy-filtered.tsv"
+    batch_path = work_dir / "batch-filtered.tsv"
+
+    started = time.perf_counter()
+    legacy_quality_filter(reads_path, legacy_path, min_mean_quality=min_mean_quality, min_length=min_length)
+    legacy_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    batch_quality_filter(
+        reads_path,
+        batch_path,
+        work_dir / "batch-qc.tsv",
+        min_mean_quality=min_mean_quality,
+        min_length=min_length,
+    )
+    batch_seconds = time.perf_counter() - started
+
+    common = runpy.run_path(str(SCRIPTS_DIR / "common.py"))
+    return {
+        "schemaVersion": "h2ometa.fastq-quality-engine-benchmark.v1",
+        "reads": reads,
+        "readLength": read_length,
+        "engine": "numpy" if common["np"] is not None else "python",
+        "identicalOutput": legacy_path.read_bytes() == batch_path.read_bytes(),
+        "legacyReadsPerSecond": round(reads / legacy_seconds, 1) if legacy_seconds else None,
+        "batchReadsPerSecond": round(reads / batch_seconds, 1) if batch_seconds else None,
+        "speedup": round(legacy_seconds / batch_seconds, 2) if batch_seconds else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare the moving-pictures quality_filter batch engine against the legacy per-read loop."
+    )
+    parser.add_argument("--reads", type=int, default=200_000)
+    parser.add_argument("--read-length", type=int, default=250)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory(prefix="h2ometa-fastq-bench-") as work_dir:
+        result = run_benchmark(Path(work_dir), reads=max(1, args.reads), read_length=max(2, args.read_length))
+    print(json.dumps(result, indent=2))
+    return 0 if result["identicalOutput"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
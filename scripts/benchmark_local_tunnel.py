@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import select
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import paramiko
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.remote.local_tunnel import LocalTunnel  # noqa: E402
+from core.remote.tunnel_forwarder import MIB, TunnelSettings  # noqa: E402
+
+
+class PayloadServer:
+    """Loopback target behind the tunnel.
+
+    ``GET <n>\\n`` streams ``n`` bytes back; ``PUT <n>\\n`` reads ``n`` bytes
+    and answers with their SHA-256.
+    """
+
+    def __init__(self) -> None:
+        self._listener = socket.create_server(("127.0.0.1", 0))
+        self.port = int(self._listener.getsockname()[1])
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _peer = self._listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    @staticmethod
+    def _handle(conn: socket.socket) -> None:
+        with conn, conn.makefile("rb") as reader:
+            while True:
+                line = reader.readline()
+                if not line:
+                    return
+                verb, size = line.decode("ascii").split()
+                remaining = int(size)
+                if verb == "GET":
+                    block = b"\xa5" * MIB
+                    while remaining:
+                        chunk = block[: min(remaining, len(block))]
+                        conn.sendall(chunk)
+                        remaining -= len(chunk)
+                    continue
+                digest = hashlib.sha256()
+                while remaining:
+                    chunk = reader.read(min(remaining, MIB))
+                    if not chunk:
+                        return
+                    digest.update(chunk)
+                    remaining -= len(chunk)
+                conn.sendall(digest.hexdigest().encode("ascii") + b"\n")
+
+    def close(self) -> None:
+        self._listener.close()
+
+
+class _StandInServerInterface(paramiko.ServerInterface):
+    def __init__(self) -> None:
+        # paramiko passes the direct-tcpip destination only to this hook; keep it per channel id.
+        self.destinations: dict[int, tuple[str, int]] = {}
+
+    def get_allowed_auths(self, username: str) -> str:
+        return "none"
+
+    def check_auth_none(self, username: str) -> int:
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_channel_request(self, kind: str, chanid: int) -> int:
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_direct_tcpip_request(self, chanid: int, origin: Any, destination: Any) -> int:
+        self.destinations[chanid] = (str(destination[0]), int(destination[1]))
+        return paramiko.OPEN_SUCCEEDED
+
+
+class SshServerStandIn:
+    """In-process paramiko SSH server that honours ``direct-tcpip`` like sshd does.
+
+    It encrypts and flow-controls exactly like a real SSH hop, so tunnel
+    throughput measured through it includes the paramiko channel overhead.
+    """
+
+    _host_key: paramiko.RSAKey | None = None
+
+    def __init__(self) -> None:
+        if SshServerStandIn._host_key is None:
+            SshServerStandIn._host_key = paramiko.RSAKey.generate(1024)
+        self._listener = socket.create_server(("127.0.0.1", 0))
+        self.port = int(self._listener.getsockname()[1])
+        self._transports: list[paramiko.Transport] = []
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _peer = self._listener.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(conn)
+            transport.add_server_key(self._host_key)
+            interface = _StandInServerInterface()
+            transport.start_server(server=interface)
+            self._transports.append(transport)
+            threading.Thread(target=self._accept_channels, args=(transport, interface), daemon=True).start()
+
+    @staticmethod
+    def _accept_channels(transport: paramiko.Transport, interface: _StandInServerInterface) -> None:
+        while transport.is_active():
+            channel = transport.accept(timeout=0.5)
+            if channel is None:
+                continue
+            host, port = interface.destinations.pop(channel.get_id())
+            threading.Thread(target=_pump_channel, args=(channel, host, port), daemon=True).start()
+
+    def connect(self) -> paramiko.Transport:
+        transport = paramiko.Transport(socket.create_connection(("127.0.0.1", self.port)))
+        transport.start_client(timeout=10)
+        transport.auth_none("benchmark")
+        return transport
+
+    def close(self) -> None:
+        self._listener.close()
+        for transport in self._transports:
+            transport.close()
+
+
+def _pump_channel(channel: paramiko.Channel, host: str, port: int) -> None:
+    with socket.create_connection((host, port)) as target:
+        try:
+            while True:
+                readable, _, _ = select.select([channel, target], [], [], 1.0)
+                if channel in readable:
+                    data = channel.recv(MIB)
+                    if not data:
+                        target.shutdown(socket.SHUT_WR)
+                        break
+                    target.sendall(data)
+                if target in readable:
+                    data = target.recv(MIB)
+                    if not data:
+                        break
+                    channel.sendall(data)
+            while channel.recv_ready() or not channel.eof_received:
+                readable, _, _ = select.select([target], [], [], 0.5)
+                if target in readable:
+                    data = target.recv(MIB)
+                    if not data:
+                        break
+                    channel.sendall(data)
+        except (OSError, EOFError, paramiko.SSHException):
+            pass
+        finally:
+            channel.close()
+
+
+class LegacyThreadedTunnel:
+    """The previous forwarder: a thread per connection copying 4 KiB at a time."""
+
+    def __init__(self, transport: paramiko.Transport, remote_port: int) -> None:
+        class _Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                channel = transport.open_channel("direct-tcpip", ("127.0.0.1", remote_port), self.request.getpeername())
+                try:
+                    while True:
+                        readable, _, _ = select.select([self.request, channel], [], [], 1.0)
+                        if self.request in readable:
+                            data = self.request.recv(4096)
+                            if not data:
+                                break
+                            channel.sendall(data)
+                        if channel in readable:
+                            data = channel.recv(4096)
+                            if not data:
+                                break
+                            self.request.sendall(data)
+                finally:
+                    channel.close()
+
+        class _Server(socketserver.ThreadingTCPServer):
+            allow_reuse_address = True
+            daemon_threads = True
+
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self.local_port = int(self._server.server_address[1])
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _download(port: int, size_bytes: int) -> int:
+    with socket.create_connection(("127.0.0.1", port)) as conn:
+        conn.sendall(f"GET {size_bytes}\n".encode("ascii"))
+        received = 0
+        while received < size_bytes:
+            chunk = conn.recv(MIB)
+            if not chunk:
+                break
+            received += len(chunk)
+        return received
+
+
+def _upload(port: int, payload: bytes) -> str:
+    with socket.create_connection(("127.0.0.1", port)) as conn:
+        conn.sendall(f"PUT {len(payload)}\n".encode("ascii") + payload)
+        with conn.makefile("rb") as reader:
+            return reader.readline().decode("ascii").strip()
+
+
+def _measure(port: int, *, size_bytes: int, streams: int) -> dict[str, Any]:
+    payload = os.urandom(size_bytes)
+    expected = hashlib.sha256(payload).hexdigest()
+    started = time.perf_counter()
+    downloaded = _download(port, size_bytes)
+    download_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    digest = _upload(port, payload)
+    upload_seconds = time.perf_counter() - started
+
+    per_stream = max(1, size_bytes // streams)
+    results: list[int] = []
+    peak_threads = _forwarding_threads()
+    workers = [threading.Thread(target=lambda: results.append(_download(port, per_stream))) for _ in range(streams)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    while any(worker.is_alive() for worker in workers):
+        peak_threads = max(peak_threads, _forwarding_threads())
+        time.sleep(0.005)
+    parallel_seconds = time.perf_counter() - started
+    return {
+        "downloadMBps": _throughput(downloaded, download_seconds),
+        "uploadMBps": _throughput(size_bytes, upload_seconds),
+        "parallelMBps": _throughput(sum(results), parallel_seconds),
+        "identicalOutput": downloaded == size_bytes and digest == expected and sum(results) == per_stream * streams,
+        "forwardingThreads": peak_threads,
+    }
+
+
+def _forwarding_threads() -> int:
+    # socketserver names its per-connection threads after process_request_thread.
+    return sum(
+        1
+        for thread in threading.enumerate()
+        if thread.name.startswith(("local-tunnel-", "tunnel-")) or "process_request_thread" in thread.name
+    )
+
+
+def run_benchmark(*, size_mb: int, streams: int = 8, settings: TunnelSettings | None = None) -> dict[str, Any]:
+    target = PayloadServer()
+    ssh = SshServerStandIn()
+    transport = ssh.connect()
+    size_bytes = size_mb * MIB
+    try:
+        tunnel = LocalTunnel(
+            name="benchmark",
+            transport=transport,
+            remote_host="127.0.0.1",
+            remote_port=target.port,
+            settings=settings or TunnelSettings(),
+        )
+        tunnel.start()
+        try:
+            engine = _measure(tunnel.local_port, size_bytes=size_bytes, streams=streams)
+            traffic = tunnel.traffic_snapshot()
+        finally:
+            tunnel.close()
+        legacy_tunnel = LegacyThreadedTunnel(transport, target.port)
+        try:
+            legacy = _measure(legacy_tunnel.local_port, size_bytes=size_bytes, streams=streams)
+        finally:
+            legacy_tunnel.close()
+    finally:
+        transport.close()
+        ssh.close()
+        target.close()
+    return {
+        "schemaVersion": "h2ometa.local-tunnel-benchmark.v1",
+        "sizeBytes": size_bytes,
+        "streams": streams,
+        "server": "paramiko-stand-in",
+        "selector": engine,
+        "legacy": legacy,
+        "traffic": traffic,
+        "identicalOutput": engine["identicalOutput"] and legacy["identicalOutput"],
+        "downloadSpeedup": _ratio(engine["downloadMBps"], legacy["downloadMBps"]),
+        "uploadSpeedup": _ratio(engine["uploadMBps"], legacy["uploadMBps"]),
+    }
+
+
+def _throughput(size_bytes: int, seconds: float) -> float | None:
+    return round(size_bytes / MIB / seconds, 1) if seconds else None
+
+
+def _ratio(new: float | None, old: float | None) -> float | None:
+    return round(new / old, 2) if new and old else None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure LocalTunnel throughput through an in-process SSH server against the old threaded copy loop."
+    )
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--streams", type=int, default=8)
+    parser.add_argument("--window-mb", type=int, default=8)
+    parser.add_argument("--max-packet-kb", type=int, default=32)
+    args = parser.parse_args()
+    result = run_benchmark(
+        size_mb=max(1, args.size_mb),
+        streams=max(1, args.streams),
+        settings=TunnelSettings(window_size=args.window_mb * MIB, max_packet_size=args.max_packet_kb * 1024),
+    )
+    print(json.dumps(result, indent=2))
+    return 0 if result["identicalOutput"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# The engine imports minio lazily; load it here so the first timed upload does not pay for it.
+import minio.datatypes  # noqa: E402, F401
+from apps.remote_runner.artifact_s3_transfer import (  # noqa: E402
+    MIB,
+    S3TransferSettings,
+    iter_s3_object_ranges,
+    upload_file_multipart,
+)
+
+
+class _StandInResponse(io.BytesIO):
+    def release_conn(self) -> None:
+        return None
+
+
+class MinioStandIn:
+    """In-memory stand-in for the MinIO client calls the artifact transfer engine makes.
+
+    Each request streams at ``stream_bytes_per_second`` after ``request_latency_seconds``,
+    so a single stream is bandwidth-bound the way one TCP connection to a remote
+    store is. ``fail_part_numbers`` makes the first upload of those parts raise.
+    """
+
+    def __init__(
+        self,
+        *,
+        request_latency_seconds: float = 0.0,
+        stream_bytes_per_second: float = 0.0,
+        list_parts_page_size: int = 1000,
+    ) -> None:
+        self.request_latency_seconds = request_latency_seconds
+        self.stream_bytes_per_second = stream_bytes_per_second
+        self.list_parts_page_size = list_parts_page_size
+        self.objects: dict[tuple[str, str], dict[str, Any]] = {}
+        self.uploads: dict[str, dict[str, Any]] = {}
+        self.fail_part_numbers: set[int] = set()
+        self.corrupt_part_numbers: set[int] = set()
+        self.uploaded_part_numbers: list[int] = []
+        self.ranged_reads: list[tuple[int, int]] = []
+        self._lock = threading.Lock()
+
+    def fput_object(self, bucket: str, object_name: str, file_path: str, *, content_type: str, metadata: dict[str, str]):
+        payload = Path(file_path).read_bytes()
+        self._transfer(len(payload))
+        with self._lock:
+            self.objects[(bucket, object_name)] = {"payload": payload, "contentType": content_type, "metadata": metadata}
+        return SimpleNamespace(bucket_name=bucket, object_name=object_name)
+
+    def stat_object(self, bucket: str, object_name: str):
+        item = self.objects[(bucket, object_name)]
+        return SimpleNamespace(size=len(item["payload"]), metadata=dict(item["metadata"]))
+
+    def get_object(self, bucket: str, object_name: str, offset: int = 0, length: int = 0) -> _StandInResponse:
+        payload = self.objects[(bucket, object_name)]["payload"]
+        end = offset + length if length else len(payload)
+        body = payload[offset:end]
+        with self._lock:
+            self.ranged_reads.append((offset, len(body)))
+        self._transfer(len(body))
+        return _StandInResponse(body)
+
+    def remove_object(self, bucket: str, object_name: str) -> None:
+        self.objects.pop((bucket, object_name), None)
+
+    def _create_multipart_upload(self, bucket: str, object_name: str, headers: dict[str, str]) -> str:
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self.uploads[upload_id] = {
+                "bucket": bucket,
+                "objectName": object_name,
+                "headers": dict(headers),
+                "parts": {},
+                "initiated": time.time(),
+            }
+        return upload_id
+
+    def _upload_part(
+        self,
+        bucket: str,
+        object_name: str,
+        data: bytes,
+        headers: dict[str, str] | None,
+        upload_id: str,
+        part_number: int,
+    ) -> str:
+        with self._lock:
+            if part_number in self.fail_part_numbers:
+                self.fail_part_numbers.discard(part_number)
+                raise ConnectionError(f"injected failure for part {part_number}")
+        self._transfer(len(data))
+        digest = hashlib.md5(data, usedforsecurity=False)
+        expected = (headers or {}).get("Content-MD5")
+        if expected is not None and expected != base64.b64encode(digest.digest()).decode("ascii"):
+            raise ValueError("BadDigest")
+        etag = digest.hexdigest()
+        with self._lock:
+            if part_number in self.corrupt_part_numbers:
+                etag = hashlib.md5(data + b"!", usedforsecurity=False).hexdigest()
+            self.uploads[upload_id]["parts"][part_number] = (bytes(data), etag)
+            self.uploaded_part_numbers.append(part_number)
+        return f'"{etag}"'
+
+    def _list_parts(
+        self,
+        bucket: str,
+        object_name: str,
+        upload_id: str,
+        max_parts: int | None = None,
+        part_number_marker: str | None = None,
+    ):
+        parts = sorted(self.uploads[upload_id]["parts"].items())
+        marker = int(part_number_marker or 0)
+        remaining = [(number, item) for number, item in parts if number > marker]
+        page = remaining[: max_parts or self.list_parts_page_size]
+        truncated = len(page) < len(remaining)
+        return SimpleNamespace(
+            parts=[SimpleNamespace(part_number=number, etag=f'"{etag}"', size=len(data)) for number, (data, etag) in page],
+            is_truncated=truncated,
+            next_part_number_marker=str(page[-1][0]) if truncated else None,
+        )
+
+    def _list_multipart_uploads(self, bucket: str, prefix: str | None = None, **_kwargs: Any):
+        with self._lock:
+            uploads = [
+                SimpleNamespace(object_name=item["objectName"], upload_id=upload_id, initiated_time=item["initiated"])
+                for upload_id, item in self.uploads.items()
+                if item["bucket"] == bucket and item["objectName"].startswith(prefix or "")
+            ]
+        return SimpleNamespace(uploads=uploads, is_truncated=False)
+
+    def _complete_multipart_upload(self, bucket: str, object_name: str, upload_id: str, parts: list[Any]):
+        with self._lock:
+            upload = self.uploads.pop(upload_id)
+        stored = upload["parts"]
+        for part in parts:
+            if stored[part.part_number][1] != str(part.etag).strip('"'):
+                raise ValueError("InvalidPart")
+        headers = upload["headers"]
+        self.objects[(bucket, object_name)] = {
+            "payload": b"".join(stored[part.part_number][0] for part in parts),
+            "contentType": headers.get("Content-Type", ""),
+            "metadata": {key: value for key, value in headers.items() if key != "Content-Type"},
+        }
+        return SimpleNamespace(bucket_name=bucket, object_name=object_name)
+
+    def _abort_multipart_upload(self, bucket: str, object_name: str, upload_id: str) -> None:
+        with self._lock:
+            self.uploads.pop(upload_id, None)
+
+    def _transfer(self, size_bytes: int) -> None:
+        delay = self.request_latency_seconds
+        if self.stream_bytes_per_second:
+            delay += size_bytes / self.stream_bytes_per_second
+        if delay:
+            time.sleep(delay)
+
+
+def run_benchmark(
+    work_dir: Path,
+    *,
+    size_mb: int,
+    part_size_mb: int = 8,
+    concurrency: int = 4,
+    client: Any | None = None,
+    bucket: str = "h2ometa-benchmark",
+    request_latency_seconds: float = 0.005,
+    stream_mb_per_second: float = 200.0,
+) -> dict[str, Any]:
+    source = work_dir / "artifact.bin"
+    with source.open("wb") as handle:
+        for _ in range(size_mb):
+            handle.write(os.urandom(MIB))
+    size_bytes = source.stat().st_size
+    resolved = client or MinioStandIn(
+        request_latency_seconds=request_latency_seconds,
+        stream_bytes_per_second=stream_mb_per_second * MIB,
+    )
+    settings = S3TransferSettings(part_size_bytes=part_size_mb * MIB, concurrency=concurrency)
+    single_name = f"benchmark/single-{uuid.uuid4().hex}"
+    multipart_name = f"benchmark/multipart-{uuid.uuid4().hex}"
+
+    started = time.perf_counter()
+    resolved.fput_object(bucket, single_name, str(source), content_type="application/octet-stream", metadata={})
+    single_upload_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    response = resolved.get_object(bucket, single_name)
+    single_digest = hashlib.sha256(response.read()).hexdigest()
+    response.release_conn()
+    single_download_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    upload = upload_file_multipart(
+        resolved,
+        bucket,
+        multipart_name,
+        source,
+        content_type="application/octet-stream",
+        metadata={},
+        settings=settings,
+    )
+    multipart_upload_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    digest = hashlib.sha256()
+    for chunk in iter_s3_object_ranges(resolved, bucket, multipart_name, size_bytes=size_bytes, settings=settings):
+        digest.update(chunk)
+    multipart_download_seconds = time.perf_counter() - started
+    for object_name in (single_name, multipart_name):
+        resolved.remove_object(bucket, object_name)
+
+    source_digest = hashlib.sha256(source.read_bytes()).hexdigest()
+    return {
+        "schemaVersion": "h2ometa.s3-multipart-transfer-benchmark.v1",
+        "sizeBytes": size_bytes,
+        "partSizeBytes": upload["partSizeBytes"],
+        "parts": upload["parts"],
+        "concurrency": concurrency,
+        "store": "minio-stand-in" if client is None else "s3",
+        "identicalOutput": single_digest == source_digest == digest.hexdigest(),
+        "singleUploadMBps": _throughput(size_bytes, single_upload_seconds),
+        "multipartUploadMBps": _throughput(size_bytes, multipart_upload_seconds),
+        "singleDownloadMBps": _throughput(size_bytes, single_download_seconds),
+        "rangedDownloadMBps": _throughput(size_bytes, multipart_download_seconds),
+        "uploadSpeedup": round(single_upload_seconds / multipart_upload_seconds, 2) if multipart_upload_seconds else None,
+        "downloadSpeedup": (
+            round(single_download_seconds / multipart_download_seconds, 2) if multipart_download_seconds else None
+        ),
+    }
+
+
+def _throughput(size_bytes: int, seconds: float) -> float | None:
+    return round(size_bytes / MIB / seconds, 1) if seconds else None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare single-stream S3 artifact transfers against the parallel multipart engine."
+    )
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--part-size-mb", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--endpoint", default="", help="Benchmark a real MinIO/S3 endpoint instead of the stand-in.")
+    parser.add_argument("--bucket", default="h2ometa-benchmark")
+    parser.add_argument("--secure", action="store_true")
+    args = parser.parse_args()
+    client = None
+    if args.endpoint:
+        from minio import Minio
+
+        client = Minio(
+            args.endpoint,
+            access_key=os.environ.get("H2OMETA_ARTIFACT_S3_ACCESS_KEY", ""),
+            secret_key=os.environ.get("H2OMETA_ARTIFACT_S3_SECRET_KEY", ""),
+            secure=args.secure,
+        )
+    with tempfile.TemporaryDirectory(prefix="h2ometa-s3-bench-") as work_dir:
+        result = run_benchmark(
+            Path(work_dir),
+            size_mb=max(1, args.size_mb),
+            part_size_mb=max(5, args.part_size_mb),
+            concurrency=max(1, args.concurrency),
+            client=client,
+            bucket=args.bucket,
+        )
+    print(json.dumps(result, indent=2))
+    return 0 if result["identicalOutput"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -158,7 +158,7 @@ def test_run_result_routes_delegate_runtime_calls_to_service() -> None:
     assert "runtime_service().resume_run(" in service_source
     assert "runtime_service().export_result_package(" in service_source
     assert "runtime_service().list_result_package_exports(" in service_source
-    assert "runtime_service().download_result_package(" in service_source
+    assert "runtime_service().open_result_package_download_stream(" in service_source
     assert "runtime_service().retire_result_package(" in service_source
     assert "runtime_service().run_result_package_byte_gc(" in service_source
     assert "runtime_service().delete_result_package_bytes(" not in service_source
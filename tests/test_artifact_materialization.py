@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import errno
+import hashlib
+import os
+from pathlib import Path
+import stat
+
+import pytest
+
+from apps.remote_runner import artifact_materialization as materialization
+from apps.remote_runner.artifact_io import restore_artifact_payload
+from apps.remote_runner.artifact_ledger_storage import (
+    list_artifact_materializations,
+    record_artifact_blob_for_path,
+    record_artifact_materialization,
+)
+from tests.helpers.reference_database import make_configured_remote_runner
+
+
+def _record(path: Path) -> dict[str, object]:
+    payload = path.read_bytes()
+    return {
+        "storageBackend": "local",
+        "storageUri": path.resolve().as_uri(),
+        "localPath": str(path.resolve()),
+        "sizeBytes": len(payload),
+        "sha256": hashlib.sha256(payload).hexdigest(),
+    }
+
+
+def _unsupported(*_args: object) -> None:
+    raise OSError(errno.EOPNOTSUPP, "unsupported")
+
+
+def _cross_device(*_args: object) -> None:
+    raise OSError(errno.EXDEV, "cross-device")
+
+
+def test_file_restore_links_instead_of_copying_and_protects_the_store(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(materialization, "_try_reflink", lambda _source, _target: False)
+    cfg = make_configured_remote_runner(tmp_path)
+    source = tmp_path / "store" / "reads.fastq"
+    source.parent.mkdir()
+    source.write_bytes(b"@r1\nACGT\n+\nIIII\n")
+
+    restored = restore_artifact_payload(cfg, _record(source), tmp_path / "work" / "reads.fastq")
+
+    assert restored["materializationMethod"] == "hardlink"
+    assert os.stat(restored["path"]).st_ino == source.stat().st_ino
+    assert stat.S_IMODE(source.stat().st_mode) & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH) == 0
+    assert restored["sha256"] == _record(source)["sha256"]
+
+
+def test_reflink_is_preferred_and_failures_fall_back_in_order(tmp_path: Path, monkeypatch) -> None:
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"payload")
+    cloned: list[Path] = []
+
+    def fake_reflink(src: Path, target: Path) -> bool:
+        target.write_bytes(src.read_bytes())
+        cloned.append(target)
+        return True
+
+    monkeypatch.setattr(materialization, "_try_reflink", fake_reflink)
+    assert materialization.materialize_file(source, tmp_path / "clone.bin") == "reflink"
+    assert cloned == [tmp_path / "clone.bin"]
+
+    monkeypatch.undo()
+    import fcntl
+
+    monkeypatch.setattr(fcntl, "ioctl", _unsupported)
+    monkeypatch.setattr(os, "link", _cross_device)
+    copied = tmp_path / "copy.bin"
+    assert materialization.materialize_file(source, copied) == "copy"
+    assert copied.read_bytes() == b"payload"
+    assert copied.stat().st_ino != source.stat().st_ino
+
+
+def test_directory_restore_reports_the_weakest_strategy_used(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(materialization, "_try_reflink", lambda _source, _target: False)
+    cfg = make_configured_remote_runner(tmp_path)
+    source = tmp_path / "store" / "report"
+    (source / "nested").mkdir(parents=True)
+    (source / "summary.tsv").write_text("a\t1\n", encoding="utf-8")
+    (source / "nested" / "plot.svg").write_text("<svg/>", encoding="utf-8")
+    real_link = os.link
+
+    def link_only_top_level(src, dst, *args, **kwargs):
+        if "nested" in str(src):
+            _cross_device()
+        return real_link(src, dst, *args, **kwargs)
+
+    monkeypatch.setattr(os, "link", link_only_top_level)
+    restored = restore_artifact_payload(
+        cfg,
+        {"storageBackend": "local", "localPath": str(source), "kind": "directory"},
+        tmp_path / "work" / "report",
+    )
+
+    assert restored["materializationMethod"] == "copy"
+    assert (tmp_path / "work" / "report" / "nested" / "plot.svg").read_text(encoding="utf-8") == "<svg/>"
+    assert (tmp_path / "work" / "report" / "summary.tsv").stat().st_ino == (source / "summary.tsv").stat().st_ino
+
+
+def test_materialization_strategy_env_selects_the_order(tmp_path: Path, monkeypatch) -> None:
+    assert materialization.configured_materialization_strategies() == ("reflink", "hardlink", "copy")
+    monkeypatch.setenv("H2OMETA_ARTIFACT_MATERIALIZATION", "hardlink")
+    assert materialization.configured_materialization_strategies() == ("hardlink", "copy")
+    monkeypatch.setenv("H2OMETA_ARTIFACT_MATERIALIZATION", "copy")
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"payload")
+    assert materialization.materialize_file(source, tmp_path / "target.bin") == "copy"
+    assert (tmp_path / "target.bin").stat().st_ino != source.stat().st_ino
+
+    monkeypatch.setenv("H2OMETA_ARTIFACT_MATERIALIZATION", "symlink")
+    with pytest.raises(ValueError, match="ARTIFACT_MATERIALIZATION_STRATEGY_INVALID"):
+        materialization.configured_materialization_strategies()
+
+
+def test_materializations_expose_the_recorded_method(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    payload = tmp_path / "artifact.txt"
+    payload.write_text("accepted\n", encoding="utf-8")
+    blob = record_artifact_blob_for_path(cfg, path=payload, media_type="text/plain")
+    record_artifact_materialization(
+        cfg,
+        artifact_blob_id=blob["artifactBlobId"],
+        storage_backend="local",
+        storage_uri=payload.resolve().as_uri(),
+        local_path=payload,
+        materialization_method="reflink",
+    )
+
+    materializations = list_artifact_materializations(cfg, blob["artifactBlobId"])
+    assert [item["materializationMethod"] for item in materializations] == ["reflink"]
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+from apps.remote_runner import artifact_io
+from apps.remote_runner.artifact_s3_transfer import (
+    S3TransferSettings,
+    configured_s3_transfer_settings,
+    iter_s3_object_ranges,
+    upload_file_multipart,
+)
+from apps.remote_runner.config import RemoteRunnerConfig
+from tests.helpers.reference_database import make_configured_remote_runner
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PART = 64 * 1024
+
+
+def _load_benchmark():
+    spec = importlib.util.spec_from_file_location(
+        "benchmark_s3_multipart_transfer",
+        ROOT / "scripts" / "benchmark_s3_multipart_transfer.py",
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+benchmark = _load_benchmark()
+
+
+def _payload(tmp_path: Path, size_bytes: int) -> Path:
+    path = tmp_path / "artifact.bin"
+    path.write_bytes(os.urandom(size_bytes))
+    return path
+
+
+def _s3_config(tmp_path: Path) -> RemoteRunnerConfig:
+    cfg = make_configured_remote_runner(tmp_path)
+    cfg.artifact_storage_backend = "s3"
+    cfg.artifact_s3_endpoint = "minio.local:9000"
+    cfg.artifact_s3_bucket = "h2ometa-artifacts"
+    cfg.artifact_s3_access_key = "access-key"
+    cfg.artifact_s3_secret_key = "secret-key"
+    cfg.artifact_s3_prefix = "tenant-a"
+    return cfg
+
+
+def test_artifact_io_uses_parallel_parts_and_ranged_reads_above_the_part_size(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = benchmark.MinioStandIn()
+    settings = S3TransferSettings(part_size_bytes=PART, concurrency=3)
+    monkeypatch.setattr(artifact_io, "_build_s3_client", lambda _cfg: store)
+    monkeypatch.setattr(artifact_io, "configured_s3_transfer_settings", lambda: settings)
+    cfg = _s3_config(tmp_path)
+    source = _payload(tmp_path, PART * 4 + 123)
+    sha256 = hashlib.sha256(source.read_bytes()).hexdigest()
+
+    location = artifact_io.persist_artifact_location(
+        cfg,
+        path=source,
+        run_id="run_multipart",
+        artifact_id="art_multipart",
+        sha256=sha256,
+        size_bytes=source.stat().st_size,
+        mime_type="application/octet-stream",
+    )
+    record = {**location, "sizeBytes": source.stat().st_size}
+    chunks = list(artifact_io.iter_artifact_byte_chunks(cfg, record))
+    preview = artifact_io.read_artifact_bytes(cfg, record, limit=10)
+
+    assert sorted(store.uploaded_part_numbers) == [1, 2, 3, 4, 5]
+    stored = next(iter(store.objects.values()))
+    assert stored["metadata"]["X-Amz-Meta-H2OMeta-Sha256"] == sha256
+    assert stored["contentType"] == "application/octet-stream"
+    assert b"".join(chunks) == source.read_bytes()
+    assert max(len(chunk) for chunk in chunks) <= artifact_io.ARTIFACT_STREAM_CHUNK_BYTES
+    assert store.ranged_reads[:5] == [(0, PART), (PART, PART), (PART * 2, PART), (PART * 3, PART), (PART * 4, 123)]
+    assert preview == source.read_bytes()[:10]
+    assert store.ranged_reads[-1] == (0, 10)
+
+
+def test_small_artifacts_keep_the_single_request_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = benchmark.MinioStandIn()
+    monkeypatch.setattr(artifact_io, "_build_s3_client", lambda _cfg: store)
+    monkeypatch.setattr(
+        artifact_io,
+        "configured_s3_transfer_settings",
+        lambda: S3TransferSettings(part_size_bytes=PART, concurrency=2),
+    )
+    cfg = _s3_config(tmp_path)
+    source = _payload(tmp_path, PART)
+
+    location = artifact_io.persist_artifact_location(
+        cfg,
+        path=source,
+        run_id="run_small",
+        artifact_id="art_small",
+        sha256=hashlib.sha256(source.read_bytes()).hexdigest(),
+        size_bytes=PART,
+        mime_type="application/octet-stream",
+    )
+
+    assert store.uploaded_part_numbers == []
+    assert b"".join(artifact_io.iter_artifact_byte_chunks(cfg, location)) == source.read_bytes()
+    assert store.ranged_reads == [(0, PART)]
+
+
+def test_interrupted_upload_resumes_from_the_listed_parts(tmp_path: Path) -> None:
+    store = benchmark.MinioStandIn(list_parts_page_size=2)
+    settings = S3TransferSettings(part_size_bytes=PART, concurrency=1)
+    source = _payload(tmp_path, PART * 5)
+    store.fail_part_numbers = {4}
+
+    with pytest.raises(ValueError, match="ARTIFACT_S3_UPLOAD_FAILED: ConnectionError"):
+        upload_file_multipart(
+            store, "bucket", "artifacts/a", source, content_type="application/zip", metadata={}, settings=settings
+        )
+    assert len(store.uploads) == 1
+    assert sorted(store.uploaded_part_numbers) == [1, 2, 3, 5]
+
+    store.uploaded_part_numbers.clear()
+    result = upload_file_multipart(
+        store, "bucket", "artifacts/a", source, content_type="application/zip", metadata={}, settings=settings
+    )
+
+    assert store.uploaded_part_numbers == [4]
+    assert result["resumedParts"] == 4
+    assert result["uploadedBytes"] == PART
+    assert store.uploads == {}
+    assert store.objects[("bucket", "artifacts/a")]["payload"] == source.read_bytes()
+
+
+def test_resume_reuploads_parts_whose_local_bytes_changed(tmp_path: Path) -> None:
+    store = benchmark.MinioStandIn()
+    settings = S3TransferSettings(part_size_bytes=PART, concurrency=2)
+    source = _payload(tmp_path, PART * 3)
+    store.fail_part_numbers = {3}
+    with pytest.raises(ValueError, match="ARTIFACT_S3_UPLOAD_FAILED"):
+        upload_file_multipart(store, "bucket", "key", source, content_type="", metadata={}, settings=settings)
+    payload = bytearray(source.read_bytes())
+    payload[0] ^= 0xFF
+    source.write_bytes(bytes(payload))
+    store.uploaded_part_numbers.clear()
+
+    result = upload_file_multipart(store, "bucket", "key", source, content_type="", metadata={}, settings=settings)
+
+    assert sorted(store.uploaded_part_numbers) == [1, 3]
+    assert result["resumedParts"] == 1
+    assert store.objects[("bucket", "key")]["payload"] == bytes(payload)
+
+
+def test_part_etag_mismatch_fails_the_upload(tmp_path: Path) -> None:
+    store = benchmark.MinioStandIn()
+    store.corrupt_part_numbers = {2}
+    source = _payload(tmp_path, PART * 2)
+
+    with pytest.raises(ValueError, match="ARTIFACT_S3_PART_CHECKSUM_MISMATCH: part 2"):
+        upload_file_multipart(
+            store,
+            "bucket",
+            "key",
+            source,
+            content_type="",
+            metadata={},
+            settings=S3TransferSettings(part_size_bytes=PART, concurrency=2),
+        )
+    assert ("bucket", "key") not in store.objects
+
+
+def test_ranged_reads_stop_fetching_when_the_consumer_stops(tmp_path: Path) -> None:
+    store = benchmark.MinioStandIn()
+    payload = os.urandom(PART * 8)
+    store.objects[("bucket", "key")] = {"payload": payload, "contentType": "", "metadata": {}}
+    settings = S3TransferSettings(part_size_bytes=PART, concurrency=2)
+
+    chunks = iter_s3_object_ranges(store, "bucket", "key", size_bytes=len(payload), settings=settings, chunk_bytes=PART)
+    assert next(chunks) == payload[:PART]
+    chunks.close()
+
+    assert len(store.ranged_reads) <= 3
+
+
+def test_transfer_settings_come_from_the_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert configured_s3_transfer_settings() == S3TransferSettings()
+    monkeypatch.setenv("H2OMETA_ARTIFACT_S3_PART_SIZE_MB", "8")
+    monkeypatch.setenv("H2OMETA_ARTIFACT_S3_CONCURRENCY", "6")
+    assert configured_s3_transfer_settings() == S3TransferSettings(part_size_bytes=8 * 1024 * 1024, concurrency=6)
+    assert S3TransferSettings(part_size_bytes=5).upload_part_size(100_001) == 11
+
+    monkeypatch.setenv("H2OMETA_ARTIFACT_S3_PART_SIZE_MB", "4")
+    with pytest.raises(ValueError, match="ARTIFACT_S3_PART_SIZE_INVALID"):
+        configured_s3_transfer_settings()
+    monkeypatch.setenv("H2OMETA_ARTIFACT_S3_PART_SIZE_MB", "8")
+    monkeypatch.setenv("H2OMETA_ARTIFACT_S3_CONCURRENCY", "0")
+    with pytest.raises(ValueError, match="ARTIFACT_S3_CONCURRENCY_INVALID"):
+        configured_s3_transfer_settings()
+
+
+def test_benchmark_round_trips_through_the_stand_in(tmp_path: Path) -> None:
+    result = benchmark.run_benchmark(tmp_path, size_mb=2, part_size_mb=1, concurrency=2, stream_mb_per_second=0)
+
+    assert result["identicalOutput"] is True
+    assert result["parts"] == 2
+    assert result["store"] == "minio-stand-in"
@@ -93,12 +93,40 @@ def test_result_package_download_route_streams_runtime_payload(monkeypatch) -> N
         )
     )
 
-    assert runtime.calls == [("res_run_demo", "rpex_demo", "srv_remote")]
-    assert response.body == b"package-bytes"
+    assert runtime.calls == [("res_run_demo", "rpex_demo", "srv_remote", None, None)]
+    assert asyncio.run(_read_streaming_body(response)) == b"package-bytes"
+    assert response.status_code == 200
     assert response.media_type == "application/zip"
     assert response.headers["content-disposition"] == 'attachment; filename="res_run_demo.zip"'
     assert response.headers["x-content-type-options"] == "nosniff"
     assert response.headers["x-h2ometa-sha256"] == "b" * 64
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+def test_result_package_download_route_forwards_range_and_partial_status(monkeypatch) -> None:
+    runtime = FakeResultPackageDownloadRuntime()
+    monkeypatch.setattr("apps.api.execution_query_service.runtime_service", lambda: runtime)
+
+    response = asyncio.run(
+        download_result_package(
+            "res_run_demo",
+            "rpex_demo",
+            serverId="srv_remote",
+            range_header="bytes=8-",
+            if_range='"etag-demo"',
+        )
+    )
+
+    assert runtime.calls == [("res_run_demo", "rpex_demo", "srv_remote", "bytes=8-", '"etag-demo"')]
+    assert asyncio.run(_read_streaming_body(response)) == b"bytes"
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 8-12/13"
+    assert response.headers["content-length"] == "5"
+    assert response.headers["etag"] == '"etag-demo"'
+
+
+async def _read_streaming_body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
 
 
 def test_result_package_list_route_sanitizes_runtime_inventory(monkeypatch) -> None:
@@ -361,17 +389,32 @@ class FakeResultPackageDownloadRuntime:
     def __init__(self) -> None:
         self.calls = []
 
-    def download_result_package(self, result_id, package_export_id, server_id=None):
-        self.calls.append((result_id, package_export_id, server_id))
-        return {
-            "content": b"package-bytes",
-            "headers": {
-                "content-disposition": 'attachment; filename="res_run_demo.zip"',
-                "content-type": "application/zip",
-                "x-content-type-options": "nosniff",
-                "x-h2ometa-sha256": "b" * 64,
-            },
+    def open_result_package_download_stream(
+        self,
+        result_id,
+        package_export_id,
+        server_id=None,
+        *,
+        range_header=None,
+        if_range=None,
+    ):
+        self.calls.append((result_id, package_export_id, server_id, range_header, if_range))
+        content = b"package-bytes"
+        headers = {
+            "accept-ranges": "bytes",
+            "content-disposition": 'attachment; filename="res_run_demo.zip"',
+            "content-type": "application/zip",
+            "etag": '"etag-demo"',
+            "x-content-type-options": "nosniff",
+            "x-h2ometa-sha256": "b" * 64,
         }
+        if range_header and if_range == headers["etag"]:
+            return {
+                "statusCode": 206,
+                "headers": {**headers, "content-length": "5", "content-range": "bytes 8-12/13"},
+                "chunks": iter([content[8:]]),
+            }
+        return {"statusCode": 200, "headers": headers, "chunks": iter([content[:8], content[8:]])}
 
 
 class FakeResultPackageListRuntime:
@@ -33,6 +33,7 @@ def _tracked_policy_sources() -> list[Path]:
             ROOT / "apps" / "remote_runner" / "run_failure_locator_read_api.py",
             ROOT / "apps" / "remote_runner" / "run_failure_locator_read_model.py",
             ROOT / "apps" / "remote_runner" / "run_reexecution_service.py",
+            ROOT / "apps" / "remote_runner" / "run_update_stream_api.py",
             ROOT / "apps" / "remote_runner" / "rule_cache_restore_adoption_service.py",
             ROOT / "apps" / "remote_runner" / "rule_staged_restore_promotion_service.py",
             ROOT / "apps" / "remote_runner" / "execution_observability_governance.py",
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+from pathlib import Path
+import socket
+import threading
+import time
+
+import paramiko
+import pytest
+
+from core.remote.local_tunnel import LocalTunnel
+from core.remote.tunnel_forwarder import MIB, TunnelSettings, configured_tunnel_settings
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_benchmark():
+    spec = importlib.util.spec_from_file_location(
+        "benchmark_local_tunnel",
+        ROOT / "scripts" / "benchmark_local_tunnel.py",
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+benchmark = _load_benchmark()
+
+
+@pytest.fixture
+def ssh_hop():
+    target = benchmark.PayloadServer()
+    ssh = benchmark.SshServerStandIn()
+    transport = ssh.connect()
+    yield transport, target
+    transport.close()
+    ssh.close()
+    target.close()
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_tunnel_forwards_both_directions_through_one_event_loop(ssh_hop) -> None:
+    transport, target = ssh_hop
+    tunnel = LocalTunnel(name="runner", transport=transport, remote_host="127.0.0.1", remote_port=target.port)
+    tunnel.start()
+    try:
+        payload = os.urandom(3 * MIB + 17)
+        assert benchmark._upload(tunnel.local_port, payload) == hashlib.sha256(payload).hexdigest()
+        assert benchmark._download(tunnel.local_port, 5 * MIB) == 5 * MIB
+
+        results: list[int] = []
+        workers = [
+            threading.Thread(target=lambda: results.append(benchmark._download(tunnel.local_port, MIB)))
+            for _ in range(6)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+        assert results == [MIB] * 6
+        tunnel_threads = [thread for thread in threading.enumerate() if thread.name.startswith("local-tunnel-runner")]
+        assert len(tunnel_threads) == 1
+
+        _wait_for(lambda: tunnel.traffic_snapshot()["connectionsActive"] == 0)
+        traffic = tunnel.traffic_snapshot()
+        assert traffic["connectionsTotal"] == 8
+        assert traffic["connectionsPeak"] >= 2
+        assert traffic["bytesDown"] >= 11 * MIB
+        assert traffic["bytesUp"] >= len(payload)
+        assert traffic["channelOpenFailures"] == 0
+    finally:
+        tunnel.close()
+    assert tunnel.is_active is False
+
+
+class _RefusingTransport:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, object]] = []
+
+    def open_channel(self, kind, dest_addr, src_addr, **kwargs):
+        self.calls.append({"kind": kind, "dest": dest_addr, **kwargs})
+        raise paramiko.ChannelException(2, "Connect failed")
+
+
+def test_failed_channel_opens_close_the_client_and_are_counted() -> None:
+    transport = _RefusingTransport()
+    tunnel = LocalTunnel(
+        name="refused",
+        transport=transport,
+        remote_host="127.0.0.1",
+        remote_port=39967,
+        settings=TunnelSettings(window_size=16 * MIB, max_packet_size=64 * 1024),
+    )
+    tunnel.start()
+    try:
+        with socket.create_connection(("127.0.0.1", tunnel.local_port), timeout=5) as conn:
+            assert conn.recv(1) == b""
+        _wait_for(lambda: tunnel.traffic_snapshot()["channelOpenFailures"] == 1)
+    finally:
+        tunnel.close()
+
+    assert transport.calls[0]["kind"] == "direct-tcpip"
+    assert transport.calls[0]["dest"] == ("127.0.0.1", 39967)
+    assert transport.calls[0]["window_size"] == 16 * MIB
+    assert transport.calls[0]["max_packet_size"] == 64 * 1024
+
+
+class _StalledChannel:
+    """A channel whose SSH window never opens; readable only through an idle socketpair."""
+
+    def __init__(self) -> None:
+        self._reader, self._writer = socket.socketpair()
+        self.send_ready_calls = 0
+        self.closed = False
+
+    def fileno(self) -> int:
+        return self._reader.fileno()
+
+    def settimeout(self, _timeout) -> None:
+        pass
+
+    def send_ready(self) -> bool:
+        self.send_ready_calls += 1
+        return False
+
+    def close(self) -> None:
+        self.closed = True
+        self._reader.close()
+        self._writer.close()
+
+
+class _StalledTransport:
+    def __init__(self) -> None:
+        self.channels: list[_StalledChannel] = []
+
+    def open_channel(self, *_args, **_kwargs):
+        self.channels.append(_StalledChannel())
+        return self.channels[-1]
+
+
+def test_stalled_upload_backs_off_instead_of_busy_polling_the_window() -> None:
+    transport = _StalledTransport()
+    tunnel = LocalTunnel(name="stalled", transport=transport, remote_host="127.0.0.1", remote_port=39968)
+    tunnel.start()
+    try:
+        with socket.create_connection(("127.0.0.1", tunnel.local_port), timeout=5) as conn:
+            conn.sendall(b"x" * 4096)
+            _wait_for(lambda: transport.channels and transport.channels[0].send_ready_calls > 0)
+            time.sleep(0.5)
+            polls = transport.channels[0].send_ready_calls
+    finally:
+        tunnel.close()
+
+    # A fixed 2 ms poll would check the window ~250 times here; the backoff settles at 50 ms.
+    assert polls < 60
+    assert transport.channels[0].closed
+
+
+class _SlowOpenTransport(_StalledTransport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.opening = threading.Event()
+        self.release = threading.Event()
+
+    def open_channel(self, *args, **kwargs):
+        self.opening.set()
+        assert self.release.wait(5)
+        return super().open_channel(*args, **kwargs)
+
+
+def test_channel_open_finishing_after_shutdown_releases_socket_and_channel() -> None:
+    transport = _SlowOpenTransport()
+    tunnel = LocalTunnel(name="slow-open", transport=transport, remote_host="127.0.0.1", remote_port=39969)
+    tunnel.start()
+    with socket.create_connection(("127.0.0.1", tunnel.local_port), timeout=5) as conn:
+        assert transport.opening.wait(5)
+        tunnel.close()
+        transport.release.set()
+        _wait_for(lambda: transport.channels and transport.channels[0].closed)
+        assert conn.recv(1) == b""
+
+
+def test_tunnel_window_and_packet_sizes_come_from_the_environment(monkeypatch) -> None:
+    assert configured_tunnel_settings() == TunnelSettings()
+    monkeypatch.setenv("H2OMETA_SSH_TUNNEL_WINDOW_MB", "32")
+    monkeypatch.setenv("H2OMETA_SSH_TUNNEL_MAX_PACKET_KB", "64")
+    assert configured_tunnel_settings() == TunnelSettings(window_size=32 * MIB, max_packet_size=64 * 1024)
+
+    monkeypatch.setenv("H2OMETA_SSH_TUNNEL_MAX_PACKET_KB", "1")
+    with pytest.raises(ValueError, match="SSH_TUNNEL_MAX_PACKET_SIZE_INVALID"):
+        configured_tunnel_settings()
+    monkeypatch.setenv("H2OMETA_SSH_TUNNEL_MAX_PACKET_KB", "64")
+    monkeypatch.setenv("H2OMETA_SSH_TUNNEL_WINDOW_MB", "big")
+    with pytest.raises(ValueError, match="SSH_TUNNEL_WINDOW_SIZE_INVALID"):
+        configured_tunnel_settings()
+
+
+def test_benchmark_compares_against_the_threaded_copy_loop() -> None:
+    result = benchmark.run_benchmark(size_mb=1, streams=2)
+
+    assert result["identicalOutput"] is True
+    assert result["server"] == "paramiko-stand-in"
+    assert result["traffic"]["connectionsTotal"] == 4
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "apps" / "remote_runner" / "pipelines" / "moving-pictures-16s-rulegraph-v1" / "workflow" / "scripts"
+QUALITIES = ["", "5", "55", "IIII", "#" * 40, "5" * 19 + "4", "5" * 19 + "6", "5é5", "!!!!!!!!!!"]
+
+
+def _load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+common = _load_module("moving_pictures_common", SCRIPTS_DIR / "common.py")
+
+
+def _write_fastq(path: Path, reads: int) -> None:
+    path.write_text(
+        "".join(f"@read-{index}\nacgt{'T' * (index % 5)}\n+\n{'I' * (4 + index % 5)}\n" for index in range(reads)),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.parametrize("threshold", [0, 1, 20, 40])
+def test_quality_pass_mask_matches_mean_quality_with_and_without_numpy(monkeypatch, threshold: int) -> None:
+    expected = [common.mean_quality(qual) >= threshold for qual in QUALITIES]
+
+    assert common.quality_pass_mask(QUALITIES, threshold) == expected
+    assert common.quality_pass_mask([qual for qual in QUALITIES if qual.isascii()], threshold) == [
+        passed for qual, passed in zip(QUALITIES, expected) if qual.isascii()
+    ]
+    monkeypatch.setattr(common, "np", None)
+    assert common.quality_pass_mask(QUALITIES, threshold) == expected
+
+
+def test_quality_pass_mask_uses_numpy_when_available() -> None:
+    pytest.importorskip("numpy")
+
+    assert common.np is not None
+    assert common.quality_pass_mask(["5" * 20, "5" * 19 + "4", ""], 20) == [True, False, False]
+
+
+def test_fastq_batches_match_the_record_stream_across_batch_boundaries(tmp_path: Path) -> None:
+    fastq = tmp_path / "sequences.fastq"
+    _write_fastq(fastq, 11)
+
+    batches = list(common.iter_fastq_batches(fastq, batch_reads=4))
+
+    assert [len(batch) for batch in batches] == [4, 4, 3]
+    assert [record for batch in batches for record in batch] == list(common.iter_fastq(fastq))
+    assert batches[0][1] == ("@read-1", "ACGTT", "+", "IIIII")
+
+
+def test_fastq_batches_reject_a_truncated_record(tmp_path: Path) -> None:
+    fastq = tmp_path / "sequences.fastq"
+    _write_fastq(fastq, 3)
+    fastq.write_text(fastq.read_text(encoding="utf-8") + "@read-3\nACGT\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="FASTQ file ended mid-record"):
+        list(common.iter_fastq_batches(fastq, batch_reads=2))
+
+
+def test_batch_quality_filter_output_is_identical_to_the_legacy_loop(tmp_path: Path) -> None:
+    benchmark = _load_module("benchmark_fastq_quality_engine", ROOT / "scripts" / "benchmark_fastq_quality_engine.py")
+
+    result = benchmark.run_benchmark(tmp_path, reads=2000, read_length=200)
+
+    assert result["identicalOutput"] is True
+    assert result["reads"] == 2000
+    assert "demultiplexed_reads\t2000\n" in (tmp_path / "batch-qc.tsv").read_text(encoding="utf-8")
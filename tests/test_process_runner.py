@@ -92,3 +92,119 @@ def test_process_runner_terminates_process_group_when_poll_callback_fails(monkey
         )
 
     assert kill_calls == [(5252, signal.SIGTERM)]
+
+
+def test_process_runner_streams_output_to_sink_while_process_runs() -> None:
+    import sys
+
+    from apps.remote_runner import process_runner
+    from apps.remote_runner.process_output_capture import ProcessOutputCapture
+
+    received: list[tuple[str, str]] = []
+    polls_with_output: list[int] = []
+    capture = ProcessOutputCapture(lambda stream, text: received.append((stream, text)))
+    script = (
+        "import sys, time\n"
+        "print('first', flush=True)\n"
+        "time.sleep(0.5)\n"
+        "print('oops', file=sys.stderr, flush=True)\n"
+        "print('second', flush=True)\n"
+    )
+
+    result = process_runner.run_process(
+        [sys.executable, "-c", script],
+        env={},
+        on_poll=lambda: polls_with_output.append(len(received)),
+        poll_interval_seconds=0.05,
+        output_capture=capture,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout == "first\nsecond\n"
+    assert result.stderr == "oops\n"
+    assert any(count > 0 for count in polls_with_output), "output was not delivered before the process exited"
+    assert "".join(text for stream, text in received if stream == "stdout") == "first\nsecond\n"
+    assert capture.stats()["streams"]["stderr"]["bytes"] == len("oops\n")
+
+
+def test_process_runner_sleeps_when_child_closes_pipes_but_keeps_running() -> None:
+    import sys
+
+    from apps.remote_runner import process_runner
+    from apps.remote_runner.process_output_capture import ProcessOutputCapture
+
+    class CountingCapture(ProcessOutputCapture):
+        drains = 0
+
+        def drain(self, timeout: float = 0.0) -> bool:
+            self.drains += 1
+            return super().drain(timeout)
+
+    capture = CountingCapture(lambda _stream, _text: None)
+    polls: list[int] = []
+    script = "import os, time\nprint('bye', flush=True)\nos.close(1)\nos.close(2)\ntime.sleep(0.6)\n"
+
+    result = process_runner.run_process(
+        [sys.executable, "-c", script],
+        env={},
+        on_poll=lambda: polls.append(capture.drains),
+        poll_interval_seconds=0.05,
+        output_capture=capture,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout == "bye\n"
+    assert len(polls) >= 5
+    # Once both readers are gone each poll interval costs one drain, not a busy loop.
+    assert capture.drains <= 2 * len(polls) + 5
+
+
+def test_process_output_capture_bounds_memory_with_backpressure_and_tail() -> None:
+    import sys
+    import time
+
+    from apps.remote_runner import process_runner
+    from apps.remote_runner.process_output_capture import ProcessOutputCapture
+
+    delivered_bytes = 0
+
+    def slow_sink(stream: str, text: str) -> None:
+        nonlocal delivered_bytes
+        time.sleep(0.002)
+        delivered_bytes += len(text)
+
+    capture = ProcessOutputCapture(slow_sink, max_buffered_bytes=4096, tail_bytes=100, chunk_bytes=1024)
+    script = "import sys\nfor index in range(2000):\n    sys.stdout.write(f'{index:09d}\\n')\n"
+
+    result = process_runner.run_process(
+        [sys.executable, "-c", script],
+        env={},
+        poll_interval_seconds=0.2,
+        output_capture=capture,
+    )
+
+    stats = capture.stats()
+    assert result.returncode == 0
+    assert delivered_bytes == 20000
+    assert len(result.stdout) == 100
+    assert result.stdout.endswith("000001999\n")
+    assert stats["peakBufferedBytes"] <= 4096
+    assert stats["backpressureWaits"] > 0
+    assert stats["tailTruncatedBytes"] == 20000 - 100
+
+
+def test_run_log_stream_writer_commits_only_complete_lines(tmp_path) -> None:
+    from apps.remote_runner.log_storage import RunLogStreamWriter, fetch_log_lines
+    from tests.helpers.reference_database import make_remote_runner_config
+
+    cfg = make_remote_runner_config(tmp_path)
+    attempt_log = tmp_path / "attempt.stdout.log"
+    writer = RunLogStreamWriter(cfg, "run_stream", attempt_logs={"stdout": attempt_log})
+
+    writer.write("stdout", "alpha\nbe")
+    assert fetch_log_lines(cfg, "run_stream", "stdout", None)["lines"] == ["alpha"]
+    writer.write("stdout", "ta\n\ngam")
+    writer.close()
+
+    assert fetch_log_lines(cfg, "run_stream", "stdout", None)["lines"] == ["alpha", "beta", "gam"]
+    assert attempt_log.read_text(encoding="utf-8") == "alpha\nbeta\n\ngam"
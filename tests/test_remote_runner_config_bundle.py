@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -121,6 +122,20 @@ def test_remote_runner_bundle_contains_expected_phase1_files(tmp_path: Path) ->
     assert bundle.archive_path.exists()
     assert bundle.platform == "linux-64"
 
+def test_remote_runner_bundle_ships_checked_hash_bytecode_for_runtime_python(tmp_path: Path) -> None:
+    runtime_dir = _fake_runtime_dir(tmp_path)
+    (runtime_dir / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}").mkdir(parents=True)
+
+    bundle = RemoteRunnerBundleBuilder().build(version=REMOTE_RUNNER_VERSION, platform="linux-64", runtime_dir=runtime_dir)
+
+    manifest = json.loads((bundle.bundle_dir / "bootstrap_manifest.json").read_text(encoding="utf-8"))
+    assert manifest["bytecode"] == {"cacheTag": sys.implementation.cache_tag, "invalidationMode": "checked-hash"}
+    pyc = bundle.bundle_dir / "remote_runner" / "__pycache__" / f"main.{sys.implementation.cache_tag}.pyc"
+    # Flags word 0b11 marks a checked hash-based pyc (PEP 552).
+    assert int.from_bytes(pyc.read_bytes()[4:8], "little") == 0b11
+    assert (bundle.bundle_dir / "core" / "contracts" / "__pycache__").is_dir()
+
+
 def test_load_remote_runner_config_preserves_workflow_runtime_metadata(tmp_path: Path, monkeypatch) -> None:
     config_path = tmp_path / "runner.json"
     managed_conda_command = tmp_path / "tooling" / "bin" / "micromamba"
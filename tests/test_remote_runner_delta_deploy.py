@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import filecmp
+import shutil
+import subprocess
+import tarfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from core.remote_runner.artifact_io import sha256_file
+from core.remote_runner.bootstrap_bundle import RemoteRunnerBootstrapBundleMixin
+from core.remote_runner.bundle import RemoteRunnerBundleBuilder
+from core.remote_runner.delta_deploy import RELEASE_MANIFEST_NAME, configured_deploy_mode
+from core.remote_runner.layout import remote_runner_bootstrap_layout
+from core.remote_runner.remote_io import RemoteRunnerRemoteIoMixin
+from tests.helpers.remote_runner_control_plane import _fake_runtime_dir
+
+
+class LocalShellSshService:
+    """Runs remote commands in a local bash so the remote assembly script really executes."""
+
+    def __init__(self) -> None:
+        self.uploads: list[tuple[str, str, int]] = []
+
+    def run(self, cmd: str, timeout: int = 30):
+        completed = subprocess.run(["bash", "-c", cmd], capture_output=True, text=True, timeout=timeout)
+        return completed.returncode, completed.stdout, completed.stderr
+
+    def upload(self, local_path: str, remote_path: str) -> None:
+        self.uploads.append((local_path, remote_path, Path(local_path).stat().st_size))
+        shutil.copyfile(local_path, remote_path)
+
+
+class Deployer(RemoteRunnerBootstrapBundleMixin, RemoteRunnerRemoteIoMixin):
+    pass
+
+
+def _bundle(tmp_path: Path, name: str, files: dict[str, str]) -> SimpleNamespace:
+    source = tmp_path / f"{name}-src"
+    for relative, content in files.items():
+        path = source / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    (source / "start_service.sh").chmod(0o644)
+    (source / "runtime" / "bin").mkdir(parents=True, exist_ok=True)
+    (source / "runtime" / "bin" / "python3").symlink_to("python")
+    archive_path = tmp_path / f"{name}.tar.gz"
+    with tarfile.open(archive_path, "w:gz") as archive:
+        archive.add(source, arcname=".")
+    return SimpleNamespace(archive_path=archive_path, sha256=sha256_file(archive_path), source=source)
+
+
+@pytest.fixture
+def delta_env(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("H2OMETA_REMOTE_RUNNER_DEPLOY_MODE", "delta")
+    monkeypatch.setenv("H2OMETA_ARTIFACT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    return tmp_path
+
+
+FILES = {
+    "start_service.sh": "#!/usr/bin/env bash\necho start\n",
+    "remote_runner/run.py": "print('v1')\n",
+    "remote_runner/pipelines/file-summary-v1/pipeline.json": "{}\n",
+    "runtime/bin/python": "#!/bin/sh\n" + "x" * 4096,
+    "runtime/lib/big.so": "y" * 200_000,
+}
+
+
+def test_delta_deploy_uploads_only_missing_blobs_and_assembles_identical_release(delta_env: Path) -> None:
+    ssh_service = LocalShellSshService()
+    deployer = Deployer()
+    first = _bundle(delta_env, "v1", FILES)
+    paths_v1 = remote_runner_bootstrap_layout(str(delta_env / "home"), "v1")
+
+    summary = deployer._deploy_service_runtime_bundle(ssh_service=ssh_service, artifact=first, paths=paths_v1)
+
+    assert summary["missingBlobs"] == summary["blobs"] == 5
+    release = Path(paths_v1.release)
+    assert filecmp.cmpfiles(first.source, release, list(FILES), shallow=False)[0] == list(FILES)
+    assert (release / "start_service.sh").stat().st_mode & 0o777 == 0o755
+    assert (release / "runtime" / "bin" / "python3").readlink() == Path("python")
+    assert (release / RELEASE_MANIFEST_NAME).is_file()
+    assert (release / "artifact.sha256").read_text(encoding="utf-8") == first.sha256
+    assert not Path(paths_v1.bundle).exists()
+    assert not Path(paths_v1.delta_manifest()).exists()
+
+    ssh_service.uploads.clear()
+    second = _bundle(delta_env, "v2", {**FILES, "remote_runner/run.py": "print('v2')\n"})
+    paths_v2 = remote_runner_bootstrap_layout(str(delta_env / "home"), "v2")
+    summary = deployer._deploy_service_runtime_bundle(ssh_service=ssh_service, artifact=second, paths=paths_v2)
+
+    assert summary["missingBlobs"] == 1
+    assert summary["transferredBytes"] < 1024 < summary["bundleBytes"]
+    assert [remote for _local, remote, _size in ssh_service.uploads] == [
+        paths_v2.delta_manifest() + ".tmp",
+        paths_v2.bundle,
+    ]
+    assert (Path(paths_v2.release) / "remote_runner" / "run.py").read_text(encoding="utf-8") == "print('v2')\n"
+
+    # Dropping v1 leaves its unique blob unreferenced; the next deploy collects it.
+    shutil.rmtree(paths_v1.release)
+    summary = deployer._deploy_service_runtime_bundle(ssh_service=ssh_service, artifact=second, paths=paths_v2)
+    assert summary["missingBlobs"] == 0
+    assert summary["gcRemovedBlobs"] == 1
+    blobs = [path for path in Path(paths_v2.delta_blob_store()).rglob("*") if path.is_file()]
+    assert len(blobs) == 5
+
+
+def test_archive_mode_stays_the_default(delta_env: Path, monkeypatch) -> None:
+    monkeypatch.delenv("H2OMETA_REMOTE_RUNNER_DEPLOY_MODE")
+    assert configured_deploy_mode() == "archive"
+    ssh_service = LocalShellSshService()
+    artifact = _bundle(delta_env, "v1", FILES)
+    paths = remote_runner_bootstrap_layout(str(delta_env / "home"), "v1")
+
+    assert Deployer()._deploy_service_runtime_bundle(ssh_service=ssh_service, artifact=artifact, paths=paths) is None
+    assert ssh_service.uploads == [(str(artifact.archive_path), paths.bundle, artifact.archive_path.stat().st_size)]
+    assert not Path(paths.delta_blob_store()).exists()
+
+    monkeypatch.setenv("H2OMETA_REMOTE_RUNNER_DEPLOY_MODE", "rsync")
+    with pytest.raises(ValueError, match="REMOTE_RUNNER_DEPLOY_MODE_INVALID"):
+        configured_deploy_mode()
+
+
+def test_bundle_builder_reuses_an_unchanged_build(tmp_path: Path) -> None:
+    builder = RemoteRunnerBundleBuilder()
+    runtime_dir = _fake_runtime_dir(tmp_path)
+    cache_dir = tmp_path / "builds"
+
+    first = builder.build(version="v1", runtime_dir=runtime_dir, cache_dir=cache_dir)
+    second = builder.build(version="v1", runtime_dir=runtime_dir, cache_dir=cache_dir)
+    assert first.reused is False
+    assert second.reused is True
+    assert second.archive_path == first.archive_path
+    assert (second.bundle_dir / "remote_runner" / "run.py").exists()
+
+    (runtime_dir / "bin" / "extra").write_text("new\n", encoding="utf-8")
+    third = builder.build(version="v1", runtime_dir=runtime_dir, cache_dir=cache_dir)
+    assert third.reused is False
+    assert third.archive_path != first.archive_path
+    assert not any(path.name.startswith(".building-") for path in cache_dir.iterdir())
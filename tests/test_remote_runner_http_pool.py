@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+
+from core.remote_runner import client as client_module
+from core.remote_runner.client import RemoteRunnerClientError, RemoteRunnerHttpClient
+from core.remote_runner.http_pool import RunnerHttpConnectionPool, configured_idle_timeout_seconds
+
+
+class _RunnerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.server.peers.append(self.client_address)
+        if self.path == "/stream":
+            body = b"x" * 200_000
+        else:
+            body = json.dumps({"data": {"path": self.path}}).encode("utf-8")
+        status = 404 if self.path == "/missing" else 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Drop the socket without announcing it, the way an expired keep-alive looks to the client.
+        if self.path == "/drop":
+            self.close_connection = True
+
+    def do_POST(self) -> None:
+        self.server.peers.append(self.client_address)
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        body = json.dumps({"data": payload}).encode("utf-8")
+        self.send_response(201)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: object) -> None:
+        return None
+
+
+class _QuietServer(ThreadingHTTPServer):
+    def handle_error(self, *_args: object) -> None:
+        # Streams abandoned on purpose reset their connection mid-response.
+        return None
+
+
+@pytest.fixture
+def runner() -> Iterator[ThreadingHTTPServer]:
+    server = _QuietServer(("127.0.0.1", 0), _RunnerHandler)
+    server.peers = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(
+    runner: ThreadingHTTPServer,
+    monkeypatch: pytest.MonkeyPatch,
+    **pool_kwargs: object,
+) -> tuple[RemoteRunnerHttpClient, RunnerHttpConnectionPool]:
+    pool = RunnerHttpConnectionPool(**{"max_idle_per_host": 4, "idle_timeout_seconds": 30.0, **pool_kwargs})
+    monkeypatch.setattr(client_module, "get_runner_http_pool", lambda: pool)
+    return RemoteRunnerHttpClient(f"http://127.0.0.1:{runner.server_address[1]}", "token"), pool
+
+
+def test_sequential_calls_reuse_one_keep_alive_connection(runner, monkeypatch) -> None:
+    client, pool = _client(runner, monkeypatch)
+
+    assert client.get_json("/api/v1/runs")["data"] == {"path": "/api/v1/runs"}
+    assert client.last_timing["reused"] is False
+    assert client.post_json("/api/v1/runs", {"a": 1}, accepted_statuses={201})["data"] == {"a": 1}
+    assert client.last_timing["reused"] is True
+    assert client.probe_json("/api/v1/health")["httpStatus"] == 200
+
+    stats = pool.stats.snapshot()
+    assert len(set(runner.peers)) == 1
+    assert stats["requests"] == 3
+    assert stats["newConnections"] == 1
+    assert stats["reusedConnections"] == 2
+    assert stats["connectSeconds"]["count"] == 1
+    assert stats["firstByteSeconds"]["count"] == 3
+    assert stats["bodySeconds"]["count"] == 3
+    assert set(client.last_timing) == {"reused", "connectSeconds", "firstByteSeconds", "bodySeconds"}
+    assert pool.idle_connections() == 1
+
+
+def test_stale_pooled_connection_is_retried_once_for_idempotent_requests(runner, monkeypatch) -> None:
+    client, pool = _client(runner, monkeypatch)
+    client.get_json("/drop")
+    time.sleep(0.05)
+
+    assert client.get_json("/api/v1/runs")["data"] == {"path": "/api/v1/runs"}
+    stats = pool.stats.snapshot()
+    assert stats["staleRetries"] == 1
+    assert stats["newConnections"] == 2
+    assert len(set(runner.peers)) == 2
+
+
+def test_idle_connections_past_the_timeout_are_evicted(runner, monkeypatch) -> None:
+    client, pool = _client(runner, monkeypatch, idle_timeout_seconds=0.01)
+    client.get_json("/a")
+    time.sleep(0.05)
+    client.get_json("/b")
+
+    stats = pool.stats.snapshot()
+    assert stats["idleEvictions"] == 1
+    assert stats["reusedConnections"] == 0
+    assert stats["newConnections"] == 2
+
+
+def test_streams_return_the_connection_only_when_fully_read(runner, monkeypatch) -> None:
+    client, pool = _client(runner, monkeypatch)
+
+    chunks = client.stream_bytes("/stream")["chunks"]
+    next(chunks)
+    chunks.close()
+    assert pool.idle_connections() == 0
+
+    assert sum(len(chunk) for chunk in client.stream_bytes("/stream")["chunks"]) == 200_000
+    assert pool.idle_connections() == 1
+
+    with pytest.raises(RemoteRunnerClientError) as exc_info:
+        client.get_json("/missing")
+    assert exc_info.value.status_code == 404
+    assert pool.stats.snapshot()["reusedConnections"] == 1
+    assert pool.idle_connections() == 1
+
+
+def test_unreachable_runner_keeps_the_client_error_contract(monkeypatch) -> None:
+    pool = RunnerHttpConnectionPool(max_idle_per_host=1, idle_timeout_seconds=1.0)
+    monkeypatch.setattr(client_module, "get_runner_http_pool", lambda: pool)
+    with ThreadingHTTPServer(("127.0.0.1", 0), _RunnerHandler) as server:
+        port = server.server_address[1]
+    client = RemoteRunnerHttpClient(f"http://127.0.0.1:{port}", "token")
+
+    with pytest.raises(RemoteRunnerClientError, match="Connection refused"):
+        client.get_json("/api/v1/health")
+    assert client.probe_json("/api/v1/health")["error"]["reasonCode"] == "RUNNER_UNREACHABLE"
+
+
+def test_pool_settings_come_from_the_environment(monkeypatch) -> None:
+    monkeypatch.setenv("H2OMETA_RUNNER_HTTP_POOL_SIZE", "2")
+    monkeypatch.setenv("H2OMETA_RUNNER_HTTP_POOL_IDLE_SECONDS", "1.5")
+    pool = RunnerHttpConnectionPool()
+    assert (pool.max_idle_per_host, pool.idle_timeout_seconds) == (2, 1.5)
+
+    monkeypatch.setenv("H2OMETA_RUNNER_HTTP_POOL_IDLE_SECONDS", "soon")
+    with pytest.raises(ValueError, match="RUNNER_HTTP_POOL_IDLE_TIMEOUT_INVALID"):
+        configured_idle_timeout_seconds()
+    monkeypatch.setenv("H2OMETA_RUNNER_HTTP_POOL_SIZE", "-1")
+    monkeypatch.delenv("H2OMETA_RUNNER_HTTP_POOL_IDLE_SECONDS")
+    with pytest.raises(ValueError, match="RUNNER_HTTP_POOL_SIZE_INVALID"):
+        RunnerHttpConnectionPool()
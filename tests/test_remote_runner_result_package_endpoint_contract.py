@@ -302,6 +302,34 @@ def test_result_package_proxy_download_uses_registry_rendered_path() -> None:
     assert proxy.timeouts == [60]
 
 
+def test_result_package_proxy_stream_forwards_range_validators() -> None:
+    proxy = FakeDownloadProxy()
+
+    stream = proxy.open_result_package_download_stream(
+        server_id="srv_1",
+        ssh_service=object(),
+        server_record={"server_id": "srv_1"},
+        result_id="res/1",
+        package_export_id="rpex/1",
+        range_header="bytes=1024-",
+        if_range='"abc"',
+    )
+    plain = proxy.open_result_package_download_stream(
+        server_id="srv_1",
+        ssh_service=object(),
+        server_record={"server_id": "srv_1"},
+        result_id="res/1",
+        package_export_id="rpex/1",
+    )
+
+    assert stream == {
+        "path": "/api/v1/results/res%2F1/exports/rpex%2F1/download",
+        "headers": {"Range": "bytes=1024-", "If-Range": '"abc"'},
+        "acceptedStatuses": {416},
+    }
+    assert plain["headers"] is None
+
+
 class FakeCommandClient:
     def __init__(self) -> None:
         self.calls: list[tuple[str, str, dict[str, object]]] = []
@@ -327,6 +355,10 @@ class FakeDownloadClient(RemoteRunnerHttpClient):
         self.calls.append((method, path))
         return {"method": method, "path": path}
 
+    def stream_bytes(self, path: str, *, extra_headers=None, accepted_statuses=None) -> dict[str, object]:
+        self.calls.append(("STREAM", path))
+        return {"path": path, "headers": extra_headers, "acceptedStatuses": accepted_statuses}
+
 
 class FakeDownloadProxy(RemoteRunnerResultPackageProxyMixin):
     def __init__(self) -> None:
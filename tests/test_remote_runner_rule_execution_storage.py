@@ -9,6 +9,7 @@ from apps.remote_runner.rule_execution_storage import (
     append_run_rule_event,
     fetch_run_rules,
     upsert_run_rule_state,
+    write_run_rule_projection_batch,
 )
 from apps.remote_runner.run_execution_storage import claim_next_run_job, complete_run_attempt
 from apps.remote_runner.storage import create_run_record
@@ -135,6 +136,62 @@ def test_rule_execution_storage_rejects_stale_attempt_publish(tmp_path: Path) ->
         )
 
 
+def test_rule_projection_batch_writes_states_and_events_in_order(tmp_path: Path) -> None:
+    cfg, claim = _create_claim(tmp_path, "run_rule_batch")
+    context = {
+        "run_id": str(claim["runId"]),
+        "attempt_id": str(claim["attemptId"]),
+        "lease_generation": int(claim["leaseGeneration"]),
+    }
+
+    stored = write_run_rule_projection_batch(
+        cfg,
+        rule_states=[
+            {**context, "rule_name": "trim_reads", "status": "running", "started_at": "2099-06-07T10:00:02Z"},
+            {**context, "rule_name": "trim_reads", "status": "succeeded", "exit_code": 0},
+            {**context, "rule_name": "summarize", "status": "pending"},
+        ],
+        rule_events=[
+            {**context, "rule_name": "trim_reads", "event_type": "rule_started", "status": "running"},
+            {**context, "rule_name": "trim_reads", "event_type": "rule_finished", "status": "succeeded"},
+        ],
+    )
+
+    rules = {item["ruleName"]: item for item in fetch_run_rules(cfg, str(claim["runId"]))["items"]}
+    assert {rule["ruleName"] for rule in stored.values()} == {"trim_reads", "summarize"}
+    assert rules["trim_reads"]["status"] == "succeeded"
+    assert rules["trim_reads"]["startedAt"] == "2099-06-07T10:00:02Z"
+    assert rules["trim_reads"]["attemptNumber"] == int(claim["attempt"]["attemptNumber"])
+    assert [event["eventType"] for event in rules["trim_reads"]["events"]] == ["rule_started", "rule_finished"]
+    assert rules["summarize"]["status"] == "pending"
+
+
+def test_rule_projection_batch_rolls_back_when_any_item_is_stale(tmp_path: Path) -> None:
+    cfg, claim = _create_claim(tmp_path, "run_rule_batch_stale")
+    context = {
+        "run_id": str(claim["runId"]),
+        "attempt_id": str(claim["attemptId"]),
+        "lease_generation": int(claim["leaseGeneration"]),
+    }
+
+    with pytest.raises(RuntimeError, match="RUN_RULE_EVENT_STALE_ATTEMPT"):
+        write_run_rule_projection_batch(
+            cfg,
+            rule_states=[{**context, "rule_name": "trim_reads", "status": "running"}],
+            rule_events=[
+                {
+                    **context,
+                    "attempt_id": "att_superseded",
+                    "rule_name": "trim_reads",
+                    "event_type": "rule_started",
+                    "status": "running",
+                }
+            ],
+        )
+
+    assert fetch_run_rules(cfg, str(claim["runId"]))["items"] == []
+
+
 def test_fetch_run_rules_requires_existing_run(tmp_path: Path) -> None:
     cfg = make_configured_remote_runner(tmp_path)
 
@@ -247,11 +247,12 @@ def test_transport_and_proxy_do_not_keep_basic_run_command_methods() -> None:
 
 
 def test_transport_rejects_unlisted_contract_success_status(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_urlopen(_request, timeout):
-        assert timeout == 5
-        return FakeHttpResponse(status=200, body={"data": {"queued": True}})
+    class FakePool:
+        def open(self, _method, _url, *, headers, body, timeout):
+            assert timeout == 5
+            return FakeHttpResponse(status=200, body={"data": {"queued": True}})
 
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr("core.remote_runner.client.get_runner_http_pool", FakePool)
 
     client = RemoteRunnerHttpClient("http://runner.example", "token")
     with pytest.raises(RemoteRunnerClientError) as exc_info:
@@ -298,14 +299,10 @@ class FakeCommandClient:
 class FakeHttpResponse:
     def __init__(self, *, status: int, body: dict[str, object]) -> None:
         self.status = status
+        self.headers: dict[str, str] = {}
+        self.timing: dict[str, object] = {}
         self._body = json.dumps(body).encode("utf-8")
 
-    def __enter__(self):
-        return self
-
-    def __exit__(self, _exc_type, _exc, _traceback) -> None:
-        return None
-
     def read(self) -> bytes:
         return self._body
 
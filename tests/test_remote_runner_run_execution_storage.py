@@ -193,6 +193,7 @@ def test_run_execution_storage_migrates_retry_timeout_and_publish_columns(tmp_pa
         "retry_policy_json",
         "timeout_policy_json",
         "execution_options_json",
+        "resource_request_json",
         "dead_lettered_at",
     }.issubset(job_columns)
     assert {
@@ -396,6 +397,133 @@ def test_admission_rejects_when_slot_or_resources_unavailable_before_lease(tmp_p
     }
 
 
+def _claim_with_capacity(cfg, slot_id: str, now: str, *, cpu: int = 4):
+    return claim_next_run_job(
+        cfg,
+        worker_id="worker_backfill",
+        session_id="session_backfill",
+        slot_id=slot_id,
+        resource_request=ResourceRequest(cpu=1),
+        resource_capacity=ResourceRequest(cpu=cpu),
+        max_active_slots=3,
+        now=now,
+        lease_seconds=30,
+    )
+
+
+def _queue_ahead(cfg, run_id: str) -> None:
+    with get_connection(cfg) as connection:
+        connection.execute("UPDATE run_jobs SET available_at = '2000-01-01T00:00:00Z' WHERE run_id = ?", (run_id,))
+        connection.commit()
+
+
+def _job_wait_reason(cfg, run_id: str) -> dict:
+    with get_connection(cfg) as connection:
+        row = connection.execute("SELECT wait_reason_json FROM run_jobs WHERE run_id = ?", (run_id,)).fetchone()
+    return json.loads(row["wait_reason_json"])
+
+
+def test_backfill_claims_smaller_job_behind_resource_blocked_head(tmp_path):
+    cfg = make_configured_remote_runner(tmp_path)
+    _create_run(cfg, "run_running", execution={"resources": {"cpu": 2}})
+    running = _claim_with_capacity(cfg, "slot-0", "2099-06-07T10:00:00Z")
+    _create_run(cfg, "run_large", execution={"resources": {"cpu": 4, "memoryMb": 0}})
+    _create_run(cfg, "run_small", execution={"resources": {"cpu": 1}})
+    _queue_ahead(cfg, "run_large")
+
+    backfilled = _claim_with_capacity(cfg, "slot-1", "2099-06-07T10:00:05Z")
+
+    assert running["resourceRequest"]["cpu"] == 2
+    assert backfilled is not None
+    assert backfilled["runId"] == "run_small"
+    assert backfilled["resourceRequest"] == {"cpu": 1, "memoryMb": 0, "diskMb": 0, "gpu": 0}
+    assert backfilled["job"]["resourcePolicy"]["cpu"] == 1
+    assert _queued_attempt_and_lease_counts(cfg, "run_large") == ("queued", 0, 0)
+    assert _job_wait_reason(cfg, "run_large") == {
+        "code": "ADMISSION_RESOURCES_UNAVAILABLE",
+        "resource": "cpu",
+        "available": 2,
+        "requested": 4,
+        "reservedSince": "2099-06-07T10:00:05Z",
+    }
+    with get_connection(cfg) as connection:
+        allocation = connection.execute(
+            "SELECT cpu FROM run_resource_allocations WHERE attempt_id = ?",
+            (backfilled["attemptId"],),
+        ).fetchone()
+    assert allocation["cpu"] == 1
+
+
+def test_expired_head_reservation_stops_backfill_until_head_fits(tmp_path):
+    cfg = make_configured_remote_runner(tmp_path)
+    _create_run(cfg, "run_running", execution={"resources": {"cpu": 2}})
+    running = _claim_with_capacity(cfg, "slot-0", "2099-06-07T10:00:00Z")
+    _create_run(cfg, "run_large", execution={"resources": {"cpu": 4}})
+    _queue_ahead(cfg, "run_large")
+    assert _claim_with_capacity(cfg, "slot-1", "2099-06-07T10:00:05Z") is None
+    _create_run(cfg, "run_small", execution={"resources": {"cpu": 1}})
+
+    starved = _claim_with_capacity(cfg, "slot-1", "2099-06-07T10:05:05Z")
+    reservation = _job_wait_reason(cfg, "run_large")
+    complete_run_attempt(
+        cfg,
+        running["attemptId"],
+        lease_generation=running["leaseGeneration"],
+        state="succeeded",
+        exit_code=0,
+        now="2099-06-07T10:05:06Z",
+    )
+    head = _claim_with_capacity(cfg, "slot-1", "2099-06-07T10:05:07Z")
+
+    assert starved is None
+    assert reservation["reservedSince"] == "2099-06-07T10:00:05Z"
+    assert _queued_attempt_and_lease_counts(cfg, "run_small") == ("queued", 0, 0)
+    assert head is not None and head["runId"] == "run_large"
+
+
+def test_strict_admission_mode_leaves_smaller_jobs_waiting(tmp_path):
+    cfg = make_configured_remote_runner(tmp_path)
+    cfg.run_admission_mode = "strict"
+    _create_run(cfg, "run_running", execution={"resources": {"cpu": 2}})
+    _claim_with_capacity(cfg, "slot-0", "2099-06-07T10:00:00Z")
+    _create_run(cfg, "run_large", execution={"resources": {"cpu": 4}})
+    _create_run(cfg, "run_small", execution={"resources": {"cpu": 1}})
+    _queue_ahead(cfg, "run_large")
+
+    assert _claim_with_capacity(cfg, "slot-1", "2099-06-07T10:00:05Z") is None
+    assert "reservedSince" not in _job_wait_reason(cfg, "run_large")
+
+
+@pytest.mark.parametrize("admission_mode", ["backfill", "strict"])
+def test_head_larger_than_capacity_is_dead_lettered_instead_of_blocking_the_queue(tmp_path, admission_mode):
+    cfg = make_configured_remote_runner(tmp_path)
+    cfg.run_admission_mode = admission_mode
+    _create_run(cfg, "run_oversized", execution={"resources": {"cpu": 64}})
+    _create_run(cfg, "run_small", execution={"resources": {"cpu": 1}})
+    _queue_ahead(cfg, "run_oversized")
+
+    claimed = _claim_with_capacity(cfg, "slot-0", "2099-06-07T10:10:00Z")
+
+    assert claimed is not None and claimed["runId"] == "run_small"
+    assert _job_wait_reason(cfg, "run_oversized") == {
+        "code": "ADMISSION_REQUEST_EXCEEDS_CAPACITY",
+        "resource": "cpu",
+        "capacity": 4,
+        "requested": 64,
+    }
+    with get_connection(cfg) as connection:
+        job = connection.execute(
+            "SELECT state, dead_lettered_at FROM run_jobs WHERE run_id = 'run_oversized'"
+        ).fetchone()
+        run = connection.execute("SELECT status FROM runs WHERE run_id = 'run_oversized'").fetchone()
+        event = connection.execute(
+            "SELECT details_json FROM run_events WHERE run_id = 'run_oversized' AND event_type = 'run_job_dead_lettered'"
+        ).fetchone()
+    assert dict(job) == {"state": "failed", "dead_lettered_at": "2099-06-07T10:10:00Z"}
+    assert run["status"] == "failed"
+    assert json.loads(event["details_json"])["payload"]["reason"] == "ADMISSION_REQUEST_EXCEEDS_CAPACITY"
+
+
 def test_claim_and_admission_wait_emit_structured_decision_logs(tmp_path, caplog) -> None:
     cfg = make_configured_remote_runner(tmp_path)
     _create_run(cfg, "run_log_claimed")
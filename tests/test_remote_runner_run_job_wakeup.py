@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from apps.remote_runner.metrics import get_metrics, reset_metrics
+from apps.remote_runner.run_job_wakeup import RunJobWakeup
+
+
+def test_notification_sent_before_wait_is_not_lost() -> None:
+    wakeup = RunJobWakeup()
+    generation = wakeup.generation()
+
+    wakeup.notify("enqueued")
+
+    assert wakeup.wait(generation, 0) is True
+    assert wakeup.wait(wakeup.generation(), 0.01) is False
+
+
+def test_deferred_notification_wakes_waiters_when_the_job_becomes_available() -> None:
+    wakeup = RunJobWakeup()
+    generation = wakeup.generation()
+
+    wakeup.notify("retry_scheduled", delay_seconds=0.05)
+    started = time.monotonic()
+    notified = wakeup.wait(generation, 5)
+    elapsed = time.monotonic() - started
+
+    assert notified is True
+    assert 0.04 <= elapsed < 2
+    assert wakeup.snapshot() == {
+        "generation": 1,
+        "pendingDueWakeups": 0,
+        "notifications": {"retry_scheduled": 1},
+    }
+
+
+def test_interrupt_releases_a_stopping_waiter() -> None:
+    wakeup = RunJobWakeup()
+    stopping = threading.Event()
+    results: list[bool] = []
+    waiter = threading.Thread(
+        target=lambda: results.append(wakeup.wait(wakeup.generation(), 30, interrupted=stopping.is_set))
+    )
+    waiter.start()
+
+    stopping.set()
+    wakeup.interrupt()
+    waiter.join(timeout=2)
+
+    assert results == [False]
+
+
+def test_claim_after_enqueue_records_enqueue_to_claim_latency() -> None:
+    reset_metrics()
+    wakeup = RunJobWakeup()
+
+    wakeup.notify("enqueued", run_id="run_latency")
+    wakeup.record_claimed("run_latency")
+    wakeup.record_claimed("run_latency")
+
+    latency = get_metrics().snapshot()["enqueueToClaimSeconds"]
+    assert latency["count"] == 1
+    assert latency["max"] < 1
+    reset_metrics()
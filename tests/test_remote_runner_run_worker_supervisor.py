@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 import threading
 import time
 from pathlib import Path
@@ -10,6 +11,7 @@ import pytest
 
 from apps.remote_runner.config import RemoteRunnerConfig, ensure_runtime_layout
 from apps.remote_runner.resource_pool import ResourceRequest
+from apps.remote_runner.run_job_wakeup import RunJobWakeup
 from apps.remote_runner.run_execution_storage import claim_next_run_job, request_run_cancel
 from apps.remote_runner.run_worker_storage import build_run_worker_health
 from apps.remote_runner.storage import create_run_record, fetch_run, update_run_state
@@ -362,6 +364,119 @@ def test_two_slot_supervisor_cancel_isolation(monkeypatch, tmp_path: Path) -> No
     assert active_allocations == 0
 
 
+def test_idle_slot_claims_a_submitted_run_without_waiting_for_the_safety_poll(monkeypatch, tmp_path: Path) -> None:
+    from apps.remote_runner import executor, worker_supervisor
+    from apps.remote_runner.metrics import get_metrics, reset_metrics
+
+    cfg = _config(tmp_path)
+    claims: list[str] = []
+    finished = threading.Event()
+    real_process_next_run_job = worker_supervisor.process_next_run_job
+
+    def counting_process_next_run_job(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        result = real_process_next_run_job(*args, **kwargs)
+        claims.append(str(result.get("runId") or ""))
+        return result
+
+    def fake_workflow(
+        cfg: RemoteRunnerConfig,
+        *,
+        run_id: str,
+        request_id: str,
+        attempt_id: str,
+        lease_generation: int,
+        **_kwargs: Any,
+    ) -> None:
+        update_run_state(
+            cfg,
+            run_id=run_id,
+            status="completed",
+            stage="finalize",
+            message="Fake workflow completed.",
+            request_id=request_id,
+            attempt_id=attempt_id,
+            lease_generation=lease_generation,
+        )
+        finished.set()
+
+    reset_metrics()
+    monkeypatch.setattr(executor, "_execute_snakemake_workflow", fake_workflow)
+    monkeypatch.setattr(worker_supervisor, "process_next_run_job", counting_process_next_run_job)
+    supervisor = worker_supervisor.start_run_worker_supervisor(
+        cfg,
+        worker_id="worker_wakeup",
+        poll_interval_seconds=0.01,
+        heartbeat_interval_seconds=0,
+        idle_poll_interval_seconds=30,
+    )
+    try:
+        deadline = time.monotonic() + 2
+        while not claims and time.monotonic() < deadline:
+            time.sleep(0.01)
+        run_id = _create_queued_run(cfg, "run_wakeup")
+
+        assert finished.wait(timeout=2)
+    finally:
+        started_stop = time.monotonic()
+        supervisor.stop(timeout_seconds=2)
+        stop_seconds = time.monotonic() - started_stop
+
+    assert claims[0] == ""
+    assert fetch_run(cfg, run_id)["status"] == "completed"
+    assert get_metrics().snapshot()["enqueueToClaimSeconds"]["count"] == 1
+    assert stop_seconds < 2
+    reset_metrics()
+
+
+def test_reconciler_requeue_wakes_idle_slots_when_the_backoff_elapses(monkeypatch) -> None:
+    from apps.remote_runner import worker_supervisor
+
+    available_at = (datetime.now(timezone.utc) + timedelta(seconds=2)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    due = datetime.strptime(available_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+    reconciled = [
+        [{"type": "run_attempt_recovered", "action": "requeued", "jobId": "job_retry", "availableAt": available_at}]
+    ]
+    claimed = threading.Event()
+    polls: list[float] = []
+
+    def claim_once_due(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
+        polls.append(time.time())
+        if polls[-1] >= due:
+            claimed.set()
+            return {"claimed": True, "runId": "run_retry"}
+        return {"claimed": False}
+
+    monkeypatch.setattr(worker_supervisor, "register_run_worker", lambda _cfg, **_kwargs: {})
+    monkeypatch.setattr(worker_supervisor, "register_run_worker_slot", lambda _cfg, **_kwargs: {})
+    monkeypatch.setattr(worker_supervisor, "heartbeat_run_worker", lambda _cfg, **_kwargs: {})
+    monkeypatch.setattr(worker_supervisor, "mark_run_worker_stopped", lambda _cfg, **_kwargs: {})
+    monkeypatch.setattr(worker_supervisor, "run_worker_is_draining", lambda _cfg, _worker_id: False)
+    monkeypatch.setattr(
+        worker_supervisor,
+        "run_active_reconciler_once",
+        lambda _cfg: reconciled.pop() if reconciled else [],
+    )
+    monkeypatch.setattr(worker_supervisor, "process_next_run_job", claim_once_due)
+    wakeup = RunJobWakeup()
+    supervisor = worker_supervisor.RunWorkerSupervisor(
+        SimpleNamespace(service_name="test-runner"),
+        worker_id="worker_delayed_requeue",
+        poll_interval_seconds=0.01,
+        heartbeat_interval_seconds=0,
+        error_backoff_seconds=0.01,
+        idle_poll_interval_seconds=30,
+        wakeup=wakeup,
+    )
+    supervisor.start()
+    try:
+        assert claimed.wait(timeout=5)
+    finally:
+        supervisor.stop(timeout_seconds=2)
+
+    assert polls[-1] - due < 1.5
+    assert wakeup.snapshot()["notifications"]["reconciled"] == 2
+
+
 def test_run_worker_supervisor_drain_skips_new_claims(monkeypatch) -> None:
     from apps.remote_runner import worker_supervisor
 
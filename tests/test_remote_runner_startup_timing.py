@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from apps.remote_runner import main, startup_timing
+from apps.remote_runner.health_service import build_health_startup_payload
+from apps.remote_runner.route_errors import register_exception_handlers
+from apps.remote_runner.route_groups import RouteGroupRegistry, lazy_route_groups_enabled
+from apps.remote_runner.startup_timing import StartupTimeline
+from tests.helpers.reference_database import make_configured_remote_runner
+
+
+def test_route_groups_are_included_eagerly_by_default() -> None:
+    assert main.route_groups.loaded_groups() == {group.name for group in main.ROUTE_GROUPS}
+    paths = main.app.openapi()["paths"]
+    assert "/api/v1/secrets/provider-readiness" in paths
+    assert "/api/v1/audit/events" in paths
+    assert "/api/v1/databases" in paths
+
+
+def test_lazy_route_group_is_imported_by_its_first_request(monkeypatch) -> None:
+    recorded: dict[str, dict[str, object]] = {}
+    monkeypatch.setattr(
+        startup_timing.STARTUP_TIMELINE,
+        "record_route_group",
+        lambda name, **fields: recorded.__setitem__(name, fields),
+    )
+    app = FastAPI()
+    register_exception_handlers(app)
+    registry = RouteGroupRegistry(app, main.ROUTE_GROUPS)
+    registry.register(lazy=True)
+    client = TestClient(app)
+
+    assert registry.loaded_groups() == set()
+    assert client.get("/api/v1/unknown").status_code == 404
+    assert client.get("/api/v1/secrets/provider-readiness").status_code == 401
+    assert registry.loaded_groups() == {"secrets"}
+    assert recorded["secrets"]["loaded"] is True
+    assert recorded["audit"] == {"lazy": True, "loaded": False}
+
+    assert "/api/v1/audit/events" in client.get("/openapi.json").json()["paths"]
+    assert registry.loaded_groups() == {group.name for group in main.ROUTE_GROUPS}
+
+
+def test_lazy_route_groups_flag_is_strict(monkeypatch) -> None:
+    assert lazy_route_groups_enabled() is False
+    monkeypatch.setenv("H2OMETA_REMOTE_LAZY_ROUTE_GROUPS", "on")
+    assert lazy_route_groups_enabled() is True
+    monkeypatch.setenv("H2OMETA_REMOTE_LAZY_ROUTE_GROUPS", "sometimes")
+    with pytest.raises(ValueError, match="H2OMETA_REMOTE_LAZY_ROUTE_GROUPS_INVALID"):
+        lazy_route_groups_enabled()
+
+
+def test_startup_health_reports_phase_breakdown_and_bundled_bytecode(tmp_path: Path, monkeypatch) -> None:
+    timeline = StartupTimeline()
+    with timeline.phase("import"):
+        pass
+    timeline.record("schema_check", 0.25)
+    timeline.record_route_group("audit", lazy=True, loaded=False)
+    timeline.mark_ready()
+    manifest = tmp_path / "bootstrap_manifest.json"
+    manifest.write_text(json.dumps({"bytecode": {"cacheTag": "cpython-312"}}), encoding="utf-8")
+    monkeypatch.setattr(startup_timing, "STARTUP_TIMELINE", timeline)
+    monkeypatch.setattr(startup_timing, "_RELEASE_MANIFEST", manifest)
+
+    payload = build_health_startup_payload(make_configured_remote_runner(tmp_path))
+
+    timing = payload["startupTiming"]
+    assert set(timing["phasesMs"]) == {"import", "schema_check"}
+    assert timing["phasesMs"]["schema_check"] == 250.0
+    assert timing["readyMs"] >= 0
+    assert timing["routeGroups"] == {"audit": {"lazy": True, "loaded": False, "loadMs": 0.0}}
+    assert timing["bytecode"] == {"cacheTag": "cpython-312"}
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import hashlib
+import io
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+import pytest
+
+from apps.remote_runner import route_utils
+from apps.remote_runner import upload_session_storage
+from apps.remote_runner.errors import RemoteRunnerNotFoundError, RemoteRunnerOperationBlockedError
+from apps.remote_runner.main import app
+from apps.remote_runner.storage import fetch_upload
+from apps.remote_runner.upload_session_storage import (
+    append_upload_chunk,
+    complete_upload_session,
+    create_upload_session,
+    expire_upload_sessions,
+    require_upload_session,
+)
+from core.app_runtime.errors import RuntimeServiceError
+from core.app_runtime.managers.file import FileManager
+from core.contracts.submission_remote_endpoints import (
+    UPLOAD_SESSION_CHUNK,
+    UPLOAD_SESSION_COMPLETE,
+    UPLOAD_SESSION_CREATE,
+    UPLOAD_SESSION_READ,
+)
+from tests.helpers.reference_database import make_configured_remote_runner
+
+
+def _sha(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def test_chunked_upload_routes_stream_raw_bytes_into_a_regular_upload(tmp_path: Path, monkeypatch) -> None:
+    cfg = make_configured_remote_runner(tmp_path, token="upload-token")
+    monkeypatch.setattr(route_utils, "load_remote_runner_config", lambda: cfg)
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer upload-token"}
+    content = b"@r1\nACGT\n+\nIIII\n" * 1000
+    first, second = content[:7000], content[7000:]
+
+    created = client.post(
+        "/api/v1/upload-sessions",
+        json={"filename": "reads.fq", "sizeBytes": len(content), "sha256": _sha(content)},
+        headers=headers,
+    ).json()["data"]
+    session_path = f"/api/v1/upload-sessions/{created['uploadSessionId']}"
+    client.post(
+        f"{session_path}/chunks",
+        params={"offset": 0, "sha256": _sha(first)},
+        content=first,
+        headers=headers,
+    )
+    stale = client.post(
+        f"{session_path}/chunks",
+        params={"offset": 0, "sha256": _sha(second)},
+        content=second,
+        headers=headers,
+    )
+    resumed = client.get(session_path, headers=headers).json()["data"]
+    client.post(
+        f"{session_path}/chunks",
+        params={"offset": resumed["receivedBytes"], "sha256": _sha(second)},
+        content=second,
+        headers=headers,
+    )
+    upload = client.post(f"{session_path}/complete", headers=headers).json()["data"]
+
+    assert created["receivedBytes"] == 0
+    assert stale.status_code == 409
+    assert stale.json()["detail"] == {"code": "UPLOAD_SESSION_OFFSET_MISMATCH", "receivedBytes": len(first)}
+    assert upload["sha256"] == _sha(content)
+    assert upload["sizeBytes"] == len(content)
+    assert Path(upload["path"]).read_bytes() == content
+    assert fetch_upload(cfg, upload["uploadId"]) == upload
+
+
+def test_chunk_checksum_and_incomplete_sessions_are_rejected(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    session = create_upload_session(cfg, filename="reads.fq", size_bytes=8)
+
+    with pytest.raises(ValueError, match="UPLOAD_CHUNK_CHECKSUM_MISMATCH"):
+        append_upload_chunk(cfg, session["uploadSessionId"], offset=0, content=b"ACGT", sha256=_sha(b"TTTT"))
+    append_upload_chunk(cfg, session["uploadSessionId"], offset=0, content=b"ACGT", sha256=_sha(b"ACGT"))
+    with pytest.raises(RemoteRunnerOperationBlockedError) as incomplete:
+        complete_upload_session(cfg, session["uploadSessionId"])
+
+    assert incomplete.value.payload == {"code": "UPLOAD_SESSION_INCOMPLETE", "receivedBytes": 4, "sizeBytes": 8}
+
+
+def test_whole_file_checksum_mismatch_discards_the_partial_file(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    session = create_upload_session(cfg, filename="reads.fq", size_bytes=4, sha256=_sha(b"TTTT"))
+    append_upload_chunk(cfg, session["uploadSessionId"], offset=0, content=b"ACGT", sha256=_sha(b"ACGT"))
+
+    with pytest.raises(ValueError, match="UPLOAD_CHECKSUM_MISMATCH"):
+        complete_upload_session(cfg, session["uploadSessionId"])
+
+    assert require_upload_session(cfg, session["uploadSessionId"])["state"] == "failed"
+    assert not any((Path(cfg.uploads_dir) / ".partial").iterdir())
+
+
+def test_completion_is_idempotent_and_stale_sessions_expire(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    done = create_upload_session(cfg, filename="done.txt", size_bytes=2)
+    append_upload_chunk(cfg, done["uploadSessionId"], offset=0, content=b"ok", sha256=_sha(b"ok"))
+    stale = create_upload_session(cfg, filename="stale.txt", size_bytes=2)
+
+    first = complete_upload_session(cfg, done["uploadSessionId"])
+    again = complete_upload_session(cfg, done["uploadSessionId"])
+    expired = expire_upload_sessions(cfg, now="2999-01-01T00:00:00Z")
+
+    assert again == first
+    assert expired == 1
+    assert require_upload_session(cfg, stale["uploadSessionId"])["state"] == "expired"
+    assert not any((Path(cfg.uploads_dir) / ".partial").iterdir())
+
+
+def test_unknown_and_closed_sessions_leave_no_lock_behind(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    done = create_upload_session(cfg, filename="done.txt", size_bytes=2)
+    append_upload_chunk(cfg, done["uploadSessionId"], offset=0, content=b"ok", sha256=_sha(b"ok"))
+    complete_upload_session(cfg, done["uploadSessionId"])
+    before = dict(upload_session_storage._SESSION_LOCKS)
+
+    for attempt in range(3):
+        with pytest.raises(RemoteRunnerNotFoundError, match="UPLOAD_SESSION_NOT_FOUND"):
+            append_upload_chunk(cfg, f"missing-{attempt}", offset=0, content=b"ok", sha256=_sha(b"ok"))
+        with pytest.raises(RemoteRunnerNotFoundError, match="UPLOAD_SESSION_NOT_FOUND"):
+            complete_upload_session(cfg, f"missing-{attempt}")
+        complete_upload_session(cfg, done["uploadSessionId"])
+        with pytest.raises(RemoteRunnerOperationBlockedError):
+            append_upload_chunk(cfg, done["uploadSessionId"], offset=0, content=b"ok", sha256=_sha(b"ok"))
+
+    assert upload_session_storage._SESSION_LOCKS == before
+
+
+def test_runtime_chunked_upload_resumes_from_runner_offset_after_a_dropped_connection(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    content = bytes(range(256)) * 3
+    manager = FileManager(service=None)
+    calls: list[str] = []
+    dropped = {"remaining": 1}
+
+    def call_remote_endpoint(endpoint_id, *, path_values, query_values=None, payload=None, raw_body=None, **_kwargs):
+        calls.append(endpoint_id)
+        if endpoint_id == UPLOAD_SESSION_CREATE:
+            session = create_upload_session(cfg, filename=payload["filename"], size_bytes=payload["sizeBytes"])
+            return {**session, "chunkSizeBytes": 300}
+        session_id = path_values["upload_session_id"]
+        if endpoint_id == UPLOAD_SESSION_READ:
+            return require_upload_session(cfg, session_id)
+        if endpoint_id == UPLOAD_SESSION_COMPLETE:
+            return complete_upload_session(cfg, session_id)
+        session = append_upload_chunk(cfg, session_id, content=raw_body, **query_values)
+        if query_values["offset"] == 300 and dropped["remaining"]:
+            dropped["remaining"] -= 1
+            raise RuntimeServiceError("runner unreachable")
+        return session
+
+    manager.call_remote_endpoint = call_remote_endpoint
+    upload = manager.upload_file_chunked(io.BytesIO(content), filename="reads.bin", size_bytes=len(content))
+
+    assert Path(upload["path"]).read_bytes() == content
+    assert calls == [
+        UPLOAD_SESSION_CREATE,
+        UPLOAD_SESSION_CHUNK,
+        UPLOAD_SESSION_CHUNK,
+        UPLOAD_SESSION_READ,
+        UPLOAD_SESSION_CHUNK,
+        UPLOAD_SESSION_COMPLETE,
+    ]
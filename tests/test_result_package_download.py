@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from fastapi.testclient import TestClient
 import pytest
 
+from apps.remote_runner import route_utils
 from apps.remote_runner.artifact_product_service import export_result_package
+from apps.remote_runner.main import app
 from apps.remote_runner.result_package_download_service import build_result_package_download
 from apps.remote_runner.storage import create_run_record, persist_artifact
 from apps.remote_runner.storage_core import get_connection
@@ -35,6 +38,33 @@ def test_result_package_download_validates_record_and_checksum(tmp_path: Path) -
     assert download["headers"]["X-H2OMeta-Package-Export-Id"] == package["packageExportId"]
 
 
+def test_result_package_download_route_resumes_byte_ranges_for_the_same_package(tmp_path: Path, monkeypatch) -> None:
+    cfg = make_configured_remote_runner(tmp_path, token="download-token")
+    monkeypatch.setattr(route_utils, "load_remote_runner_config", lambda: cfg)
+    _create_exportable_result(cfg, "run_download_range")
+    package = export_result_package(cfg, "res_run_download_range", include_artifacts=True)
+    content = Path(package["packagePath"]).read_bytes()
+    url = f"/api/v1/results/res_run_download_range/exports/{package['packageExportId']}/download"
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer download-token"}
+
+    full = client.get(url, headers=headers)
+    resumed = client.get(url, headers={**headers, "Range": "bytes=100-", "If-Range": full.headers["etag"]})
+    stale = client.get(url, headers={**headers, "Range": "bytes=100-", "If-Range": '"stale"'})
+    beyond = client.get(url, headers={**headers, "Range": f"bytes={len(content) + 1}-"})
+
+    assert full.status_code == 200
+    assert full.headers["accept-ranges"] == "bytes"
+    assert full.headers["etag"] == f'"{package["sha256"]}"'
+    assert full.content == content
+    assert resumed.status_code == 206
+    assert resumed.headers["content-range"] == f"bytes 100-{len(content) - 1}/{len(content)}"
+    assert full.content[:100] + resumed.content == content
+    assert stale.status_code == 200
+    assert stale.content == content
+    assert beyond.status_code == 416
+
+
 def test_result_package_download_rejects_unknown_or_invalid_export_id(tmp_path: Path) -> None:
     cfg = make_configured_remote_runner(tmp_path)
 
@@ -84,7 +84,7 @@ def test_result_read_routes_record_safe_allow_audit_and_redact_public_payload(tm
     )
     monkeypatch.setattr(route_utils, "load_remote_runner_config", lambda: cfg)
     monkeypatch.setattr(result_read_service, "fetch_run_results", lambda _cfg, run_id: _raw_run_results(run_id))
-    monkeypatch.setattr(result_read_service, "list_results", lambda _cfg: [_raw_result_summary()])
+    monkeypatch.setattr(result_read_service, "list_results", lambda _cfg, **_query: [_raw_result_summary()])
     monkeypatch.setattr(result_read_service, "fetch_result", lambda _cfg, result_id: _raw_result_detail(result_id))
 
     client = TestClient(app)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from apps.remote_runner.metrics import get_metrics, reset_metrics
 from apps.remote_runner.rule_execution_projection import (
     mark_run_rules_failed,
     mark_run_rules_running,
@@ -327,6 +328,53 @@ def test_snakemake_rule_event_projector_tails_complete_jsonl_lines_once(tmp_path
     assert event_types.count("rule_finished") == 1
 
 
+def test_snakemake_rule_event_projector_writes_each_poll_as_one_batch(tmp_path: Path, monkeypatch) -> None:
+    from apps.remote_runner import snakemake_rule_event_projection
+
+    cfg, claim = _claim_for_projection(tmp_path)
+    run_id = str(claim["runId"])
+    event_log = tmp_path / "batched-events.jsonl"
+    records = []
+    for job_id in range(1, 6):
+        records.append({"event": "JOB_INFO", "jobId": job_id, "ruleName": f"rule_{job_id}"})
+        records.append({"event": "JOB_STARTED", "jobIds": [job_id], "createdAt": "2099-06-07T10:00:02Z"})
+        records.append({"event": "JOB_FINISHED", "jobId": job_id, "createdAt": "2099-06-07T10:00:04Z"})
+    event_log.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    batch_writes: list[int] = []
+    write_batch = snakemake_rule_event_projection.write_run_rule_projection_batch
+
+    def counting_write(cfg, *, rule_states, rule_events):
+        batch_writes.append(len(rule_states) + len(rule_events))
+        return write_batch(cfg, rule_states=rule_states, rule_events=rule_events)
+
+    monkeypatch.setattr(snakemake_rule_event_projection, "write_run_rule_projection_batch", counting_write)
+    reset_metrics()
+    projector = SnakemakeRuleEventProjector(
+        cfg,
+        run_id=run_id,
+        attempt_id=str(claim["attemptId"]),
+        lease_generation=int(claim["leaseGeneration"]),
+        attempt_number=int(claim["attempt"]["attemptNumber"]),
+        event_log_path=event_log,
+    )
+
+    result = projector.poll()
+    snapshot = get_metrics().snapshot()
+    reset_metrics()
+
+    rules = {item["ruleName"]: item for item in fetch_run_rules(cfg, run_id)["items"]}
+    assert result["newEventCount"] == 15
+    assert result["batchSize"] == 30
+    assert batch_writes == [30]
+    assert snapshot["ruleProjectionBatchSize"]["count"] == 1
+    assert snapshot["ruleProjectionBatchSize"]["max"] == 30
+    assert snapshot["ruleProjectionCommitSeconds"]["count"] == 1
+    assert {name: rule["status"] for name, rule in rules.items()} == {f"rule_{index}": "succeeded" for index in range(1, 6)}
+    assert rules["rule_3"]["startedAt"] == "2099-06-07T10:00:02Z"
+    assert [event["eventType"] for event in rules["rule_3"]["events"]] == ["rule_observed", "rule_started", "rule_finished"]
+    assert projector.poll()["batchSize"] == 0
+
+
 def test_run_snakemake_with_rule_events_polls_logger_events_while_engine_runs(tmp_path: Path) -> None:
     cfg, claim = _claim_for_projection(tmp_path)
     run_id = str(claim["runId"])
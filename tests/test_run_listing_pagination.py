@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from apps.remote_runner.execution_query_storage import (
+    list_results,
+    list_runs,
+    next_result_page_cursor,
+    next_run_page_cursor,
+)
+from apps.remote_runner.storage import get_connection
+from tests.helpers.reference_database import make_configured_remote_runner
+
+
+def _insert_run(connection, run_id: str, *, status: str, pipeline_id: str, submitted_at: str) -> None:
+    connection.execute(
+        """
+        INSERT INTO runs (
+            run_id, server_id, project_id, pipeline_id, pipeline_version, run_spec_version,
+            status, stage, state_version, message, started_at, finished_at, result_dir,
+            last_error_json, last_updated_at, request_id, submitted_at, run_spec_json
+        ) VALUES (?, 'srv_demo', 'proj_demo', ?, '0.1.0', '2026-04-21', ?, 'finalize', 1, '', NULL, ?, '', NULL, ?, ?, ?, '{}')
+        """,
+        (
+            run_id,
+            pipeline_id,
+            status,
+            submitted_at if status in {"completed", "failed"} else None,
+            submitted_at,
+            f"req_{run_id}",
+            submitted_at,
+        ),
+    )
+
+
+def _seed_runs(tmp_path: Path):
+    cfg = make_configured_remote_runner(tmp_path)
+    with get_connection(cfg) as connection:
+        for index in range(7):
+            _insert_run(
+                connection,
+                f"run_{index:02d}",
+                status="completed" if index % 2 == 0 else "running",
+                pipeline_id="taxonomy-v1" if index < 5 else "qc-v1",
+                submitted_at=f"2026-04-21T12:0{index}:00Z",
+            )
+        # Two runs sharing a timestamp must still page deterministically by run id.
+        _insert_run(connection, "run_tie", status="completed", pipeline_id="taxonomy-v1", submitted_at="2026-04-21T12:06:00Z")
+        connection.commit()
+    return cfg
+
+
+def _collect_pages(fetch, next_cursor, *, limit: int) -> list[list[str]]:
+    pages: list[list[str]] = []
+    cursor = None
+    while True:
+        items = fetch(limit=limit, cursor=cursor)
+        pages.append([item["runId"] for item in items])
+        cursor = next_cursor(items, limit)
+        if cursor is None:
+            return pages
+
+
+def test_list_runs_keyset_pages_cover_every_run_once_in_order(tmp_path: Path) -> None:
+    cfg = _seed_runs(tmp_path)
+
+    pages = _collect_pages(lambda **query: list_runs(cfg, **query), next_run_page_cursor, limit=3)
+
+    flattened = [run_id for page in pages for run_id in page]
+    assert flattened == [run["runId"] for run in list_runs(cfg)]
+    assert flattened[:2] == ["run_tie", "run_06"]
+    assert len(flattened) == len(set(flattened)) == 8
+    assert all(len(page) <= 3 for page in pages)
+
+
+def test_list_runs_filters_by_status_pipeline_and_submission_window(tmp_path: Path) -> None:
+    cfg = _seed_runs(tmp_path)
+
+    runs = list_runs(
+        cfg,
+        status="completed",
+        pipeline_id="taxonomy-v1",
+        submitted_after="2026-04-21T12:01:00Z",
+        submitted_before="2026-04-21T12:06:00Z",
+    )
+
+    assert [run["runId"] for run in runs] == ["run_04", "run_02"]
+
+
+def test_list_results_pages_only_terminal_runs_with_artifact_counts(tmp_path: Path) -> None:
+    cfg = _seed_runs(tmp_path)
+
+    pages = _collect_pages(lambda **query: list_results(cfg, **query), next_result_page_cursor, limit=2)
+
+    flattened = [run_id for page in pages for run_id in page]
+    assert flattened == ["run_tie", "run_06", "run_04", "run_02", "run_00"]
+    first = list_results(cfg, limit=1)[0]
+    assert first["resultId"] == "res_run_tie"
+    assert first["artifactCount"] == 0
+    assert first["lineageEdges"] == []
+
+
+@pytest.mark.parametrize(
+    ("query", "code"),
+    [
+        ({"limit": 0}, "LISTING_LIMIT_INVALID"),
+        ({"limit": 501}, "LISTING_LIMIT_INVALID"),
+        ({"cursor": "not-a-cursor"}, "LISTING_CURSOR_INVALID"),
+    ],
+)
+def test_list_runs_rejects_invalid_page_arguments(tmp_path: Path, query: dict, code: str) -> None:
+    cfg = _seed_runs(tmp_path)
+
+    with pytest.raises(ValueError, match=code):
+        list_runs(cfg, **query)
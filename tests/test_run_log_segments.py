@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from apps.remote_runner.log_segments import list_segments, read_index, segment_dir
+from apps.remote_runner.log_storage import (
+    append_log_lines,
+    close_run_log_writers,
+    fetch_log_lines,
+    fetch_log_tail,
+)
+from tests.helpers.reference_database import make_remote_runner_config
+
+
+def _read_all(cfg, run_id: str, stream: str, *, max_bytes: int) -> tuple[list[str], int]:
+    lines: list[str] = []
+    cursor = None
+    calls = 0
+    while True:
+        page = fetch_log_lines(cfg, run_id, stream, cursor, max_bytes=max_bytes)
+        calls += 1
+        lines.extend(page["lines"])
+        cursor = page["nextCursor"]
+        if not page["hasMore"]:
+            return lines, calls
+
+
+def test_log_reads_page_by_byte_window_and_resume_from_cursor(tmp_path: Path) -> None:
+    cfg = make_remote_runner_config(tmp_path)
+    expected = [f"line {index} – µ" for index in range(200)]
+    append_log_lines(cfg, "run_window", "stdout", expected[:150])
+    append_log_lines(cfg, "run_window", "stdout", expected[150:])
+
+    lines, calls = _read_all(cfg, "run_window", "stdout", max_bytes=512)
+
+    assert lines == expected
+    assert calls > 1
+    first = fetch_log_lines(cfg, "run_window", "stdout", None, max_bytes=512)
+    assert first["lines"] == expected[: len(first["lines"])]
+    assert int(first["nextCursor"]) <= 512
+
+
+def test_sealed_segments_are_compressed_and_still_readable(tmp_path: Path) -> None:
+    cfg = replace(make_remote_runner_config(tmp_path), log_segment_max_bytes=1024)
+    expected = [f"{index:06d} {'x' * 40}" for index in range(300)]
+    for offset in range(0, len(expected), 10):
+        append_log_lines(cfg, "run_sealed", "stderr", expected[offset : offset + 10])
+
+    segments = list_segments(segment_dir(cfg.logs_dir, "run_sealed", "stderr"))
+    lines, _ = _read_all(cfg, "run_sealed", "stderr", max_bytes=700)
+
+    assert sum(1 for segment in segments if segment.compressed) >= 10
+    assert not segments[-1].compressed
+    assert lines == expected
+
+
+def test_tail_reads_seek_through_sparse_line_index(tmp_path: Path) -> None:
+    cfg = replace(make_remote_runner_config(tmp_path), log_segment_max_bytes=16 * 1024)
+    append_log_lines(cfg, "run_tail", "stdout", [f"row {index}" for index in range(5000)])
+    close_run_log_writers(cfg, "run_tail")
+    # A fresh writer must recover the line count and keep indexing at the right offsets.
+    append_log_lines(cfg, "run_tail", "stdout", ["row 5000", "row 5001"])
+
+    tail = fetch_log_tail(cfg, "run_tail", "stdout", 3)
+    index = read_index(segment_dir(cfg.logs_dir, "run_tail", "stdout"))
+
+    assert tail["lineCount"] == 5002
+    assert tail["lines"] == ["row 4999", "row 5000", "row 5001"]
+    assert [line for line, _ in index] == [0, 1024, 2048, 3072, 4096]
+    page = fetch_log_lines(cfg, "run_tail", "stdout", str(index[2][1]), max_bytes=16)
+    assert page["lines"][0] == "row 2048"
+
+
+def test_logs_written_before_segmentation_remain_readable(tmp_path: Path) -> None:
+    cfg = make_remote_runner_config(tmp_path)
+    legacy = Path(cfg.logs_dir) / "run_legacy.stdout.log"
+    legacy.parent.mkdir(parents=True, exist_ok=True)
+    legacy.write_text("one\ntwo\nthree\n", encoding="utf-8")
+
+    assert fetch_log_lines(cfg, "run_legacy", "stdout", "4")["lines"] == ["two", "three"]
+    assert fetch_log_tail(cfg, "run_legacy", "stdout", 1) == {
+        "runId": "run_legacy",
+        "stream": "stdout",
+        "lineCount": 3,
+        "nextCursor": "14",
+        "lines": ["three"],
+    }
+
+
+def test_log_reads_reject_non_numeric_cursor(tmp_path: Path) -> None:
+    cfg = make_remote_runner_config(tmp_path)
+    append_log_lines(cfg, "run_cursor", "stdout", ["hello"])
+
+    with pytest.raises(ValueError, match="LOG_CURSOR_INVALID"):
+        fetch_log_lines(cfg, "run_cursor", "stdout", "abc")
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+import threading
+
+import pytest
+
+from apps.api import execution_query_service
+from apps.remote_runner.log_storage import append_log_lines
+from apps.remote_runner.run_update_stream import (
+    RunUpdateCursor,
+    collect_run_updates,
+    format_sse_event,
+    iter_run_update_stream,
+)
+from apps.remote_runner.storage import get_connection
+from tests.helpers.reference_database import make_configured_remote_runner
+
+
+def _seed_run(tmp_path: Path):
+    cfg = make_configured_remote_runner(tmp_path)
+    with get_connection(cfg) as connection:
+        connection.execute(
+            """
+            INSERT INTO runs (
+                run_id, server_id, project_id, pipeline_id, pipeline_version, run_spec_version,
+                status, stage, state_version, message, started_at, finished_at, result_dir,
+                last_error_json, last_updated_at, request_id, submitted_at, run_spec_json
+            ) VALUES (
+                'run_live', 'srv_demo', 'proj_demo', 'taxonomy-v1', '0.1.0', '2026-04-21',
+                'running', 'execute', 3, 'running', '2026-04-21T12:00:00Z', NULL, '',
+                NULL, '2026-04-21T12:00:00Z', 'req_live', '2026-04-21T12:00:00Z', '{}'
+            )
+            """
+        )
+        _upsert_rule(connection, "align", "running", "2026-04-21T12:00:01Z")
+        connection.commit()
+    return cfg
+
+
+def _upsert_rule(connection, rule_name: str, status: str, updated_at: str) -> None:
+    connection.execute(
+        """
+        INSERT INTO run_rules (run_rule_id, run_id, rule_name, status, message, inputs_json, updated_at)
+        VALUES (?, 'run_live', ?, ?, 'private detail', '["/data/in.fq"]', ?)
+        ON CONFLICT(run_rule_id) DO UPDATE SET status = excluded.status, updated_at = excluded.updated_at
+        """,
+        (f"rr_{rule_name}", rule_name, status, updated_at),
+    )
+
+
+def _finish_run(cfg) -> None:
+    with get_connection(cfg) as connection:
+        connection.execute(
+            "UPDATE runs SET status = 'completed', stage = 'finalize', state_version = 4 WHERE run_id = 'run_live'"
+        )
+        connection.commit()
+
+
+def _drain(stream) -> bytes:
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in stream])
+
+    return asyncio.run(collect())
+
+
+def _parse_frames(payload: bytes) -> list[dict[str, str]]:
+    frames = []
+    for block in payload.decode("utf-8").split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line and not line.startswith(":"))
+        if "event" in fields:
+            frames.append(fields)
+    return frames
+
+
+def test_collect_run_updates_emits_only_changes_since_cursor(tmp_path: Path) -> None:
+    cfg = _seed_run(tmp_path)
+    append_log_lines(cfg, "run_live", "stdout", ["start", "step 1"])
+    cursor = RunUpdateCursor()
+
+    first = collect_run_updates(cfg, "run_live", cursor)
+    idle = collect_run_updates(cfg, "run_live", cursor)
+    with get_connection(cfg) as connection:
+        _upsert_rule(connection, "align", "completed", "2026-04-21T12:00:05Z")
+        _upsert_rule(connection, "classify", "running", "2026-04-21T12:00:05Z")
+        connection.commit()
+    append_log_lines(cfg, "run_live", "stdout", ["step 2"])
+    append_log_lines(cfg, "run_live", "stderr", ["warn"])
+    second = collect_run_updates(cfg, "run_live", cursor)
+
+    assert [event for event, _ in first.events] == ["status", "rule", "log"]
+    assert first.events[0][1]["stateVersion"] == 3
+    assert first.events[1][1] == {
+        "ruleName": "align",
+        "status": "running",
+        "attemptId": "",
+        "startedAt": None,
+        "finishedAt": None,
+        "exitCode": None,
+        "updatedAt": "2026-04-21T12:00:01Z",
+    }
+    assert first.events[2][1]["lines"] == ["start", "step 1"]
+    assert idle.events == []
+    assert not idle.terminal
+    assert [(event, payload.get("ruleName") or payload.get("stream")) for event, payload in second.events] == [
+        ("rule", "align"),
+        ("rule", "classify"),
+        ("log", "stdout"),
+        ("log", "stderr"),
+    ]
+    assert second.events[2][1]["lines"] == ["step 2"]
+    assert cursor.event_id() == f"3:{len(b'start\nstep 1\nstep 2\n')}:{len(b'warn\n')}:2026-04-21T12:00:05Z"
+
+
+def test_run_update_stream_ends_after_terminal_status_and_drained_logs(tmp_path: Path) -> None:
+    cfg = _seed_run(tmp_path)
+    append_log_lines(cfg, "run_live", "stdout", [f"line {index} {'x' * 100}" for index in range(1200)])
+    polls: list[float] = []
+
+    async def finish_on_first_sleep(seconds: float) -> None:
+        polls.append(seconds)
+        append_log_lines(cfg, "run_live", "stdout", ["done"])
+        _finish_run(cfg)
+
+    payload = _drain(iter_run_update_stream(cfg, "run_live", RunUpdateCursor(), sleep=finish_on_first_sleep))
+    frames = _parse_frames(payload)
+
+    assert payload.startswith(b"retry: ")
+    assert polls == [0.5]
+    assert [frame["event"] for frame in frames if frame["event"] != "log"] == ["status", "rule", "status", "end"]
+    log_lines = [line for frame in frames if frame["event"] == "log" for line in json.loads(frame["data"])["lines"]]
+    assert len(log_lines) == 1201 and log_lines[-1] == "done"
+    statuses = [json.loads(frame["data"])["status"] for frame in frames if frame["event"] == "status"]
+    assert statuses == ["running", "completed"]
+    assert frames[-1]["id"] == frames[-2]["id"] and frames[-1]["id"].startswith("4:")
+
+
+def test_run_update_stream_resumes_from_last_event_id(tmp_path: Path) -> None:
+    cfg = _seed_run(tmp_path)
+    append_log_lines(cfg, "run_live", "stdout", ["seen", "unseen"])
+    _finish_run(cfg)
+
+    cursor = RunUpdateCursor.parse("4:5:0")
+    frames = _parse_frames(_drain(iter_run_update_stream(cfg, "run_live", cursor)))
+
+    assert [frame["event"] for frame in frames] == ["rule", "log", "end"]
+    assert json.loads(frames[1]["data"])["lines"] == ["unseen"]
+    assert cursor.resumed
+
+
+def test_run_update_stream_resume_skips_rules_below_the_watermark(tmp_path: Path) -> None:
+    cfg = _seed_run(tmp_path)
+    with get_connection(cfg) as connection:
+        _upsert_rule(connection, "classify", "running", "2026-04-21T12:00:09Z")
+        connection.commit()
+    _finish_run(cfg)
+    first = _parse_frames(_drain(iter_run_update_stream(cfg, "run_live", RunUpdateCursor())))
+    assert [json.loads(frame["data"])["ruleName"] for frame in first if frame["event"] == "rule"] == [
+        "align",
+        "classify",
+    ]
+
+    cursor = RunUpdateCursor.parse(first[-1]["id"])
+    with get_connection(cfg) as connection:
+        _upsert_rule(connection, "report", "completed", "2026-04-21T12:00:10Z")
+        connection.commit()
+    resumed = _parse_frames(_drain(iter_run_update_stream(cfg, "run_live", cursor)))
+
+    assert cursor.rules_updated_at == "2026-04-21T12:00:10Z"
+    assert [json.loads(frame["data"])["ruleName"] for frame in resumed if frame["event"] == "rule"] == [
+        "classify",
+        "report",
+    ]
+    assert resumed[-1]["id"].endswith(":2026-04-21T12:00:10Z")
+
+def test_run_update_stream_heartbeats_while_idle(tmp_path: Path) -> None:
+    cfg = _seed_run(tmp_path)
+    ticks = iter(range(0, 10_000, 20))
+    sleeps: list[float] = []
+
+    async def finish_after_two_polls(seconds: float) -> None:
+        sleeps.append(seconds)
+        if len(sleeps) == 2:
+            _finish_run(cfg)
+
+    payload = _drain(
+        iter_run_update_stream(
+            cfg,
+            "run_live",
+            RunUpdateCursor(),
+            clock=lambda: float(next(ticks)),
+            sleep=finish_after_two_polls,
+        )
+    )
+
+    assert payload.count(b": keepalive\n\n") == 2
+    end_id = "4:0:0:2026-04-21T12:00:01Z"
+    assert format_sse_event("end", {"runId": "run_live"}, event_id=end_id) in payload
+
+
+def test_run_update_stream_waits_on_the_event_loop_between_polls(tmp_path: Path) -> None:
+    cfg = _seed_run(tmp_path)
+    poll_threads: list[int] = []
+    sleep_threads: list[int] = []
+    collect = collect_run_updates
+
+    def record_poll(*args, **kwargs):
+        poll_threads.append(threading.get_ident())
+        return collect(*args, **kwargs)
+
+    async def finish_on_sleep(seconds: float) -> None:
+        sleep_threads.append(threading.get_ident())
+        _finish_run(cfg)
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr("apps.remote_runner.run_update_stream.collect_run_updates", record_poll)
+        _drain(iter_run_update_stream(cfg, "run_live", RunUpdateCursor(), sleep=finish_on_sleep))
+
+    assert sleep_threads == [threading.get_ident()]
+    assert len(poll_threads) == 2 and threading.get_ident() not in poll_threads
+
+
+def test_legacy_three_part_event_id_resumes_without_rule_watermark() -> None:
+    cursor = RunUpdateCursor.parse("4:5:0")
+    assert cursor.rules_updated_at == ""
+    assert RunUpdateCursor.parse(cursor.event_id()) == cursor
+
+
+def test_local_api_relays_runner_stream_without_blocking_the_event_loop(monkeypatch) -> None:
+    read_threads: list[int] = []
+    closed: list[bool] = []
+
+    def upstream():
+        try:
+            for chunk in (b"retry: 2000\n\n", b"event: end\n\n"):
+                read_threads.append(threading.get_ident())
+                yield chunk
+        finally:
+            closed.append(True)
+
+    class Runtime:
+        def open_run_update_stream(self, run_id, **kwargs):
+            return {"statusCode": 200, "headers": {}, "chunks": upstream()}
+
+    monkeypatch.setattr(execution_query_service, "runtime_service", lambda: Runtime())
+
+    async def relay() -> bytes:
+        stream = await execution_query_service.open_run_update_stream_from_request("run_live")
+        return b"".join([chunk async for chunk in stream["chunks"]])
+
+    assert asyncio.run(relay()) == b"retry: 2000\n\nevent: end\n\n"
+    assert read_threads and threading.get_ident() not in read_threads
+    assert closed == [True]
+
+
+@pytest.mark.parametrize("event_id", ["1:2", "a:0:0", "1:-5:0"])
+def test_run_update_cursor_rejects_malformed_event_ids(event_id: str) -> None:
+    with pytest.raises(ValueError, match="RUN_UPDATE_CURSOR_INVALID"):
+        RunUpdateCursor.parse(event_id)
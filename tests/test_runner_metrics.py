@@ -284,6 +284,161 @@ def test_observed_sqlite_connection_records_busy_errors(tmp_path):
     assert get_metrics().snapshot()["sqliteBusyErrors"] == 1
 
 
+def test_histogram_reports_cumulative_buckets_and_sketch_quantiles():
+    metrics = RunnerMetrics()
+    for value in range(1, 1001):
+        metrics.enqueue_to_claim_seconds.observe(value / 1000)
+
+    snapshot = metrics.snapshot()["enqueueToClaimSeconds"]
+    buckets = dict(metrics.enqueue_to_claim_seconds.cumulative_buckets())
+
+    assert buckets[0.01] == 10
+    assert buckets[0.5] == 500
+    assert buckets[float("inf")] == 1000
+    assert snapshot["p50"] == pytest.approx(0.5, rel=0.02)
+    assert snapshot["p95"] == pytest.approx(0.95, rel=0.02)
+    assert snapshot["p99"] == pytest.approx(0.99, rel=0.02)
+
+
+def test_histograms_merge_buckets_and_quantiles():
+    left = RunnerMetrics().http_request_seconds
+    right = RunnerMetrics().http_request_seconds
+    for _ in range(90):
+        left.observe(0.02)
+    for _ in range(10):
+        right.observe(3.0)
+
+    left.merge(right)
+
+    assert left.totals() == (100, pytest.approx(31.8))
+    assert dict(left.cumulative_buckets())[0.025] == 90
+    assert left.quantiles((0.5, 0.95)) == {0.5: pytest.approx(0.02, rel=0.02), 0.95: pytest.approx(3.0, rel=0.02)}
+    with pytest.raises(ValueError, match="METRICS_HISTOGRAM_BUCKETS_MISMATCH"):
+        left.merge(RunnerMetrics().run_duration_seconds)
+
+
+def test_prometheus_endpoint_exposes_runner_process_and_sqlite_series(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from apps.remote_runner import route_utils
+    from apps.remote_runner.main import app
+
+    reset_metrics()
+    cfg = make_configured_remote_runner(tmp_path, token="metrics-token")
+    monkeypatch.setattr(route_utils, "load_remote_runner_config", lambda: cfg)
+    _create_run(cfg, "run_prometheus")
+    get_metrics().run_duration_seconds.observe(42.0)
+    client = TestClient(app)
+
+    assert client.get("/metrics").status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer metrics-token"})
+    body = response.text
+    reset_metrics()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE h2ometa_runner_run_duration_seconds histogram" in body
+    assert 'h2ometa_runner_run_duration_seconds_bucket{le="60"} 1' in body
+    assert 'h2ometa_runner_run_duration_seconds_bucket{le="+Inf"} 1' in body
+    assert 'h2ometa_runner_run_duration_seconds_sketch{quantile="0.99"}' in body
+    assert "h2ometa_runner_http_request_seconds_count" in body
+    assert 'h2ometa_runner_queue_jobs{state="ready"} 1' in body
+    assert "h2ometa_runner_sqlite_database_bytes" in body
+    assert "h2ometa_runner_process_threads" in body
+    assert all(line.startswith("#") or len(line.split(" ")) == 2 for line in body.strip().splitlines())
+
+
+def test_http_latency_covers_the_whole_streamed_body():
+    import asyncio
+
+    from fastapi import FastAPI
+    from fastapi.responses import StreamingResponse
+    from fastapi.testclient import TestClient
+
+    from apps.remote_runner.metrics_exposition import HttpRequestLatencyMiddleware
+
+    async def slow_body():
+        for chunk in (b"a", b"b", b"c"):
+            await asyncio.sleep(0.1)
+            yield chunk
+
+    app = FastAPI()
+    app.add_middleware(HttpRequestLatencyMiddleware)
+    app.get("/stream")(lambda: StreamingResponse(slow_body(), media_type="text/plain"))
+    app.get("/boom")(lambda: 1 / 0)
+    reset_metrics()
+
+    with TestClient(app, raise_server_exceptions=False) as client:
+        assert client.get("/stream").content == b"abc"
+        assert client.get("/boom").status_code == 500
+    count, total = get_metrics().http_request_seconds.totals()
+    reset_metrics()
+
+    assert count == 2
+    assert total >= 0.3
+
+
+def test_collect_queue_metrics_reads_all_gauges_in_one_statement(tmp_path, monkeypatch):
+    from apps.remote_runner import storage_core
+
+    cfg = make_configured_remote_runner(tmp_path)
+    _create_run(cfg, "run_single_pass")
+    statements: list[str] = []
+    real_get_connection = storage_core.get_connection
+
+    class _TracedConnection:
+        def __init__(self, managed):
+            self._managed = managed
+
+        def __enter__(self):
+            self._connection = self._managed.__enter__()
+            self._connection.set_trace_callback(statements.append)
+            return self._connection
+
+        def __exit__(self, *exc_info):
+            self._connection.set_trace_callback(None)
+            return self._managed.__exit__(*exc_info)
+
+    monkeypatch.setattr(storage_core, "get_connection", lambda cfg: _TracedConnection(real_get_connection(cfg)))
+
+    queue = collect_queue_metrics(cfg)
+
+    assert [statement for statement in statements if "SELECT" in statement.upper()] == statements[-1:]
+    assert queue["queuedJobs"] == 1
+    assert queue["totalQueuedJobs"] == 1
+    assert queue["jobsByState"] == {"queued": 1}
+    assert queue["recovery"]["fencedAttempts"] == 0
+
+
+def test_operational_metrics_snapshot_serves_cached_queue_and_disk_reads(tmp_path):
+    from apps.remote_runner.metrics_snapshot import OperationalMetricsRefresher, OperationalMetricsSnapshot
+
+    cfg = make_configured_remote_runner(tmp_path)
+    snapshot = OperationalMetricsSnapshot()
+    _create_run(cfg, "run_snapshot_first")
+
+    first = snapshot.queue(cfg, max_age_seconds=60)
+    _create_run(cfg, "run_snapshot_second")
+    cached = snapshot.queue(cfg, max_age_seconds=60)
+    disk = snapshot.disk(cfg.data_root, max_age_seconds=60)
+    snapshot.disk(cfg.data_root, max_age_seconds=60)
+
+    assert first["queuedJobs"] == 1
+    assert cached["queuedJobs"] == 1
+    assert cached["snapshotAgeSeconds"] >= 0
+    assert "freeBytes" in disk
+    assert snapshot.stats() == {"refreshes": 0, "inlineCollections": 2}
+    assert snapshot.queue(cfg, max_age_seconds=0)["queuedJobs"] == 2
+
+    refresher = OperationalMetricsRefresher(cfg, snapshot=snapshot, interval_seconds=60)
+    refresher.start()
+    refresher.stop()
+    assert snapshot.stats()["refreshes"] == 2
+    assert snapshot.stats()["inlineCollections"] == 3
+    with pytest.raises(ValueError, match="OPERATIONAL_METRICS_REFRESH_INTERVAL_INVALID"):
+        OperationalMetricsRefresher(cfg, snapshot=snapshot, interval_seconds=0)
+
+
 def _create_run(cfg, run_id: str) -> None:
     create_run_record(
         cfg,
@@ -460,7 +460,12 @@ def test_runtime_execution_operations_delegate_to_execution_manager() -> None:
 
     assert "from core.app_runtime.managers.execution import ExecutionManager" in service_source
     assert "self.execution = ExecutionManager(self)" in service_source
-    assert "class ExecutionManager(BaseRuntimeManager)" in execution_manager_source
+    assert (
+        "class ExecutionManager(ExecutionListingMixin, ResultPackageStreamMixin, BaseRuntimeManager)"
+        in execution_manager_source
+    )
+    assert "class ExecutionListingMixin:" in _source("core/app_runtime/managers/execution_listing.py")
+    assert "class ResultPackageStreamMixin:" in _source("core/app_runtime/managers/result_package_stream.py")
     assert "def _runner_context(" in base_manager_source
     assert "def call_runner(" in base_manager_source
     assert "def read_remote_endpoint(" in base_manager_source
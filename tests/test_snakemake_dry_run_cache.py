@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import subprocess
+from dataclasses import replace
+
+from apps.remote_runner.snakemake_dry_run_cache import (
+    DryRunCacheScope,
+    collect_dry_run_cache_metrics,
+    run_dry_run_with_cache,
+)
+from apps.remote_runner.workflow_engine_adapter import SnakemakeEngineAdapter
+from tests.helpers.reference_database import make_configured_remote_runner
+
+
+class FakeDryRun:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def __call__(self, command: list[str], **_kwargs):
+        self.calls.append(command)
+        work_dir = command[command.index("--directory") + 1]
+        return subprocess.CompletedProcess(command, 0, f"Job stats in {work_dir}/out.txt\n", "")
+
+
+def _prepare_run(tmp_path: Path, run_id: str, upload: Path) -> tuple[Path, Path, Path, DryRunCacheScope]:
+    work_dir = tmp_path / "work" / run_id
+    result_dir = tmp_path / "results" / run_id
+    workflow_dir = tmp_path / "pipeline" / "workflow"
+    workflow_dir.mkdir(parents=True, exist_ok=True)
+    snakefile = workflow_dir / "Snakefile"
+    snakefile.write_text("rule all:\n    input: 'out.txt'\n", encoding="utf-8")
+    work_dir.mkdir(parents=True)
+    config_path = work_dir / "run-config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "run_id": run_id,
+                "inputs": [{"path": str(upload)}],
+                "outputs": {"summary": str(result_dir / "summary.txt")},
+            }
+        ),
+        encoding="utf-8",
+    )
+    scope = DryRunCacheScope(run_id=run_id, request_id=f"req_{run_id}", work_dir=work_dir, result_dir=result_dir)
+    return snakefile, work_dir, config_path, scope
+
+
+def _dry_run(cfg, fake: FakeDryRun, tmp_path: Path, run_id: str, upload: Path, **options):
+    snakefile, work_dir, config_path, scope = _prepare_run(tmp_path, run_id, upload)
+    engine = SnakemakeEngineAdapter(replace(cfg, snakemake_command="snakemake"), run_command=fake)
+    return engine.dry_run(
+        snakefile=snakefile,
+        work_dir=work_dir,
+        config_path=config_path,
+        cache_scope=scope,
+        **options,
+    )
+
+
+def test_identical_plan_and_inputs_skip_the_dry_run_subprocess(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    upload = tmp_path / "uploads" / "reads.fq"
+    upload.parent.mkdir()
+    upload.write_text("@r1\nACGT\n+\nIIII\n", encoding="utf-8")
+    fake = FakeDryRun()
+
+    first = _dry_run(cfg, fake, tmp_path, "run_a", upload)
+    second = _dry_run(cfg, fake, tmp_path, "run_b", upload)
+
+    assert len(fake.calls) == 1
+    assert second.returncode == 0
+    assert second.stdout == f"Job stats in {tmp_path / 'work' / 'run_b'}/out.txt\n"
+    assert first.stdout != second.stdout
+    metrics = collect_dry_run_cache_metrics(cfg)
+    assert {key: metrics[key] for key in ("entries", "hits", "misses", "hitRatio")} == {
+        "entries": 1,
+        "hits": 1,
+        "misses": 1,
+        "hitRatio": 0.5,
+    }
+
+
+def test_cache_hits_accumulate_the_recorded_dry_run_duration_as_time_saved(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    upload = tmp_path / "uploads" / "reads.fq"
+    upload.parent.mkdir()
+    upload.write_text("@r1\n", encoding="utf-8")
+    fake = FakeDryRun()
+
+    for run_id in ("run_a", "run_b", "run_c"):
+        snakefile, work_dir, config_path, scope = _prepare_run(tmp_path, run_id, upload)
+        ticks = iter([10.0, 12.5])
+        run_dry_run_with_cache(
+            cfg,
+            lambda: fake(["snakemake", "--directory", str(work_dir), "-n"]),
+            snakefile=snakefile,
+            config_path=config_path,
+            scope=scope,
+            execution_options={},
+            clock=lambda: next(ticks),
+        )
+
+    assert len(fake.calls) == 1
+    assert collect_dry_run_cache_metrics(cfg)["savedSeconds"] == 5.0
+
+
+def test_changed_input_fingerprint_misses_the_cache(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    upload = tmp_path / "uploads" / "reads.fq"
+    upload.parent.mkdir()
+    upload.write_text("@r1\nACGT\n+\nIIII\n", encoding="utf-8")
+    fake = FakeDryRun()
+
+    _dry_run(cfg, fake, tmp_path, "run_a", upload)
+    stat = upload.stat()
+    os.utime(upload, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    _dry_run(cfg, fake, tmp_path, "run_b", upload)
+
+    assert len(fake.calls) == 2
+    assert collect_dry_run_cache_metrics(cfg)["entries"] == 2
+
+
+def test_workdir_dependent_dry_runs_are_never_cached(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    upload = tmp_path / "uploads" / "reads.fq"
+    upload.parent.mkdir()
+    upload.write_text("@r1\n", encoding="utf-8")
+    fake = FakeDryRun()
+
+    _dry_run(cfg, fake, tmp_path, "run_a", upload, forcerun_rules=["align"])
+    _dry_run(cfg, fake, tmp_path, "run_b", upload, forcerun_rules=["align"])
+
+    assert len(fake.calls) == 2
+    assert collect_dry_run_cache_metrics(cfg)["entries"] == 0
@@ -4,6 +4,8 @@ import os
 from pathlib import Path
 
 from apps.remote_runner.config import RemoteRunnerConfig, ensure_runtime_layout
+from apps.remote_runner.resource_pool import ResourceRequest
+from apps.remote_runner.snakemake_resource_plan import build_snakemake_resource_plan, snakemake_resource_policy
 from apps.remote_runner.workflow_engine_adapter import SnakemakeEngineAdapter, WorkflowRuntimeCommandError
 
 
@@ -223,3 +225,60 @@ def test_snakemake_engine_adapter_passes_live_poll_callback_to_process_runner(mo
     assert captured["on_poll"] is not None
     assert poll_calls == ["poll"]
     assert "--logger-h2ometa-event-path" in captured["command"]
+
+
+def test_snakemake_engine_adapter_sizes_unprofiled_runs_from_the_resource_plan(monkeypatch, tmp_path: Path) -> None:
+    cfg = RemoteRunnerConfig(
+        token="phase2-token",
+        data_root=str(tmp_path / "shared"),
+        db_path=str(tmp_path / "shared" / "data" / "runner.db"),
+        uploads_dir=str(tmp_path / "shared" / "uploads"),
+        results_dir=str(tmp_path / "shared" / "results"),
+        work_dir=str(tmp_path / "shared" / "work"),
+        logs_dir=str(tmp_path / "shared" / "logs"),
+        release_dir=str(tmp_path / "release"),
+        snakemake_command=str(tmp_path / "snakemake"),
+    )
+    (Path(cfg.release_dir) / "snakemake_wrappers").mkdir(parents=True, exist_ok=True)
+    ensure_runtime_layout(cfg)
+    monkeypatch.setattr("apps.remote_runner.workflow_engine_adapter.get_workflow_profile_dir", lambda _cfg: None)
+    calls: list[list[str]] = []
+
+    class Result:
+        returncode = 0
+        stdout = "ok\n"
+        stderr = ""
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(list(cmd))
+        return Result()
+
+    plan = build_snakemake_resource_plan(
+        ResourceRequest(cpu=16, memory_mb=65536),
+        snakemake_resource_policy({"snakemakeResources": {"ruleThreads": {"align": 32}}}),
+    )
+    adapter = SnakemakeEngineAdapter(cfg, run_command=fake_run)
+    adapter.dry_run(
+        snakefile=tmp_path / "workflow" / "Snakefile",
+        work_dir=tmp_path / "work",
+        config_path=tmp_path / "work" / "run-config.json",
+    )
+    adapter.run(
+        snakefile=tmp_path / "workflow" / "Snakefile",
+        work_dir=tmp_path / "work",
+        config_path=tmp_path / "work" / "run-config.json",
+        resource_plan=plan,
+    )
+
+    dry_run, run = calls
+    assert dry_run[dry_run.index("--cores") : dry_run.index("--cores") + 3] == ["--cores", "1", "--use-conda"]
+    assert run[run.index("--cores") : run.index("--use-conda")] == [
+        "--cores",
+        "16",
+        "--resources",
+        "mem_mb=65536",
+        "--max-threads",
+        "8",
+        "--set-threads",
+        "align=16",
+    ]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+from apps.remote_runner import snakemake_logger_plugin_h2ometa as plugin
+from apps.remote_runner.snakemake_rule_event_projection import _read_event_records_since
+
+
+def _handler(event_path: Path) -> plugin.LogHandler:
+    handler = plugin.LogHandler()
+    handler.settings = plugin.LogHandlerSettings(event_path=str(event_path))
+    handler.__post_init__()
+    return handler
+
+
+def _record(event: str, **fields: object) -> logging.LogRecord:
+    record = logging.LogRecord("snakemake", logging.INFO, __file__, 1, f"{event} record", None, None)
+    record.event = event
+    for key, value in fields.items():
+        setattr(record, key, value)
+    return record
+
+
+def _events(path: Path) -> list[str]:
+    return [json.loads(line)["event"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_logger_buffers_records_until_a_job_state_boundary(tmp_path: Path) -> None:
+    event_path = tmp_path / "events" / "snakemake.jsonl"
+    handler = _handler(event_path)
+
+    handler.emit(_record("JOB_INFO", jobid=1, rule_name="trim_reads"))
+    handler.emit(_record("SHELLCMD", jobid=1, shellcmd="trim reads.fq"))
+    assert not event_path.exists() or event_path.read_bytes() == b""
+
+    handler.emit(_record("JOB_STARTED", job_ids=[1]))
+    first_handle = handler._handle
+    assert _events(event_path) == ["JOB_INFO", "SHELLCMD", "JOB_STARTED"]
+
+    handler.emit(_record("PROGRESS", done=1, total=2))
+    handler.emit(_record("JOB_FINISHED", job_id=1))
+    assert handler._handle is first_handle
+    assert _events(event_path)[-2:] == ["PROGRESS", "JOB_FINISHED"]
+
+    handler.emit(_record("PROGRESS", done=2, total=2))
+    handler.close()
+    assert _events(event_path)[-1] == "PROGRESS"
+    assert handler._handle is None
+
+
+def test_logger_flushes_when_the_buffer_reaches_its_size_bound(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(plugin, "EVENT_BUFFER_MAX_BYTES", 512)
+    event_path = tmp_path / "snakemake.jsonl"
+    handler = _handler(event_path)
+
+    for index in range(20):
+        handler.emit(_record("DEBUG_DAG", file=f"step-{index}"))
+
+    assert 0 < len(_events(event_path)) < 20
+    assert event_path.read_bytes().endswith(b"\n")
+    handler.close()
+    assert len(_events(event_path)) == 20
+
+
+def test_projector_tail_waits_for_a_partially_written_multibyte_line(tmp_path: Path) -> None:
+    event_path = tmp_path / "snakemake.jsonl"
+    first = json.dumps({"event": "JOB_INFO", "jobId": 1}).encode("utf-8") + b"\n"
+    second = json.dumps({"event": "SHELLCMD", "shellcmd": "echo µ"}, ensure_ascii=False).encode("utf-8") + b"\n"
+    split = second.index("µ".encode("utf-8")) + 1
+    event_path.write_bytes(first + second[:split])
+
+    records, offset = _read_event_records_since(event_path, 0, require_complete_line=True)
+    assert [record["event"] for record in records] == ["JOB_INFO"]
+    assert offset == len(first)
+
+    with event_path.open("ab") as handle:
+        handle.write(second[split:])
+    records, offset = _read_event_records_since(event_path, offset, require_complete_line=True)
+    assert records == [{"event": "SHELLCMD", "shellcmd": "echo µ"}]
+    assert offset == len(first) + len(second)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from apps.remote_runner.resource_pool import ResourceRequest
+from apps.remote_runner.run_execution_storage import claim_next_run_job
+from apps.remote_runner.snakemake_resource_plan import (
+    attempt_snakemake_resource_plan,
+    build_snakemake_resource_plan,
+    snakemake_resource_policy,
+)
+from apps.remote_runner.storage import create_run_record
+from tests.helpers.reference_database import make_configured_remote_runner
+
+
+@pytest.mark.parametrize(
+    ("strategy", "max_threads"),
+    [("balanced", 8), ("parallel_rules", 1), ("threaded_tools", 16)],
+)
+def test_strategy_decides_the_per_rule_thread_cap(strategy: str, max_threads: int) -> None:
+    plan = build_snakemake_resource_plan(
+        ResourceRequest(cpu=16, memory_mb=65536, disk_mb=1024, gpu=1),
+        snakemake_resource_policy({"snakemakeResources": {"strategy": strategy}}),
+    )
+
+    assert plan.command_args() == [
+        "--cores",
+        "16",
+        "--resources",
+        "mem_mb=65536",
+        "disk_mb=1024",
+        "gpu=1",
+        "--max-threads",
+        str(max_threads),
+    ]
+
+
+def test_explicit_caps_never_exceed_the_allocation() -> None:
+    policy = snakemake_resource_policy(
+        {"snakemakeResources": {"maxThreadsPerRule": 12, "ruleThreads": {"qc": 2, "align": 64}}}
+    )
+
+    plan = build_snakemake_resource_plan(ResourceRequest(cpu=4), policy)
+
+    assert plan.as_dict() == {
+        "strategy": "balanced",
+        "cores": 4,
+        "memoryMb": 0,
+        "diskMb": 0,
+        "gpu": 0,
+        "maxThreadsPerRule": 4,
+        "ruleThreads": {"align": 4, "qc": 2},
+    }
+    assert plan.command_args() == ["--cores", "4", "--max-threads", "4", "--set-threads", "align=4", "qc=2"]
+
+
+@pytest.mark.parametrize(
+    ("raw", "code"),
+    [
+        ("all", "SNAKEMAKE_RESOURCE_POLICY_INVALID"),
+        ({"strategy": "greedy"}, "SNAKEMAKE_RESOURCE_STRATEGY_INVALID"),
+        ({"maxThreadsPerRule": -1}, "SNAKEMAKE_RESOURCE_MAX_THREADS_INVALID"),
+        ({"ruleThreads": {"bad-rule": 2}}, "SNAKEMAKE_RESOURCE_RULE_THREADS_INVALID"),
+        ({"ruleThreads": {"align": 0}}, "SNAKEMAKE_RESOURCE_RULE_THREADS_INVALID"),
+    ],
+)
+def test_invalid_policies_are_rejected(raw, code: str) -> None:
+    with pytest.raises(ValueError, match=code):
+        snakemake_resource_policy({"snakemakeResources": raw})
+
+
+def test_plan_follows_the_attempts_recorded_allocation(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    create_run_record(
+        cfg,
+        server_id="srv_resource_plan",
+        request_id="req_resource_plan",
+        run_spec={
+            "runId": "run_resource_plan",
+            "projectId": "proj_resource_plan",
+            "pipelineId": "pipeline_resource_plan",
+            "pipelineVersion": "0.1.0",
+            "execution": {"resources": {"cpu": 6, "memoryMb": 2048}},
+        },
+        idempotency_key="idem_resource_plan",
+        payload_hash="payload_resource_plan",
+    )
+    claim = claim_next_run_job(
+        cfg,
+        worker_id="worker_resource_plan",
+        resource_capacity=ResourceRequest(cpu=8, memory_mb=4096),
+    )
+
+    plan = attempt_snakemake_resource_plan(
+        cfg,
+        attempt_id=claim["attemptId"],
+        fallback=ResourceRequest(),
+        execution={"snakemakeResources": {"strategy": "threaded_tools"}},
+    )
+    unrecorded = attempt_snakemake_resource_plan(cfg, attempt_id="att_missing", fallback=None, execution={})
+
+    assert plan is not None
+    assert plan.command_args() == ["--cores", "6", "--resources", "mem_mb=2048", "--max-threads", "6"]
+    assert unrecorded is None
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from apps.remote_runner.sqlite_connection_pool import SQLiteConnectionPool, database_identity
+from apps.remote_runner.storage_core import _open_runtime_connection
+from tests.helpers.reference_database import make_configured_remote_runner
+
+
+def _acquire(pool: SQLiteConnectionPool, db_path: str | Path, *, max_idle: int = 4, validate_schema=None) -> sqlite3.Connection:
+    return pool.acquire(
+        Path(db_path),
+        max_idle=max_idle,
+        connect=_open_runtime_connection,
+        validate_schema=validate_schema or (lambda _: None),
+    )
+
+
+def _counting_validator(calls: list[int]):
+    def validate(connection: sqlite3.Connection) -> None:
+        calls.append(1)
+
+    return validate
+
+
+def test_pool_reuses_released_connection_and_validates_schema_once(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    pool = SQLiteConnectionPool()
+    validations: list[int] = []
+
+    with _acquire(pool, cfg.db_path, validate_schema=_counting_validator(validations)) as first:
+        first_id = id(first)
+    with _acquire(pool, cfg.db_path, validate_schema=_counting_validator(validations)) as second:
+        assert id(second) == first_id
+        assert second.row_factory is sqlite3.Row
+
+    stats = pool.stats()
+    assert validations == [1]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["idleConnections"] == 1
+    assert stats["inUseConnections"] == 0
+    assert stats["schemaValidations"] == 1
+    pool.close_all()
+
+
+def test_pool_hands_out_distinct_connections_to_nested_checkouts(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    pool = SQLiteConnectionPool()
+    validations: list[int] = []
+
+    def acquire() -> sqlite3.Connection:
+        return _acquire(pool, cfg.db_path, validate_schema=_counting_validator(validations))
+
+    with acquire() as outer:
+        outer.execute("BEGIN IMMEDIATE")
+        with acquire() as inner:
+            assert inner is not outer
+            assert pool.stats()["inUseConnections"] == 2
+        outer.execute("CREATE TABLE pool_probe (value TEXT)")
+
+    assert validations == [1]
+    assert pool.stats()["idleConnections"] == 2
+    pool.close_all()
+
+
+def test_pool_rolls_back_open_transaction_before_reuse(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    db_path = Path(cfg.db_path)
+    pool = SQLiteConnectionPool()
+    with _acquire(pool, db_path, max_idle=1) as connection:
+        connection.execute("CREATE TABLE pool_probe (value TEXT)")
+
+    leaked = _acquire(pool, db_path, max_idle=1)
+    leaked.execute("INSERT INTO pool_probe (value) VALUES ('uncommitted')")
+    assert leaked.in_transaction is True
+    pool.release(database_identity(db_path), leaked, max_idle=1)
+
+    with _acquire(pool, db_path, max_idle=1) as checked:
+        assert checked is leaked
+        assert checked.in_transaction is False
+        assert checked.execute("SELECT COUNT(*) FROM pool_probe").fetchone()[0] == 0
+    pool.close_all()
+
+
+def test_pool_does_not_cache_failed_schema_validation(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    pool = SQLiteConnectionPool()
+
+    def reject(connection: sqlite3.Connection) -> None:
+        raise RuntimeError("schema rejected")
+
+    with pytest.raises(RuntimeError, match="schema rejected"):
+        _acquire(pool, cfg.db_path, validate_schema=reject)
+
+    stats = pool.stats()
+    assert stats["schemaValidations"] == 0
+    assert stats["inUseConnections"] == 0
+    assert stats["idleConnections"] == 0
+
+
+def test_pool_with_zero_idle_capacity_closes_released_connections(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    pool = SQLiteConnectionPool()
+
+    connection = _acquire(pool, cfg.db_path, max_idle=0)
+    with connection:
+        pass
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+    assert pool.stats()["discardedConnections"] == 1
+
+
+def test_pool_evicts_least_recently_used_database(tmp_path: Path) -> None:
+    first = make_configured_remote_runner(tmp_path / "first")
+    second = make_configured_remote_runner(tmp_path / "second")
+    pool = SQLiteConnectionPool(max_databases=1)
+
+    connection = _acquire(pool, first.db_path)
+    with connection:
+        pass
+    with _acquire(pool, second.db_path):
+        pass
+
+    stats = pool.stats()
+    assert stats["databases"] == 1
+    assert stats["evictedConnections"] == 1
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+    pool.close_all()
@@ -0,0 +1,168 @@
+import threading
+from types import SimpleNamespace
+
+import paramiko
+import pytest
+
+from core.remote.ssh_channel_pool import SftpSessionPool, SSHChannelGate, configured_max_concurrent_channels
+from core.remote.ssh_service import SSHService
+
+
+class FakeChannel:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def recv_exit_status(self) -> int:
+        return 0
+
+
+class FakeStream:
+    def __init__(self, payload: bytes = b"") -> None:
+        self.channel = FakeChannel()
+        self._payload = payload
+
+    def read(self) -> bytes:
+        return self._payload
+
+
+class FakeSftp:
+    def __init__(self, client: "FakeClient") -> None:
+        self._client = client
+        self._channel = FakeChannel()
+        self.closed = False
+
+    def get_channel(self) -> FakeChannel:
+        return self._channel
+
+    def put(self, local: str, remote: str) -> None:
+        self._client.upload_started.set()
+        assert self._client.release_upload.wait(5)
+        self._client.uploaded.append((local, remote))
+
+    def get(self, remote: str, local: str) -> None:
+        if self._client.fail_next_get:
+            self._client.fail_next_get = False
+            raise paramiko.SSHException("sftp channel closed")
+        self._client.downloaded.append((remote, local))
+
+    def normalize(self, path: str) -> str:
+        return "/data" if path == "." else path
+
+    def listdir_attr(self, path: str):
+        return [SimpleNamespace(filename="db", st_mode=0o040755, st_size=0, st_mtime=1)]
+
+    def close(self) -> None:
+        self.closed = True
+        self._channel.closed = True
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.opened: list[FakeSftp] = []
+        self.upload_started = threading.Event()
+        self.release_upload = threading.Event()
+        self.release_upload.set()
+        self.fail_next_get = False
+        self.uploaded: list[tuple[str, str]] = []
+        self.downloaded: list[tuple[str, str]] = []
+
+    def open_sftp(self) -> FakeSftp:
+        sftp = FakeSftp(self)
+        self.opened.append(sftp)
+        return sftp
+
+    def exec_command(self, cmd: str, timeout: int):
+        return None, FakeStream(cmd.encode("utf-8")), FakeStream()
+
+
+def test_long_upload_does_not_block_commands_or_listings() -> None:
+    client = FakeClient()
+    client.release_upload.clear()
+    service = SSHService(initial_client=client)
+    upload = threading.Thread(target=service.upload, args=("local.tar", "/remote.tar"))
+    upload.start()
+    assert client.upload_started.wait(5)
+
+    assert service.run("echo status") == (0, "echo status", "")
+    assert service.list_directory("")["items"][0]["name"] == "db"
+    client.release_upload.set()
+    upload.join(5)
+
+    assert client.uploaded == [("local.tar", "/remote.tar")]
+    assert len(client.opened) == 2
+    metrics = service.channel_metrics()
+    assert metrics["channels"]["peakInFlight"] == 2
+    assert set(metrics["channels"]["operations"]) == {"exec", "list_directory", "upload"}
+
+
+def test_sftp_sessions_are_reused_and_broken_ones_discarded() -> None:
+    client = FakeClient()
+    service = SSHService(initial_client=client)
+
+    service.download("/a", "a")
+    service.list_directory("/data")
+    assert len(client.opened) == 1
+
+    client.fail_next_get = True
+    with pytest.raises(paramiko.SSHException):
+        service.download("/b", "b")
+    assert client.opened[0].closed is True
+    service.download("/c", "c")
+
+    assert len(client.opened) == 2
+    assert service.channel_metrics()["sftpSessions"] == {
+        "maxIdle": 2,
+        "idle": 1,
+        "opened": 2,
+        "reused": 2,
+        "discarded": 1,
+    }
+
+    replacement = FakeClient()
+    service._on_reconnect(replacement)
+    assert client.opened[1].closed is True
+    service.download("/d", "d")
+    assert len(replacement.opened) == 1
+
+
+def test_channel_gate_caps_concurrency_and_records_queue_wait() -> None:
+    gate = SSHChannelGate(max_concurrent=1)
+    entered = threading.Event()
+    release = threading.Event()
+
+    def hold() -> None:
+        with gate.slot("upload"):
+            entered.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    assert entered.wait(5)
+    threading.Timer(0.05, release.set).start()
+    with gate.slot("exec"):
+        assert gate.snapshot()["inFlight"] == 1
+    holder.join(5)
+
+    snapshot = gate.snapshot()
+    assert snapshot["peakInFlight"] == 1
+    assert snapshot["operations"]["exec"]["queued"] == 1
+    assert snapshot["operations"]["exec"]["waitSecondsMax"] >= 0.03
+    assert snapshot["operations"]["upload"]["queued"] == 0
+
+
+def test_channel_limits_come_from_the_environment(monkeypatch) -> None:
+    monkeypatch.setenv("H2OMETA_SSH_MAX_CONCURRENT_CHANNELS", "3")
+    monkeypatch.setenv("H2OMETA_SSH_SFTP_POOL_SIZE", "0")
+    assert configured_max_concurrent_channels() == 3
+    pool = SftpSessionPool()
+    client = FakeClient()
+    with pool.session(client):
+        pass
+    assert client.opened[0].closed is True
+
+    monkeypatch.setenv("H2OMETA_SSH_MAX_CONCURRENT_CHANNELS", "0")
+    with pytest.raises(ValueError, match="SSH_CHANNEL_LIMIT_INVALID"):
+        SSHChannelGate()
+    monkeypatch.setenv("H2OMETA_SSH_SFTP_POOL_SIZE", "many")
+    with pytest.raises(ValueError, match="SSH_SFTP_POOL_SIZE_INVALID"):
+        SftpSessionPool()
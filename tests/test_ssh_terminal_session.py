@@ -33,8 +33,10 @@ def test_local_tunnel_logic_lives_outside_ssh_service() -> None:
     assert "socketserver.ThreadingTCPServer" not in service_source
     assert "select.select(" not in service_source
     assert "class LocalTunnel:" in tunnel_source
-    assert "socketserver.ThreadingTCPServer" in tunnel_source
-    assert "select.select(" in tunnel_source
+    assert "from core.remote.tunnel_forwarder import TunnelForwarder" in tunnel_source
+    forwarder_source = Path("core/remote/tunnel_forwarder.py").read_text(encoding="utf-8")
+    assert "selectors.DefaultSelector()" in forwarder_source
+    assert "ThreadingTCPServer" not in forwarder_source + tunnel_source
 
 
 def test_ssh_reconnector_logic_lives_outside_ssh_service() -> None:
@@ -54,9 +56,11 @@ def test_ssh_reconnector_logic_lives_outside_ssh_service() -> None:
 
 def test_local_tunnel_forwarder_uses_explicit_transport_error_boundaries() -> None:
     local_tunnel_source = Path("core/remote/local_tunnel.py").read_text(encoding="utf-8")
+    forwarder_source = Path("core/remote/tunnel_forwarder.py").read_text(encoding="utf-8")
 
-    assert "except Exception" not in local_tunnel_source
-    assert local_tunnel_source.count("except (OSError, EOFError, paramiko.SSHException)") == 2
+    assert "except Exception" not in local_tunnel_source + forwarder_source
+    assert "_CHANNEL_ERRORS = (OSError, EOFError, paramiko.SSHException)" in forwarder_source
+    assert forwarder_source.count("except _CHANNEL_ERRORS") == 3
 
 
 class DummyChannel:
@@ -412,7 +416,8 @@ def test_list_directory_uses_sftp_and_returns_directory_metadata() -> None:
     assert result["parentPath"] == "/home/user"
     assert [item["name"] for item in result["items"]] == [".cache", "kraken2"]
     assert result["items"][0]["type"] == "directory"
-    assert client.sftp.closed is True
+    assert client.sftp.closed is False
+    assert service.channel_metrics()["sftpSessions"]["idle"] == 1
 
 
 def test_list_directory_allows_large_remote_directory_listing() -> None:
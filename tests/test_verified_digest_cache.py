@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import apps.remote_runner.verified_digest_cache as verified_digest_cache
+from apps.remote_runner.verified_digest_cache import (
+    scrub_verified_digests_once,
+    verified_digest_cache_metrics,
+    verified_file_stats,
+)
+from tests.helpers.reference_database import make_configured_remote_runner
+
+
+def _settled_file(path: Path, content: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    stat = path.stat()
+    # Files modified within the racy window are never remembered.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 60_000_000_000))
+    return path
+
+
+def _count_hashes(monkeypatch) -> list[Path]:
+    hashed: list[Path] = []
+    original = verified_digest_cache._hash_file
+
+    def counting_hash(path: Path) -> tuple[int, str]:
+        hashed.append(Path(path))
+        return original(path)
+
+    monkeypatch.setattr(verified_digest_cache, "_hash_file", counting_hash)
+    return hashed
+
+
+def test_unchanged_file_reuses_the_verified_digest(tmp_path: Path, monkeypatch) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    path = _settled_file(tmp_path / "results" / "reads.fq", b"@r1\nACGT\n+\nIIII\n")
+    hashed = _count_hashes(monkeypatch)
+
+    first = verified_file_stats(cfg, path)
+    second = verified_file_stats(cfg, path)
+
+    expected = (path.stat().st_size, hashlib.sha256(path.read_bytes()).hexdigest())
+    assert first == second == expected
+    assert hashed == [path]
+    metrics = verified_digest_cache_metrics(cfg)
+    assert metrics["entries"] == 1
+    assert metrics["hits"] >= 1
+
+
+def test_changed_mtime_or_recent_write_rehashes(tmp_path: Path, monkeypatch) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    path = _settled_file(tmp_path / "results" / "reads.fq", b"@r1\n")
+    hashed = _count_hashes(monkeypatch)
+    verified_file_stats(cfg, path)
+
+    path.write_bytes(b"@r2\n")
+    fresh = verified_file_stats(cfg, path)
+    verified_file_stats(cfg, path)
+
+    assert fresh[1] == hashlib.sha256(b"@r2\n").hexdigest()
+    assert hashed == [path, path, path]
+
+
+def test_scrubber_evicts_changed_files_and_flags_silent_corruption(tmp_path: Path) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    changed = _settled_file(tmp_path / "results" / "changed.txt", b"alpha")
+    corrupted = _settled_file(tmp_path / "results" / "corrupted.txt", b"bravo")
+    intact = _settled_file(tmp_path / "results" / "intact.txt", b"charlie")
+    for path in (changed, corrupted, intact):
+        verified_file_stats(cfg, path)
+
+    _settled_file(changed, b"alpha-2")
+    stat = corrupted.stat()
+    corrupted.write_bytes(b"BRAVO")
+    os.utime(corrupted, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    result = scrub_verified_digests_once(cfg, reverify_after_seconds=0)
+
+    assert result == {"checked": 3, "reverified": 1, "evicted": 1, "mismatched": 1}
+    assert verified_digest_cache_metrics(cfg)["entries"] == 1
+    assert verified_file_stats(cfg, corrupted)[1] == hashlib.sha256(b"BRAVO").hexdigest()
@@ -13,6 +13,7 @@ from apps.remote_runner.execution_query_storage import fetch_run
 from apps.remote_runner.governance_audit import list_governance_audit_events
 from apps.remote_runner.resource_pool import ResourceRequest
 from apps.remote_runner.run_execution_storage import claim_next_run_job
+from apps.remote_runner.storage_core import get_connection
 from apps.remote_runner.trigger_service import (
     cancel_workflow_backfill_launch_from_request,
     create_workflow_trigger_from_request,
@@ -100,13 +101,14 @@ def test_backfill_launch_read_model_lists_partition_runs_and_replay_state(
     assert "runSpecPreview" not in str(detail)
 
     claim_now = str(detail_run["submittedAt"])
+    _occupy_capacity(cfg, memory_mb=7168)
     claim = claim_next_run_job(
         cfg,
         worker_id="worker-limited",
         slot_id="slot-0",
         resource_request=ResourceRequest(memory_mb=8192),
-        resource_capacity=ResourceRequest(memory_mb=1024),
-        max_active_slots=1,
+        resource_capacity=ResourceRequest(memory_mb=8192),
+        max_active_slots=2,
         now=claim_now,
     )
     waited = get_workflow_backfill_launch_from_storage(cfg, launched["launchId"])["data"]
@@ -225,3 +227,21 @@ def _expected_admission_summary(run: dict[str, object] | None) -> dict[str, obje
         "deadLetteredAt": None,
         "updatedAt": run["submittedAt"],
     }
+
+
+def _occupy_capacity(cfg, **resources: int) -> None:
+    # Another worker already holds part of the capacity, so the claim below has to wait.
+    with get_connection(cfg) as connection:
+        connection.execute(
+            """
+            INSERT INTO run_resource_allocations (
+                allocation_id, run_id, attempt_id, worker_id, session_id, slot_id,
+                cpu, memory_mb, disk_mb, gpu, state, created_at, updated_at
+            ) VALUES (
+                'alloc_busy', 'run_busy', 'att_busy', 'worker-busy', 'session-busy', 'slot-1',
+                :cpu, :memory_mb, 0, 0, 'allocated', '2026-01-01T00:00:00Z', '2026-01-01T00:00:00Z'
+            )
+            """,
+            {"cpu": 0, "memory_mb": 0, **resources},
+        )
+        connection.commit()
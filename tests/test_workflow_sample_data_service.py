@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import hashlib
 from typing import Any
 
@@ -40,7 +39,8 @@ def test_sample_data_uploads_verify_integrity_before_upload(monkeypatch, tmp_pat
     payload = runtime.uploads[0]
     assert payload["serverId"] == "srv_first"
     assert payload["filename"] == "sample-metadata.tsv"
-    assert base64.b64decode(payload["contentBase64"]) == content
+    assert payload["content"] == content
+    assert payload["sha256"] == sample.expected_sha256
     item = response["data"]["items"][0]
     assert item["role"] == "metadata"
     assert item["sha256"] == sample.expected_sha256
@@ -202,12 +202,12 @@ class FakeRuntime:
     def __init__(self) -> None:
         self.uploads: list[dict[str, Any]] = []
 
-    def upload_file(self, payload: dict[str, Any]) -> dict[str, Any]:
-        self.uploads.append(payload)
-        content = base64.b64decode(payload["contentBase64"])
+    def upload_file_chunked(self, source, **kwargs: Any) -> dict[str, Any]:
+        content = source.read()
+        self.uploads.append({"serverId": kwargs["server_id"], "content": content, **kwargs})
         return {
             "uploadId": "upl_sample",
-            "filename": payload["filename"],
+            "filename": kwargs["filename"],
             "sizeBytes": len(content),
         }
 
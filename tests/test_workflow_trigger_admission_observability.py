@@ -6,6 +6,7 @@ from apps.remote_runner.api_models import WorkflowTriggerCreateRequest, Workflow
 from apps.remote_runner.execution_query_storage import fetch_run
 from apps.remote_runner.resource_pool import ResourceRequest
 from apps.remote_runner.run_execution_storage import claim_next_run_job
+from apps.remote_runner.storage_core import get_connection
 from apps.remote_runner.trigger_service import (
     create_workflow_trigger_from_request,
     list_workflow_trigger_events_from_storage,
@@ -45,13 +46,14 @@ def test_trigger_dispatch_read_model_exposes_allowlisted_admission_wait(tmp_path
     run = fetch_run(cfg, response["data"]["run"]["runId"])
     assert run is not None
 
+    _occupy_capacity(cfg, cpu=7)
     claim = claim_next_run_job(
         cfg,
         worker_id="worker-limited",
         slot_id="slot-0",
         resource_request=ResourceRequest(cpu=8),
-        resource_capacity=ResourceRequest(cpu=1),
-        max_active_slots=1,
+        resource_capacity=ResourceRequest(cpu=8),
+        max_active_slots=2,
         now=str(run["submittedAt"]),
     )
     waited_events = list_workflow_trigger_events_from_storage(cfg, trigger["triggerId"])["data"]["items"]
@@ -72,3 +74,21 @@ def test_trigger_dispatch_read_model_exposes_allowlisted_admission_wait(tmp_path
         "requested": 8,
     }
     assert admission["updatedAt"] == run["submittedAt"]
+
+
+def _occupy_capacity(cfg, **resources: int) -> None:
+    # Another worker already holds part of the capacity, so the claim below has to wait.
+    with get_connection(cfg) as connection:
+        connection.execute(
+            """
+            INSERT INTO run_resource_allocations (
+                allocation_id, run_id, attempt_id, worker_id, session_id, slot_id,
+                cpu, memory_mb, disk_mb, gpu, state, created_at, updated_at
+            ) VALUES (
+                'alloc_busy', 'run_busy', 'att_busy', 'worker-busy', 'session-busy', 'slot-1',
+                :cpu, :memory_mb, 0, 0, 'allocated', '2026-01-01T00:00:00Z', '2026-01-01T00:00:00Z'
+            )
+            """,
+            {"cpu": 0, "memory_mb": 0, **resources},
+        )
+        connection.commit()
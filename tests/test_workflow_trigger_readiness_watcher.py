@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import time
 from pathlib import Path
@@ -8,11 +9,13 @@ from typing import Any
 
 import pytest
 
+from apps.remote_runner import trigger_readiness_path_manifest
 from apps.remote_runner import trigger_readiness_watcher as watcher
 from apps.remote_runner.api_models import WorkflowTriggerCreateRequest
 from apps.remote_runner.databases import add_reference_database
 from apps.remote_runner.governance_audit import list_governance_audit_events
 from apps.remote_runner.trigger_readiness_read_model import get_workflow_trigger_readiness_observation_from_storage
+from apps.remote_runner.trigger_readiness_inotify import InotifyWakeup, inotify_available
 from apps.remote_runner.trigger_readiness_watcher import run_workflow_trigger_readiness_watcher_once
 from apps.remote_runner.trigger_readiness_watcher_storage import fetch_readiness_observation
 from apps.remote_runner.trigger_service import create_workflow_trigger_from_request
@@ -139,6 +142,60 @@ def test_readiness_watcher_waits_for_local_path_stability_before_dispatch(
     assert str(watched) not in repr(events[0]["payload"]["payload"])
 
 
+def test_readiness_watcher_rehashes_only_files_whose_stat_changed(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cfg = make_configured_remote_runner(tmp_path)
+    monkeypatch.setattr("apps.remote_runner.trigger_service.ensure_submission_ready", lambda _cfg: None)
+    monkeypatch.setattr("apps.remote_runner.trigger_service.ensure_execution_admission_ready", lambda _cfg: None)
+    watched = tmp_path / "incoming" / "run42"
+    for relative, content in {"a/b.bcl": b"lane1", "a-b/x.bcl": b"lane2", "reads.fastq": b"@r\nACGT\n"}.items():
+        (watched / relative).parent.mkdir(parents=True, exist_ok=True)
+        (watched / relative).write_bytes(content)
+    _settle_tree(watched)
+    trigger = _create_file_trigger_with_resource_id(cfg, watched, "file:/incoming/run42")
+    hashed: list[Path] = []
+    original_hash = trigger_readiness_path_manifest._hash_file
+    monkeypatch.setattr(
+        trigger_readiness_path_manifest,
+        "_hash_file",
+        lambda path: hashed.append(Path(path)) or original_hash(path),
+    )
+
+    first = run_workflow_trigger_readiness_watcher_once(cfg)
+    (watched / "reads.fastq").write_bytes(b"@r\nACGTACGT\n")
+    _settle_tree(watched)
+    second = run_workflow_trigger_readiness_watcher_once(cfg)
+    events = list_workflow_trigger_events(cfg, trigger["triggerId"])["items"]
+
+    assert first["scans"][0]["filesHashed"] == 3
+    assert second["scans"][0]["filesHashed"] == 1
+    assert second["scans"][0]["filesReused"] == 2
+    assert second["scans"][0]["bytesHashed"] == len(b"@r\nACGTACGT\n")
+    assert second["scans"][0]["durationMs"] >= 0
+    assert hashed[3:] == [watched / "reads.fastq"]
+    assert len(events) == 2
+    assert f"sha256:{_legacy_tree_checksum(watched)}" in {event["payload"]["resource"]["checksum"] for event in events}
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify is Linux-only")
+def test_inotify_wakeup_returns_on_tree_changes_and_times_out_when_quiet(tmp_path: Path) -> None:
+    watched = tmp_path / "incoming"
+    (watched / "lane1").mkdir(parents=True)
+    wakeup = InotifyWakeup()
+    try:
+        assert wakeup.watch_paths([watched, tmp_path / "later" / "reads.fastq"]) == 3
+        assert wakeup.wait(0.05) is False
+
+        (watched / "lane1" / "tile.bcl").write_bytes(b"bcl")
+
+        assert wakeup.wait(2, settle_seconds=0.05) is True
+        assert wakeup.wait(0.05) is False
+    finally:
+        wakeup.close()
+
+
 def test_readiness_observation_read_model_returns_null_before_first_observation(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -388,8 +445,10 @@ def test_configured_readiness_watcher_builds_supervisor_from_env(monkeypatch: py
     sentinel = object()
     cfg = SimpleNamespace(token="token")
 
-    def fake_start(cfg_arg, *, poll_interval_seconds: float, limit: int):
-        captured.append({"cfg": cfg_arg, "pollIntervalSeconds": poll_interval_seconds, "limit": limit})
+    def fake_start(cfg_arg, *, poll_interval_seconds: float, limit: int, wakeup: str):
+        captured.append(
+            {"cfg": cfg_arg, "pollIntervalSeconds": poll_interval_seconds, "limit": limit, "wakeup": wakeup}
+        )
         return sentinel
 
     monkeypatch.setattr(watcher, "load_remote_runner_config", lambda: cfg)
@@ -397,11 +456,12 @@ def test_configured_readiness_watcher_builds_supervisor_from_env(monkeypatch: py
     monkeypatch.setenv("H2OMETA_TRIGGER_READINESS_WATCHER", "1")
     monkeypatch.setenv("H2OMETA_TRIGGER_READINESS_WATCHER_POLL_SECONDS", "7.5")
     monkeypatch.setenv("H2OMETA_TRIGGER_READINESS_WATCHER_LIMIT", "12")
+    monkeypatch.setenv("H2OMETA_TRIGGER_READINESS_WATCHER_WAKEUP", "inotify")
 
     supervisor = watcher.start_configured_workflow_trigger_readiness_watcher_supervisor()
 
     assert supervisor is sentinel
-    assert captured == [{"cfg": cfg, "pollIntervalSeconds": 7.5, "limit": 12}]
+    assert captured == [{"cfg": cfg, "pollIntervalSeconds": 7.5, "limit": 12, "wakeup": "inotify"}]
 
 
 def test_readiness_watcher_supervisor_runs_ticks(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -437,6 +497,22 @@ def test_readiness_watcher_source_boundary_uses_existing_readiness_submission()
     assert "record_workflow_trigger_event(" not in source
 
 
+def _settle_tree(root: Path) -> None:
+    old_ns = 1_577_836_800_000_000_000
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, ns=(old_ns, old_ns))
+
+
+def _legacy_tree_checksum(root: Path) -> str:
+    digest = hashlib.sha256()
+    for child in sorted(item for item in root.rglob("*") if item.is_file()):
+        content = child.read_bytes()
+        digest.update(child.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(str(len(content)).encode("utf-8"))
+        digest.update(hashlib.sha256(content).hexdigest().encode("utf-8"))
+    return digest.hexdigest()
+
+
 def _add_available_database(cfg, database_path: Path, *, version: str, checksum: str) -> dict[str, Any]:
     return _add_database(cfg, database_path, version=version, status="available", checksum=checksum)
 